@@ -0,0 +1,52 @@
+"""add HNSW index on claims.embedding
+
+Revision ID: n4o5p6q7r8s9
+Revises: 9dc8503f66db
+Create Date: 2026-02-09 10:00:00.000000
+
+Issue #176: LLM-based Claim Extraction - Deduplication using vector similarity
+
+Claim deduplication previously ran a sequential scan over every 1536-dimension
+embedding in the claims table. This migration adds an approximate-nearest-
+neighbour (HNSW) index using cosine distance so that
+ClaimSimilarityService can answer "ORDER BY embedding <=> :q LIMIT k" queries
+from the index instead.
+
+Index parameters (pgvector defaults, documented here for tuning):
+- m = 16: maximum connections per graph layer
+- ef_construction = 64: candidate list size while building the graph
+
+Query-time recall is controlled per request via hnsw.ef_search
+(see CLAIM_SIMILARITY_HNSW_EF_SEARCH).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "n4o5p6q7r8s9"
+down_revision: Union[str, None] = "9dc8503f66db"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create HNSW index on claims.embedding using vector_cosine_ops.
+
+    HNSW (pgvector >= 0.5.0) is preferred over IVFFlat because it does not
+    need a training step and can be built on an empty table.
+    """
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_claims_embedding_hnsw "
+        "ON claims USING hnsw (embedding vector_cosine_ops) "
+        "WITH (m = 16, ef_construction = 64)"
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the HNSW index on claims.embedding.
+    """
+    op.execute("DROP INDEX IF EXISTS ix_claims_embedding_hnsw")
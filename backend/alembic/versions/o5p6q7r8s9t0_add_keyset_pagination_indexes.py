@@ -0,0 +1,49 @@
+"""add keyset pagination indexes
+
+Revision ID: o5p6q7r8s9t0
+Revises: n4o5p6q7r8s9
+Create Date: 2026-10-16 10:00:00.000000
+
+The submissions list, public corrections log and admin RTBF request list
+page with a cursor on (timestamp, id) instead of OFFSET (see
+app.core.pagination). These composite indexes let each page start with an
+index seek, so deep pages cost the same as the first one.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "o5p6q7r8s9t0"
+down_revision: Union[str, None] = "n4o5p6q7r8s9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create composite (filter, timestamp, id) indexes for keyset pagination.
+    """
+    op.create_index("ix_submissions_created_at_id", "submissions", ["created_at", "id"])
+    op.create_index(
+        "ix_submissions_user_id_created_at_id", "submissions", ["user_id", "created_at", "id"]
+    )
+    op.create_index(
+        "ix_corrections_status_reviewed_at_id", "corrections", ["status", "reviewed_at", "id"]
+    )
+    op.create_index("ix_rtbf_requests_created_at_id", "rtbf_requests", ["created_at", "id"])
+    op.create_index(
+        "ix_rtbf_requests_status_created_at_id", "rtbf_requests", ["status", "created_at", "id"]
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the keyset pagination indexes.
+    """
+    op.drop_index("ix_rtbf_requests_status_created_at_id", table_name="rtbf_requests")
+    op.drop_index("ix_rtbf_requests_created_at_id", table_name="rtbf_requests")
+    op.drop_index("ix_corrections_status_reviewed_at_id", table_name="corrections")
+    op.drop_index("ix_submissions_user_id_created_at_id", table_name="submissions")
+    op.drop_index("ix_submissions_created_at_id", table_name="submissions")
@@ -0,0 +1,87 @@
+"""add metric rollup tables
+
+Revision ID: p6q7r8s9t0u1
+Revises: o5p6q7r8s9t0
+Create Date: 2026-10-16 12:00:00.000000
+
+Pre-aggregated counts for the EFCSN analytics dashboard and monthly
+transparency reports (see app.models.metrics_rollup):
+- fact_check_daily_rollups: fact-checks per (UTC day, verdict, sources_count)
+- source_rollups: sources per (type, relevance) with credibility score sums
+- correction_rollups: corrections per (status, type)
+
+The tables are backfilled from existing rows here; afterwards the ORM keeps
+them current. scripts/backfill_metric_rollups.py rebuilds them on demand.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "p6q7r8s9t0u1"
+down_revision: Union[str, None] = "o5p6q7r8s9t0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Create the rollup tables and backfill them from the raw tables.
+    """
+    op.create_table(
+        "fact_check_daily_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("verdict", sa.String(length=50), nullable=False),
+        sa.Column("sources_count", sa.Integer(), nullable=False),
+        sa.Column("fact_check_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "verdict", "sources_count"),
+    )
+    op.create_table(
+        "source_rollups",
+        sa.Column("source_type", sa.String(length=50), nullable=False),
+        sa.Column("relevance", sa.String(length=50), nullable=False),
+        sa.Column("source_count", sa.Integer(), nullable=False),
+        sa.Column("scored_count", sa.Integer(), nullable=False),
+        sa.Column("credibility_sum", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("source_type", "relevance"),
+    )
+    op.create_table(
+        "correction_rollups",
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("correction_type", sa.String(length=20), nullable=False),
+        sa.Column("correction_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("status", "correction_type"),
+    )
+
+    op.execute("""
+        INSERT INTO fact_check_daily_rollups (day, verdict, sources_count, fact_check_count)
+        SELECT (created_at AT TIME ZONE 'UTC')::date, verdict, sources_count, count(*)
+        FROM fact_checks
+        GROUP BY 1, 2, 3
+        """)
+    op.execute("""
+        INSERT INTO source_rollups
+            (source_type, relevance, source_count, scored_count, credibility_sum)
+        SELECT source_type::text, coalesce(relevance::text, ''), count(*),
+               count(credibility_score), coalesce(sum(credibility_score), 0)
+        FROM sources
+        GROUP BY 1, 2
+        """)
+    op.execute("""
+        INSERT INTO correction_rollups (status, correction_type, correction_count)
+        SELECT status::text, correction_type::text, count(*)
+        FROM corrections
+        GROUP BY 1, 2
+        """)
+
+
+def downgrade() -> None:
+    """
+    Drop the rollup tables.
+    """
+    op.drop_table("correction_rollups")
+    op.drop_table("source_rollups")
+    op.drop_table("fact_check_daily_rollups")
@@ -0,0 +1,69 @@
+"""add submission publication latency
+
+Revision ID: q7r8s9t0u1v2
+Revises: p6q7r8s9t0u1
+Create Date: 2026-10-16 14:00:00.000000
+
+Materializes each submission's first SUBMITTED -> PUBLISHED interval so
+time-to-publication metrics aggregate one indexed column in SQL instead of
+loading rows into Python. WorkflowService sets the columns on the first
+PUBLISHED transition; existing submissions are backfilled here from
+workflow_transitions.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "q7r8s9t0u1v2"
+down_revision: Union[str, None] = "p6q7r8s9t0u1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add published_at and publication_latency_seconds to submissions.
+    """
+    op.add_column(
+        "submissions", sa.Column("published_at", sa.DateTime(timezone=True), nullable=True)
+    )
+    op.add_column(
+        "submissions", sa.Column("publication_latency_seconds", sa.Float(), nullable=True)
+    )
+
+    op.execute("""
+        UPDATE submissions
+        SET published_at = t.published_at,
+            publication_latency_seconds = GREATEST(
+                EXTRACT(EPOCH FROM t.published_at - COALESCE(t.submitted_at, submissions.created_at)),
+                0
+            )
+        FROM (
+            SELECT submission_id,
+                   MIN(created_at) FILTER (WHERE to_state = 'published') AS published_at,
+                   MIN(created_at) FILTER (WHERE to_state = 'submitted') AS submitted_at
+            FROM workflow_transitions
+            GROUP BY submission_id
+        ) AS t
+        WHERE t.submission_id = submissions.id
+          AND t.published_at IS NOT NULL
+        """)
+
+    op.create_index(
+        "ix_submissions_published_at_latency",
+        "submissions",
+        ["published_at", "publication_latency_seconds"],
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the publication latency columns.
+    """
+    op.drop_index("ix_submissions_published_at_latency", table_name="submissions")
+    op.drop_column("submissions", "publication_latency_seconds")
+    op.drop_column("submissions", "published_at")
@@ -0,0 +1,41 @@
+"""add transparency page version diffs
+
+Revision ID: r8s9t0u1v2w3
+Revises: q7r8s9t0u1v2
+Create Date: 2026-10-16 16:00:00.000000
+
+Stores the diff from each transparency page version to the next, computed
+once when the next version is saved, so the public diff endpoint no longer
+runs difflib per request. Versions saved before this migration keep NULL and
+are diffed on first request (then kept in the service's in-process cache).
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "r8s9t0u1v2w3"
+down_revision: Union[str, None] = "q7r8s9t0u1v2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add diff_to_next to transparency_page_versions.
+    """
+    op.add_column(
+        "transparency_page_versions",
+        sa.Column("diff_to_next", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop diff_to_next from transparency_page_versions.
+    """
+    op.drop_column("transparency_page_versions", "diff_to_next")
@@ -0,0 +1,114 @@
+"""partition analytics events by month
+
+Revision ID: s9t0u1v2w3x4
+Revises: r8s9t0u1v2w3
+Create Date: 2026-10-16 18:00:00.000000
+
+Rebuilds analytics_events as a table range-partitioned by month on
+occurred_at. Each partition (analytics_events_YYYY_MM) holds one UTC month,
+so indexes stay month-sized, queries bounded by occurred_at scan only the
+matching partitions, and retention drops whole partitions instead of
+deleting rows (see app.services.analytics_partition_service).
+
+Existing rows are copied into partitions created for every month from the
+oldest event up to three months ahead; the daily analytics-partitions beat
+task keeps creating partitions from then on. A default partition catches
+rows outside every range.
+
+The primary key becomes (id, occurred_at) because a partitioned table's
+unique constraints must include the partition key.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "s9t0u1v2w3x4"
+down_revision: Union[str, None] = "r8s9t0u1v2w3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months after the current one created up front, matching ANALYTICS_PARTITION_PREMAKE_MONTHS
+PREMAKE_MONTHS: int = 3
+
+INDEXES: list[tuple[str, str]] = [
+    ("ix_analytics_events_event_type", "event_type"),
+    ("ix_analytics_events_entity_type", "entity_type"),
+    ("ix_analytics_events_occurred_at", "occurred_at"),
+    ("idx_analytics_events_entity", "entity_type, entity_id"),
+    ("idx_analytics_events_type_occurred", "event_type, occurred_at"),
+    ("idx_analytics_events_entity_type_occurred", "entity_type, occurred_at"),
+]
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.execute(f"CREATE INDEX {name} ON analytics_events ({columns})")
+
+
+def upgrade() -> None:
+    """
+    Replace analytics_events with a monthly range-partitioned table.
+    """
+    op.execute(
+        "CREATE TABLE analytics_events_partitioned "
+        "(LIKE analytics_events INCLUDING DEFAULTS) PARTITION BY RANGE (occurred_at)"
+    )
+
+    # One partition per UTC month from the oldest event to PREMAKE_MONTHS ahead
+    op.execute(f"""
+        DO $$
+        DECLARE
+            part_month date := date_trunc(
+                'month', COALESCE((SELECT min(occurred_at) FROM analytics_events), now())
+                AT TIME ZONE 'UTC'
+            )::date;
+            last_month date := (
+                date_trunc('month', now() AT TIME ZONE 'UTC')
+                + interval '{PREMAKE_MONTHS} months'
+            )::date;
+        BEGIN
+            WHILE part_month <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF analytics_events_partitioned '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'analytics_events_' || to_char(part_month, 'YYYY_MM'),
+                    part_month::text || ' 00:00:00+00',
+                    (part_month + interval '1 month')::date::text || ' 00:00:00+00'
+                );
+                part_month := (part_month + interval '1 month')::date;
+            END LOOP;
+        END
+        $$
+        """)
+    op.execute(
+        "CREATE TABLE analytics_events_default PARTITION OF analytics_events_partitioned DEFAULT"
+    )
+
+    op.execute("INSERT INTO analytics_events_partitioned SELECT * FROM analytics_events")
+    op.execute("DROP TABLE analytics_events")
+    op.execute("ALTER TABLE analytics_events_partitioned RENAME TO analytics_events")
+
+    # Created on the parent, so every current and future partition gets them
+    op.execute(
+        "ALTER TABLE analytics_events "
+        "ADD CONSTRAINT analytics_events_pkey PRIMARY KEY (id, occurred_at)"
+    )
+    _create_indexes()
+
+
+def downgrade() -> None:
+    """
+    Restore analytics_events as a single unpartitioned table.
+    """
+    op.execute(
+        "CREATE TABLE analytics_events_unpartitioned (LIKE analytics_events INCLUDING DEFAULTS)"
+    )
+    op.execute("INSERT INTO analytics_events_unpartitioned SELECT * FROM analytics_events")
+    # Dropping the parent drops every partition
+    op.execute("DROP TABLE analytics_events")
+    op.execute("ALTER TABLE analytics_events_unpartitioned RENAME TO analytics_events")
+
+    op.execute("ALTER TABLE analytics_events ADD CONSTRAINT analytics_events_pkey PRIMARY KEY (id)")
+    _create_indexes()
@@ -0,0 +1,76 @@
+"""add full-text search columns
+
+Revision ID: t0u1v2w3x4y5
+Revises: s9t0u1v2w3x4
+Create Date: 2026-10-16 20:00:00.000000
+
+Adds generated tsvector columns for GET /search (see
+app.services.search_service):
+- claims.search_vector: claim content (weight A)
+- fact_checks.search_vector: verdict (A), reasoning (B) and the strings in
+  draft_content (C)
+
+Each text is indexed with both the dutch and english configurations, so a
+query parsed with either (or both) matches the stemmed lexemes. The columns
+are STORED and maintained by PostgreSQL on every write; GIN indexes answer
+the @@ match. A pg_trgm GIN index on claims.content serves the fuzzy
+fallback for queries with no full-text match (typos, partial words).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "t0u1v2w3x4y5"
+down_revision: Union[str, None] = "s9t0u1v2w3x4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _bilingual(expression: str, weight: str) -> str:
+    """tsvector of expression under both configurations, with weight"""
+    return (
+        f"setweight(to_tsvector('dutch'::regconfig, {expression}), '{weight}') || "
+        f"setweight(to_tsvector('english'::regconfig, {expression}), '{weight}')"
+    )
+
+
+def upgrade() -> None:
+    """
+    Add the generated search_vector columns and their GIN indexes.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    claim_vector: str = _bilingual("coalesce(content, '')", "A")
+    fact_check_vector: str = " || ".join(
+        [
+            _bilingual("coalesce(verdict, '')", "A"),
+            _bilingual("coalesce(reasoning, '')", "B"),
+            # to_tsvector(regconfig, jsonb) indexes the string values only
+            _bilingual("coalesce(draft_content, '{}'::jsonb)", "C"),
+        ]
+    )
+    op.execute(
+        "ALTER TABLE claims ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({claim_vector}) STORED"
+    )
+    op.execute(
+        "ALTER TABLE fact_checks ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({fact_check_vector}) STORED"
+    )
+
+    op.execute("CREATE INDEX ix_claims_search_vector ON claims USING gin (search_vector)")
+    op.execute("CREATE INDEX ix_fact_checks_search_vector ON fact_checks USING gin (search_vector)")
+    op.execute("CREATE INDEX ix_claims_content_trgm ON claims USING gin (content gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """
+    Drop the search columns and indexes (pg_trgm is left installed).
+    """
+    op.execute("DROP INDEX IF EXISTS ix_claims_content_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_fact_checks_search_vector")
+    op.execute("DROP INDEX IF EXISTS ix_claims_search_vector")
+    op.execute("ALTER TABLE fact_checks DROP COLUMN search_vector")
+    op.execute("ALTER TABLE claims DROP COLUMN search_vector")
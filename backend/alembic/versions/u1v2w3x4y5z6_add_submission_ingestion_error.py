@@ -0,0 +1,35 @@
+"""add submission ingestion error
+
+Revision ID: u1v2w3x4y5z6
+Revises: t0u1v2w3x4y5
+Create Date: 2026-10-16 22:00:00.000000
+
+Records why background Spotlight ingestion failed (fetch, transcription or
+queueing the task), next to the "failed" status it leaves on the submission.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "u1v2w3x4y5z6"
+down_revision: Union[str, None] = "t0u1v2w3x4y5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add ingestion_error to submissions.
+    """
+    op.add_column("submissions", sa.Column("ingestion_error", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """
+    Drop ingestion_error from submissions.
+    """
+    op.drop_column("submissions", "ingestion_error")
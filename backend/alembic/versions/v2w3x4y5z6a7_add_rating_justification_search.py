@@ -0,0 +1,53 @@
+"""add rating justification search
+
+Revision ID: v2w3x4y5z6a7
+Revises: u1v2w3x4y5z6
+Create Date: 2026-10-17 10:00:00.000000
+
+Adds a generated tsvector column over fact_check_ratings.justification, so
+GET /search also finds claims by the justification of their rating (see
+app.services.search_service). Like the columns of t0u1v2w3x4y5 it holds
+dutch and english lexemes (weight B, as fact-check reasoning), is STORED and
+is matched through a GIN index.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "v2w3x4y5z6a7"
+down_revision: Union[str, None] = "u1v2w3x4y5z6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _bilingual(expression: str, weight: str) -> str:
+    """tsvector of expression under both configurations, with weight"""
+    return (
+        f"setweight(to_tsvector('dutch'::regconfig, {expression}), '{weight}') || "
+        f"setweight(to_tsvector('english'::regconfig, {expression}), '{weight}')"
+    )
+
+
+def upgrade() -> None:
+    """
+    Add the generated search_vector column on fact_check_ratings and its GIN index.
+    """
+    rating_vector: str = _bilingual("coalesce(justification, '')", "B")
+    op.execute(
+        "ALTER TABLE fact_check_ratings ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({rating_vector}) STORED"
+    )
+    op.execute(
+        "CREATE INDEX ix_fact_check_ratings_search_vector "
+        "ON fact_check_ratings USING gin (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    """
+    Drop the search column and its index.
+    """
+    op.execute("DROP INDEX IF EXISTS ix_fact_check_ratings_search_vector")
+    op.execute("ALTER TABLE fact_check_ratings DROP COLUMN search_vector")
@@ -12,19 +12,29 @@ Endpoints:
 - GET /analytics/rating-distribution - Rating statistics (admin only)
 - GET /analytics/source-quality - Source quality metrics (admin only)
 - GET /analytics/correction-rate - Correction rate metrics (admin only)
+- POST /analytics/events - Record views, shares and other events (public)
+
+Responses are served from the shared response cache for
+RESPONSE_CACHE_ANALYTICS_TTL_SECONDS and marked private for clients.
+Recorded events are buffered and bulk-written in the background (see
+app.services.analytics_ingestion_service).
 """
 
 from datetime import datetime
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import require_admin
-from app.models.user import User
+from app.core.principal_cache import Principal
+from app.core.response_cache import ANALYTICS, get_response_cache
 from app.schemas.analytics import (
     AnalyticsDashboardResponse,
+    AnalyticsEventBatch,
+    AnalyticsEventIngestResponse,
     CorrectionRateMetrics,
     EFCSNComplianceChecklistItem,
     EFCSNComplianceResponse,
@@ -35,6 +45,7 @@ from app.schemas.analytics import (
     SourceQualityMetrics,
     TimeToPublicationMetrics,
 )
+from app.services.analytics_ingestion_service import get_event_buffer
 from app.services.analytics_service import AnalyticsService
 
 router = APIRouter()
@@ -53,9 +64,10 @@ router = APIRouter()
     description="Get real-time EFCSN compliance status and checklist. Admin only.",
 )
 async def get_efcsn_compliance(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
-) -> EFCSNComplianceResponse:
+    current_user: Principal = Depends(require_admin),
+) -> Response:
     """
     Get EFCSN compliance checklist with real-time status.
 
@@ -66,26 +78,32 @@ async def get_efcsn_compliance(
 
     Admin only.
     """
-    service: AnalyticsService = AnalyticsService(db)
-    result: dict[str, Any] = await service.get_efcsn_compliance()
-
-    # Convert checklist items to Pydantic models
-    checklist_items: list[EFCSNComplianceChecklistItem] = [
-        EFCSNComplianceChecklistItem(
-            requirement=item["requirement"],
-            status=item["status"],
-            details=item["details"],
-            value=item.get("value"),
-            threshold=item.get("threshold"),
+
+    async def build() -> EFCSNComplianceResponse:
+        service: AnalyticsService = AnalyticsService(db)
+        result: dict[str, Any] = await service.get_efcsn_compliance()
+
+        # Convert checklist items to Pydantic models
+        checklist_items: list[EFCSNComplianceChecklistItem] = [
+            EFCSNComplianceChecklistItem(
+                requirement=item["requirement"],
+                status=item["status"],
+                details=item["details"],
+                value=item.get("value"),
+                threshold=item.get("threshold"),
+            )
+            for item in result["checklist"]
+        ]
+
+        return EFCSNComplianceResponse(
+            overall_status=result["overall_status"],
+            checklist=checklist_items,
+            last_checked=result["last_checked"],
+            compliance_score=result["compliance_score"],
         )
-        for item in result["checklist"]
-    ]
-
-    return EFCSNComplianceResponse(
-        overall_status=result["overall_status"],
-        checklist=checklist_items,
-        last_checked=result["last_checked"],
-        compliance_score=result["compliance_score"],
+
+    return await get_response_cache().respond(
+        request, ANALYTICS, settings.RESPONSE_CACHE_ANALYTICS_TTL_SECONDS, build, private=True
     )
 
 
@@ -102,9 +120,10 @@ async def get_efcsn_compliance(
     description="Get complete analytics dashboard with all metrics. Admin only.",
 )
 async def get_analytics_dashboard(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
-) -> AnalyticsDashboardResponse:
+    current_user: Principal = Depends(require_admin),
+) -> Response:
     """
     Get complete analytics dashboard combining all metrics.
 
@@ -118,93 +137,101 @@ async def get_analytics_dashboard(
 
     Admin only.
     """
-    service: AnalyticsService = AnalyticsService(db)
-    result: dict[str, Any] = await service.get_dashboard()
-
-    # Convert to Pydantic models
-    monthly_fc: dict[str, Any] = result["monthly_fact_checks"]
-    monthly_counts: list[MonthlyFactCheckCount] = [
-        MonthlyFactCheckCount(
-            year=m["year"],
-            month=m["month"],
-            count=m["count"],
-            meets_efcsn_minimum=m["meets_efcsn_minimum"],
-        )
-        for m in monthly_fc["months"]
-    ]
-
-    time_pub: dict[str, Any] = result["time_to_publication"]
-    rating_dist: dict[str, Any] = result["rating_distribution"]
-    source_qual: dict[str, Any] = result["source_quality"]
-    corr_rate: dict[str, Any] = result["correction_rate"]
-    compliance: dict[str, Any] = result["efcsn_compliance"]
-
-    # Build rating distribution items
-    rating_items: list[RatingDistributionItem] = [
-        RatingDistributionItem(
-            rating=r["rating"],
-            count=r["count"],
-            percentage=r["percentage"],
-        )
-        for r in rating_dist["ratings"]
-    ]
-
-    # Build compliance checklist items
-    compliance_items: list[EFCSNComplianceChecklistItem] = [
-        EFCSNComplianceChecklistItem(
-            requirement=item["requirement"],
-            status=item["status"],
-            details=item["details"],
-            value=item.get("value"),
-            threshold=item.get("threshold"),
+
+    async def build() -> AnalyticsDashboardResponse:
+        service: AnalyticsService = AnalyticsService(db)
+        result: dict[str, Any] = await service.get_dashboard()
+
+        # Convert to Pydantic models
+        monthly_fc: dict[str, Any] = result["monthly_fact_checks"]
+        monthly_counts: list[MonthlyFactCheckCount] = [
+            MonthlyFactCheckCount(
+                year=m["year"],
+                month=m["month"],
+                count=m["count"],
+                meets_efcsn_minimum=m["meets_efcsn_minimum"],
+            )
+            for m in monthly_fc["months"]
+        ]
+
+        time_pub: dict[str, Any] = result["time_to_publication"]
+        rating_dist: dict[str, Any] = result["rating_distribution"]
+        source_qual: dict[str, Any] = result["source_quality"]
+        corr_rate: dict[str, Any] = result["correction_rate"]
+        compliance: dict[str, Any] = result["efcsn_compliance"]
+
+        # Build rating distribution items
+        rating_items: list[RatingDistributionItem] = [
+            RatingDistributionItem(
+                rating=r["rating"],
+                count=r["count"],
+                percentage=r["percentage"],
+            )
+            for r in rating_dist["ratings"]
+        ]
+
+        # Build compliance checklist items
+        compliance_items: list[EFCSNComplianceChecklistItem] = [
+            EFCSNComplianceChecklistItem(
+                requirement=item["requirement"],
+                status=item["status"],
+                details=item["details"],
+                value=item.get("value"),
+                threshold=item.get("threshold"),
+            )
+            for item in compliance["checklist"]
+        ]
+
+        return AnalyticsDashboardResponse(
+            monthly_fact_checks=MonthlyFactCheckCountResponse(
+                months=monthly_counts,
+                total_count=monthly_fc["total_count"],
+                average_per_month=monthly_fc["average_per_month"],
+            ),
+            time_to_publication=TimeToPublicationMetrics(
+                average_hours=time_pub["average_hours"],
+                median_hours=time_pub["median_hours"],
+                p90_hours=time_pub["p90_hours"],
+                p99_hours=time_pub["p99_hours"],
+                min_hours=time_pub["min_hours"],
+                max_hours=time_pub["max_hours"],
+                total_published=time_pub["total_published"],
+            ),
+            rating_distribution=RatingDistributionResponse(
+                ratings=rating_items,
+                total_count=rating_dist["total_count"],
+                period_start=rating_dist.get("period_start"),
+                period_end=rating_dist.get("period_end"),
+            ),
+            source_quality=SourceQualityMetrics(
+                average_sources_per_fact_check=source_qual["average_sources_per_fact_check"],
+                average_credibility_score=source_qual["average_credibility_score"],
+                total_sources=source_qual["total_sources"],
+                sources_by_type=source_qual["sources_by_type"],
+                sources_by_relevance=source_qual["sources_by_relevance"],
+                fact_checks_meeting_minimum=source_qual["fact_checks_meeting_minimum"],
+                fact_checks_below_minimum=source_qual["fact_checks_below_minimum"],
+            ),
+            correction_rate=CorrectionRateMetrics(
+                total_fact_checks=corr_rate["total_fact_checks"],
+                total_corrections=corr_rate["total_corrections"],
+                corrections_accepted=corr_rate["corrections_accepted"],
+                corrections_rejected=corr_rate["corrections_rejected"],
+                corrections_pending=corr_rate["corrections_pending"],
+                correction_rate=corr_rate["correction_rate"],
+                corrections_by_type=corr_rate["corrections_by_type"],
+            ),
+            efcsn_compliance=EFCSNComplianceResponse(
+                overall_status=compliance["overall_status"],
+                checklist=compliance_items,
+                last_checked=compliance["last_checked"],
+                compliance_score=compliance["compliance_score"],
+            ),
+            generated_at=result["generated_at"],
         )
-        for item in compliance["checklist"]
-    ]
 
-    return AnalyticsDashboardResponse(
-        monthly_fact_checks=MonthlyFactCheckCountResponse(
-            months=monthly_counts,
-            total_count=monthly_fc["total_count"],
-            average_per_month=monthly_fc["average_per_month"],
-        ),
-        time_to_publication=TimeToPublicationMetrics(
-            average_hours=time_pub["average_hours"],
-            median_hours=time_pub["median_hours"],
-            min_hours=time_pub["min_hours"],
-            max_hours=time_pub["max_hours"],
-            total_published=time_pub["total_published"],
-        ),
-        rating_distribution=RatingDistributionResponse(
-            ratings=rating_items,
-            total_count=rating_dist["total_count"],
-            period_start=rating_dist.get("period_start"),
-            period_end=rating_dist.get("period_end"),
-        ),
-        source_quality=SourceQualityMetrics(
-            average_sources_per_fact_check=source_qual["average_sources_per_fact_check"],
-            average_credibility_score=source_qual["average_credibility_score"],
-            total_sources=source_qual["total_sources"],
-            sources_by_type=source_qual["sources_by_type"],
-            sources_by_relevance=source_qual["sources_by_relevance"],
-            fact_checks_meeting_minimum=source_qual["fact_checks_meeting_minimum"],
-            fact_checks_below_minimum=source_qual["fact_checks_below_minimum"],
-        ),
-        correction_rate=CorrectionRateMetrics(
-            total_fact_checks=corr_rate["total_fact_checks"],
-            total_corrections=corr_rate["total_corrections"],
-            corrections_accepted=corr_rate["corrections_accepted"],
-            corrections_rejected=corr_rate["corrections_rejected"],
-            corrections_pending=corr_rate["corrections_pending"],
-            correction_rate=corr_rate["correction_rate"],
-            corrections_by_type=corr_rate["corrections_by_type"],
-        ),
-        efcsn_compliance=EFCSNComplianceResponse(
-            overall_status=compliance["overall_status"],
-            checklist=compliance_items,
-            last_checked=compliance["last_checked"],
-            compliance_score=compliance["compliance_score"],
-        ),
-        generated_at=result["generated_at"],
+    return await get_response_cache().respond(
+        request, ANALYTICS, settings.RESPONSE_CACHE_ANALYTICS_TTL_SECONDS, build, private=True
     )
 
 
@@ -221,10 +248,11 @@ async def get_analytics_dashboard(
     description="Get monthly fact-check publication counts. Admin only.",
 )
 async def get_monthly_fact_checks(
+    request: Request,
     months: int = Query(default=12, ge=1, le=36, description="Number of months to include"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
-) -> MonthlyFactCheckCountResponse:
+    current_user: Principal = Depends(require_admin),
+) -> Response:
     """
     Get monthly fact-check publication counts.
 
@@ -232,23 +260,29 @@ async def get_monthly_fact_checks(
 
     Admin only.
     """
-    service: AnalyticsService = AnalyticsService(db)
-    result: dict[str, Any] = await service.get_monthly_fact_check_counts(months=months)
-
-    monthly_counts: list[MonthlyFactCheckCount] = [
-        MonthlyFactCheckCount(
-            year=m["year"],
-            month=m["month"],
-            count=m["count"],
-            meets_efcsn_minimum=m["meets_efcsn_minimum"],
+
+    async def build() -> MonthlyFactCheckCountResponse:
+        service: AnalyticsService = AnalyticsService(db)
+        result: dict[str, Any] = await service.get_monthly_fact_check_counts(months=months)
+
+        monthly_counts: list[MonthlyFactCheckCount] = [
+            MonthlyFactCheckCount(
+                year=m["year"],
+                month=m["month"],
+                count=m["count"],
+                meets_efcsn_minimum=m["meets_efcsn_minimum"],
+            )
+            for m in result["months"]
+        ]
+
+        return MonthlyFactCheckCountResponse(
+            months=monthly_counts,
+            total_count=result["total_count"],
+            average_per_month=result["average_per_month"],
         )
-        for m in result["months"]
-    ]
 
-    return MonthlyFactCheckCountResponse(
-        months=monthly_counts,
-        total_count=result["total_count"],
-        average_per_month=result["average_per_month"],
+    return await get_response_cache().respond(
+        request, ANALYTICS, settings.RESPONSE_CACHE_ANALYTICS_TTL_SECONDS, build, private=True
     )
 
 
@@ -265,11 +299,12 @@ async def get_monthly_fact_checks(
     description="Get fact-check rating distribution statistics. Admin only.",
 )
 async def get_rating_distribution(
+    request: Request,
     start_date: Optional[datetime] = Query(default=None, description="Start of analysis period"),
     end_date: Optional[datetime] = Query(default=None, description="End of analysis period"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
-) -> RatingDistributionResponse:
+    current_user: Principal = Depends(require_admin),
+) -> Response:
     """
     Get rating distribution statistics.
 
@@ -277,26 +312,32 @@ async def get_rating_distribution(
 
     Admin only.
     """
-    service: AnalyticsService = AnalyticsService(db)
-    result: dict[str, Any] = await service.get_rating_distribution(
-        start_date=start_date,
-        end_date=end_date,
-    )
 
-    rating_items: list[RatingDistributionItem] = [
-        RatingDistributionItem(
-            rating=r["rating"],
-            count=r["count"],
-            percentage=r["percentage"],
+    async def build() -> RatingDistributionResponse:
+        service: AnalyticsService = AnalyticsService(db)
+        result: dict[str, Any] = await service.get_rating_distribution(
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        rating_items: list[RatingDistributionItem] = [
+            RatingDistributionItem(
+                rating=r["rating"],
+                count=r["count"],
+                percentage=r["percentage"],
+            )
+            for r in result["ratings"]
+        ]
+
+        return RatingDistributionResponse(
+            ratings=rating_items,
+            total_count=result["total_count"],
+            period_start=result.get("period_start"),
+            period_end=result.get("period_end"),
         )
-        for r in result["ratings"]
-    ]
-
-    return RatingDistributionResponse(
-        ratings=rating_items,
-        total_count=result["total_count"],
-        period_start=result.get("period_start"),
-        period_end=result.get("period_end"),
+
+    return await get_response_cache().respond(
+        request, ANALYTICS, settings.RESPONSE_CACHE_ANALYTICS_TTL_SECONDS, build, private=True
     )
 
 
@@ -313,9 +354,10 @@ async def get_rating_distribution(
     description="Get source quality metrics for EFCSN compliance. Admin only.",
 )
 async def get_source_quality(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
-) -> SourceQualityMetrics:
+    current_user: Principal = Depends(require_admin),
+) -> Response:
     """
     Get source quality metrics.
 
@@ -323,17 +365,23 @@ async def get_source_quality(
 
     Admin only.
     """
-    service: AnalyticsService = AnalyticsService(db)
-    result: dict[str, Any] = await service.get_source_quality_metrics()
-
-    return SourceQualityMetrics(
-        average_sources_per_fact_check=result["average_sources_per_fact_check"],
-        average_credibility_score=result["average_credibility_score"],
-        total_sources=result["total_sources"],
-        sources_by_type=result["sources_by_type"],
-        sources_by_relevance=result["sources_by_relevance"],
-        fact_checks_meeting_minimum=result["fact_checks_meeting_minimum"],
-        fact_checks_below_minimum=result["fact_checks_below_minimum"],
+
+    async def build() -> SourceQualityMetrics:
+        service: AnalyticsService = AnalyticsService(db)
+        result: dict[str, Any] = await service.get_source_quality_metrics()
+
+        return SourceQualityMetrics(
+            average_sources_per_fact_check=result["average_sources_per_fact_check"],
+            average_credibility_score=result["average_credibility_score"],
+            total_sources=result["total_sources"],
+            sources_by_type=result["sources_by_type"],
+            sources_by_relevance=result["sources_by_relevance"],
+            fact_checks_meeting_minimum=result["fact_checks_meeting_minimum"],
+            fact_checks_below_minimum=result["fact_checks_below_minimum"],
+        )
+
+    return await get_response_cache().respond(
+        request, ANALYTICS, settings.RESPONSE_CACHE_ANALYTICS_TTL_SECONDS, build, private=True
     )
 
 
@@ -350,9 +398,10 @@ async def get_source_quality(
     description="Get correction rate metrics for quality tracking. Admin only.",
 )
 async def get_correction_rate(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
-) -> CorrectionRateMetrics:
+    current_user: Principal = Depends(require_admin),
+) -> Response:
     """
     Get correction rate metrics.
 
@@ -363,15 +412,47 @@ async def get_correction_rate(
 
     Admin only.
     """
-    service: AnalyticsService = AnalyticsService(db)
-    result: dict[str, Any] = await service.get_correction_rate_metrics()
-
-    return CorrectionRateMetrics(
-        total_fact_checks=result["total_fact_checks"],
-        total_corrections=result["total_corrections"],
-        corrections_accepted=result["corrections_accepted"],
-        corrections_rejected=result["corrections_rejected"],
-        corrections_pending=result["corrections_pending"],
-        correction_rate=result["correction_rate"],
-        corrections_by_type=result["corrections_by_type"],
+
+    async def build() -> CorrectionRateMetrics:
+        service: AnalyticsService = AnalyticsService(db)
+        result: dict[str, Any] = await service.get_correction_rate_metrics()
+
+        return CorrectionRateMetrics(
+            total_fact_checks=result["total_fact_checks"],
+            total_corrections=result["total_corrections"],
+            corrections_accepted=result["corrections_accepted"],
+            corrections_rejected=result["corrections_rejected"],
+            corrections_pending=result["corrections_pending"],
+            correction_rate=result["correction_rate"],
+            corrections_by_type=result["corrections_by_type"],
+        )
+
+    return await get_response_cache().respond(
+        request, ANALYTICS, settings.RESPONSE_CACHE_ANALYTICS_TTL_SECONDS, build, private=True
     )
+
+
+# =============================================================================
+# Event Ingestion Endpoint
+# =============================================================================
+
+
+@router.post(
+    "/analytics/events",
+    response_model=AnalyticsEventIngestResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["analytics"],
+    summary="Record analytics events",
+    description="Record views, shares and other events. Public; events are written in batches.",
+)
+async def record_analytics_events(batch: AnalyticsEventBatch) -> AnalyticsEventIngestResponse:
+    """
+    Record a batch of analytics events.
+
+    Events are buffered in memory and bulk-written by a background flusher,
+    so this endpoint never waits for the database. Under heavy load view
+    events are sampled and, once the buffer is full, events are dropped;
+    the response reports how many were kept.
+    """
+    accepted: int = get_event_buffer().record(event.model_dump() for event in batch.events)
+    return AnalyticsEventIngestResponse(accepted=accepted, dropped=len(batch.events) - accepted)
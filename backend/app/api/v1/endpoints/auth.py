@@ -3,7 +3,7 @@ Authentication endpoints for user registration, login, and token management
 """
 
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -12,13 +12,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.password_hashing import PasswordHasherBusyError, get_password_hasher
+from app.core.principal_cache import Principal, invalidate_principal
 from app.core.redis import get_redis
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    hash_password,
-    verify_password,
 )
 from app.models.user import User, UserRole
 from app.schemas.auth import (
@@ -36,6 +36,15 @@ security = HTTPBearer()
 router = APIRouter()
 
 
+def _password_hasher_busy() -> HTTPException:
+    """Build the 503 response for a saturated password hashing queue"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many authentication requests, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=TokenWithUser, status_code=status.HTTP_200_OK)
 async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db)) -> TokenWithUser:
     """
@@ -54,8 +63,11 @@ async def register(user_data: UserRegister, db: AsyncSession = Depends(get_db))
             detail="Email already registered",
         )
 
-    # Hash password
-    password_hash = hash_password(user_data.password)
+    # Hash password off the event loop
+    try:
+        password_hash = await get_password_hasher().hash(user_data.password)
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy() from e
 
     # Create new user with default role 'submitter'
     new_user = User(
@@ -98,8 +110,18 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)) -> T
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
-    # Verify user exists and password is correct
-    if not user or not verify_password(credentials.password, user.password_hash):
+    # Verify user exists and password is correct (bcrypt runs off the event loop)
+    verified: bool = False
+    new_hash: Optional[str] = None
+    if user:
+        try:
+            verified, new_hash = await get_password_hasher().verify_and_update(
+                credentials.password, user.password_hash
+            )
+        except PasswordHasherBusyError as e:
+            raise _password_hasher_busy() from e
+
+    if not user or not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -114,6 +136,12 @@ async def login(credentials: UserLogin, db: AsyncSession = Depends(get_db)) -> T
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Upgrade the stored hash when PASSWORD_BCRYPT_ROUNDS has changed
+    if new_hash is not None:
+        user.password_hash = new_hash
+        await db.commit()
+        await db.refresh(user)
+
     # Generate tokens
     token_data = {
         "sub": str(user.id),
@@ -230,6 +258,7 @@ async def logout(
         ttl_seconds = max(int(exp_timestamp - current_timestamp), 60)  # Min 60s TTL
 
         await blacklist_service.blacklist_token(access_payload["jti"], ttl_seconds)
+        await invalidate_principal(jti=access_payload["jti"])
 
     # Blacklist refresh token if valid
     if refresh_payload and refresh_payload.get("jti"):
@@ -244,7 +273,7 @@ async def logout(
 
 @router.get("/me", response_model=UserResponse, status_code=status.HTTP_200_OK)
 async def get_current_user_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserResponse:
     """
     Get current authenticated user's profile.
@@ -6,32 +6,38 @@ Issue #176: LLM-based Claim Extraction from Transcriptions and Submitter Comment
 This module provides API endpoints for:
 - Extracting claims from text using LLM
 - Finding similar claims using vector similarity
+- Hybrid full-text + vector search for reviewers
 - Managing claim extraction for submissions
 """
 
 import logging
-from typing import Any
+from typing import Any, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.dependencies import get_current_user
+from app.core.dependencies import get_current_user, require_reviewer
+from app.core.principal_cache import Principal
+from app.models.loading import SUBMISSION_CLAIMS
 from app.models.submission import Submission
-from app.models.user import User
 from app.schemas.claim import (
     ClaimCreate,
     ClaimExtractionRequest,
     ClaimExtractionResponse,
     ClaimResponse,
     ExtractedClaimSchema,
+    HybridSearchRequest,
+    HybridSearchResultSchema,
     SimilarClaimSchema,
 )
 from app.services.claim_service import ClaimService, get_claim
 from app.services.claim_similarity_service import ClaimSimilarityService
-from app.services.embedding_service import EmbeddingService, EmbeddingServiceError
+from app.services.embedding_service import EmbeddingServiceError, get_embedding_batcher
+from app.services.hybrid_search_service import HybridSearchService
 from app.services.llm_claim_extraction_service import LLMClaimExtractionError
+from app.services.search_service import SearchFilters
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +58,7 @@ async def extract_claims_for_submission(
     submission_id: UUID,
     request: ClaimExtractionRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> ClaimExtractionResponse:
     """Extract claims from submission content
 
@@ -65,7 +71,9 @@ async def extract_claims_for_submission(
     Requires: Reviewer or Admin role
     """
     # Verify submission exists
-    submission: Submission | None = await db.get(Submission, submission_id)
+    submission: Submission | None = await db.get(
+        Submission, submission_id, options=SUBMISSION_CLAIMS
+    )
     if not submission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -146,7 +154,7 @@ async def create_claim_for_submission(
     submission_id: UUID,
     claim_data: ClaimCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> ClaimResponse:
     """Manually create a claim and link it to a submission
 
@@ -167,7 +175,9 @@ async def create_claim_for_submission(
         )
 
     # Verify submission exists
-    submission: Submission | None = await db.get(Submission, submission_id)
+    submission: Submission | None = await db.get(
+        Submission, submission_id, options=SUBMISSION_CLAIMS
+    )
     if not submission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -175,11 +185,8 @@ async def create_claim_for_submission(
         )
 
     try:
-        # Initialize embedding service
-        embedding_service: EmbeddingService = EmbeddingService()
-
-        # Generate embedding for the claim
-        embedding: list[float] = await embedding_service.generate_embedding(claim_data.content)
+        # Generate embedding for the claim (coalesced with concurrent requests)
+        embedding: list[float] = await get_embedding_batcher().embed(claim_data.content)
 
         # Create claim using claim service
         from app.models.claim import Claim
@@ -236,7 +243,7 @@ async def create_claim_for_submission(
 async def get_claim_by_id(
     claim_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Any:
     """Get a claim by its ID"""
     claim = await get_claim(db, claim_id)
@@ -265,13 +272,25 @@ async def find_similar_claims(
     claim_id: UUID,
     threshold: float = 0.85,
     limit: int = 5,
+    search_mode: Optional[Literal["ann", "exact"]] = Query(
+        None, description="'ann' (HNSW index) or 'exact' (sequential scan)"
+    ),
+    ef_search: Optional[int] = Query(
+        None, ge=1, le=1000, description="HNSW candidate list size (ANN mode only)"
+    ),
+    probes: Optional[int] = Query(
+        None, ge=1, le=1000, description="IVFFlat lists to probe (ANN mode only)"
+    ),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[SimilarClaimSchema]:
     """Find claims similar to a given claim
 
     Uses pgvector cosine similarity to find semantically similar claims.
     Requires the claim to have an embedding generated.
+
+    By default the approximate HNSW index is used; ef_search/probes trade
+    latency for recall on a per-request basis.
     """
     # Get the claim
     claim = await get_claim(db, claim_id)
@@ -294,6 +313,9 @@ async def find_similar_claims(
         threshold=threshold,
         limit=limit,
         exclude_claim_id=claim_id,
+        search_mode=search_mode,
+        ef_search=ef_search,
+        probes=probes,
     )
 
     return [
@@ -306,6 +328,46 @@ async def find_similar_claims(
     ]
 
 
+@router.post(
+    "/claims/hybrid-search",
+    response_model=list[HybridSearchResultSchema],
+    summary="Hybrid claim search",
+    description=(
+        "Search claims by text with full-text and vector similarity at once, fused with "
+        "reciprocal-rank fusion. Optional workflow state, verdict and date filters. "
+        "Reviewers and admins only."
+    ),
+)
+async def hybrid_search_claims(
+    request: HybridSearchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_reviewer),
+) -> list[HybridSearchResultSchema]:
+    """Find claims matching raw text lexically and semantically
+
+    The text is embedded server-side, so no embedding has to be supplied.
+    Claims found by both rankings come first; lexical_rank and vector_rank
+    show where each result came from.
+    """
+    filters: SearchFilters = SearchFilters(
+        workflow_state=request.workflow_state,
+        verdict=request.verdict,
+        created_from=request.created_from,
+        created_to=request.created_to,
+    )
+    try:
+        hits = await HybridSearchService(db).search(
+            request.query, language=request.language, limit=request.limit, filters=filters
+        )
+    except EmbeddingServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Embedding generation failed: {str(e)}",
+        ) from e
+
+    return [HybridSearchResultSchema.model_validate(hit) for hit in hits]
+
+
 @router.post(
     "/claims/generate-embedding",
     response_model=dict[str, Any],
@@ -314,7 +376,7 @@ async def find_similar_claims(
 )
 async def generate_embedding(
     text: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> dict[str, Any]:
     """Generate an embedding for text content
 
@@ -322,8 +384,7 @@ async def generate_embedding(
     Returns the embedding dimensions and a sample of values.
     """
     try:
-        embedding_service: EmbeddingService = EmbeddingService()
-        embedding: list[float] = await embedding_service.generate_embedding(text)
+        embedding: list[float] = await get_embedding_batcher().embed(text)
 
         return {
             "text_length": len(text),
@@ -26,13 +26,16 @@ routes (like /{correction_id}) to prevent FastAPI from treating path segments as
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import require_admin
+from app.core.pagination import CountMode, InvalidCursorError
+from app.core.principal_cache import Principal
+from app.core.response_cache import CORRECTIONS_LOG, get_response_cache
 from app.models.correction import CorrectionStatus, CorrectionType
-from app.models.user import User
 from app.schemas.correction import (
     CorrectionAllListResponse,
     CorrectionApplicationResponse,
@@ -141,7 +144,7 @@ async def submit_correction(
 )
 async def list_pending_corrections(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> CorrectionPendingListResponse:
     """
     List all pending corrections for admin triage.
@@ -201,7 +204,7 @@ async def list_all_corrections(
         description="Number of corrections to skip for pagination",
     ),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> CorrectionAllListResponse:
     """
     List all corrections with optional filtering and pagination.
@@ -248,6 +251,7 @@ async def list_all_corrections(
     "and update corrections. EFCSN transparency requirement. No auth required.",
 )
 async def get_public_corrections_log(
+    request: Request,
     limit: int = Query(
         100,
         ge=1,
@@ -259,8 +263,16 @@ async def get_public_corrections_log(
         ge=0,
         description="Number of corrections to skip for pagination",
     ),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page (offset is then ignored)",
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total to return: exact, cached, estimated or none",
+    ),
     db: AsyncSession = Depends(get_db),
-) -> PublicLogListResponse:
+) -> Response:
     """
     Get the public corrections log for EFCSN transparency.
 
@@ -274,34 +286,48 @@ async def get_public_corrections_log(
     - Requester email addresses are NOT included in the response
     - Only correction details and resolution notes are shown
 
-    Ordered by reviewed_at date (newest first).
+    Ordered by reviewed_at date (newest first). Follow next_cursor to page
+    through the log; count=cached/estimated/none avoids a full count.
+    Responses are cached until a correction is accepted, rejected or applied.
     """
-    service = CorrectionService(db)
 
-    corrections, total_count = await service.get_public_log(
-        limit=limit,
-        offset=offset,
-    )
-
-    # Convert to privacy-aware response (no requester_email)
-    public_corrections: list[PublicLogCorrectionResponse] = [
-        PublicLogCorrectionResponse(
-            id=c.id,
-            fact_check_id=c.fact_check_id,
-            correction_type=c.correction_type,
-            request_details=c.request_details,
-            status=c.status,
-            reviewed_at=c.reviewed_at,
-            resolution_notes=c.resolution_notes,
-            created_at=c.created_at,
-            updated_at=c.updated_at,
+    async def build() -> PublicLogListResponse:
+        service = CorrectionService(db)
+
+        try:
+            page = await service.get_public_log(
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                count=count,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+        # Convert to privacy-aware response (no requester_email)
+        public_corrections: list[PublicLogCorrectionResponse] = [
+            PublicLogCorrectionResponse(
+                id=c.id,
+                fact_check_id=c.fact_check_id,
+                correction_type=c.correction_type,
+                request_details=c.request_details,
+                status=c.status,
+                reviewed_at=c.reviewed_at,
+                resolution_notes=c.resolution_notes,
+                created_at=c.created_at,
+                updated_at=c.updated_at,
+            )
+            for c in page.items
+        ]
+
+        return PublicLogListResponse(
+            corrections=public_corrections,
+            total_count=page.total,
+            next_cursor=page.next_cursor,
         )
-        for c in corrections
-    ]
 
-    return PublicLogListResponse(
-        corrections=public_corrections,
-        total_count=total_count,
+    return await get_response_cache().respond(
+        request, CORRECTIONS_LOG, settings.RESPONSE_CACHE_CORRECTIONS_LOG_TTL_SECONDS, build
     )
 
 
@@ -424,7 +450,7 @@ async def accept_correction(
     correction_id: UUID,
     review_data: CorrectionReviewRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> CorrectionResponse:
     """
     Accept a correction request.
@@ -473,7 +499,7 @@ async def reject_correction(
     correction_id: UUID,
     review_data: CorrectionReviewRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> CorrectionResponse:
     """
     Reject a correction request.
@@ -523,7 +549,7 @@ async def apply_correction(
     correction_id: UUID,
     apply_data: CorrectionApplyRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> CorrectionApplicationResponse:
     """
     Apply an accepted correction to a fact-check.
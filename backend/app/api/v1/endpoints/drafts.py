@@ -17,7 +17,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.core.principal_cache import Principal
 from app.schemas.draft import DraftResponse, DraftUpdate
 from app.services.draft_service import (
     DraftNotFoundError,
@@ -52,7 +52,7 @@ async def update_draft(
     fact_check_id: UUID,
     draft_data: DraftUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> DraftResponse:
     """
     Save or update draft content for a fact-check.
@@ -103,7 +103,7 @@ Returns `has_draft: false` if no draft exists yet.
 async def retrieve_draft(
     fact_check_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> DraftResponse:
     """
     Retrieve draft content for a fact-check.
@@ -12,8 +12,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import require_admin
+from app.core.principal_cache import Principal
 from app.models.email_template import EmailTemplateType
-from app.models.user import User
 from app.schemas.email_template import (
     EmailTemplateCreate,
     EmailTemplateRenderRequest,
@@ -32,7 +32,7 @@ async def list_templates(
     db: AsyncSession = Depends(get_db),
     include_inactive: bool = False,
     template_type: EmailTemplateType | None = None,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     List all email templates (admin only)
@@ -51,7 +51,7 @@ async def get_template(
     *,
     db: AsyncSession = Depends(get_db),
     template_key: str,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     Get email template by key (admin only)
@@ -73,7 +73,7 @@ async def create_template(
     *,
     db: AsyncSession = Depends(get_db),
     template_in: EmailTemplateCreate,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     Create new email template (admin only)
@@ -107,7 +107,7 @@ async def update_template(
     db: AsyncSession = Depends(get_db),
     template_key: str,
     template_in: EmailTemplateUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     Update email template (admin only)
@@ -139,7 +139,7 @@ async def deactivate_template(
     *,
     db: AsyncSession = Depends(get_db),
     template_key: str,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> None:
     """
     Deactivate email template (admin only)
@@ -159,7 +159,7 @@ async def render_template(
     *,
     db: AsyncSession = Depends(get_db),
     render_request: EmailTemplateRenderRequest,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> Any:
     """
     Preview rendered template with test data (admin only)
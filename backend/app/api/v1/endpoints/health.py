@@ -4,9 +4,15 @@ Health check endpoint
 Provides service health status for monitoring and load balancers
 """
 
+from typing import Any
+
 from fastapi import APIRouter
 
 from app.core.config import settings
+from app.core.http_clients import get_http_client_registry
+from app.core.password_hashing import get_password_hasher
+from app.services.analytics_ingestion_service import get_event_buffer
+from app.services.token_blacklist import get_blacklist_filter
 
 router = APIRouter()
 
@@ -31,3 +37,109 @@ async def health_check() -> dict[str, str]:
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
     }
+
+
+@router.get("/health/upstreams")
+async def upstream_health() -> dict[str, Any]:
+    """
+    Outbound HTTP client statistics
+
+    Returns:
+        Request counts, transport errors, latency and status codes per
+        upstream (Snapchat API and CDN, Wayback Machine, OpenAI) for this
+        process, plus whether HTTP/2 is enabled
+
+    Example response:
+        {
+            "http2": true,
+            "upstreams": {
+                "wayback": {"requests": 12, "errors": 0, "avg_ms": 840.5, ...}
+            }
+        }
+    """
+    registry = get_http_client_registry()
+    return {"http2": registry.http2, "upstreams": registry.metrics_snapshot()}
+
+
+@router.get("/health/password-hashing")
+async def password_hashing_health() -> dict[str, Any]:
+    """
+    Password hashing pool statistics
+
+    Returns:
+        Pool size and queue limit, plus submitted, completed, rejected and
+        rehashed job counts, current and peak queue depth, and average queue
+        wait and bcrypt run time for this process
+
+    Example response:
+        {
+            "max_workers": 2,
+            "queue_limit": 32,
+            "submitted": 120,
+            "rejected": 0,
+            "pending": 1,
+            "avg_wait_ms": 3.1,
+            "avg_run_ms": 248.7,
+            ...
+        }
+    """
+    hasher = get_password_hasher()
+    return {
+        "max_workers": hasher.max_workers,
+        "queue_limit": hasher.queue_limit,
+        **hasher.metrics.snapshot(),
+    }
+
+
+@router.get("/health/token-blacklist")
+async def token_blacklist_health() -> dict[str, Any]:
+    """
+    Token blacklist filter statistics
+
+    Returns:
+        Whether the local bloom filter is in sync (when it is not, every
+        lookup goes to Redis), plus lookups, lookups answered locally, Redis
+        checks and rebuilds for this process
+
+    Example response:
+        {
+            "ready": true,
+            "lookups": 5400,
+            "filtered": 5391,
+            "redis_checks": 9,
+            "rebuilds": 12
+        }
+    """
+    blacklist_filter = get_blacklist_filter()
+    return {"ready": blacklist_filter.ready, **blacklist_filter.metrics.snapshot()}
+
+
+@router.get("/health/analytics-ingestion")
+async def analytics_ingestion_health() -> dict[str, Any]:
+    """
+    Analytics event buffer statistics
+
+    Returns:
+        Events currently buffered and the buffer capacity, plus received,
+        accepted, sampled-out, dropped, written and lost event counts, and
+        batch count, average batch size and average flush time for this process
+
+    Example response:
+        {
+            "buffered": 120,
+            "capacity": 50000,
+            "received": 98000,
+            "accepted": 97880,
+            "dropped": 0,
+            "written": 97760,
+            "avg_batch_size": 488.8,
+            "avg_flush_ms": 14.2,
+            ...
+        }
+    """
+    event_buffer = get_event_buffer()
+    return {
+        "buffered": len(event_buffer),
+        "capacity": event_buffer.capacity,
+        **event_buffer.metrics.snapshot(),
+    }
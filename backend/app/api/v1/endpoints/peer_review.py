@@ -22,9 +22,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import require_admin, require_reviewer
+from app.core.principal_cache import Principal
 from app.models.peer_review import ApprovalStatus, PeerReview
 from app.models.peer_review_trigger import PeerReviewTrigger
-from app.models.user import User
 from app.schemas.peer_review import (
     PeerReviewInitiate,
     PeerReviewInitiateResponse,
@@ -41,6 +41,7 @@ from app.services.peer_review_service import (
     PeerReviewNotFoundError,
     PeerReviewService,
 )
+from app.services.peer_review_trigger_cache import invalidate_peer_review_triggers
 
 router = APIRouter(prefix="/peer-review", tags=["peer-review"])
 
@@ -61,7 +62,7 @@ async def initiate_peer_review(
     fact_check_id: UUID,
     data: PeerReviewInitiate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> PeerReviewInitiateResponse:
     """
     Initiate peer review by assigning reviewers to a fact-check.
@@ -110,7 +111,7 @@ async def submit_peer_review(
     fact_check_id: UUID,
     data: PeerReviewSubmit,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_reviewer),
+    current_user: Principal = Depends(require_reviewer),
 ) -> PeerReviewResponse:
     """
     Submit a peer review decision for a fact-check.
@@ -156,7 +157,7 @@ async def get_peer_review_status(
         description="Minimum number of reviewers required for consensus",
     ),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_reviewer),
+    current_user: Principal = Depends(require_reviewer),
 ) -> PeerReviewStatusResponse:
     """
     Get the peer review status and consensus for a fact-check.
@@ -199,7 +200,7 @@ async def get_peer_review_status(
 )
 async def get_pending_reviews(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_reviewer),
+    current_user: Principal = Depends(require_reviewer),
 ) -> PendingReviewsResponse:
     """
     Get all pending peer reviews assigned to the current user.
@@ -241,7 +242,7 @@ async def get_triggers(
         description="If true, only return enabled triggers",
     ),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TriggerListResponse:
     """
     Get all peer review trigger configurations.
@@ -274,7 +275,7 @@ async def get_triggers(
 async def update_trigger(
     data: TriggerUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TriggerResponse:
     """
     Update a peer review trigger configuration.
@@ -304,6 +305,8 @@ async def update_trigger(
         trigger.description = data.description
 
     await db.commit()
+    # Other API processes drop their compiled triggers too
+    await invalidate_peer_review_triggers()
     await db.refresh(trigger)
 
     return TriggerResponse.model_validate(trigger)
@@ -22,8 +22,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_admin
+from app.core.principal_cache import Principal
 from app.models.rating_definition import RatingDefinition
-from app.models.user import User
 from app.schemas.rating import (
     CurrentRatingResponse,
     RatingCreate,
@@ -154,7 +154,7 @@ class SeedResponse(BaseModel):
 )
 async def seed_rating_definitions(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> SeedResponse:
     """
     Seed the database with EFCSN rating definitions.
@@ -224,7 +224,7 @@ async def create_fact_check_rating(
     fact_check_id: UUID,
     rating_data: RatingCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> RatingResponse:
     """
     Assign a rating to a fact-check.
@@ -12,6 +12,8 @@ from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
+from app.core.principal_cache import Principal
+from app.models.loading import SUBMISSION_LIST
 from app.models.submission import Submission
 from app.models.submission_reviewer import SubmissionReviewer
 from app.models.user import User, UserRole
@@ -25,7 +27,7 @@ from app.schemas.reviewer_assignment import (
 router = APIRouter()
 
 
-def _user_has_permission(user: User, action: str) -> bool:
+def _user_has_permission(user: User | Principal, action: str) -> bool:
     """Check if user has permission for reviewer assignment actions"""
     # Only admins and super_admins can assign/remove reviewers
     if action in ["assign", "remove"]:
@@ -43,11 +45,7 @@ def _user_has_permission(user: User, action: str) -> bool:
 
 async def _get_submission_or_404(db: AsyncSession, submission_id: UUID) -> Submission:
     """Get submission by ID or raise 404"""
-    result = await db.execute(
-        select(Submission)
-        .where(Submission.id == submission_id)
-        .options(selectinload(Submission.reviewer_assignments))
-    )
+    result = await db.execute(select(Submission).where(Submission.id == submission_id))
     submission = result.scalar_one_or_none()
     if not submission:
         raise HTTPException(
@@ -82,7 +80,7 @@ def _format_reviewer_info(assignment: SubmissionReviewer) -> ReviewerInfo:
 async def assign_reviewers(
     submission_id: UUID,
     assignment_data: ReviewerAssignmentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> ReviewerAssignmentResponse:
     """
@@ -95,8 +93,8 @@ async def assign_reviewers(
             detail="You do not have permission to assign reviewers",
         )
 
-    # Get submission
-    submission = await _get_submission_or_404(db, submission_id)
+    # Verify submission exists
+    await _get_submission_or_404(db, submission_id)
 
     # Get existing reviewer IDs from database (fresh query)
     result = await db.execute(
@@ -144,13 +142,11 @@ async def assign_reviewers(
     await db.commit()
 
     # Reload submission with updated assignments
-    await db.refresh(submission)
     result = await db.execute(
         select(Submission)
         .where(Submission.id == submission_id)
-        .options(
-            selectinload(Submission.reviewer_assignments).selectinload(SubmissionReviewer.reviewer)
-        )
+        .options(*SUBMISSION_LIST)
+        .execution_options(populate_existing=True)
     )
     updated_submission = cast(Submission, result.scalar_one())
 
@@ -166,7 +162,7 @@ async def assign_reviewers(
 async def remove_reviewer(
     submission_id: UUID,
     reviewer_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> ReviewerRemoveResponse:
     """
@@ -224,7 +220,7 @@ async def remove_reviewer(
 @router.get("/{submission_id}/reviewers", response_model=list[ReviewerInfo])
 async def get_reviewers(
     submission_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> list[ReviewerInfo]:
     """
@@ -22,8 +22,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_admin
+from app.core.pagination import CountMode, InvalidCursorError
+from app.core.principal_cache import Principal
 from app.models.rtbf_request import RTBFRequestStatus
-from app.models.user import User
 from app.schemas.rtbf import (
     DataExportResponse,
     RTBFRequestCreate,
@@ -48,7 +49,7 @@ router = APIRouter(prefix="/rtbf")
 async def create_rtbf_request(
     request_data: RTBFRequestCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> RTBFRequestResponse:
     """
     Create a new Right to be Forgotten request.
@@ -77,7 +78,7 @@ async def create_rtbf_request(
 )
 async def get_my_rtbf_requests(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[RTBFRequestResponse]:
     """
     Get all RTBF requests for the current user.
@@ -100,8 +101,10 @@ async def list_rtbf_requests(
     status_filter: RTBFRequestStatus | None = None,
     limit: int = 100,
     offset: int = 0,
+    cursor: str | None = None,
+    count: CountMode = CountMode.EXACT,
     db: AsyncSession = Depends(get_db),
-    _admin: User = Depends(require_admin),
+    _admin: Principal = Depends(require_admin),
 ) -> RTBFRequestListResponse:
     """
     List all RTBF requests (admin only).
@@ -111,27 +114,31 @@ async def list_rtbf_requests(
     - **status_filter**: Optional filter by request status
     - **limit**: Maximum number of results (default 100)
     - **offset**: Offset for pagination
+    - **cursor**: next_cursor from the previous page (offset is then ignored)
+    - **count**: Total to return: exact (default), cached, estimated or none
     """
     service: RTBFService = RTBFService(db)
 
-    requests, total = await service.list_all_requests(
-        status=status_filter,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        page = await service.list_all_requests(
+            status=status_filter,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
 
     # Count by status
-    pending_requests = await service.list_pending_requests()
-    pending_count: int = len(pending_requests)
-
-    processing_requests, _ = await service.list_all_requests(status=RTBFRequestStatus.PROCESSING)
-    processing_count: int = len(processing_requests)
+    status_counts = await service.count_by_status()
 
     return RTBFRequestListResponse(
-        items=[RTBFRequestResponse.model_validate(r) for r in requests],
-        total=total,
-        pending_count=pending_count,
-        processing_count=processing_count,
+        items=[RTBFRequestResponse.model_validate(r) for r in page.items],
+        total=page.total,
+        pending_count=status_counts[RTBFRequestStatus.PENDING],
+        processing_count=status_counts[RTBFRequestStatus.PROCESSING],
+        next_cursor=page.next_cursor,
     )
 
 
@@ -144,7 +151,7 @@ async def list_rtbf_requests(
 async def get_rtbf_request(
     request_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> RTBFRequestResponse:
     """
     Get a specific RTBF request.
@@ -181,7 +188,7 @@ async def get_rtbf_request(
 async def process_rtbf_request(
     request_id: UUID,
     db: AsyncSession = Depends(get_db),
-    admin: User = Depends(require_admin),
+    admin: Principal = Depends(require_admin),
 ) -> RTBFRequestProcessResult:
     """
     Process an RTBF request (admin only).
@@ -219,7 +226,7 @@ async def reject_rtbf_request(
     request_id: UUID,
     rejection_data: RTBFRequestRejectInput,
     db: AsyncSession = Depends(get_db),
-    admin: User = Depends(require_admin),
+    admin: Principal = Depends(require_admin),
 ) -> RTBFRequestResponse:
     """
     Reject an RTBF request (admin only).
@@ -256,7 +263,7 @@ async def reject_rtbf_request(
 )
 async def export_my_data(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> DataExportResponse:
     """
     Export user's personal data (GDPR Article 20 - Data Portability).
@@ -289,7 +296,7 @@ async def export_my_data(
 )
 async def get_my_data_summary(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserDataSummary:
     """
     Get a summary of user's data for deletion preview.
@@ -0,0 +1,60 @@
+"""
+Search API endpoints
+
+Ranked full-text search over claims, fact-check verdicts, reasoning and
+drafts, so reviewers can find whether a rumour was already checked (see
+app.services.search_service).
+"""
+
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.dependencies import require_reviewer
+from app.core.pagination import InvalidCursorError
+from app.core.principal_cache import Principal
+from app.schemas.search import SearchResponse, SearchResultSchema
+from app.services.search_service import SearchService
+
+router = APIRouter()
+
+
+@router.get(
+    "/search",
+    response_model=SearchResponse,
+    summary="Search claims and fact-checks",
+    description=(
+        "Full-text search over claim content and fact-check verdicts, reasoning and drafts, "
+        "in Dutch and/or English, with a fuzzy fallback. Reviewers and admins only."
+    ),
+)
+async def search(
+    q: str = Query(..., min_length=1, max_length=500, description="Search text"),
+    language: Optional[Literal["nl", "en"]] = Query(
+        None, description="Parse the query as Dutch or English only (default: both)"
+    ),
+    limit: int = Query(20, ge=1, le=100, description="Maximum results per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(require_reviewer),
+) -> SearchResponse:
+    """Search claims and fact-checks, best matches first
+
+    Results are claims with their latest fact-check. Use web search syntax:
+    "quoted phrases", -excluded words and OR. When nothing matches the
+    words exactly, similar spellings are returned with match="fuzzy".
+    """
+    service: SearchService = SearchService(db)
+    try:
+        page = await service.search(q, language=language, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+    return SearchResponse(
+        query=q,
+        language=language,
+        results=[SearchResultSchema.model_validate(hit) for hit in page.items],
+        next_cursor=page.next_cursor,
+    )
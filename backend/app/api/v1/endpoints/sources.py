@@ -25,7 +25,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import require_reviewer
-from app.models.user import User
+from app.core.principal_cache import Principal
 from app.schemas.source import (
     ArchiveRequest,
     ArchiveResponse,
@@ -76,7 +76,7 @@ async def add_source(
     fact_check_id: UUID,
     source_data: SourceCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_reviewer),
+    current_user: Principal = Depends(require_reviewer),
 ) -> SourceResponse:
     """
     Add a new source to a fact-check.
@@ -203,7 +203,7 @@ async def update_single_source(
     source_id: UUID,
     update_data: SourceUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_reviewer),
+    current_user: Principal = Depends(require_reviewer),
 ) -> SourceResponse:
     """
     Update an existing source.
@@ -231,7 +231,7 @@ async def update_single_source(
 async def delete_single_source(
     source_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_reviewer),
+    current_user: Principal = Depends(require_reviewer),
 ) -> None:
     """
     Delete a source.
@@ -372,7 +372,7 @@ async def get_high_credibility_sources(
 async def archive_source_url(
     archive_request: ArchiveRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_reviewer),
+    current_user: Principal = Depends(require_reviewer),
 ) -> ArchiveResponse:
     """
     Archive a URL via Wayback Machine.
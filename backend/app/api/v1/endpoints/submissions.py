@@ -2,6 +2,7 @@
 Submissions API endpoints
 """
 
+import logging
 from typing import Any, Dict, Optional, Union
 from uuid import UUID
 
@@ -12,11 +13,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
-from app.models.spotlight import SpotlightContent
+from app.core.pagination import CountMode, InvalidCursorError
+from app.core.principal_cache import Principal
+from app.models.loading import SUBMISSION_DETAIL, SUBMISSION_FACT_CHECK
 from app.models.submission import Submission
 from app.models.submission_reviewer import SubmissionReviewer
 from app.models.user import User, UserRole
-from app.schemas.spotlight import SpotlightContentResponse, SpotlightSubmissionCreate
+from app.schemas.spotlight import SpotlightSubmissionAccepted, SpotlightSubmissionCreate
 from app.schemas.submission import (
     SubmissionCreate,
     SubmissionListResponse,
@@ -25,7 +28,8 @@ from app.schemas.submission import (
 )
 from app.schemas.user import UserResponse
 from app.services import submission_service
-from app.services.snapchat import snapchat_service
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -40,7 +44,7 @@ router = APIRouter()
 async def create_submission(
     submission: SubmissionCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> SubmissionWithClaimsResponse:
     """
     Create a new fact-check submission (requires authentication).
@@ -69,7 +73,7 @@ async def create_submission(
 async def get_submission(
     submission_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> SubmissionResponse:
     """
     Get a submission by ID (requires authentication).
@@ -81,7 +85,7 @@ async def get_submission(
     - REVIEWER, ADMIN, SUPER_ADMIN can view any submission
     - Returns 404 if submission not found, 403 if access denied
     """
-    submission = await submission_service.get_submission(db, submission_id)
+    submission = await submission_service.get_submission(db, submission_id, SUBMISSION_DETAIL)
     if not submission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -118,8 +122,14 @@ async def list_submissions(
         None, description="Filter by assignments (reviewers only)"
     ),
     status: Optional[str] = Query(None, description="Filter by submission status"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (page is then ignored)"
+    ),
+    count: CountMode = Query(
+        CountMode.EXACT, description="Total to return: exact, cached, estimated or none"
+    ),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> SubmissionListResponse:
     """
     List submissions with pagination and role-based filtering (requires authentication).
@@ -128,6 +138,8 @@ async def list_submissions(
     - **page_size**: Number of items per page (1-100, default 50)
     - **assigned_to_me**: Filter to show only submissions assigned to the current reviewer
     - **status**: Filter by submission status (pending, processing, completed, rejected)
+    - **cursor**: Continue after the previous page (constant cost at any depth)
+    - **count**: exact (default), cached (reused for a few seconds), estimated, or none
 
     Role-based access:
     - SUBMITTER: Only sees their own submissions
@@ -136,101 +148,87 @@ async def list_submissions(
 
     Returns a paginated list of submissions ordered by creation date (newest first).
     """
-    return await submission_service.list_submissions(
-        db=db,
-        page=page,
-        page_size=page_size,
-        user_id=current_user.id,
-        user_role=current_user.role,
-        assigned_to_me=assigned_to_me,
-        status=status,
-    )
+    try:
+        return await submission_service.list_submissions(
+            db=db,
+            page=page,
+            page_size=page_size,
+            user_id=current_user.id,
+            user_role=current_user.role,
+            assigned_to_me=assigned_to_me,
+            status=status,
+            cursor=cursor,
+            count=count,
+        )
+    except InvalidCursorError as e:
+        # The status query parameter shadows fastapi.status here
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 
 @router.post(
     "/spotlight",
-    response_model=SpotlightContentResponse,
-    status_code=status.HTTP_201_CREATED,
+    response_model=SpotlightSubmissionAccepted,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Submit Snapchat Spotlight content",
-    description="Submit a Snapchat Spotlight link for fact-checking. Fetches metadata and downloads video.",
+    description=(
+        "Submit a Snapchat Spotlight link for fact-checking. Metadata fetch, video download, "
+        "transcription and claim extraction run in the background."
+    ),
 )
 async def create_spotlight_submission(
     spotlight_submission: SpotlightSubmissionCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> SpotlightContentResponse:
+    current_user: Principal = Depends(get_current_user),
+) -> SpotlightSubmissionAccepted:
     """
     Create a new Spotlight submission (requires authentication).
 
     - **spotlight_link**: Full Snapchat Spotlight URL
 
-    This endpoint will:
+    This endpoint only records the submission and queues the ingestion task,
+    which will:
     1. Fetch metadata from Snapchat API via RapidAPI
-    2. Create a submission record
-    3. Download the video to local storage
-    4. Store all metadata in the database
+    2. Download the video to local storage
+    3. Transcribe the audio and extract claims
 
-    Returns the created Spotlight content with all metadata
-    """
-    # Fetch Spotlight data from API
-    spotlight_data = await snapchat_service.fetch_spotlight_data(
-        spotlight_submission.spotlight_link
-    )
+    Progress is visible through the submission's status: fetching,
+    transcribing, extracting_claims, then completed (or failed).
 
-    # Parse metadata
-    parsed_metadata = snapchat_service.parse_spotlight_metadata(spotlight_data)
-
-    # Create submission record
+    Returns the submission ID and the queued task ID, or 503 (leaving the
+    submission failed) if the task cannot be queued
+    """
     submission = Submission(
         user_id=current_user.id,
-        content=f"Snapchat Spotlight: {parsed_metadata.get('creator_name', 'Unknown')} - {spotlight_submission.spotlight_link}",
+        content=f"Snapchat Spotlight: {spotlight_submission.spotlight_link}",
         submission_type="spotlight",
-        status="processing",
+        status="fetching",
     )
     db.add(submission)
-    await db.flush()  # Get submission ID
+    await db.commit()
+    await db.refresh(submission)
 
-    # Download video
-    video_local_path = await snapchat_service.download_video(
-        parsed_metadata["video_url"], parsed_metadata["spotlight_id"]
-    )
+    # Queue ingestion after commit so the worker can see the submission
+    from app.tasks.ingestion_tasks import ingest_spotlight
+
+    try:
+        task = ingest_spotlight.delay(str(submission.id), spotlight_submission.spotlight_link)
+    except Exception as e:
+        # Without a queued task the submission would stay "fetching" forever
+        logger.error(f"Failed to queue Spotlight ingestion for {submission.id}: {e}")
+        submission.status = "failed"
+        submission.ingestion_error = f"Failed to queue ingestion: {e}"
+        await db.commit()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Spotlight ingestion is temporarily unavailable",
+        ) from e
 
-    # Create Spotlight content record
-    spotlight_content = SpotlightContent(
+    return SpotlightSubmissionAccepted(
         submission_id=submission.id,
+        status=submission.status,
         spotlight_link=spotlight_submission.spotlight_link,
-        spotlight_id=parsed_metadata["spotlight_id"],
-        video_url=parsed_metadata["video_url"],
-        video_local_path=video_local_path,
-        thumbnail_url=parsed_metadata["thumbnail_url"],
-        duration_ms=parsed_metadata.get("duration_ms"),
-        width=parsed_metadata.get("width"),
-        height=parsed_metadata.get("height"),
-        creator_username=parsed_metadata.get("creator_username"),
-        creator_name=parsed_metadata.get("creator_name"),
-        creator_url=parsed_metadata.get("creator_url"),
-        view_count=parsed_metadata.get("view_count"),
-        share_count=parsed_metadata.get("share_count"),
-        comment_count=parsed_metadata.get("comment_count"),
-        boost_count=parsed_metadata.get("boost_count"),
-        recommend_count=parsed_metadata.get("recommend_count"),
-        upload_timestamp=parsed_metadata.get("upload_timestamp"),
-        raw_metadata=spotlight_data,
+        task_id=task.id,
     )
-    db.add(spotlight_content)
-
-    # Update submission status
-    submission.status = "completed"
-
-    await db.commit()
-    await db.refresh(spotlight_content)
-
-    # Trigger async transcription task after commit
-    from app.tasks.transcription_tasks import transcribe_spotlight
-
-    transcribe_spotlight.delay(str(spotlight_content.id))
-
-    return SpotlightContentResponse.model_validate(spotlight_content)
 
 
 @router.post(
@@ -249,7 +247,7 @@ async def create_spotlight_submission(
 async def self_assign_as_reviewer(
     submission_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Union[dict[str, str], Response]:
     """
     Self-assign as a reviewer to a submission (requires Reviewer+ role).
@@ -323,7 +321,7 @@ async def assign_reviewer_to_submission(
     submission_id: UUID,
     reviewer_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> dict[str, str]:
     """
     Assign a reviewer to a submission (requires Admin or Super Admin role).
@@ -399,7 +397,7 @@ async def remove_reviewer_from_submission(
     submission_id: UUID,
     reviewer_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> dict[str, str]:
     """
     Remove a reviewer from a submission (requires Admin or Super Admin role).
@@ -451,7 +449,7 @@ async def remove_reviewer_from_submission(
 async def get_submission_reviewers(
     submission_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[UserResponse]:
     """
     Get all reviewers assigned to a submission (requires authentication).
@@ -513,7 +511,7 @@ async def assign_submission_rating(
     submission_id: UUID,
     rating_data: Dict[str, Any],
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> Dict[str, Any]:
     """
     Assign a rating to a submission's fact-check.
@@ -534,7 +532,7 @@ async def assign_submission_rating(
     )
 
     # Get submission to find fact_check_id
-    submission = await submission_service.get_submission(db, submission_id)
+    submission = await submission_service.get_submission(db, submission_id, SUBMISSION_FACT_CHECK)
     if not submission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -640,7 +638,7 @@ async def get_submission_ratings(
     from app.services.rating_service import RatingValidationError, get_rating_history
 
     # Get submission to find fact_check_id
-    submission = await submission_service.get_submission(db, submission_id)
+    submission = await submission_service.get_submission(db, submission_id, SUBMISSION_FACT_CHECK)
     if not submission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -694,7 +692,7 @@ async def get_submission_current_rating(
     from app.services.rating_service import get_current_rating
 
     # Get submission to find fact_check_id
-    submission = await submission_service.get_submission(db, submission_id)
+    submission = await submission_service.get_submission(db, submission_id, SUBMISSION_FACT_CHECK)
     if not submission:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -12,17 +12,22 @@ Endpoints:
 - GET /api/v1/transparency/{slug}/versions - Get version history
 - GET /api/v1/transparency/{slug}/diff/{v1}/{v2} - Get diff between versions
 - POST /api/v1/transparency/{slug}/review - Mark page as reviewed (admin only)
+
+Public GET responses are served from the shared response cache and
+invalidated when a page is updated or reviewed.
 """
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import require_admin
-from app.models.user import User
+from app.core.principal_cache import Principal
+from app.core.response_cache import TRANSPARENCY_PAGES, get_response_cache, invalidate_responses
 from app.schemas.transparency_page import (
     TransparencyPageDiff,
     TransparencyPageListResponse,
@@ -44,17 +49,24 @@ router = APIRouter()
     description="Retrieve a list of all transparency pages. Public endpoint.",
 )
 async def list_transparency_pages(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> TransparencyPageListResponse:
+) -> Response:
     """
     List all transparency pages.
 
     Returns a list of all available transparency pages with their metadata.
     This is a public endpoint - no authentication required.
     """
-    pages = await transparency_page_service.list_all_pages(db)
-    items = [TransparencyPageSummary.model_validate(page) for page in pages]
-    return TransparencyPageListResponse(items=items, total=len(items))
+
+    async def build() -> TransparencyPageListResponse:
+        pages = await transparency_page_service.list_all_pages(db)
+        items = [TransparencyPageSummary.model_validate(page) for page in pages]
+        return TransparencyPageListResponse(items=items, total=len(items))
+
+    return await get_response_cache().respond(
+        request, TRANSPARENCY_PAGES, settings.RESPONSE_CACHE_TRANSPARENCY_PAGES_TTL_SECONDS, build
+    )
 
 
 @router.get(
@@ -66,11 +78,12 @@ async def list_transparency_pages(
 )
 async def get_transparency_page(
     slug: str,
+    request: Request,
     lang: Optional[str] = Query(
         None, description="Language code for response filtering (e.g., 'en', 'nl')"
     ),
     db: AsyncSession = Depends(get_db),
-) -> TransparencyPageResponse:
+) -> Response:
     """
     Get a transparency page by its slug.
 
@@ -80,6 +93,7 @@ async def get_transparency_page(
 
     Args:
         slug: URL-friendly page identifier (e.g., "methodology", "funding")
+        request: Incoming request (cache key and If-None-Match)
         lang: Optional language code for filtering (passed through for frontend use)
         db: Database session
 
@@ -89,15 +103,21 @@ async def get_transparency_page(
     Raises:
         HTTPException 404: If page with given slug is not found
     """
-    page = await transparency_page_service.get_page_by_slug(db, slug, language=lang)
 
-    if page is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Transparency page '{slug}' not found",
-        )
+    async def build() -> TransparencyPageResponse:
+        page = await transparency_page_service.get_page_by_slug(db, slug, language=lang)
 
-    return TransparencyPageResponse.model_validate(page)
+        if page is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Transparency page '{slug}' not found",
+            )
+
+        return TransparencyPageResponse.model_validate(page)
+
+    return await get_response_cache().respond(
+        request, TRANSPARENCY_PAGES, settings.RESPONSE_CACHE_TRANSPARENCY_PAGES_TTL_SECONDS, build
+    )
 
 
 @router.patch(
@@ -111,7 +131,7 @@ async def update_transparency_page(
     slug: str,
     update_data: TransparencyPageUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TransparencyPageResponse:
     """
     Update a transparency page with automatic versioning.
@@ -160,8 +180,9 @@ async def update_transparency_page(
 )
 async def get_version_history(
     slug: str,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> list[TransparencyPageVersionResponse]:
+) -> Response:
     """
     Get the version history for a transparency page.
 
@@ -170,6 +191,7 @@ async def get_version_history(
 
     Args:
         slug: URL-friendly page identifier
+        request: Incoming request (cache key and If-None-Match)
         db: Database session
 
     Returns:
@@ -178,16 +200,22 @@ async def get_version_history(
     Raises:
         HTTPException 404: If page with given slug is not found
     """
-    # First check if page exists
-    page = await transparency_page_service.get_page_by_slug(db, slug)
-    if page is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Transparency page '{slug}' not found",
-        )
 
-    versions = await transparency_page_service.get_version_history(db, slug)
-    return [TransparencyPageVersionResponse.model_validate(v) for v in versions]
+    async def build() -> list[TransparencyPageVersionResponse]:
+        # First check if page exists
+        page = await transparency_page_service.get_page_by_slug(db, slug)
+        if page is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Transparency page '{slug}' not found",
+            )
+
+        versions = await transparency_page_service.get_version_history(db, slug)
+        return [TransparencyPageVersionResponse.model_validate(v) for v in versions]
+
+    return await get_response_cache().respond(
+        request, TRANSPARENCY_PAGES, settings.RESPONSE_CACHE_TRANSPARENCY_PAGES_TTL_SECONDS, build
+    )
 
 
 @router.get(
@@ -201,11 +229,12 @@ async def get_version_diff(
     slug: str,
     v1: int,
     v2: int,
+    request: Request,
     lang: Optional[str] = Query(
         None, description="Language code to filter diff (e.g., 'en', 'nl')"
     ),
     db: AsyncSession = Depends(get_db),
-) -> TransparencyPageDiff:
+) -> Response:
     """
     Generate a diff between two versions of a transparency page.
 
@@ -215,6 +244,7 @@ async def get_version_diff(
         slug: URL-friendly page identifier
         v1: Starting version number (from)
         v2: Ending version number (to)
+        request: Incoming request (cache key and If-None-Match)
         lang: Optional language code to filter diff to specific language
         db: Database session
 
@@ -224,21 +254,27 @@ async def get_version_diff(
     Raises:
         HTTPException 404: If page or versions not found
     """
-    diff_result = await transparency_page_service.generate_diff(
-        db=db,
-        slug=slug,
-        from_version=v1,
-        to_version=v2,
-        language=lang,
-    )
 
-    if diff_result is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Transparency page '{slug}' or version(s) {v1}/{v2} not found",
+    async def build() -> TransparencyPageDiff:
+        diff_result = await transparency_page_service.generate_diff(
+            db=db,
+            slug=slug,
+            from_version=v1,
+            to_version=v2,
+            language=lang,
         )
 
-    return TransparencyPageDiff(**diff_result)
+        if diff_result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Transparency page '{slug}' or version(s) {v1}/{v2} not found",
+            )
+
+        return TransparencyPageDiff(**diff_result)
+
+    return await get_response_cache().respond(
+        request, TRANSPARENCY_PAGES, settings.RESPONSE_CACHE_TRANSPARENCY_PAGES_TTL_SECONDS, build
+    )
 
 
 @router.post(
@@ -251,7 +287,7 @@ async def get_version_diff(
 async def mark_page_reviewed(
     slug: str,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TransparencyPageResponse:
     """
     Mark a transparency page as reviewed for annual EFCSN compliance.
@@ -287,5 +323,6 @@ async def mark_page_reviewed(
 
     await db.commit()
     await db.refresh(page)
+    await invalidate_responses(TRANSPARENCY_PAGES)
 
     return TransparencyPageResponse.model_validate(page)
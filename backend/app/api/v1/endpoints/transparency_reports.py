@@ -10,18 +10,23 @@ Provides endpoints for:
 - Public: Export reports as PDF/CSV
 - Admin: Generate, publish, unpublish reports
 - Admin: Send email notifications
+
+Public responses are served from the shared response cache and invalidated
+when a report is published, unpublished or regenerated.
 """
 
 import logging
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import require_admin
-from app.models.user import User
+from app.core.principal_cache import Principal
+from app.core.response_cache import TRANSPARENCY_REPORTS, get_response_cache
 from app.schemas.transparency_report import (
     TransparencyReportEmailResult,
     TransparencyReportGenerate,
@@ -49,33 +54,43 @@ router = APIRouter(prefix="/reports/transparency", tags=["transparency-reports"]
     description="Returns a list of all published transparency reports (public access).",
 )
 async def list_published_reports(
+    request: Request,
     db: AsyncSession = Depends(get_db),
     limit: int = 24,
-) -> TransparencyReportListResponse:
+) -> Response:
     """
     List all published transparency reports.
 
     This is a public endpoint - no authentication required.
     """
-    service: TransparencyReportService = TransparencyReportService(db)
-    reports = await service.list_reports(published_only=True, limit=limit)
 
-    return TransparencyReportListResponse(
-        reports=[
-            {
-                "id": r.id,
-                "year": r.year,
-                "month": r.month,
-                "title": r.title,
-                "summary": r.summary,
-                "is_published": r.is_published,
-                "generated_at": r.generated_at,
-                "published_at": r.published_at,
-                "created_at": r.created_at,
-            }
-            for r in reports
-        ],
-        total=len(reports),
+    async def build() -> TransparencyReportListResponse:
+        service: TransparencyReportService = TransparencyReportService(db)
+        reports = await service.list_reports(published_only=True, limit=limit)
+
+        return TransparencyReportListResponse(
+            reports=[
+                {
+                    "id": r.id,
+                    "year": r.year,
+                    "month": r.month,
+                    "title": r.title,
+                    "summary": r.summary,
+                    "is_published": r.is_published,
+                    "generated_at": r.generated_at,
+                    "published_at": r.published_at,
+                    "created_at": r.created_at,
+                }
+                for r in reports
+            ],
+            total=len(reports),
+        )
+
+    return await get_response_cache().respond(
+        request,
+        TRANSPARENCY_REPORTS,
+        settings.RESPONSE_CACHE_TRANSPARENCY_REPORTS_TTL_SECONDS,
+        build,
     )
 
 
@@ -87,39 +102,49 @@ async def list_published_reports(
 )
 async def get_published_report(
     report_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> TransparencyReportResponse:
+) -> Response:
     """
     Get a specific published transparency report.
 
     This is a public endpoint - only published reports are accessible.
     """
-    service: TransparencyReportService = TransparencyReportService(db)
-    report = await service.get_report_by_id(report_id)
 
-    if not report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
-        )
-
-    if not report.is_published:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
+    async def build() -> TransparencyReportResponse:
+        service: TransparencyReportService = TransparencyReportService(db)
+        report = await service.get_report_by_id(report_id)
+
+        if not report:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found",
+            )
+
+        if not report.is_published:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found",
+            )
+
+        return TransparencyReportResponse(
+            id=report.id,
+            year=report.year,
+            month=report.month,
+            title=report.title,
+            summary=report.summary,
+            report_data=report.report_data,
+            is_published=report.is_published,
+            generated_at=report.generated_at,
+            published_at=report.published_at,
+            created_at=report.created_at,
         )
 
-    return TransparencyReportResponse(
-        id=report.id,
-        year=report.year,
-        month=report.month,
-        title=report.title,
-        summary=report.summary,
-        report_data=report.report_data,
-        is_published=report.is_published,
-        generated_at=report.generated_at,
-        published_at=report.published_at,
-        created_at=report.created_at,
+    return await get_response_cache().respond(
+        request,
+        TRANSPARENCY_REPORTS,
+        settings.RESPONSE_CACHE_TRANSPARENCY_REPORTS_TTL_SECONDS,
+        build,
     )
 
 
@@ -130,6 +155,7 @@ async def get_published_report(
 )
 async def export_report_csv(
     report_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> Response:
     """
@@ -137,29 +163,38 @@ async def export_report_csv(
 
     This is a public endpoint - only published reports can be exported.
     """
-    service: TransparencyReportService = TransparencyReportService(db)
-    report = await service.get_report_by_id(report_id)
 
-    if not report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
-        )
+    async def build() -> Response:
+        service: TransparencyReportService = TransparencyReportService(db)
+        report = await service.get_report_by_id(report_id)
 
-    if not report.is_published:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
-        )
+        if not report:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found",
+            )
+
+        if not report.is_published:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found",
+            )
+
+        csv_content: str = await service.export_to_csv(report_id)
 
-    csv_content: str = await service.export_to_csv(report_id)
+        filename: str = f"transparency_report_{report.year}_{report.month:02d}.csv"
 
-    filename: str = f"transparency_report_{report.year}_{report.month:02d}.csv"
+        return Response(
+            content=csv_content,
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
 
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    return await get_response_cache().respond(
+        request,
+        TRANSPARENCY_REPORTS,
+        settings.RESPONSE_CACHE_TRANSPARENCY_REPORTS_TTL_SECONDS,
+        build,
     )
 
 
@@ -170,6 +205,7 @@ async def export_report_csv(
 )
 async def export_report_pdf(
     report_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> Response:
     """
@@ -177,29 +213,38 @@ async def export_report_pdf(
 
     This is a public endpoint - only published reports can be exported.
     """
-    service: TransparencyReportService = TransparencyReportService(db)
-    report = await service.get_report_by_id(report_id)
 
-    if not report:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
-        )
+    async def build() -> Response:
+        service: TransparencyReportService = TransparencyReportService(db)
+        report = await service.get_report_by_id(report_id)
 
-    if not report.is_published:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Report not found",
-        )
+        if not report:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found",
+            )
 
-    pdf_content: bytes = await service.export_to_pdf(report_id)
+        if not report.is_published:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Report not found",
+            )
 
-    filename: str = f"transparency_report_{report.year}_{report.month:02d}.pdf"
+        pdf_content: bytes = await service.export_to_pdf(report_id)
+
+        filename: str = f"transparency_report_{report.year}_{report.month:02d}.pdf"
+
+        return Response(
+            content=pdf_content,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
 
-    return Response(
-        content=pdf_content,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    return await get_response_cache().respond(
+        request,
+        TRANSPARENCY_REPORTS,
+        settings.RESPONSE_CACHE_TRANSPARENCY_REPORTS_TTL_SECONDS,
+        build,
     )
 
 
@@ -216,7 +261,7 @@ async def export_report_pdf(
 )
 async def admin_list_all_reports(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     limit: int = 50,
 ) -> TransparencyReportListResponse:
     """
@@ -256,7 +301,7 @@ async def admin_list_all_reports(
 async def generate_report(
     request: TransparencyReportGenerate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TransparencyReportResponse:
     """
     Generate a transparency report for a specific month.
@@ -298,7 +343,7 @@ async def generate_report(
 async def publish_report(
     report_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TransparencyReportResponse:
     """
     Publish a transparency report.
@@ -340,7 +385,7 @@ async def publish_report(
 async def unpublish_report(
     report_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TransparencyReportResponse:
     """
     Unpublish a transparency report.
@@ -382,7 +427,7 @@ async def unpublish_report(
 async def send_report_email(
     report_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TransparencyReportEmailResult:
     """
     Send report email notifications to all admin users.
@@ -418,7 +463,7 @@ async def send_report_email(
 )
 async def trigger_report_generation(
     request: TriggerReportGeneration,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
 ) -> TriggerReportResponse:
     """
     Trigger report generation via Celery task.
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, require_admin, require_super_admin
+from app.core.principal_cache import Principal, invalidate_principal
 from app.models.user import User, UserRole
 from app.schemas.user import UserResponse, UserRoleUpdate, UserUpdate
 
@@ -18,7 +19,7 @@ router = APIRouter()
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_user_info(current_user: Principal = Depends(get_current_user)) -> Principal:
     """
     Get current authenticated user's information.
 
@@ -33,7 +34,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user))
 
 @router.get("", response_model=List[UserResponse])
 async def list_users(
-    current_user: User = Depends(require_admin), db: AsyncSession = Depends(get_db)
+    current_user: Principal = Depends(require_admin), db: AsyncSession = Depends(get_db)
 ) -> list[User]:
     """
     List all users (admin+ only).
@@ -53,7 +54,7 @@ async def list_users(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
@@ -98,7 +99,7 @@ async def get_user(
 async def update_user_role(
     user_id: UUID,
     role_update: UserRoleUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
@@ -150,6 +151,7 @@ async def update_user_role(
     target_user.role = role_update.role
     await db.commit()
     await db.refresh(target_user)
+    await invalidate_principal(user_id=target_user.id)
 
     return target_user
 
@@ -158,7 +160,7 @@ async def update_user_role(
 async def update_user(
     user_id: UUID,
     user_update: UserUpdate,
-    current_user: User = Depends(require_admin),
+    current_user: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
@@ -208,6 +210,7 @@ async def update_user(
 
     await db.commit()
     await db.refresh(target_user)
+    await invalidate_principal(user_id=target_user.id)
 
     return target_user
 
@@ -215,7 +218,7 @@ async def update_user(
 @router.delete("/{user_id}")
 async def delete_user(
     user_id: UUID,
-    current_user: User = Depends(require_super_admin),
+    current_user: Principal = Depends(require_super_admin),
     db: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
     """
@@ -248,5 +251,6 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    await invalidate_principal(user_id=user_id)
 
     return {"message": "User deleted successfully"}
@@ -20,7 +20,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
-from app.models.user import User
+from app.core.principal_cache import Principal
 from app.models.workflow_transition import WorkflowState
 from app.services.workflow_service import (
     InvalidTransitionError,
@@ -109,7 +109,7 @@ async def perform_transition(
     submission_id: UUID,
     request: TransitionRequest,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> TransitionResponse:
     """
     Perform a workflow state transition.
@@ -171,7 +171,7 @@ async def perform_transition(
 async def get_transition_history(
     submission_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[WorkflowHistoryItem]:
     """
     Get the complete workflow transition history for a submission.
@@ -216,7 +216,7 @@ async def get_transition_history(
 async def get_current_workflow_state(
     submission_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> CurrentStateResponse:
     """
     Get the current workflow state for a submission.
@@ -16,6 +16,7 @@ from app.api.v1.endpoints import (
     ratings,
     reviewer_assignments,
     rtbf,
+    search,
     sources,
     submissions,
     transparency,
@@ -48,3 +49,4 @@ api_router.include_router(rtbf.router, tags=["rtbf"])
 api_router.include_router(analytics.router, tags=["analytics"])
 api_router.include_router(transparency_reports.router, tags=["transparency-reports"])
 api_router.include_router(claims.router, tags=["claims"])
+api_router.include_router(search.router, tags=["search"])
@@ -0,0 +1,57 @@
+"""
+Bloom filter for fast in-process negative membership checks
+
+A bloom filter answers "definitely not present" or "possibly present" using
+a fixed bit array and never returns false negatives. Used to skip Redis
+lookups for values that were never added (see app.services.token_blacklist).
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings
+
+    Attributes:
+        capacity: Number of items the filter is sized for
+        error_rate: False positive rate at capacity
+        size: Number of bits
+        hash_count: Number of bit positions per item
+        count: Number of items added
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Initialize an empty filter
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: Target false positive rate at capacity (0 < rate < 1)
+        """
+        self.capacity: int = max(1, capacity)
+        self.error_rate: float = error_rate
+        self.size: int = max(
+            8, math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self.hash_count: int = max(1, round(self.size / self.capacity * math.log(2)))
+        self.count: int = 0
+        self._bits: bytearray = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str) -> list[int]:
+        """Return the bit positions of an item (Kirsch-Mitzenmacher double hashing)"""
+        digest: bytes = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1: int = int.from_bytes(digest[:8], "little")
+        h2: int = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, item: str) -> None:
+        """Add an item"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """Return False if the item was definitely never added"""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item)
+        )
@@ -6,8 +6,11 @@ Used for email queuing, scheduled tasks, and background jobs
 Issue #89: Added report_tasks for automated monthly transparency reports
 """
 
+from typing import Any
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 from app.core.config import settings
 
@@ -22,6 +25,7 @@ celery_app = Celery(
         "app.tasks.report_tasks",  # Issue #89: Monthly transparency reports
         "app.tasks.transcription_tasks",  # Issue #175: Audio transcription
         "app.tasks.claim_extraction_tasks",  # Issue #176: Claim extraction
+        "app.tasks.ingestion_tasks",  # Background Spotlight ingestion
     ],
 )
 
@@ -38,6 +42,7 @@ celery_app.conf.update(
         "app.tasks.report_tasks.*": {"queue": "reports"},  # Issue #89
         "app.tasks.transcription_tasks.*": {"queue": "transcription"},  # Issue #175
         "app.tasks.claim_extraction_tasks.*": {"queue": "claim_extraction"},  # Issue #176
+        "app.tasks.ingestion_tasks.*": {"queue": "ingestion"},
     },
     task_acks_late=True,  # Acknowledge after task completion
     worker_prefetch_multiplier=1,  # Process one task at a time per worker
@@ -56,6 +61,12 @@ celery_app.conf.beat_schedule = {
         # "schedule": crontab(hour=2, minute=0),  # Run daily at 2 AM UTC
         "options": {"queue": "maintenance"},
     },
+    # Monthly analytics_events partitions: create ahead, drop expired
+    "analytics-partitions-daily": {
+        "task": "app.tasks.retention_tasks.maintain_analytics_partitions",
+        "schedule": crontab(hour=1, minute=0),
+        "options": {"queue": "maintenance"},
+    },
     # Issue #89: Monthly transparency report generation
     # Runs on the 1st day of each month at 3 AM UTC
     "generate-monthly-transparency-report": {
@@ -68,3 +79,11 @@ celery_app.conf.beat_schedule = {
         "options": {"queue": "reports"},
     },
 }
+
+
+@worker_process_init.connect
+def init_worker_http_clients(**kwargs: Any) -> None:
+    """Give each forked worker process its own outbound HTTP client registry"""
+    from app.core.http_clients import init_http_client_registry
+
+    init_http_client_registry()
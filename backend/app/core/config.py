@@ -25,28 +25,96 @@ class Settings(BaseSettings):
     )
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
+    PAGINATION_COUNT_CACHE_SECONDS: int = 30  # Reuse count=cached listing totals; 0 disables
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Response cache for public and analytics GET endpoints (see app.core.response_cache)
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TRANSPARENCY_PAGES_TTL_SECONDS: int = 600  # Invalidated on page update
+    RESPONSE_CACHE_TRANSPARENCY_REPORTS_TTL_SECONDS: int = 3600  # Invalidated on (un)publish
+    RESPONSE_CACHE_CORRECTIONS_LOG_TTL_SECONDS: int = 300  # Invalidated on correction review
+    RESPONSE_CACHE_ANALYTICS_TTL_SECONDS: int = 60  # Also bounds staleness of live counts
+    RESPONSE_CACHE_LOCK_SECONDS: float = 30.0  # Single-flight lock held while recomputing
+    RESPONSE_CACHE_LOCK_WAIT_SECONDS: float = 10.0  # Wait for another process's recomputation
+
+    # Transparency page diffs (see app.services.transparency_page_service)
+    TRANSPARENCY_DIFF_CACHE_MAX_ENTRIES: int = 1000  # Computed version-range diffs per process
+    TRANSPARENCY_DIFF_MAX_LINES: int = 5000  # Longer texts are diffed as a whole replacement
+
+    # Analytics event ingestion (see app.services.analytics_ingestion_service)
+    ANALYTICS_INGEST_BUFFER_CAPACITY: int = 50000  # Events held per API process before dropping
+    ANALYTICS_INGEST_BATCH_SIZE: int = 1000  # Events per bulk write (COPY or multi-row INSERT)
+    ANALYTICS_INGEST_FLUSH_INTERVAL_SECONDS: float = 2.0  # Longest a partial batch waits
+    ANALYTICS_INGEST_SAMPLE_ABOVE: float = 0.8  # Buffer fill ratio at which views are sampled
+    ANALYTICS_INGEST_SAMPLE_RATE: float = 0.1  # Share of view events kept while sampling
+
     # Security
     SECRET_KEY: str = "your-secret-key-change-in-production"
     JWT_SECRET_KEY: str = "your-jwt-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # Changing this rehashes passwords on next login
+    PASSWORD_HASH_MAX_WORKERS: int = 2  # Threads hashing passwords per API process
+    PASSWORD_HASH_QUEUE_LIMIT: int = 32  # Pending hash jobs before logins get 503
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30.0  # Reuse a resolved user per token; 0 disables
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000  # Cached (user, token) pairs per API process
+    TOKEN_BLACKLIST_FILTER_ENABLED: bool = True  # Local bloom filter in front of Redis lookups
+    TOKEN_BLACKLIST_FILTER_CAPACITY: int = 100000  # Minimum JTIs the filter is sized for
+    TOKEN_BLACKLIST_FILTER_ERROR_RATE: float = 0.001  # Share of misses still checked in Redis
+    TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS: float = 60.0  # Full rebuild from a Redis scan
+
+    # Outbound HTTP clients (shared pools per upstream, see app.core.http_clients)
+    HTTP_CLIENT_HTTP2: bool = True  # Negotiate HTTP/2 with upstreams (h2 comes with httpx[http2])
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    SNAPCHAT_API_TIMEOUT_SECONDS: float = 30.0
+    SNAPCHAT_API_MAX_CONNECTIONS: int = 10
+    SNAPCHAT_MEDIA_TIMEOUT_SECONDS: float = 60.0
+    SNAPCHAT_MEDIA_MAX_CONNECTIONS: int = 20
+    WAYBACK_TIMEOUT_SECONDS: float = 30.0
+    WAYBACK_MAX_CONNECTIONS: int = 5
+    OPENAI_HTTP_TIMEOUT_SECONDS: float = 600.0  # Matches the OpenAI SDK default
+    OPENAI_MAX_CONNECTIONS: int = 20
 
     # External APIs
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_WHISPER_MODEL: str = "whisper-1"  # Issue #175: Whisper model for transcription
+    WHISPER_MAX_CONCURRENCY: int = 4  # Concurrent Whisper API calls per ingestion worker process
+    WHISPER_REQUEST_TIMEOUT_SECONDS: float = 300.0  # Per-request Whisper API timeout
+    SPOTLIGHT_DOWNLOAD_VIDEO: bool = False  # Archive ingested videos; transcription streams
+    TRANSCRIPTION_STREAM_AUDIO: bool = True  # Pipe remote video into FFmpeg instead of yt-dlp
+    TRANSCRIPTION_CHUNK_MAX_SECONDS: float = 600.0  # Longer audio is split and sent in parallel
+    TRANSCRIPTION_CHUNK_MIN_SECONDS: float = 60.0  # Shortest chunk when cutting at a silence
+    TRANSCRIPTION_SILENCE_THRESHOLD_DB: float = -35.0  # silencedetect noise floor
+    TRANSCRIPTION_SILENCE_MIN_SECONDS: float = 0.5  # Minimum silence length to cut at
     OPENAI_GPT_MODEL: str = "gpt-4-turbo-preview"  # Issue #176: GPT model for claim extraction
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"  # Issue #176: Embedding model
     OPENAI_EMBEDDING_DIMENSIONS: int = 1536  # text-embedding-3-small dimensions
+    EMBEDDING_COALESCE_WINDOW_MS: int = 10  # Wait for concurrent embedding requests to batch
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10000  # In-process LRU tier (~6 KB per entry)
+    EMBEDDING_CACHE_TTL_SECONDS: int = 604800  # 7 days
+    EMBEDDING_CACHE_REDIS_ENABLED: bool = True  # Shared Redis tier across workers
     BENEDMO_API_KEY: Optional[str] = None
 
     # Claim Extraction Settings (Issue #176)
     CLAIM_EXTRACTION_MAX_CLAIMS: int = 10  # Maximum claims to extract per submission
     CLAIM_SIMILARITY_THRESHOLD: float = 0.85  # Cosine similarity threshold for deduplication
+    CLAIM_SIMILARITY_SEARCH_MODE: str = "ann"  # "ann" (HNSW index) or "exact" (sequential scan)
+    CLAIM_SIMILARITY_HNSW_EF_SEARCH: int = 40  # HNSW candidate list size (pgvector default: 40)
+    CLAIM_SIMILARITY_IVFFLAT_PROBES: int = 1  # IVFFlat lists probed (pgvector default: 1)
+
+    # Peer review triggers (see app.services.peer_review_trigger_cache)
+    PEER_REVIEW_TRIGGER_CACHE_TTL_SECONDS: int = (
+        300  # Bounds staleness if an invalidation is missed
+    )
+
+    # Full-text search (see app.services.search_service)
+    SEARCH_FUZZY_THRESHOLD: float = 0.5  # pg_trgm word similarity for the fuzzy fallback
+    HYBRID_SEARCH_CANDIDATES: int = 50  # Results taken from each ranking before fusion
+    HYBRID_SEARCH_RRF_K: int = 60  # Reciprocal-rank fusion constant (higher flattens ranks)
+    HYBRID_SEARCH_MIN_SIMILARITY: float = 0.3  # Cosine similarity floor for vector candidates
 
     # CORS Configuration
     CORS_ORIGINS: str = "http://localhost:3000,https://ans.postxsociety.cloud"
@@ -69,6 +137,8 @@ class Settings(BaseSettings):
     RETENTION_DRAFT_EVIDENCE_DAYS: int = 730  # 2 years
     RETENTION_REJECTED_CLAIMS_DAYS: int = 365  # 1 year
     RETENTION_CORRECTION_REQUESTS_DAYS: int = 1095  # 3 years
+    RETENTION_ANALYTICS_EVENTS_DAYS: int = 760  # 25 months, for year-over-year comparisons
+    ANALYTICS_PARTITION_PREMAKE_MONTHS: int = 3  # Monthly analytics_events partitions made ahead
 
     @property
     def cors_origins_list(self) -> list[str]:
@@ -2,9 +2,16 @@
 Database configuration and session management
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from typing import Any, AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
 
 from app.core.config import settings
@@ -44,3 +51,33 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def run_concurrently(
+    db: AsyncSession, *queries: Callable[[AsyncSession], Awaitable[Any]]
+) -> list[Any]:
+    """
+    Run read-only queries concurrently, each on its own pooled connection.
+
+    Sessions are opened on the engine behind db, so they only see committed
+    data. Falls back to running the queries one after another on db when the
+    session is bound to a single connection.
+
+    Args:
+        db: Session whose engine the queries run on
+        queries: Callables taking a session and returning a result
+
+    Returns:
+        Results in the order of the queries
+    """
+    bind: Any = db.bind
+    if not isinstance(bind, AsyncEngine):
+        return [await query(db) for query in queries]
+
+    session_factory = async_sessionmaker(bind, expire_on_commit=False)
+
+    async def run(query: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with session_factory() as session:
+            return await query(session)
+
+    return list(await asyncio.gather(*(run(query) for query in queries)))
@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.principal_cache import Principal, get_principal_cache
 from app.core.redis import get_redis
 from app.core.security import decode_token
 from app.models.user import User, UserRole
@@ -20,15 +21,46 @@ from app.services.token_blacklist import TokenBlacklistService
 security = HTTPBearer()
 
 
+async def _check_not_blacklisted(redis: Any, jti: str) -> None:
+    """Reject tokens that were blacklisted on logout
+
+    Raises:
+        HTTPException: 401 if the token is blacklisted
+    """
+    blacklist_service = TokenBlacklistService(redis)
+    if await blacklist_service.is_token_blacklisted(jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been blacklisted (logged out)",
+        )
+
+
+async def _load_principal(db: AsyncSession, user_id: UUID) -> Principal:
+    """Load the columns of a Principal without the User relationships
+
+    Raises:
+        HTTPException: 401 if user not found
+    """
+    stmt = select(
+        User.id, User.email, User.role, User.is_active, User.created_at, User.updated_at
+    ).where(User.id == user_id)
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    return Principal(*row)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
     redis: Any = Depends(get_redis),
-) -> User:
+) -> Principal:
     """
     Get current authenticated user from JWT token.
 
     Security: Checks if token is blacklisted (logged out) before accepting.
+    Principals resolved for a token are cached briefly (see
+    app.core.principal_cache), so repeat requests skip Redis and the database.
 
     Args:
         credentials: HTTP Bearer token credentials
@@ -36,7 +68,7 @@ async def get_current_user(
         redis: Redis client for blacklist checking
 
     Returns:
-        User: Authenticated user object
+        Principal: Authenticated user
 
     Raises:
         HTTPException: 401 if token is invalid, blacklisted, or user not found
@@ -49,35 +81,30 @@ async def get_current_user(
         if not payload:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-        # Check if token is blacklisted (logged out)
-        jti = payload.get("jti")
-        if jti:
-            blacklist_service = TokenBlacklistService(redis)
-            is_blacklisted = await blacklist_service.is_token_blacklisted(jti)
-            if is_blacklisted:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token has been blacklisted (logged out)",
-                )
-
         user_id = payload.get("sub")
         if not user_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload"
             )
 
-        stmt = select(User).where(User.id == UUID(user_id))
-        result = await db.execute(stmt)
-        user = result.scalar_one_or_none()
+        jti = payload.get("jti")
+        cache = get_principal_cache()
+        if jti:
+            cached = cache.get(UUID(user_id), jti)
+            if cached is not None:
+                return cached
 
-        if not user:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
-        if not user.is_active:
+            await _check_not_blacklisted(redis, jti)
+
+        principal = await _load_principal(db, UUID(user_id))
+        if not principal.is_active:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="User account is inactive"
             )
 
-        return user
+        if jti:
+            cache.set(jti, principal)
+        return principal
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials"
@@ -90,7 +117,7 @@ async def get_current_user(
         ) from e
 
 
-def require_role(*allowed_roles: UserRole) -> Callable[..., Awaitable[User]]:
+def require_role(*allowed_roles: UserRole) -> Callable[..., Awaitable[Principal]]:
     """
     Dependency factory to require specific roles.
 
@@ -102,11 +129,11 @@ def require_role(*allowed_roles: UserRole) -> Callable[..., Awaitable[User]]:
 
     Example:
         @router.get("/admin-only")
-        async def admin_endpoint(user: User = Depends(require_role(UserRole.ADMIN))):
+        async def admin_endpoint(user: Principal = Depends(require_role(UserRole.ADMIN))):
             pass
     """
 
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    async def role_checker(current_user: Principal = Depends(get_current_user)) -> Principal:
         if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
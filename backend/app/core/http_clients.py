@@ -0,0 +1,318 @@
+"""
+Shared outbound HTTP clients
+
+One pooled httpx.AsyncClient per upstream (RapidAPI, Snapchat CDN, Wayback
+Machine, OpenAI) so that keep-alive connections and TLS sessions are reused
+across calls instead of being set up for every request. Each upstream has its
+own connection limits and timeouts, and request counts and latencies are
+recorded per upstream.
+
+Like the Redis client, pooled connections belong to the event loop they were
+opened on. The API process runs one loop, so its clients live for the whole
+application (opened and closed in the FastAPI lifespan). Most Celery tasks
+run a fresh loop per task (asyncio.run), so workers get one set of clients per
+task loop, closed (together with the loop's Redis client) with
+closing_http_clients() before the loop ends. Ingestion and transcription
+tasks share one long-lived loop per worker process (app.core.task_loop) and
+keep its clients open.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+import weakref
+from collections import Counter
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Optional, TypeVar
+
+import httpx
+
+from app.core.config import settings
+from app.core.redis import close_redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Upstream names
+UPSTREAM_SNAPCHAT_API = "snapchat_api"  # RapidAPI metadata lookups
+UPSTREAM_SNAPCHAT_MEDIA = "snapchat_media"  # Video downloads from the Snapchat CDN
+UPSTREAM_WAYBACK = "wayback"  # Internet Archive Wayback Machine
+UPSTREAM_OPENAI = "openai"  # Whisper, chat completions and embeddings
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    """Connection settings for one upstream"""
+
+    timeout_seconds: float
+    max_connections: int
+    connect_timeout_seconds: float = 5.0
+    follow_redirects: bool = False
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        """httpx timeout with a separate connect limit"""
+        return httpx.Timeout(self.timeout_seconds, connect=self.connect_timeout_seconds)
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Pool limits; every connection may be kept alive"""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+
+
+@dataclass
+class UpstreamMetrics:
+    """Request statistics for one upstream (per process)"""
+
+    requests: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    status_codes: Counter[int] = field(default_factory=Counter)
+
+    def record(self, elapsed: float, status_code: Optional[int]) -> None:
+        """Record a finished request
+
+        Args:
+            elapsed: Seconds until the response headers arrived (or the error)
+            status_code: HTTP status, or None for a transport error
+        """
+        self.requests += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        if status_code is None:
+            self.errors += 1
+        else:
+            self.status_codes[status_code] += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dict"""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "avg_ms": round(self.total_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "status_codes": {str(code): count for code, count in sorted(self.status_codes.items())},
+        }
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that records latency and outcome per request"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, metrics: UpstreamMetrics) -> None:
+        self._transport = transport
+        self._metrics = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started: float = time.perf_counter()
+        try:
+            response: httpx.Response = await self._transport.handle_async_request(request)
+        except Exception:
+            self._metrics.record(time.perf_counter() - started, None)
+            raise
+        self._metrics.record(time.perf_counter() - started, response.status_code)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def http2_available() -> bool:
+    """Check whether the optional h2 package (httpx[http2]) is installed"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def default_upstream_configs() -> dict[str, UpstreamConfig]:
+    """Build the upstream configurations from settings
+
+    Returns:
+        Mapping of upstream name to its connection settings
+    """
+    connect_timeout: float = settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS
+    return {
+        UPSTREAM_SNAPCHAT_API: UpstreamConfig(
+            timeout_seconds=settings.SNAPCHAT_API_TIMEOUT_SECONDS,
+            max_connections=settings.SNAPCHAT_API_MAX_CONNECTIONS,
+            connect_timeout_seconds=connect_timeout,
+        ),
+        UPSTREAM_SNAPCHAT_MEDIA: UpstreamConfig(
+            timeout_seconds=settings.SNAPCHAT_MEDIA_TIMEOUT_SECONDS,
+            max_connections=settings.SNAPCHAT_MEDIA_MAX_CONNECTIONS,
+            connect_timeout_seconds=connect_timeout,
+            follow_redirects=True,
+        ),
+        UPSTREAM_WAYBACK: UpstreamConfig(
+            timeout_seconds=settings.WAYBACK_TIMEOUT_SECONDS,
+            max_connections=settings.WAYBACK_MAX_CONNECTIONS,
+            connect_timeout_seconds=connect_timeout,
+        ),
+        UPSTREAM_OPENAI: UpstreamConfig(
+            timeout_seconds=settings.OPENAI_HTTP_TIMEOUT_SECONDS,
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            connect_timeout_seconds=connect_timeout,
+        ),
+    }
+
+
+class HttpClientRegistry:
+    """Per-upstream pooled httpx clients, one set per event loop
+
+    Attributes:
+        configs: Connection settings per upstream
+        http2: Whether clients negotiate HTTP/2 (needs the h2 package)
+        metrics: Request statistics per upstream, shared by all loops
+    """
+
+    def __init__(
+        self,
+        configs: Optional[dict[str, UpstreamConfig]] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        """Initialize the registry
+
+        Args:
+            configs: Upstream settings (defaults to default_upstream_configs())
+            http2: Enable HTTP/2 (defaults to HTTP_CLIENT_HTTP2 when h2 is installed)
+            transport: Base transport for every client, used by tests instead
+                of opening real connections
+        """
+        self.configs: dict[str, UpstreamConfig] = (
+            configs if configs is not None else default_upstream_configs()
+        )
+        if http2 is None:
+            http2 = settings.HTTP_CLIENT_HTTP2 and http2_available()
+            if settings.HTTP_CLIENT_HTTP2 and not http2:
+                logger.warning("HTTP_CLIENT_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        self.http2: bool = http2
+        self.metrics: dict[str, UpstreamMetrics] = {
+            name: UpstreamMetrics() for name in self.configs
+        }
+        self._transport: Optional[httpx.AsyncBaseTransport] = transport
+        self._clients: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, httpx.AsyncClient]]"
+        ) = weakref.WeakKeyDictionary()
+
+    def get(self, upstream: str) -> httpx.AsyncClient:
+        """Get the pooled client for an upstream on the running event loop
+
+        Args:
+            upstream: Upstream name (one of the UPSTREAM_* constants)
+
+        Returns:
+            Shared httpx.AsyncClient; callers must not close it
+
+        Raises:
+            KeyError: If the upstream is not configured
+            RuntimeError: If called outside a running event loop
+        """
+        config: UpstreamConfig = self.configs[upstream]
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        clients: dict[str, httpx.AsyncClient] = self._clients.setdefault(loop, {})
+        client: Optional[httpx.AsyncClient] = clients.get(upstream)
+        if client is None or client.is_closed:
+            client = self._build_client(upstream, config)
+            clients[upstream] = client
+        return client
+
+    def _build_client(self, upstream: str, config: UpstreamConfig) -> httpx.AsyncClient:
+        """Create a pooled client for one upstream"""
+        base_transport: httpx.AsyncBaseTransport = self._transport or httpx.AsyncHTTPTransport(
+            http2=self.http2, limits=config.limits
+        )
+        return httpx.AsyncClient(
+            transport=InstrumentedTransport(base_transport, self.metrics[upstream]),
+            timeout=config.timeout,
+            follow_redirects=config.follow_redirects,
+        )
+
+    async def open(self) -> None:
+        """Create every upstream client on the running loop ahead of first use"""
+        for upstream in self.configs:
+            self.get(upstream)
+        logger.info(
+            f"Opened HTTP clients for {', '.join(self.configs)} (http2={'on' if self.http2 else 'off'})"
+        )
+
+    async def aclose(self) -> None:
+        """Close the running loop's clients and their pooled connections"""
+        clients: dict[str, httpx.AsyncClient] = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+    def metrics_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return request statistics for every upstream"""
+        return {name: metrics.snapshot() for name, metrics in self.metrics.items()}
+
+
+# Process-wide registry (created lazily or by init_http_client_registry)
+_registry: Optional[HttpClientRegistry] = None
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Get or create the HttpClientRegistry singleton
+
+    Returns:
+        HttpClientRegistry instance
+    """
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry()
+    return _registry
+
+
+def init_http_client_registry() -> HttpClientRegistry:
+    """Create a fresh registry for this process
+
+    Called from the Celery worker_process_init signal so that forked worker
+    processes never inherit the parent's clients or metrics.
+
+    Returns:
+        The new HttpClientRegistry
+    """
+    global _registry
+    _registry = HttpClientRegistry()
+    return _registry
+
+
+def get_http_client(upstream: str) -> httpx.AsyncClient:
+    """Get the shared pooled client for an upstream
+
+    Args:
+        upstream: Upstream name (one of the UPSTREAM_* constants)
+
+    Returns:
+        httpx.AsyncClient bound to the running event loop
+    """
+    return get_http_client_registry().get(upstream)
+
+
+async def close_http_clients() -> None:
+    """Close the running loop's HTTP clients"""
+    if _registry is not None:
+        await _registry.aclose()
+
+
+async def closing_http_clients(awaitable: Awaitable[T]) -> T:
+    """Await a coroutine, then close the HTTP and Redis clients it opened
+
+    Wrap Celery task coroutines with this before passing them to
+    asyncio.run(), so pooled connections are closed before the loop is.
+
+    Args:
+        awaitable: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        return await awaitable
+    finally:
+        await close_http_clients()
+        await close_redis()
@@ -0,0 +1,236 @@
+"""
+Keyset (cursor) pagination and total counts for list endpoints
+
+Listings are ordered newest first on (sort column, id) and paged with an
+opaque cursor holding the last row's key, so the database seeks straight to
+the next page through a composite index instead of scanning and discarding
+OFFSET rows. Deep pages cost the same as page one.
+
+Totals are optional per request (CountMode): an exact count(*), a count
+cached in Redis for a few seconds, the PostgreSQL planner's row estimate,
+or no count at all.
+"""
+
+import base64
+import binascii
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.elements import ClauseElement
+
+from app.core.config import settings
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+COUNT_CACHE_KEY_PREFIX = "count:"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+class CountMode(str, Enum):
+    """How a listing computes its total"""
+
+    EXACT = "exact"  # count(*) over the filtered query
+    CACHED = "cached"  # exact count reused from Redis for PAGINATION_COUNT_CACHE_SECONDS
+    ESTIMATED = "estimated"  # PostgreSQL planner row estimate (exact on other databases)
+    NONE = "none"  # no total
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page of a keyset-paginated listing
+
+    Attributes:
+        items: Rows on this page
+        next_cursor: Cursor for the following page, None on the last page
+        total: Total matching rows, None when not requested
+    """
+
+    items: list[T]
+    next_cursor: Optional[str]
+    total: Optional[int] = None
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode the key of the last row on a page as an opaque cursor"""
+    payload: bytes = json.dumps([sort_value.isoformat(), str(row_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor
+
+    Raises:
+        InvalidCursorError: If the cursor was not produced by encode_cursor
+    """
+    try:
+        padded: str = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+async def fetch_keyset_page(
+    db: AsyncSession,
+    stmt: Select[Any],
+    sort_column: InstrumentedAttribute[Any],
+    id_column: InstrumentedAttribute[Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+) -> KeysetPage[Any]:
+    """Fetch one page of stmt, newest first on (sort_column, id_column)
+
+    Args:
+        db: Database session
+        stmt: Filtered select of the ORM entity, without ORDER BY or LIMIT
+        sort_column: Non-null timestamp column to order by
+        id_column: Primary key column breaking ties in sort_column
+        limit: Maximum rows on the page
+        cursor: next_cursor of the previous page; None for the first page
+        offset: Rows to skip when no cursor is given (legacy page numbers)
+
+    Returns:
+        The page, without a total
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
+    if cursor is not None:
+        sort_value, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(sort_column, id_column) < tuple_(sort_value, row_id))
+    elif offset:
+        stmt = stmt.offset(offset)
+
+    # One extra row tells whether another page follows
+    stmt = stmt.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+    result = await db.execute(stmt)
+    rows: list[Any] = list(result.scalars().all())
+
+    next_cursor: Optional[str] = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last: Any = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return KeysetPage(items=rows, next_cursor=next_cursor)
+
+
+def encode_score_cursor(kind: str, score: float, row_id: UUID) -> str:
+    """Encode the key of the last row on a relevance-ranked page
+
+    Ranked listings (search) order by (score desc, id desc) instead of a
+    timestamp; kind records which ranking produced the page.
+    """
+    payload: bytes = json.dumps([kind, score, str(row_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_score_cursor(cursor: str) -> tuple[str, float, UUID]:
+    """Decode a cursor produced by encode_score_cursor
+
+    Raises:
+        InvalidCursorError: If the cursor was not produced by encode_score_cursor
+    """
+    try:
+        padded: str = cursor + "=" * (-len(cursor) % 4)
+        kind, score, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(kind, str):
+            raise TypeError("cursor kind must be a string")
+        return kind, float(score), UUID(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, for planner row estimates"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement: Select[Any] = statement
+
+
+@compiles(_ExplainJSON, "postgresql")
+def _compile_explain_json(element: _ExplainJSON, compiler: SQLCompiler, **kw: Any) -> str:
+    """Render EXPLAIN (FORMAT JSON) followed by the wrapped statement"""
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+async def _exact_count(db: AsyncSession, stmt: Select[Any]) -> int:
+    """count(*) over a filtered select"""
+    result = await db.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))
+    return int(result.scalar_one())
+
+
+async def _estimated_count(db: AsyncSession, stmt: Select[Any]) -> int:
+    """Planner row estimate on PostgreSQL, exact count elsewhere"""
+    if db.get_bind().dialect.name != "postgresql":
+        return await _exact_count(db, stmt)
+    result = await db.execute(_ExplainJSON(stmt.order_by(None)))
+    plan: Any = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _cached_count(db: AsyncSession, stmt: Select[Any], cache_key: str) -> int:
+    """Exact count reused from Redis until PAGINATION_COUNT_CACHE_SECONDS pass"""
+    ttl: int = settings.PAGINATION_COUNT_CACHE_SECONDS
+    if ttl <= 0:
+        return await _exact_count(db, stmt)
+
+    key: str = f"{COUNT_CACHE_KEY_PREFIX}{cache_key}"
+    redis: Any = get_redis_client()
+    try:
+        cached: Optional[bytes] = await redis.get(key)
+        if cached is not None:
+            return int(cached)
+    except Exception as e:
+        logger.warning(f"Count cache read failed for {key}: {e}")
+
+    total: int = await _exact_count(db, stmt)
+    try:
+        await redis.set(key, total, ex=ttl)
+    except Exception as e:
+        logger.warning(f"Count cache write failed for {key}: {e}")
+    return total
+
+
+async def count_total(
+    db: AsyncSession, stmt: Select[Any], mode: CountMode, cache_key: str
+) -> Optional[int]:
+    """Total rows matching stmt, computed the way mode asks for
+
+    Args:
+        db: Database session
+        stmt: Filtered select, without LIMIT or cursor condition
+        mode: How to count
+        cache_key: Identifies the listing and its filters for CountMode.CACHED
+
+    Returns:
+        The total, or None for CountMode.NONE
+    """
+    if mode == CountMode.NONE:
+        return None
+    if mode == CountMode.CACHED:
+        return await _cached_count(db, stmt, cache_key)
+    if mode == CountMode.ESTIMATED:
+        return await _estimated_count(db, stmt)
+    return await _exact_count(db, stmt)
@@ -0,0 +1,195 @@
+"""
+Password hashing off the event loop
+
+bcrypt takes hundreds of milliseconds of CPU per hash. Running it inline in an
+async handler stalls every other request on the worker, so the auth endpoints
+hash and verify passwords on a small dedicated thread pool instead (bcrypt
+releases the GIL while hashing). The number of pending jobs is capped: when
+the pool is saturated new requests are rejected immediately rather than
+queueing without limit, and the rejections are counted so the saturation is
+visible.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.security import hash_password, pwd_context, truncate_password
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusyError(Exception):
+    """Raised when the password hashing queue is full"""
+
+    pass
+
+
+@dataclass
+class PasswordHasherMetrics:
+    """Backpressure statistics for the password hashing pool (per process)"""
+
+    submitted: int = 0
+    completed: int = 0
+    rejected: int = 0
+    rehashed: int = 0
+    pending: int = 0
+    max_pending: int = 0
+    total_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dict"""
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "avg_wait_ms": (
+                round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0
+            ),
+            "avg_run_ms": (
+                round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0
+            ),
+        }
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt hashing and verification
+
+    Attributes:
+        max_workers: Threads hashing in parallel
+        queue_limit: Maximum jobs running or waiting; further jobs are rejected
+        metrics: Queue and latency statistics
+    """
+
+    def __init__(self, max_workers: int, queue_limit: int) -> None:
+        """Initialize the hasher
+
+        Args:
+            max_workers: Threads hashing in parallel
+            queue_limit: Maximum jobs running or waiting at once
+        """
+        self.max_workers: int = max(1, max_workers)
+        self.queue_limit: int = max(self.max_workers, queue_limit)
+        self.metrics: PasswordHasherMetrics = PasswordHasherMetrics()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="password-hash"
+        )
+        self._lock: threading.Lock = threading.Lock()
+
+    def _acquire_slot(self) -> None:
+        """Reserve a queue slot or raise if the queue is full"""
+        with self._lock:
+            if self.metrics.pending >= self.queue_limit:
+                self.metrics.rejected += 1
+                raise PasswordHasherBusyError(
+                    f"Password hashing queue is full ({self.queue_limit} pending)"
+                )
+            self.metrics.pending += 1
+            self.metrics.submitted += 1
+            self.metrics.max_pending = max(self.metrics.max_pending, self.metrics.pending)
+
+    def _release_slot(self, wait: float, run: float) -> None:
+        """Free a queue slot and record the job's timings"""
+        with self._lock:
+            self.metrics.pending -= 1
+            self.metrics.completed += 1
+            self.metrics.total_wait_seconds += wait
+            self.metrics.total_run_seconds += run
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a hashing function on the pool, respecting the queue limit
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+        """
+        self._acquire_slot()
+        queued_at: float = time.perf_counter()
+        timings: dict[str, float] = {}
+
+        def job() -> T:
+            started: float = time.perf_counter()
+            timings["wait"] = started - queued_at
+            try:
+                return fn(*args)
+            finally:
+                timings["run"] = time.perf_counter() - started
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+        finally:
+            self._release_slot(timings.get("wait", 0.0), timings.get("run", 0.0))
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the configured bcrypt cost
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+        """
+        return await self._run(hash_password, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """Verify a password and rehash it if the stored cost is outdated
+
+        Args:
+            password: Plain text password
+            hashed_password: Stored hash
+
+        Returns:
+            Tuple of (verified, new_hash); new_hash is set only when the
+            password matched and the hash uses a different bcrypt cost than
+            PASSWORD_BCRYPT_ROUNDS
+
+        Raises:
+            PasswordHasherBusyError: If the queue is full
+        """
+        verified, new_hash = await self._run(
+            pwd_context.verify_and_update, truncate_password(password), hashed_password
+        )
+        if new_hash is not None:
+            with self._lock:
+                self.metrics.rehashed += 1
+        return bool(verified), new_hash
+
+    def shutdown(self) -> None:
+        """Stop the pool after running jobs finish"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Singleton instance for use across the application
+_password_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get or create the PasswordHasher singleton
+
+    Returns:
+        PasswordHasher instance
+    """
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher(
+            max_workers=settings.PASSWORD_HASH_MAX_WORKERS,
+            queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT,
+        )
+    return _password_hasher
+
+
+def shutdown_password_hasher() -> None:
+    """Shut down the PasswordHasher pool, if one was started"""
+    global _password_hasher
+    if _password_hasher is not None:
+        _password_hasher.shutdown()
+        _password_hasher = None
@@ -0,0 +1,186 @@
+"""
+Authenticated principal cache
+
+get_current_user runs on nearly every API request. Without a cache each call
+checks the token blacklist in Redis and loads the user from the database.
+Resolved principals are cached in process for a short TTL, keyed by
+(user id, token jti), so repeat requests with the same access token skip both
+round trips.
+
+Entries are dropped explicitly when they become wrong: on logout (token),
+and on role change, deactivation, deletion or RTBF anonymization (user).
+Invalidations are published on a Redis channel so every API process drops
+its copy; the TTL bounds staleness if a message is missed.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.pubsub import ChannelListener
+from app.core.redis import get_redis_client
+from app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "principal-cache:invalidate"
+
+CacheKey = tuple[UUID, str]
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable view of the authenticated user
+
+    Carries only the columns request handlers need, so resolving it never
+    loads the User relationships.
+    """
+
+    id: UUID
+    email: str
+    role: UserRole
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Build a principal from a User row"""
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+
+class PrincipalCache:
+    """In-process TTL cache of principals keyed by (user id, jti)
+
+    Attributes:
+        ttl_seconds: Lifetime of an entry
+        max_entries: Entries kept before the oldest are evicted
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        self.ttl_seconds: float = ttl_seconds
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[float, Principal]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, user_id: UUID, jti: str) -> Optional[Principal]:
+        """Return the cached principal for a token, if still fresh"""
+        key: CacheKey = (user_id, jti)
+        with self._lock:
+            entry: Optional[tuple[float, Principal]] = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return principal
+
+    def set(self, jti: str, principal: Principal) -> None:
+        """Cache a principal for a token"""
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return
+        key: CacheKey = (principal.id, jti)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        """Drop every cached token of a user"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_id]:
+                del self._entries[key]
+
+    def invalidate_token(self, jti: str) -> None:
+        """Drop a single token"""
+        with self._lock:
+            for key in [key for key in self._entries if key[1] == jti]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Singleton instance for use across the application
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get or create the PrincipalCache singleton
+
+    Returns:
+        PrincipalCache instance
+    """
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+            max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+        )
+    return _principal_cache
+
+
+def _apply_invalidation(message: dict[str, Any]) -> None:
+    """Apply an invalidation message to the local cache"""
+    cache: PrincipalCache = get_principal_cache()
+    if message.get("user_id"):
+        cache.invalidate_user(UUID(message["user_id"]))
+    if message.get("jti"):
+        cache.invalidate_token(message["jti"])
+
+
+async def invalidate_principal(user_id: Optional[UUID] = None, jti: Optional[str] = None) -> None:
+    """Invalidate cached principals in this and every other API process
+
+    Args:
+        user_id: Drop all tokens of this user (role change, deactivation, RTBF)
+        jti: Drop this token only (logout)
+    """
+    message: dict[str, Any] = {"user_id": str(user_id) if user_id else None, "jti": jti}
+    _apply_invalidation(message)
+    try:
+        await get_redis_client().publish(INVALIDATION_CHANNEL, json.dumps(message))
+    except Exception as e:
+        # Other processes fall back to the TTL
+        logger.warning(f"Failed to publish principal cache invalidation: {e}")
+
+
+def create_invalidation_listener(**kwargs: Any) -> ChannelListener:
+    """Build the listener applying invalidations published by other processes
+
+    The local cache is cleared when the subscription fails, since
+    invalidations may have been missed.
+
+    Args:
+        **kwargs: Passed to ChannelListener (retry_delay, poll_timeout)
+
+    Returns:
+        ChannelListener to start from the FastAPI lifespan
+    """
+    return ChannelListener(
+        INVALIDATION_CHANNEL,
+        on_message=lambda data: _apply_invalidation(json.loads(data)),
+        on_error=lambda: get_principal_cache().clear(),
+        **kwargs,
+    )
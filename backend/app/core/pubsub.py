@@ -0,0 +1,105 @@
+"""
+Redis pub/sub listener for keeping per-process state in sync
+
+API processes keep small in-process caches (principals, the token blacklist
+filter) that must react when another process changes the underlying data.
+Changes are published on a Redis channel and each process runs a
+ChannelListener from the FastAPI lifespan to apply them.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from typing import Any, Optional
+
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelListener:
+    """Applies messages published on a Redis channel until stopped
+
+    Reconnects after Redis errors. Messages published while disconnected are
+    lost, so on_error should mark the local state as untrustworthy and
+    on_subscribed can resynchronize it once the subscription is back.
+
+    Attributes:
+        channel: Redis channel to subscribe to
+        retry_delay: Seconds to wait before resubscribing after an error
+        poll_timeout: Seconds each read waits for a message
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_message: Callable[[bytes], None],
+        on_subscribed: Optional[Callable[[], Awaitable[None]]] = None,
+        on_error: Optional[Callable[[], None]] = None,
+        retry_delay: float = 5.0,
+        poll_timeout: float = 1.0,
+    ) -> None:
+        """Initialize the listener
+
+        Args:
+            channel: Redis channel to subscribe to
+            on_message: Called with the payload of each message
+            on_subscribed: Awaited after every (re)subscription
+            on_error: Called when the subscription fails
+            retry_delay: Seconds to wait before resubscribing after an error
+            poll_timeout: Seconds each read waits for a message
+        """
+        self.channel: str = channel
+        self.retry_delay: float = retry_delay
+        self.poll_timeout: float = poll_timeout
+        self._on_message: Callable[[bytes], None] = on_message
+        self._on_subscribed: Optional[Callable[[], Awaitable[None]]] = on_subscribed
+        self._on_error: Optional[Callable[[], None]] = on_error
+        self._stopped: bool = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def start(self) -> None:
+        """Start listening on the running event loop"""
+        self._stopped = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop listening and wait for the subscription to close"""
+        self._stopped = True
+        if self._task is None:
+            return
+        self._task.cancel()
+        # redis-py can swallow a cancel that races a read timeout; the stop
+        # flag ends the loop after the next poll in that case
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _listen(self) -> None:
+        """Subscribe and apply messages until stopped"""
+        pubsub: Any = get_redis_client().pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+            if self._on_subscribed is not None:
+                await self._on_subscribed()
+            while not self._stopped:
+                raw = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=self.poll_timeout
+                )
+                if raw is not None:
+                    self._on_message(raw["data"])
+        finally:
+            await pubsub.aclose()
+
+    async def _run(self) -> None:
+        """Listen, resubscribing after errors, until stopped"""
+        while not self._stopped:
+            try:
+                await self._listen()
+            except Exception as e:
+                logger.warning(f"Listener for Redis channel {self.channel} failed: {e}")
+                if self._on_error is not None:
+                    self._on_error()
+                if not self._stopped:
+                    await asyncio.sleep(self.retry_delay)
@@ -2,6 +2,7 @@
 Redis connection management for caching and token blacklisting
 """
 
+import asyncio
 from typing import Any, AsyncGenerator
 
 from redis.asyncio import Redis
@@ -10,26 +11,63 @@ from app.core.config import settings
 
 # Global Redis client instance
 _redis_client: Any = None
+# Event loop the client's connections belong to (Celery tasks run a new loop per task)
+_redis_client_loop: Any = None
 
 
-async def get_redis() -> AsyncGenerator[Any, None]:
+def get_redis_client() -> Any:
     """
-    Dependency to get Redis client.
+    Get the shared Redis client outside of dependency injection (services, tasks).
 
-    Yields:
+    A new client is created when called from a different event loop than the
+    one the current client was created on, because pooled asyncio connections
+    cannot be reused across loops (e.g. one asyncio.run() per Celery task).
+    Task loops close their client with close_redis() before they end (see
+    app.core.http_clients.closing_http_clients); a client left behind is
+    closed on its own loop when that loop is still running.
+
+    Returns:
         Redis client instance
     """
-    global _redis_client
+    global _redis_client, _redis_client_loop
 
-    if _redis_client is None:
+    try:
+        loop: Any = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _redis_client is None or (loop is not None and loop is not _redis_client_loop):
+        if _redis_client is not None:
+            _discard_client(_redis_client, _redis_client_loop)
         _redis_client = Redis.from_url(settings.REDIS_URL, encoding="utf-8", decode_responses=False)
+        _redis_client_loop = loop
+
+    return _redis_client
+
+
+def _discard_client(client: Any, loop: Any) -> None:
+    """Close a client being replaced, on the loop its connections belong to"""
+    # A finished loop's connections died with it; nothing can be awaited on them
+    if loop is not None and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
 
-    yield _redis_client
+
+async def get_redis() -> AsyncGenerator[Any, None]:
+    """
+    Dependency to get Redis client.
+
+    Yields:
+        Redis client instance
+    """
+    yield get_redis_client()
 
 
 async def close_redis() -> None:
-    """Close the Redis connection on shutdown"""
-    global _redis_client
-    if _redis_client:
-        await _redis_client.aclose()
-        _redis_client = None
+    """Close the running loop's Redis client (on shutdown, or at the end of a task loop)"""
+    global _redis_client, _redis_client_loop
+    if _redis_client is None or _redis_client_loop not in (None, asyncio.get_running_loop()):
+        return
+    client: Any = _redis_client
+    _redis_client = None
+    _redis_client_loop = None
+    await client.aclose()
@@ -0,0 +1,399 @@
+"""
+Shared response cache for public and analytics GET endpoints
+
+The public transparency pages, transparency reports and corrections log are
+read by anonymous visitors, so a news spike turns into one database round
+trip per page view. The analytics endpoints recompute their aggregates on
+every call. Rendered responses of these endpoints are cached in Redis with a
+per-route TTL and shared by every API process:
+
+- Entries are keyed by namespace, namespace generation and request URL.
+  Writes that change what a namespace serves call invalidate_responses(),
+  which bumps the generation so older entries are never read again (they
+  expire by TTL).
+- Every cached response carries an ETag; a matching If-None-Match is
+  answered with 304 Not Modified and no body.
+- Recomputation is single-flight: concurrent misses for the same key wait
+  for one computation, within a process through a shared future and across
+  processes through a short Redis lock.
+
+Redis failures never fail a request; the response is then computed directly.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "response-cache:"
+
+# Namespaces, one per group of endpoints invalidated together
+TRANSPARENCY_PAGES = "transparency-pages"
+TRANSPARENCY_REPORTS = "transparency-reports"
+CORRECTIONS_LOG = "corrections-log"
+ANALYTICS = "analytics"
+
+# Response headers stored with the body (others are recomputed per request)
+_STORED_HEADERS: frozenset[str] = frozenset({"content-disposition", "content-language"})
+
+# Seconds between cache lookups while another process recomputes a response
+_LOCK_POLL_SECONDS: float = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A rendered response as stored in the cache"""
+
+    body: bytes
+    media_type: str
+    etag: str
+    headers: dict[str, str]
+
+    def pack(self) -> bytes:
+        """Serialize as a JSON header line followed by the raw body"""
+        header: dict[str, Any] = {
+            "media_type": self.media_type,
+            "etag": self.etag,
+            "headers": self.headers,
+        }
+        return json.dumps(header).encode("utf-8") + b"\n" + self.body
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CachedResponse":
+        """Inverse of pack()"""
+        header, body = data.split(b"\n", 1)
+        values: dict[str, Any] = json.loads(header)
+        return cls(
+            body=body,
+            media_type=values["media_type"],
+            etag=values["etag"],
+            headers=values["headers"],
+        )
+
+    @classmethod
+    def render(cls, result: Any) -> "CachedResponse":
+        """Render an endpoint result (a Response or JSON-encodable data)"""
+        response: Response = (
+            result if isinstance(result, Response) else JSONResponse(jsonable_encoder(result))
+        )
+        body: bytes = bytes(response.body)
+        return cls(
+            body=body,
+            media_type=response.media_type or "application/json",
+            etag=make_etag(body),
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() in _STORED_HEADERS
+            },
+        )
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag of a response body"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header value matches an ETag (weak comparison)
+
+    Args:
+        if_none_match: Raw If-None-Match header, may list several ETags
+        etag: ETag of the current representation
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    candidates: list[str] = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class ResponseCache:
+    """Redis-backed cache of rendered GET responses with single-flight fills
+
+    Attributes:
+        enabled: When False, respond() computes every response
+        lock_seconds: Lifetime of the cross-process recomputation lock
+        lock_wait_seconds: How long a miss waits for another process's
+            recomputation before computing itself
+        hits: Responses served from Redis
+        misses: Responses computed by this process
+        coalesced: Misses answered by another request's computation
+        redis_errors: Redis operations that failed and were skipped
+
+    Example:
+        >>> cache = ResponseCache(redis_client=redis)
+        >>> await cache.respond(request, TRANSPARENCY_PAGES, 300, build)
+        <Response 200>
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        lock_seconds: Optional[float] = None,
+        lock_wait_seconds: Optional[float] = None,
+        redis_client: Optional[Any] = None,
+    ) -> None:
+        """Initialize ResponseCache
+
+        Args:
+            enabled: Defaults to RESPONSE_CACHE_ENABLED
+            lock_seconds: Defaults to RESPONSE_CACHE_LOCK_SECONDS
+            lock_wait_seconds: Defaults to RESPONSE_CACHE_LOCK_WAIT_SECONDS
+            redis_client: Async Redis client; defaults to app.core.redis's
+                client, resolved per call so it follows the running event loop
+        """
+        self.enabled: bool = enabled if enabled is not None else settings.RESPONSE_CACHE_ENABLED
+        self.lock_seconds: float = (
+            lock_seconds if lock_seconds is not None else settings.RESPONSE_CACHE_LOCK_SECONDS
+        )
+        self.lock_wait_seconds: float = (
+            lock_wait_seconds
+            if lock_wait_seconds is not None
+            else settings.RESPONSE_CACHE_LOCK_WAIT_SECONDS
+        )
+        self._redis_client: Optional[Any] = redis_client
+        self._inflight: dict[str, asyncio.Future[CachedResponse]] = {}
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.coalesced: int = 0
+        self.redis_errors: int = 0
+
+    def _get_redis(self) -> Any:
+        return self._redis_client if self._redis_client is not None else get_redis_client()
+
+    async def respond(
+        self,
+        request: Request,
+        namespace: str,
+        ttl_seconds: int,
+        build: Callable[[], Awaitable[Any]],
+        private: bool = False,
+    ) -> Response:
+        """Serve a GET endpoint from the cache, computing it on a miss
+
+        Exceptions raised by build (e.g. HTTPException 404) propagate and
+        nothing is cached. When caching is disabled or Redis is down the
+        response is computed directly, still with an ETag.
+
+        Args:
+            request: Incoming request; its path and query form the cache key
+            namespace: Namespace invalidated together (TRANSPARENCY_PAGES, ...)
+            ttl_seconds: Lifetime of the entry and the Cache-Control max-age
+            build: Computes the response (a Response or JSON-encodable data)
+            private: Only let the client cache it (authenticated endpoints)
+
+        Returns:
+            The response, or 304 Not Modified if the client's ETag matches
+        """
+        if not self.enabled or ttl_seconds <= 0:
+            return _conditional(request, CachedResponse.render(await build()), "BYPASS")
+
+        redis: Any = self._get_redis()
+        try:
+            generation: int = int(await redis.get(_generation_key(namespace)) or 0)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Response cache unavailable, computing {request.url.path}: {e}")
+            return _conditional(request, CachedResponse.render(await build()), "BYPASS")
+
+        key: str = _entry_key(namespace, generation, request)
+        cached: Optional[CachedResponse] = await self._get(redis, key)
+        status: str = "HIT"
+        if cached is not None:
+            self.hits += 1
+        else:
+            status = "MISS"
+            cached = await self._fill(redis, key, ttl_seconds, build)
+
+        cache_control: str = f"{'private' if private else 'public'}, max-age={ttl_seconds}"
+        return _conditional(request, cached, status, {"Cache-Control": cache_control})
+
+    async def _fill(
+        self,
+        redis: Any,
+        key: str,
+        ttl_seconds: int,
+        build: Callable[[], Awaitable[Any]],
+    ) -> CachedResponse:
+        """Compute a missing entry once per key, however many requests miss it"""
+        inflight: Optional[asyncio.Future[CachedResponse]] = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                result: CachedResponse = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The computing request was cancelled (client went away); take over
+                return await self._fill(redis, key, ttl_seconds, build)
+            self.coalesced += 1
+            return result
+
+        future: asyncio.Future[CachedResponse] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            cached: CachedResponse = await self._fill_shared(redis, key, ttl_seconds, build)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        finally:
+            del self._inflight[key]
+        future.set_result(cached)
+        return cached
+
+    async def _fill_shared(
+        self,
+        redis: Any,
+        key: str,
+        ttl_seconds: int,
+        build: Callable[[], Awaitable[Any]],
+    ) -> CachedResponse:
+        """Compute and store an entry unless another process is already doing so"""
+        lock_key: str = key + ":lock"
+        try:
+            locked: bool = bool(
+                await redis.set(lock_key, b"1", nx=True, px=int(self.lock_seconds * 1000))
+            )
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Response cache lock failed: {e}")
+            locked = True
+
+        if not locked:
+            deadline: float = asyncio.get_running_loop().time() + self.lock_wait_seconds
+            while asyncio.get_running_loop().time() < deadline:
+                await asyncio.sleep(_LOCK_POLL_SECONDS)
+                cached: Optional[CachedResponse] = await self._get(redis, key)
+                if cached is not None:
+                    self.coalesced += 1
+                    return cached
+            # The other process is slow or died; compute without the lock
+
+        self.misses += 1
+        try:
+            rendered: CachedResponse = CachedResponse.render(await build())
+            try:
+                await redis.set(key, rendered.pack(), ex=ttl_seconds)
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Response cache write failed: {e}")
+            return rendered
+        finally:
+            if locked:
+                try:
+                    await redis.delete(lock_key)
+                except Exception:
+                    pass  # Expires after lock_seconds
+
+    async def _get(self, redis: Any, key: str) -> Optional[CachedResponse]:
+        try:
+            data: Optional[bytes] = await redis.get(key)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"Response cache lookup failed: {e}")
+            return None
+        return CachedResponse.unpack(data) if data is not None else None
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """Stop serving every cached response of the given namespaces
+
+        Args:
+            *namespaces: Namespaces whose data changed
+        """
+        if not self.enabled:
+            return
+        redis: Any = self._get_redis()
+        for namespace in namespaces:
+            try:
+                await redis.incr(_generation_key(namespace))
+            except Exception as e:
+                # Entries then expire by TTL
+                self.redis_errors += 1
+                logger.warning(f"Failed to invalidate cached {namespace} responses: {e}")
+
+    def stats(self) -> dict[str, int]:
+        """Counters for monitoring"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "redis_errors": self.redis_errors,
+        }
+
+
+def _conditional(
+    request: Request,
+    cached: CachedResponse,
+    status: str,
+    extra_headers: Optional[dict[str, str]] = None,
+) -> Response:
+    """Build the response, or 304 Not Modified if the client's ETag matches"""
+    headers: dict[str, str] = {
+        **cached.headers,
+        **(extra_headers or {}),
+        "ETag": cached.etag,
+        "X-Cache": status,
+    }
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type=cached.media_type, headers=headers)
+
+
+def _generation_key(namespace: str) -> str:
+    return f"{REDIS_KEY_PREFIX}{namespace}:generation"
+
+
+def _entry_key(namespace: str, generation: int, request: Request) -> str:
+    """Key of a response; query parameters are sorted so their order doesn't matter"""
+    query: str = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+    digest: str = hashlib.sha256(f"{request.url.path}?{query}".encode("utf-8")).hexdigest()
+    return f"{REDIS_KEY_PREFIX}{namespace}:{generation}:{digest}"
+
+
+# Singleton instance for use across the application
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the ResponseCache singleton
+
+    Returns:
+        ResponseCache instance
+    """
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+
+async def invalidate_responses(*namespaces: str) -> None:
+    """Invalidate cached responses in every API process
+
+    Called after the write that changes what the namespaces serve has
+    been committed.
+
+    Args:
+        *namespaces: TRANSPARENCY_PAGES, TRANSPARENCY_REPORTS, CORRECTIONS_LOG
+            or ANALYTICS
+    """
+    await get_response_cache().invalidate(*namespaces)
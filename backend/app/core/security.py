@@ -11,8 +11,27 @@ from passlib.context import CryptContext  # type: ignore[import-untyped]
 
 from app.core.config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context; hashes with a different cost factor are flagged
+# by needs_update() / verify_and_update() and rehashed on login
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS
+)
+
+
+def truncate_password(password: str) -> str:
+    """
+    Truncate a password to bcrypt's 72-byte limit.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        Password of at most 72 UTF-8 bytes
+    """
+    password_bytes = password.encode("utf-8")
+    if len(password_bytes) > 72:
+        password = password_bytes[:72].decode("utf-8", errors="ignore")
+    return password
 
 
 def hash_password(password: str) -> str:
@@ -20,6 +39,8 @@ def hash_password(password: str) -> str:
     Hash a plain text password using bcrypt.
 
     Bcrypt has a 72-byte limit, so we truncate the password if necessary.
+    This blocks for the full bcrypt cost; async handlers should use
+    app.core.password_hashing.get_password_hasher() instead.
 
     Args:
         password: Plain text password
@@ -27,11 +48,7 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password
     """
-    # Bcrypt has a 72-byte limit, truncate if necessary
-    password_bytes = password.encode("utf-8")
-    if len(password_bytes) > 72:
-        password = password_bytes[:72].decode("utf-8", errors="ignore")
-    hashed: str = pwd_context.hash(password)
+    hashed: str = pwd_context.hash(truncate_password(password))
     return hashed
 
 
@@ -47,10 +64,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         True if password matches, False otherwise
     """
     # Bcrypt has a 72-byte limit, truncate if necessary (same as hash_password)
-    password_bytes = plain_password.encode("utf-8")
-    if len(password_bytes) > 72:
-        plain_password = password_bytes[:72].decode("utf-8", errors="ignore")
-    verified: bool = pwd_context.verify(plain_password, hashed_password)
+    verified: bool = pwd_context.verify(truncate_password(plain_password), hashed_password)
     return verified
 
 
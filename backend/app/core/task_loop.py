@@ -0,0 +1,59 @@
+"""
+Shared event loop for Celery tasks
+
+Most Celery tasks run their coroutine with asyncio.run(), i.e. in a fresh
+event loop per task. Spotlight ingestion and transcription tasks instead
+submit their coroutine to one long-lived loop per worker process, running in
+a background thread. Their worker runs on a thread pool
+(--pool=threads --concurrency=N), so several videos are processed at the
+same time in that one loop, and everything bound to the loop is shared by
+them: pooled HTTP and database connections, the Redis client, and the
+WHISPER_MAX_CONCURRENCY limit on Whisper API calls.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+# Process that started _loop; a forked child inherits the variable but not the thread
+_loop_pid: Optional[int] = None
+_loop_lock: threading.Lock = threading.Lock()
+
+
+def get_task_loop() -> asyncio.AbstractEventLoop:
+    """Get the process's shared task loop, starting it on first use
+
+    Returns:
+        Event loop running forever in a daemon thread
+    """
+    global _loop, _loop_pid
+    with _loop_lock:
+        if _loop is None or _loop_pid != os.getpid() or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_pid = os.getpid()
+            threading.Thread(target=_loop.run_forever, name="celery-task-loop", daemon=True).start()
+            logger.info(f"Started shared task event loop in process {_loop_pid}")
+        return _loop
+
+
+def run_in_task_loop(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared task loop and wait for its result
+
+    Blocks the calling (worker pool) thread, not the loop, so other tasks
+    keep running on the loop meanwhile.
+
+    Args:
+        coroutine: Coroutine to run
+
+    Returns:
+        The coroutine's result (its exception is re-raised)
+    """
+    return asyncio.run_coroutine_threadsafe(coroutine, get_task_loop()).result()
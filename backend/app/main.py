@@ -4,6 +4,8 @@ Ans Backend API - Main Application
 FastAPI application for the Ans fact-checking service
 """
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Dict
 
 from fastapi import FastAPI
@@ -11,6 +13,35 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.core.http_clients import close_http_clients, get_http_client_registry
+from app.core.password_hashing import shutdown_password_hasher
+from app.core.principal_cache import create_invalidation_listener
+from app.services.analytics_ingestion_service import get_event_buffer
+from app.services.peer_review_trigger_cache import create_trigger_invalidation_listener
+from app.services.token_blacklist import create_blacklist_filter_sync
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open shared resources on startup and release them on shutdown"""
+    await get_http_client_registry().open()
+    invalidation_listener = create_invalidation_listener()
+    invalidation_listener.start()
+    trigger_invalidation_listener = create_trigger_invalidation_listener()
+    trigger_invalidation_listener.start()
+    blacklist_filter_sync = create_blacklist_filter_sync()
+    if settings.TOKEN_BLACKLIST_FILTER_ENABLED:
+        blacklist_filter_sync.start()
+    event_buffer = get_event_buffer()
+    event_buffer.start()
+    yield
+    await event_buffer.stop()
+    await blacklist_filter_sync.stop()
+    await trigger_invalidation_listener.stop()
+    await invalidation_listener.stop()
+    await close_http_clients()
+    shutdown_password_hasher()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -18,6 +49,7 @@ app = FastAPI(
     description="Fact-checking service API for Amsterdam youth via Snapchat",
     version=settings.APP_VERSION,
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Configure CORS - Security: Only allow specific origins, not wildcard
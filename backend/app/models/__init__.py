@@ -16,6 +16,7 @@ from app.models.email_log import EmailLog, EmailStatus
 from app.models.email_template import EmailTemplate, EmailTemplateType
 from app.models.fact_check import FactCheck
 from app.models.fact_check_rating import FactCheckRating
+from app.models.metrics_rollup import CorrectionRollup, FactCheckDailyRollup, SourceRollup
 from app.models.peer_review import ApprovalStatus, PeerReview
 from app.models.peer_review_trigger import (
     PeerReviewTrigger,
@@ -60,6 +61,9 @@ __all__ = [
     "EmailStatus",
     "EmailTemplate",
     "EmailTemplateType",
+    "FactCheckDailyRollup",
+    "SourceRollup",
+    "CorrectionRollup",
     "PeerReview",
     "ApprovalStatus",
     "PeerReviewTrigger",
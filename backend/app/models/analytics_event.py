@@ -4,6 +4,12 @@ AnalyticsEvent model for tracking analytics events.
 This model stores analytics events for EFCSN compliance dashboard metrics,
 tracking views, shares, correction requests, and other user interactions
 with fact-checks, submissions, and other entities.
+
+On PostgreSQL the table is range-partitioned by month on occurred_at, with
+primary key (id, occurred_at), by migration s9t0u1v2w3x4; partitions are
+managed by app.services.analytics_partition_service. The ORM mapping keeps
+id as its identity, and metadata.create_all (tests, SQLite) builds a plain
+table.
 """
 
 from datetime import datetime
@@ -5,7 +5,7 @@ Claim model for extracted claims with vector embeddings
 from typing import TYPE_CHECKING, List, Optional
 
 from pgvector.sqlalchemy import Vector  # type: ignore[import-untyped]
-from sqlalchemy import String, Text
+from sqlalchemy import Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import TimeStampedModel, submission_claims
@@ -16,7 +16,12 @@ if TYPE_CHECKING:
 
 
 class Claim(TimeStampedModel):
-    """Claim model for storing extracted claims with embeddings for similarity search"""
+    """Claim model for storing extracted claims with embeddings for similarity search
+
+    On PostgreSQL the table also has a generated search_vector (tsvector)
+    column and a trigram index on content, used by app.services.search_service
+    through raw SQL; they are created by migration t0u1v2w3x4y5 and not mapped.
+    """
 
     __tablename__ = "claims"
 
@@ -28,13 +33,24 @@ class Claim(TimeStampedModel):
 
     # Relationships
     fact_checks: Mapped[List["FactCheck"]] = relationship(
-        "FactCheck", back_populates="claim", lazy="selectin"
+        "FactCheck", back_populates="claim", lazy="raise"
     )
     submissions: Mapped[List["Submission"]] = relationship(
         "Submission",
         secondary=submission_claims,
         back_populates="claims",
-        lazy="selectin",
+        lazy="raise",
+    )
+
+    # HNSW index for approximate nearest-neighbour search (PostgreSQL/pgvector only)
+    __table_args__ = (
+        Index(
+            "ix_claims_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
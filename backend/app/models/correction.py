@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, List, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
@@ -69,6 +69,7 @@ class Correction(TimeStampedModel):
     correction_type: Mapped[CorrectionType] = mapped_column(
         Enum(CorrectionType, values_callable=lambda obj: [e.value for e in obj]),
         nullable=False,
+        active_history=True,
     )
 
     # Requester information (optional for anonymous corrections)
@@ -89,6 +90,7 @@ class Correction(TimeStampedModel):
         nullable=False,
         default=CorrectionStatus.PENDING,
         index=True,
+        active_history=True,
     )
 
     # Reviewer information (nullable until reviewed)
@@ -116,20 +118,25 @@ class Correction(TimeStampedModel):
     fact_check: Mapped["FactCheck"] = relationship(
         "FactCheck",
         back_populates="corrections",
-        lazy="selectin",
+        lazy="raise",
     )
     reviewed_by: Mapped[Optional["User"]] = relationship(
         "User",
         back_populates="corrections_reviewed",
-        lazy="selectin",
+        lazy="raise",
     )
     applications: Mapped[List["CorrectionApplication"]] = relationship(
         "CorrectionApplication",
         back_populates="correction",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Keyset pagination of the public corrections log
+        Index("ix_corrections_status_reviewed_at_id", "status", "reviewed_at", "id"),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<Correction(id={self.id}, "
@@ -201,12 +208,12 @@ class CorrectionApplication(TimeStampedModel):
     correction: Mapped["Correction"] = relationship(
         "Correction",
         back_populates="applications",
-        lazy="selectin",
+        lazy="raise",
     )
     applied_by: Mapped["User"] = relationship(
         "User",
         back_populates="correction_applications",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
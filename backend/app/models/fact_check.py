@@ -55,13 +55,20 @@ class StringList(TypeDecorator[list[str]]):
 
 
 class FactCheck(TimeStampedModel):
-    """FactCheck model for storing verified fact-check results"""
+    """FactCheck model for storing verified fact-check results
+
+    On PostgreSQL the table also has a generated search_vector (tsvector)
+    column over verdict, reasoning and draft_content, used by
+    app.services.search_service; it is created by migration t0u1v2w3x4y5
+    and not mapped.
+    """
 
     __tablename__ = "fact_checks"
 
     claim_id: Mapped[UUID] = mapped_column(ForeignKey("claims.id"), nullable=False, index=True)
+    # active_history: metric rollups need the old value (app.models.metrics_rollup)
     verdict: Mapped[str] = mapped_column(
-        String(50), nullable=False
+        String(50), nullable=False, active_history=True
     )  # true, false, partially_true, unverified
     confidence: Mapped[float] = mapped_column(Float, nullable=False)  # 0.0 to 1.0
     reasoning: Mapped[str] = mapped_column(Text, nullable=False)
@@ -71,7 +78,7 @@ class FactCheck(TimeStampedModel):
 
     # Source count for EFCSN compliance (Issue #69)
     sources_count: Mapped[int] = mapped_column(
-        Integer, nullable=False, default=0, server_default="0"
+        Integer, nullable=False, default=0, server_default="0", active_history=True
     )
 
     # Draft storage for reviewer work-in-progress (Issue #123)
@@ -87,29 +94,29 @@ class FactCheck(TimeStampedModel):
     )
 
     # Relationships
-    claim: Mapped["Claim"] = relationship("Claim", back_populates="fact_checks", lazy="selectin")
+    claim: Mapped["Claim"] = relationship("Claim", back_populates="fact_checks", lazy="raise")
     ratings: Mapped[List["FactCheckRating"]] = relationship(
         "FactCheckRating",
         back_populates="fact_check",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     peer_reviews: Mapped[List["PeerReview"]] = relationship(
         "PeerReview",
         back_populates="fact_check",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     source_records: Mapped[List["Source"]] = relationship(
         "Source",
         back_populates="fact_check",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
     corrections: Mapped[List["Correction"]] = relationship(
         "Correction",
         back_populates="fact_check",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan",
     )
 
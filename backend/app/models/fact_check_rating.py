@@ -24,6 +24,10 @@ class FactCheckRating(TimeStampedModel):
     This model tracks the complete history of ratings assigned to fact checks,
     supporting EFCSN compliance requirements for rating justifications and audit trails.
 
+    On PostgreSQL the table also has a generated search_vector (tsvector)
+    column over justification, used by app.services.search_service; it is
+    created by migration v2w3x4y5z6a7 and not mapped.
+
     Attributes:
         fact_check_id: Reference to the fact check being rated
         assigned_by_id: User who assigned the rating
@@ -88,13 +92,13 @@ class FactCheckRating(TimeStampedModel):
     fact_check: Mapped["FactCheck"] = relationship(
         "FactCheck",
         back_populates="ratings",
-        lazy="selectin",
+        lazy="raise",
     )
 
     assigned_by: Mapped["User"] = relationship(
         "User",
         back_populates="fact_check_ratings",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
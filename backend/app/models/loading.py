@@ -0,0 +1,53 @@
+"""
+Loading profiles: named relationship loader options per use case
+
+Every relationship is declared with lazy="raise", so nothing is loaded
+unless a query asks for it. Queries pick the profile matching what the
+caller reads and pass it with .options(*PROFILE); touching a relationship
+the profile does not load raises instead of silently issuing more SQL.
+
+Keep profiles minimal: adding a relationship here adds a query to every
+request that uses the profile (see app/tests/test_loading_profiles.py).
+"""
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.interfaces import ORMOption
+
+from app.models.claim import Claim
+from app.models.fact_check import FactCheck
+from app.models.submission import Submission
+from app.models.submission_reviewer import SubmissionReviewer
+
+LoadingProfile = tuple[ORMOption, ...]
+
+# Submission list rows: assigned reviewers only
+SUBMISSION_LIST: LoadingProfile = (
+    selectinload(Submission.reviewer_assignments).selectinload(SubmissionReviewer.reviewer),
+)
+
+# Single submission page: everything SubmissionResponse renders
+SUBMISSION_DETAIL: LoadingProfile = (
+    selectinload(Submission.user),
+    selectinload(Submission.claims).selectinload(Claim.fact_checks),
+    selectinload(Submission.spotlight_content),
+    selectinload(Submission.reviewer_assignments).selectinload(SubmissionReviewer.reviewer),
+)
+
+# Workflow transitions: only the state columns on the submission itself
+SUBMISSION_WORKFLOW: LoadingProfile = ()
+
+# Linking extracted claims to a submission
+SUBMISSION_CLAIMS: LoadingProfile = (selectinload(Submission.claims),)
+
+# Resolving Submission.fact_check_id (first claim's first fact-check)
+SUBMISSION_FACT_CHECK: LoadingProfile = (
+    selectinload(Submission.claims).selectinload(Claim.fact_checks),
+)
+
+# GDPR data export: submission columns only
+SUBMISSION_EXPORT: LoadingProfile = ()
+
+# Draft access checks: fact-check -> claim -> submissions
+FACT_CHECK_SUBMISSIONS: LoadingProfile = (
+    selectinload(FactCheck.claim).selectinload(Claim.submissions),
+)
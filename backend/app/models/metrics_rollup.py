@@ -0,0 +1,265 @@
+"""
+Metrics rollup tables for EFCSN analytics
+
+Issue #88: Backend Analytics Service & EFCSN Compliance Metrics
+ADR 0005: EFCSN Compliance Architecture
+
+The analytics dashboard and monthly transparency reports read these small
+pre-aggregated tables instead of scanning fact_checks, sources and
+corrections:
+- fact_check_daily_rollups: fact-checks per (day, verdict, sources_count)
+- source_rollups: sources per (type, relevance) with credibility score sums
+- correction_rollups: corrections per (status, type)
+
+The rollups are maintained in the same transaction as the rows they count:
+an after_flush listener turns every ORM insert, update and delete of a
+FactCheck, Source or Correction into +/- deltas and upserts them. Bulk
+statements bypass the ORM, so code issuing them must rebuild the affected
+rollup (see app.services.metrics_rollup_service), which is also the backfill.
+The tracked model columns set active_history so their old values are known.
+"""
+
+import enum
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Any, Optional
+
+from sqlalchemy import Date, Integer, String, Table, event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Mapped, Session, UOWTransaction, mapped_column
+from sqlalchemy.orm.attributes import get_history
+
+from app.models.base import Base
+from app.models.correction import Correction
+from app.models.fact_check import FactCheck
+from app.models.source import Source
+
+# Stored in place of NULL so unclassified sources still have a unique key
+NO_RELEVANCE: str = ""
+
+
+class FactCheckDailyRollup(Base):
+    """Fact-check counts per UTC creation day, verdict and number of sources"""
+
+    __tablename__ = "fact_check_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    verdict: Mapped[str] = mapped_column(String(50), primary_key=True)
+    sources_count: Mapped[int] = mapped_column(Integer, primary_key=True)
+    fact_check_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<FactCheckDailyRollup(day={self.day}, verdict={self.verdict}, "
+            f"sources_count={self.sources_count}, count={self.fact_check_count})>"
+        )
+
+
+class SourceRollup(Base):
+    """Source counts and credibility score sums per source type and relevance"""
+
+    __tablename__ = "source_rollups"
+
+    source_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    # NO_RELEVANCE for sources without a relevance classification
+    relevance: Mapped[str] = mapped_column(String(50), primary_key=True)
+    source_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    scored_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    credibility_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SourceRollup(type={self.source_type}, relevance={self.relevance}, "
+            f"count={self.source_count})>"
+        )
+
+
+class CorrectionRollup(Base):
+    """Correction counts per status and correction type"""
+
+    __tablename__ = "correction_rollups"
+
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    correction_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    correction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<CorrectionRollup(status={self.status}, type={self.correction_type}, "
+            f"count={self.correction_count})>"
+        )
+
+
+# ==============================================================================
+# ROW KEYS
+# ==============================================================================
+
+
+def rollup_label(value: Any) -> str:
+    """String stored in a rollup key column for an enum or plain column value"""
+    return str(value.value) if isinstance(value, enum.Enum) else str(value)
+
+
+def utc_day(value: datetime) -> date:
+    """UTC calendar day of a timestamp (naive timestamps are taken as UTC)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def _fact_check_key(values: dict[str, Any]) -> tuple[Any, ...]:
+    return (utc_day(values["created_at"]), values["verdict"], values["sources_count"] or 0)
+
+
+def _source_key(values: dict[str, Any]) -> tuple[Any, ...]:
+    relevance: Any = values["relevance"]
+    return (
+        rollup_label(values["source_type"]),
+        NO_RELEVANCE if relevance is None else rollup_label(relevance),
+    )
+
+
+def _source_measures(values: dict[str, Any]) -> tuple[int, ...]:
+    score: Optional[int] = values["credibility_score"]
+    return (1, 0 if score is None else 1, score or 0)
+
+
+def _correction_key(values: dict[str, Any]) -> tuple[Any, ...]:
+    return (rollup_label(values["status"]), rollup_label(values["correction_type"]))
+
+
+# model -> (rollup table, tracked attributes, key function, measures function)
+_TRACKED: dict[type, tuple[Table, tuple[str, ...], Any, Any]] = {
+    FactCheck: (
+        FactCheckDailyRollup.__table__,  # type: ignore[dict-item]
+        ("created_at", "verdict", "sources_count"),
+        _fact_check_key,
+        lambda values: (1,),
+    ),
+    Source: (
+        SourceRollup.__table__,  # type: ignore[dict-item]
+        ("source_type", "relevance", "credibility_score"),
+        _source_key,
+        _source_measures,
+    ),
+    Correction: (
+        CorrectionRollup.__table__,  # type: ignore[dict-item]
+        ("status", "correction_type"),
+        _correction_key,
+        lambda values: (1,),
+    ),
+}
+
+
+# ==============================================================================
+# TRANSACTIONAL MAINTENANCE
+# ==============================================================================
+
+
+def _values(obj: Any, attrs: tuple[str, ...], committed: bool) -> Optional[dict[str, Any]]:
+    """
+    Tracked attribute values of obj before (committed) or after this flush.
+
+    An attribute with no history that was never loaded was inserted as NULL.
+    Returns None when an expired value cannot be known; the backfill corrects
+    the rollups in that case.
+    """
+    expired: set[str] = inspect(obj).expired_attributes
+    values: dict[str, Any] = {}
+    for attr in attrs:
+        history = get_history(obj, attr)
+        if committed and history.deleted:
+            values[attr] = history.deleted[0]
+        elif not committed and history.added:
+            values[attr] = history.added[0]
+        elif history.unchanged:
+            values[attr] = history.unchanged[0]
+        elif attr in expired:
+            return None
+        else:
+            values[attr] = None
+    return values
+
+
+@event.listens_for(Session, "before_flush")
+def _load_rollup_keys(session: Session, flush_context: UOWTransaction, instances: Any) -> None:
+    """
+    Make every tracked value known before rows are written.
+
+    New fact-checks get a client-side created_at so their rollup day is known;
+    expired values of changed or deleted rows are loaded while the database
+    still holds them. Tracked columns use active_history, so assigning to an
+    unloaded one also keeps its old value.
+    """
+    now: datetime = datetime.now(timezone.utc)
+    for obj in session.new:
+        if isinstance(obj, FactCheck) and obj.created_at is None:
+            obj.created_at = now
+    for obj in [*session.dirty, *session.deleted]:
+        if type(obj) in _TRACKED:
+            for attr in set(_TRACKED[type(obj)][1]) & inspect(obj).expired_attributes:
+                getattr(obj, attr)
+
+
+# rollup table -> key -> summed measure deltas
+_Deltas = dict[Table, dict[tuple[Any, ...], list[int]]]
+
+
+def _add_deltas(deltas: _Deltas, obj: Any, *changes: tuple[bool, int]) -> None:
+    """Add obj's measures, signed, under its committed and/or new rollup key"""
+    table, attrs, key_fn, measures_fn = _TRACKED[type(obj)]
+    states: list[Optional[dict[str, Any]]] = [
+        _values(obj, attrs, committed) for committed, _ in changes
+    ]
+    if any(values is None for values in states):
+        return
+    for values, (_, sign) in zip(states, changes):
+        measures: tuple[int, ...] = measures_fn(values)
+        row: list[int] = deltas[table].setdefault(key_fn(values), [0] * len(measures))
+        for i, measure in enumerate(measures):
+            row[i] += sign * measure
+
+
+def _upsert_deltas(session: Session, deltas: _Deltas) -> None:
+    """Add the deltas to the rollup rows, creating rows that do not exist yet"""
+    insert = (
+        postgresql.insert if session.connection().dialect.name == "postgresql" else sqlite.insert
+    )
+    for table, rows in deltas.items():
+        key_columns = [column for column in table.columns if column.primary_key]
+        measure_columns = [column for column in table.columns if not column.primary_key]
+        # Fixed key order so concurrent writers lock rollup rows in the same order
+        for key, measures in sorted(rows.items(), key=lambda item: str(item[0])):
+            if not any(measures):
+                continue
+            stmt = insert(table).values(
+                {
+                    **{column.name: value for column, value in zip(key_columns, key)},
+                    **{column.name: value for column, value in zip(measure_columns, measures)},
+                }
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={
+                    column.name: column + stmt.excluded[column.name] for column in measure_columns
+                },
+            )
+            session.execute(stmt)
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_rollup_deltas(session: Session, flush_context: UOWTransaction) -> None:
+    """Upsert the rollup deltas of the FactCheck, Source and Correction rows just flushed"""
+    deltas: _Deltas = defaultdict(dict)
+    for obj in session.new:
+        if type(obj) in _TRACKED:
+            _add_deltas(deltas, obj, (False, 1))
+    for obj in session.deleted:
+        if type(obj) in _TRACKED:
+            _add_deltas(deltas, obj, (True, -1))
+    for obj in session.dirty:
+        if type(obj) in _TRACKED and session.is_modified(obj, include_collections=False):
+            _add_deltas(deltas, obj, (True, -1), (False, 1))
+
+    if deltas:
+        _upsert_deltas(session, deltas)
@@ -77,13 +77,13 @@ class PeerReview(TimeStampedModel):
     fact_check: Mapped["FactCheck"] = relationship(
         "FactCheck",
         back_populates="peer_reviews",
-        lazy="selectin",
+        lazy="raise",
     )
 
     reviewer: Mapped["User"] = relationship(
         "User",
         back_populates="peer_reviews",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
@@ -15,7 +15,7 @@ from datetime import date, datetime
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON
@@ -126,12 +126,19 @@ class RTBFRequest(TimeStampedModel):
     user: Mapped["User"] = relationship(
         "User",
         foreign_keys=[user_id],
-        lazy="selectin",
+        back_populates="rtbf_requests",
+        lazy="raise",
     )
     processed_by: Mapped[Optional["User"]] = relationship(
         "User",
         foreign_keys=[processed_by_id],
-        lazy="selectin",
+        lazy="raise",
+    )
+
+    __table_args__ = (
+        # Keyset pagination of the admin request list, all and per status
+        Index("ix_rtbf_requests_created_at_id", "created_at", "id"),
+        Index("ix_rtbf_requests_status_created_at_id", "status", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -77,6 +77,7 @@ class Source(TimeStampedModel):
         Enum(SourceType, values_callable=lambda obj: [e.value for e in obj]),
         nullable=False,
         index=True,
+        active_history=True,
     )
 
     # Title (required)
@@ -108,6 +109,7 @@ class Source(TimeStampedModel):
     credibility_score: Mapped[Optional[int]] = mapped_column(
         Integer,
         nullable=True,
+        active_history=True,
     )
 
     # Relevance (optional)
@@ -115,6 +117,7 @@ class Source(TimeStampedModel):
         Enum(SourceRelevance, values_callable=lambda obj: [e.value for e in obj]),
         nullable=True,
         index=True,
+        active_history=True,
     )
 
     # Archived URL (optional - e.g., Wayback Machine snapshot)
@@ -133,7 +136,7 @@ class Source(TimeStampedModel):
     fact_check: Mapped["FactCheck"] = relationship(
         "FactCheck",
         back_populates="source_records",
-        lazy="selectin",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
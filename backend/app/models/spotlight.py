@@ -59,7 +59,7 @@ class SpotlightContent(TimeStampedModel):
 
     # Relationships
     submission: Mapped["Submission"] = relationship(
-        "Submission", back_populates="spotlight_content", lazy="selectin"
+        "Submission", back_populates="spotlight_content", lazy="raise"
     )
 
     def __repr__(self) -> str:
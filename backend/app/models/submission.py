@@ -2,10 +2,11 @@
 Submission model for user-submitted content
 """
 
+from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, Enum, ForeignKey, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import TimeStampedModel, submission_claims
@@ -29,7 +30,9 @@ class Submission(TimeStampedModel):
     submission_type: Mapped[str] = mapped_column(String(50), nullable=False)  # text, image, video
     status: Mapped[str] = mapped_column(
         String(50), nullable=False, default="pending", index=True
-    )  # pending, processing, completed
+    )  # pending, processing, completed; spotlight: fetching, transcribing, extracting_claims, failed
+    # Why Spotlight ingestion failed, when status is "failed"
+    ingestion_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # EFCSN workflow fields
     workflow_state: Mapped[WorkflowState] = mapped_column(
@@ -54,30 +57,48 @@ class Submission(TimeStampedModel):
         nullable=True,
     )
 
+    # First SUBMITTED -> PUBLISHED interval, set on the first PUBLISHED transition
+    published_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+    publication_latency_seconds: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+    )
+
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="submissions", lazy="selectin")
+    user: Mapped["User"] = relationship("User", back_populates="submissions", lazy="raise")
     claims: Mapped[List["Claim"]] = relationship(
         "Claim",
         secondary=submission_claims,
         back_populates="submissions",
-        lazy="selectin",
+        lazy="raise",
     )
     spotlight_content: Mapped[Optional["SpotlightContent"]] = relationship(
-        "SpotlightContent", back_populates="submission", lazy="selectin", uselist=False
+        "SpotlightContent", back_populates="submission", lazy="raise", uselist=False
     )
     reviewer_assignments: Mapped[List["SubmissionReviewer"]] = relationship(
         "SubmissionReviewer",
         foreign_keys="SubmissionReviewer.submission_id",
         back_populates="submission",
-        lazy="selectin",
+        lazy="raise",
     )
     workflow_transitions: Mapped[List["WorkflowTransition"]] = relationship(
         "WorkflowTransition",
         back_populates="submission",
-        lazy="selectin",
+        lazy="raise",
         order_by="WorkflowTransition.created_at",
     )
 
+    __table_args__ = (
+        # Keyset pagination of the submissions list, all and per submitter
+        Index("ix_submissions_created_at_id", "created_at", "id"),
+        Index("ix_submissions_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Time-to-publication metrics over a publication window
+        Index("ix_submissions_published_at_latency", "published_at", "publication_latency_seconds"),
+    )
+
     @property
     def reviewers(self) -> List["User"]:
         """Get list of assigned reviewers from reviewer_assignments"""
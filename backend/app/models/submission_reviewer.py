@@ -32,12 +32,10 @@ class SubmissionReviewer(TimeStampedModel):
 
     # Relationships
     submission: Mapped["Submission"] = relationship(
-        "Submission", foreign_keys=[submission_id], lazy="selectin"
-    )
-    reviewer: Mapped["User"] = relationship("User", foreign_keys=[reviewer_id], lazy="selectin")
-    assigned_by: Mapped["User"] = relationship(
-        "User", foreign_keys=[assigned_by_id], lazy="selectin"
+        "Submission", foreign_keys=[submission_id], lazy="raise"
     )
+    reviewer: Mapped["User"] = relationship("User", foreign_keys=[reviewer_id], lazy="raise")
+    assigned_by: Mapped["User"] = relationship("User", foreign_keys=[assigned_by_id], lazy="raise")
 
     # Unique constraint to prevent duplicate assignments
     __table_args__ = (
@@ -84,7 +84,7 @@ class TransparencyPage(TimeStampedModel):
     versions: Mapped[list["TransparencyPageVersion"]] = relationship(
         "TransparencyPageVersion",
         back_populates="page",
-        lazy="selectin",
+        lazy="raise",
         order_by="TransparencyPageVersion.version",
     )
 
@@ -109,6 +109,9 @@ class TransparencyPageVersion(TimeStampedModel):
         content: Page content at this version
         changed_by_id: FK to the user who made the change
         change_summary: Optional description of what changed
+        diff_to_next: Unified diffs from this version to the next, computed
+            when the next version is saved ({"title": {lang: diff}, "content": ...});
+            NULL for versions saved before diffs were stored
     """
 
     __tablename__ = "transparency_page_versions"
@@ -136,16 +139,20 @@ class TransparencyPageVersion(TimeStampedModel):
         Text,
         nullable=True,
     )
+    diff_to_next: Mapped[Optional[dict[str, Any]]] = mapped_column(
+        JSONType,
+        nullable=True,
+    )
 
     # Relationships
     page: Mapped["TransparencyPage"] = relationship(
         "TransparencyPage",
         back_populates="versions",
-        lazy="selectin",
+        lazy="raise",
     )
     changed_by: Mapped["User"] = relationship(
         "User",
-        lazy="selectin",
+        lazy="raise",
     )
 
     # Indexes for optimized queries
@@ -48,47 +48,48 @@ class User(TimeStampedModel):
 
     # Relationships
     submissions: Mapped[List["Submission"]] = relationship(
-        "Submission", back_populates="user", lazy="selectin"
+        "Submission", back_populates="user", lazy="raise"
     )
     volunteer: Mapped[Optional["Volunteer"]] = relationship(
-        "Volunteer", back_populates="user", uselist=False, lazy="selectin"
+        "Volunteer", back_populates="user", uselist=False, lazy="raise"
     )
     reviewer_assignments: Mapped[List["SubmissionReviewer"]] = relationship(
         "SubmissionReviewer",
         foreign_keys="SubmissionReviewer.reviewer_id",
         back_populates="reviewer",
-        lazy="selectin",
+        lazy="raise",
     )
     assigned_reviews: Mapped[List["SubmissionReviewer"]] = relationship(
         "SubmissionReviewer",
         foreign_keys="SubmissionReviewer.assigned_by_id",
         back_populates="assigned_by",
-        lazy="selectin",
+        lazy="raise",
     )
     fact_check_ratings: Mapped[List["FactCheckRating"]] = relationship(
         "FactCheckRating",
         back_populates="assigned_by",
-        lazy="selectin",
+        lazy="raise",
     )
     peer_reviews: Mapped[List["PeerReview"]] = relationship(
         "PeerReview",
         back_populates="reviewer",
-        lazy="selectin",
+        lazy="raise",
     )
     corrections_reviewed: Mapped[List["Correction"]] = relationship(
         "Correction",
         back_populates="reviewed_by",
-        lazy="selectin",
+        lazy="raise",
     )
     correction_applications: Mapped[List["CorrectionApplication"]] = relationship(
         "CorrectionApplication",
         back_populates="applied_by",
-        lazy="selectin",
+        lazy="raise",
     )
     rtbf_requests: Mapped[List["RTBFRequest"]] = relationship(
         "RTBFRequest",
         foreign_keys="RTBFRequest.user_id",
-        lazy="selectin",
+        back_populates="user",
+        lazy="raise",
     )
 
     def __repr__(self) -> str:
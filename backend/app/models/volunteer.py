@@ -27,7 +27,7 @@ class Volunteer(TimeStampedModel):
     accuracy_rate: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)  # 0.0 to 1.0
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="volunteer", lazy="selectin")
+    user: Mapped["User"] = relationship("User", back_populates="volunteer", lazy="raise")
 
     def __repr__(self) -> str:
         return f"<Volunteer(id={self.id}, score={self.score}, verified={self.verified_count})>"
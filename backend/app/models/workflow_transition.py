@@ -110,11 +110,11 @@ class WorkflowTransition(TimeStampedModel):
     submission: Mapped["Submission"] = relationship(
         "Submission",
         back_populates="workflow_transitions",
-        lazy="selectin",
+        lazy="raise",
     )
     actor: Mapped["User"] = relationship(
         "User",
-        lazy="selectin",
+        lazy="raise",
     )
 
     # Indexes for optimized queries
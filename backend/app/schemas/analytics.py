@@ -12,12 +12,18 @@ Provides schemas for:
 - Source quality metrics
 - Correction rate tracking
 - EFCSN compliance checklist
+- Analytics event ingestion
 """
 
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, Literal, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+# Largest serialized event_metadata accepted per event, in bytes
+MAX_EVENT_METADATA_BYTES: int = 2048
 
 
 class MonthlyFactCheckCount(BaseModel):
@@ -53,6 +59,8 @@ class TimeToPublicationMetrics(BaseModel):
 
     average_hours: float = Field(..., ge=0, description="Average time to publication in hours")
     median_hours: float = Field(..., ge=0, description="Median time to publication in hours")
+    p90_hours: float = Field(0.0, ge=0, description="90th percentile time to publication in hours")
+    p99_hours: float = Field(0.0, ge=0, description="99th percentile time to publication in hours")
     min_hours: float = Field(..., ge=0, description="Minimum time to publication in hours")
     max_hours: float = Field(..., ge=0, description="Maximum time to publication in hours")
     total_published: int = Field(
@@ -157,3 +165,62 @@ class AnalyticsDashboardResponse(BaseModel):
     correction_rate: CorrectionRateMetrics
     efcsn_compliance: EFCSNComplianceResponse
     generated_at: datetime = Field(..., description="Timestamp when dashboard was generated")
+
+
+def _contains_nul(value: Any) -> bool:
+    """Whether a JSON value has a NUL character in any string or key."""
+    if isinstance(value, str):
+        return "\x00" in value
+    if isinstance(value, dict):
+        return any(_contains_nul(k) or _contains_nul(v) for k, v in value.items())
+    if isinstance(value, list):
+        return any(_contains_nul(item) for item in value)
+    return False
+
+
+class AnalyticsEventCreate(BaseModel):
+    """Single analytics event reported by a client."""
+
+    event_type: Literal[
+        "view", "share", "correction_request", "download", "embed", "api_access"
+    ] = Field(..., description="Type of event")
+    entity_type: Literal["fact_check", "submission", "claim", "user", "transparency_page"] = Field(
+        ..., description="Type of entity the event relates to"
+    )
+    entity_id: UUID = Field(..., description="UUID of the entity the event relates to")
+    event_metadata: Optional[dict[str, Any]] = Field(
+        None, description="Event-specific context (e.g. referrer, share channel)"
+    )
+
+    @field_validator("event_metadata")
+    @classmethod
+    def validate_metadata_size(cls, v: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """Reject metadata larger than MAX_EVENT_METADATA_BYTES once serialized."""
+        if v is not None and len(json.dumps(v, default=str)) > MAX_EVENT_METADATA_BYTES:
+            raise ValueError(f"event_metadata exceeds {MAX_EVENT_METADATA_BYTES} bytes")
+        return v
+
+    @field_validator("event_metadata")
+    @classmethod
+    def validate_metadata_text(cls, v: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
+        """Reject NUL characters, which PostgreSQL JSONB cannot store."""
+        if v is not None and _contains_nul(v):
+            raise ValueError("event_metadata must not contain NUL characters")
+        return v
+
+
+class AnalyticsEventBatch(BaseModel):
+    """Batch of analytics events sent in one request."""
+
+    events: list[AnalyticsEventCreate] = Field(
+        ..., min_length=1, max_length=100, description="Events to record (1-100)"
+    )
+
+
+class AnalyticsEventIngestResponse(BaseModel):
+    """Outcome of an ingestion request."""
+
+    accepted: int = Field(..., ge=0, description="Events buffered for writing")
+    dropped: int = Field(
+        ..., ge=0, description="Events sampled out or dropped because the buffer was full"
+    )
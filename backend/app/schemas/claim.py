@@ -10,6 +10,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.models.workflow_transition import WorkflowState
+
 
 class ClaimCreate(BaseModel):
     """Schema for creating a new claim"""
@@ -99,3 +101,40 @@ class SimilarClaimSchema(BaseModel):
     claim_id: UUID = Field(..., description="ID of the similar claim")
     content: str = Field(..., description="Content of the similar claim")
     similarity: float = Field(..., ge=0.0, le=1.0, description="Cosine similarity score")
+
+
+class HybridSearchRequest(BaseModel):
+    """Request schema for hybrid (full-text + vector) claim search"""
+
+    query: str = Field(..., min_length=1, max_length=1000, description="Search text")
+    language: Optional[Literal["nl", "en"]] = Field(
+        None, description="Parse the full-text query as Dutch or English only (default: both)"
+    )
+    limit: int = Field(20, ge=1, le=100, description="Maximum number of results")
+    workflow_state: Optional[WorkflowState] = Field(
+        None, description="Only claims of a submission in this workflow state"
+    )
+    verdict: Optional[str] = Field(
+        None, max_length=50, description="Only claims with a fact-check of this verdict"
+    )
+    created_from: Optional[datetime] = Field(None, description="Claims recorded at or after")
+    created_to: Optional[datetime] = Field(None, description="Claims recorded before")
+
+
+class HybridSearchResultSchema(BaseModel):
+    """A claim found by hybrid search, with its latest fact-check"""
+
+    claim_id: UUID
+    claim_content: str
+    claim_created_at: datetime
+    fact_check_id: Optional[UUID] = None
+    verdict: Optional[str] = None
+    score: float = Field(..., ge=0, description="Reciprocal-rank fusion score")
+    lexical_rank: Optional[int] = Field(None, description="Position in the full-text ranking")
+    vector_rank: Optional[int] = Field(None, description="Position in the vector ranking")
+    similarity: Optional[float] = Field(None, description="Cosine similarity to the query")
+    content_highlight: Optional[str] = Field(
+        None, description="HTML-escaped claim excerpt with matching terms in <mark> tags"
+    )
+
+    model_config = {"from_attributes": True}
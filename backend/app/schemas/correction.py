@@ -318,4 +318,5 @@ class PublicLogListResponse(BaseModel):
     """
 
     corrections: list[PublicLogCorrectionResponse]
-    total_count: int
+    total_count: Optional[int]  # None when requested with count=none
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
@@ -56,9 +56,10 @@ class RTBFRequestListResponse(BaseModel):
     """Schema for listing RTBF requests"""
 
     items: list["RTBFRequestResponse"]
-    total: int
+    total: Optional[int]  # None when requested with count=none
     pending_count: int
     processing_count: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
 
     model_config = {"from_attributes": True}
 
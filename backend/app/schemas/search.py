@@ -0,0 +1,43 @@
+"""
+Pydantic schemas for the search API
+
+Ranked full-text search over claims and fact-checks (see
+app.services.search_service).
+"""
+
+from datetime import datetime
+from typing import Literal, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SearchResultSchema(BaseModel):
+    """A claim matching the search query, with its latest fact-check"""
+
+    claim_id: UUID
+    claim_content: str
+    claim_created_at: datetime
+    fact_check_id: Optional[UUID] = None
+    verdict: Optional[str] = None
+    score: float = Field(..., ge=0, description="Relevance; comparable within one response")
+    match: Literal["fulltext", "fuzzy"] = Field(
+        ..., description="fuzzy when no full-text match was found and trigram similarity was used"
+    )
+    content_highlight: str = Field(
+        ..., description="HTML-escaped claim excerpt with matching terms in <mark> tags"
+    )
+    reasoning_highlight: Optional[str] = Field(
+        None, description="Same for the fact-check reasoning, when it matched"
+    )
+
+    model_config = {"from_attributes": True}
+
+
+class SearchResponse(BaseModel):
+    """One page of search results, best matches first"""
+
+    query: str
+    language: Optional[str] = None
+    results: list[SearchResultSchema]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
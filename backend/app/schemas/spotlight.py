@@ -45,3 +45,12 @@ class SpotlightContentResponse(BaseModel):
     raw_metadata: dict[str, Any]
     created_at: datetime
     updated_at: datetime
+
+
+class SpotlightSubmissionAccepted(BaseModel):
+    """Schema for an accepted Spotlight submission awaiting background ingestion"""
+
+    submission_id: UUID
+    status: str = Field(..., description="Current ingestion stage (Submission.status)")
+    spotlight_link: str
+    task_id: Optional[str] = Field(None, description="Celery task ID of the ingestion job")
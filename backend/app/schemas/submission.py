@@ -68,6 +68,7 @@ class SubmissionResponse(BaseModel):
     content: str
     submission_type: str
     status: str
+    ingestion_error: Optional[str] = None  # Set when Spotlight ingestion failed
     workflow_state: Optional[str] = None
     created_at: datetime
     updated_at: datetime
@@ -93,10 +94,14 @@ class SubmissionWithClaimsResponse(SubmissionResponse):
 
 
 class SubmissionListResponse(BaseModel):
-    """Schema for paginated list of submissions"""
+    """Schema for paginated list of submissions
+
+    total and total_pages are None when the request asked for count=none.
+    """
 
     items: List[SubmissionResponse]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
+    next_cursor: Optional[str] = None  # Pass as ?cursor= for the next page
@@ -0,0 +1,359 @@
+"""
+Buffered ingestion of analytics events
+
+Issue #88: Backend Analytics Service & EFCSN Compliance Metrics
+ADR 0005: EFCSN Compliance Architecture
+
+Page views and shares arrive at public traffic rates; one ORM insert and
+commit per event would make every view a database round trip. Instead,
+POST /analytics/events appends events to a bounded in-process buffer (an
+O(1) operation that never touches the database) and a background flusher
+bulk-writes them in batches bounded by size and age:
+
+- PostgreSQL (asyncpg): COPY into analytics_events
+- Other databases: one multi-row INSERT per batch
+
+Backpressure: once the buffer is ANALYTICS_INGEST_SAMPLE_ABOVE full, view
+events are sampled at ANALYTICS_INGEST_SAMPLE_RATE and the kept ones carry a
+sample_weight in their metadata so counts can be re-weighted; when it is
+full, new events are dropped. Events buffered in a process that crashes are
+lost, which is acceptable for view statistics. Delivery statistics are
+exposed on /health/analytics-ingestion.
+
+Failed writes: while the database is unreachable, batches stay buffered and
+are retried on the next flush. A batch the database rejects is retried once;
+if it fails again it is split in halves until the rejected events are
+isolated, and those are dropped, so a single bad row cannot stall ingestion.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+import asyncpg  # type: ignore[import-untyped]
+from sqlalchemy import insert, null
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.analytics_event import AnalyticsEvent
+
+logger = logging.getLogger(__name__)
+
+# High-volume event types thinned out under backpressure; others are kept until the buffer is full
+SAMPLED_EVENT_TYPES: frozenset[str] = frozenset({"view"})
+
+_COLUMNS: tuple[str, ...] = (
+    "id",
+    "event_type",
+    "entity_type",
+    "entity_id",
+    "event_metadata",
+    "occurred_at",
+    "created_at",
+    "updated_at",
+)
+
+
+def _is_database_unavailable(error: Exception) -> bool:
+    """Whether a write failed because the database could not be reached
+
+    Such failures say nothing about the events, so they never count towards
+    dropping a batch.
+    """
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+    return isinstance(
+        error,
+        (
+            OperationalError,
+            InterfaceError,
+            asyncpg.InterfaceError,
+            asyncpg.PostgresConnectionError,
+            OSError,
+        ),
+    )
+
+
+@dataclass
+class IngestionMetrics:
+    """Delivery statistics for the analytics event buffer (per process)"""
+
+    received: int = 0
+    accepted: int = 0
+    sampled_out: int = 0
+    dropped: int = 0
+    written: int = 0
+    lost: int = 0
+    batches: int = 0
+    flush_errors: int = 0
+    max_buffered: int = 0
+    total_flush_seconds: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dict"""
+        return {
+            "received": self.received,
+            "accepted": self.accepted,
+            "sampled_out": self.sampled_out,
+            "dropped": self.dropped,
+            "written": self.written,
+            "lost": self.lost,
+            "batches": self.batches,
+            "flush_errors": self.flush_errors,
+            "max_buffered": self.max_buffered,
+            "avg_batch_size": round(self.written / self.batches, 1) if self.batches else 0.0,
+            "avg_flush_ms": (
+                round(self.total_flush_seconds / self.batches * 1000, 2) if self.batches else 0.0
+            ),
+        }
+
+
+class AnalyticsEventBuffer:
+    """Bounded buffer of analytics events with a background bulk writer
+
+    Attributes:
+        capacity: Events held before new ones are dropped
+        batch_size: Events per bulk write; a full batch is flushed immediately
+        flush_interval: Seconds an event may wait for a batch to fill
+        sample_above: Buffer fill ratio above which view events are sampled
+        sample_rate: Share of view events kept while sampling
+        metrics: Delivery statistics
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        batch_size: int,
+        flush_interval: float,
+        sample_above: float,
+        sample_rate: float,
+        session_factory: Callable[[], Any] = AsyncSessionLocal,
+    ) -> None:
+        """Initialize the buffer
+
+        Args:
+            capacity: Events held before new ones are dropped
+            batch_size: Events per bulk write
+            flush_interval: Seconds an event may wait for a batch to fill
+            sample_above: Buffer fill ratio above which view events are sampled
+            sample_rate: Share of view events kept while sampling
+            session_factory: Returns an async context manager yielding an AsyncSession
+        """
+        self.capacity: int = capacity
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.sample_above: float = sample_above
+        self.sample_rate: float = sample_rate
+        self.metrics: IngestionMetrics = IngestionMetrics()
+        self._session_factory: Callable[[], Any] = session_factory
+        self._events: deque[dict[str, Any]] = deque()
+        # Buffered events whose write was already rejected once
+        self._failed_ids: set[UUID] = set()
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._flush_lock: asyncio.Lock = asyncio.Lock()
+        self._stopped: bool = False
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record(self, events: Iterable[dict[str, Any]]) -> int:
+        """Buffer events for the next bulk write
+
+        Never blocks and never touches the database.
+
+        Args:
+            events: Dicts with event_type, entity_type, entity_id and
+                optional event_metadata
+
+        Returns:
+            Number of events buffered (the rest were sampled out or dropped)
+        """
+        now: datetime = datetime.now(timezone.utc)
+        accepted: int = 0
+        for event in events:
+            self.metrics.received += 1
+            buffered: int = len(self._events)
+            if buffered >= self.capacity:
+                self.metrics.dropped += 1
+                continue
+
+            metadata: Optional[dict[str, Any]] = event.get("event_metadata")
+            if (
+                event["event_type"] in SAMPLED_EVENT_TYPES
+                and buffered >= self.capacity * self.sample_above
+            ):
+                if random.random() >= self.sample_rate:
+                    self.metrics.sampled_out += 1
+                    continue
+                metadata = {**(metadata or {}), "sample_weight": 1 / self.sample_rate}
+
+            self._events.append(
+                {
+                    "id": uuid4(),
+                    "event_type": event["event_type"],
+                    "entity_type": event["entity_type"],
+                    "entity_id": event["entity_id"],
+                    "event_metadata": metadata,
+                    "occurred_at": now,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+            accepted += 1
+
+        self.metrics.accepted += accepted
+        self.metrics.max_buffered = max(self.metrics.max_buffered, len(self._events))
+        if self._batch_ready is not None and len(self._events) >= self.batch_size:
+            self._batch_ready.set()
+        return accepted
+
+    async def flush(self) -> int:
+        """Write every buffered event in batches of batch_size
+
+        A batch that fails is put back at the front of the buffer (as far as
+        capacity allows) and flushing stops until the next attempt. A batch
+        rejected a second time, while the database is reachable, is split in
+        halves until the rejected events are isolated; those are dropped and
+        counted as lost.
+
+        Returns:
+            Number of events written
+        """
+        written: int = 0
+        async with self._flush_lock:
+            while self._events:
+                batch: list[dict[str, Any]] = [
+                    self._events.popleft() for _ in range(min(self.batch_size, len(self._events)))
+                ]
+                retried: bool = any(row["id"] in self._failed_ids for row in batch)
+                parts: deque[list[dict[str, Any]]] = deque([batch])
+                while parts:
+                    part: list[dict[str, Any]] = parts.popleft()
+                    started: float = time.perf_counter()
+                    try:
+                        await self._write(part)
+                    except Exception as e:
+                        self.metrics.flush_errors += 1
+                        unavailable: bool = _is_database_unavailable(e)
+                        if unavailable or not retried:
+                            logger.warning(f"Failed to write {len(part)} analytics events: {e}")
+                            if not unavailable:
+                                self._failed_ids.update(row["id"] for row in part)
+                            self._requeue([row for rows in (part, *parts) for row in rows])
+                            return written
+                        if len(part) == 1:
+                            self._failed_ids.discard(part[0]["id"])
+                            self.metrics.lost += 1
+                            logger.error(f"Dropping an analytics event the database rejects: {e}")
+                            continue
+                        middle: int = len(part) // 2
+                        parts.extendleft([part[middle:], part[:middle]])
+                        continue
+                    self._failed_ids.difference_update(row["id"] for row in part)
+                    self.metrics.batches += 1
+                    self.metrics.written += len(part)
+                    self.metrics.total_flush_seconds += time.perf_counter() - started
+                    written += len(part)
+        return written
+
+    def _requeue(self, rows: list[dict[str, Any]]) -> None:
+        """Put unwritten rows back at the front of the buffer, as far as capacity allows"""
+        room: int = max(self.capacity - len(self._events), 0)
+        self._events.extendleft(reversed(rows[:room]))
+        for row in rows[room:]:
+            self._failed_ids.discard(row["id"])
+        self.metrics.lost += len(rows) - min(room, len(rows))
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        """Bulk-write one batch in its own transaction"""
+        async with self._session_factory() as session:
+            if session.get_bind().dialect.driver == "asyncpg":
+                await self._copy(session, batch)
+            else:
+                # SQL NULL rather than a JSON null for events without metadata
+                rows: list[dict[str, Any]] = [
+                    {**row, "event_metadata": row["event_metadata"] or null()} for row in batch
+                ]
+                await session.execute(insert(AnalyticsEvent).values(rows))
+            await session.commit()
+
+    async def _copy(self, session: AsyncSession, batch: list[dict[str, Any]]) -> None:
+        """COPY a batch into analytics_events through the asyncpg connection"""
+        connection = await session.connection()
+        raw: Any = await connection.get_raw_connection()
+        records: list[tuple[Any, ...]] = [
+            tuple(
+                (
+                    json.dumps(row[column])
+                    if column == "event_metadata" and row[column] is not None
+                    else row[column]
+                )
+                for column in _COLUMNS
+            )
+            for row in batch
+        ]
+        await raw.driver_connection.copy_records_to_table(
+            AnalyticsEvent.__tablename__, records=records, columns=list(_COLUMNS)
+        )
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop"""
+        self._stopped = False
+        # Created here so it belongs to the loop the flusher runs on
+        self._batch_ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run(self._batch_ready))
+
+    async def stop(self) -> None:
+        """Stop the flusher and write what is still buffered"""
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def _run(self, batch_ready: asyncio.Event) -> None:
+        """Flush when a batch is full or flush_interval has passed, until stopped"""
+        while not self._stopped:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(batch_ready.wait(), timeout=self.flush_interval)
+            batch_ready.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Analytics event flush failed: {e}")
+
+
+# Singleton instance for use across the application
+_event_buffer: Optional[AnalyticsEventBuffer] = None
+
+
+def get_event_buffer() -> AnalyticsEventBuffer:
+    """Get or create the AnalyticsEventBuffer singleton
+
+    Returns:
+        AnalyticsEventBuffer instance
+    """
+    global _event_buffer
+    if _event_buffer is None:
+        _event_buffer = AnalyticsEventBuffer(
+            capacity=settings.ANALYTICS_INGEST_BUFFER_CAPACITY,
+            batch_size=settings.ANALYTICS_INGEST_BATCH_SIZE,
+            flush_interval=settings.ANALYTICS_INGEST_FLUSH_INTERVAL_SECONDS,
+            sample_above=settings.ANALYTICS_INGEST_SAMPLE_ABOVE,
+            sample_rate=settings.ANALYTICS_INGEST_SAMPLE_RATE,
+        )
+    return _event_buffer
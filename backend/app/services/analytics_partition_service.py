@@ -0,0 +1,167 @@
+"""
+Monthly partition management for analytics_events.
+
+Issue #88: Backend Analytics Service & EFCSN Compliance Metrics
+Issue #91: Data Retention Policies & Auto-Cleanup
+
+On PostgreSQL analytics_events is range-partitioned by month on occurred_at
+(migration s9t0u1v2w3x4). Each partition is named analytics_events_YYYY_MM
+and covers [first of month, first of next month) in UTC; a default partition
+catches rows outside every range and should stay empty. This module:
+- pre-creates the partitions for the coming months, so inserts never fall
+  into the default partition
+- detaches and drops partitions entirely older than the retention cutoff,
+  which replaces a DELETE over millions of rows with a catalog operation
+
+Queries that filter on occurred_at are pruned to the matching partitions by
+the planner; always bound analytics_events queries by occurred_at.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE: str = "analytics_events"
+DEFAULT_PARTITION: str = "analytics_events_default"
+
+_PARTITION_NAME = re.compile(r"^analytics_events_(\d{4})_(\d{2})$")
+
+
+@dataclass(frozen=True)
+class DroppedPartitions:
+    """Partitions removed by drop_expired_partitions"""
+
+    names: list[str]
+    estimated_rows: int
+
+
+def is_partitioned(db: AsyncSession) -> bool:
+    """Whether analytics_events is partitioned on this database (PostgreSQL only)"""
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def month_start(day: date) -> date:
+    """First day of the month containing day"""
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month months after month (negative goes back)"""
+    index: int = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the partition holding events of month"""
+    return f"{PARENT_TABLE}_{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month covered by a partition name, or None for other tables"""
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+async def list_partitions(db: AsyncSession) -> list[str]:
+    """Names of the partitions currently attached to analytics_events"""
+    result = await db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ),
+        {"parent": PARENT_TABLE},
+    )
+    return sorted(result.scalars().all())
+
+
+async def ensure_partitions(
+    db: AsyncSession, months_ahead: int, today: Optional[date] = None
+) -> list[str]:
+    """
+    Create the partitions for the current month and the next months_ahead.
+
+    Args:
+        db: Database session; the caller commits
+        months_ahead: Months after the current one to create in advance
+        today: Reference day (defaults to today in UTC)
+
+    Returns:
+        Names of the partitions created
+    """
+    current: date = month_start(today or datetime.now(timezone.utc).date())
+    existing: set[str] = set(await list_partitions(db))
+    created: list[str] = []
+
+    for offset in range(months_ahead + 1):
+        month: date = add_months(current, offset)
+        name: str = partition_name(month)
+        if name in existing:
+            continue
+        await db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+            )
+        )
+        created.append(name)
+
+    if created:
+        logger.info(f"Created analytics event partitions: {created}")
+    return created
+
+
+async def drop_expired_partitions(db: AsyncSession, cutoff: datetime) -> DroppedPartitions:
+    """
+    Detach and drop the partitions whose whole month is before cutoff.
+
+    A partition is only dropped once every event it can hold is older than
+    cutoff, so retention is applied at month granularity (rounding down).
+
+    Args:
+        db: Database session; the caller commits
+        cutoff: Events that occurred before this moment are expired
+
+    Returns:
+        Dropped partition names and their row count as estimated by the
+        planner statistics (counting them exactly would scan each partition)
+    """
+    names: list[str] = []
+    for name in await list_partitions(db):
+        month: Optional[date] = partition_month(name)
+        if month is None:
+            continue
+        upper: datetime = datetime.combine(add_months(month, 1), datetime.min.time(), timezone.utc)
+        if upper <= cutoff:
+            names.append(name)
+
+    estimated_rows: int = 0
+    for name in names:
+        result = await db.execute(
+            text("SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE relname = :name"),
+            {"name": name},
+        )
+        estimated_rows += int(result.scalar_one_or_none() or 0)
+        await db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+
+    if names:
+        logger.info(f"Dropped expired analytics event partitions: {names}")
+    return DroppedPartitions(names=names, estimated_rows=estimated_rows)
+
+
+async def default_partition_rows(db: AsyncSession) -> int:
+    """Rows that fell outside every monthly partition (should be 0)"""
+    result = await db.execute(text(f"SELECT count(*) FROM {DEFAULT_PARTITION}"))
+    return int(result.scalar_one())
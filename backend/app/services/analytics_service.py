@@ -12,18 +12,31 @@ This service implements:
 - Source quality metrics (EFCSN requires 2+ sources per fact-check)
 - Correction rate tracking
 - EFCSN compliance checklist for real-time monitoring
+
+Counts are read from the rollup tables in app.models.metrics_rollup, which
+are maintained on every write, so each metric group costs one small grouped
+query over days or categories instead of a scan of the full history. The
+dashboard runs those queries concurrently on separate pooled connections.
 """
 
+import enum
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, cast, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.correction import Correction, CorrectionStatus
+from app.core.database import run_concurrently
+from app.models.correction import CorrectionStatus
 from app.models.fact_check import FactCheck
-from app.models.source import Source
+from app.models.metrics_rollup import (
+    NO_RELEVANCE,
+    CorrectionRollup,
+    FactCheckDailyRollup,
+    SourceRollup,
+)
+from app.models.submission import Submission
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +50,449 @@ EFCSN_MIN_FACT_CHECKS_PER_MONTH: int = 4
 # EFCSN minimum sources per fact-check
 EFCSN_MIN_SOURCES_PER_FACT_CHECK: int = 2
 
+# Time-to-publication percentiles: median, p90, p99
+PUBLICATION_PERCENTILES: tuple[float, float, float] = (0.5, 0.9, 0.99)
+
+
+# ==============================================================================
+# AGGREGATE QUERIES
+# ==============================================================================
+#
+# Each query takes the session to run on, so the dashboard can run them
+# concurrently on separate sessions while the single-metric methods below
+# run them on the service's own session.
+
+
+def _label(value: Any) -> str:
+    """String key for a grouped enum column value"""
+    return str(value.value) if isinstance(value, enum.Enum) else str(value)
+
+
+def _month_start(now: datetime, months_back: int) -> datetime:
+    """First instant of the month months_back months before now's month"""
+    index: int = now.year * 12 + now.month - 1 - months_back
+    return now.replace(
+        year=index // 12, month=index % 12 + 1, day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+async def _query_monthly_counts(
+    db: AsyncSession, months: int, now: datetime
+) -> list[dict[str, Any]]:
+    """Fact-checks per calendar month, newest month first, from the daily rollup"""
+    if months <= 0:
+        return []
+
+    year_col = func.extract("year", FactCheckDailyRollup.day)
+    month_col = func.extract("month", FactCheckDailyRollup.day)
+    stmt = (
+        select(year_col, month_col, func.sum(FactCheckDailyRollup.fact_check_count))
+        .where(FactCheckDailyRollup.day >= _month_start(now, months - 1).date())
+        .group_by(year_col, month_col)
+    )
+    result = await db.execute(stmt)
+    counts: dict[tuple[int, int], int] = {
+        (int(year), int(month)): int(count or 0) for year, month, count in result.all()
+    }
+
+    month_data: list[dict[str, Any]] = []
+    for i in range(months):
+        start: datetime = _month_start(now, i)
+        count: int = counts.get((start.year, start.month), 0)
+        month_data.append(
+            {
+                "year": start.year,
+                "month": start.month,
+                "count": count,
+                "meets_efcsn_minimum": count >= EFCSN_MIN_FACT_CHECKS_PER_MONTH,
+            }
+        )
+    return month_data
+
+
+async def _query_fact_check_totals(db: AsyncSession, now: datetime) -> dict[str, int]:
+    """Fact-check totals shared by several metric groups, from the daily rollup"""
+    count = FactCheckDailyRollup.fact_check_count
+    sources_count = FactCheckDailyRollup.sources_count
+    stmt = select(
+        func.sum(count),
+        func.sum(count).filter(sources_count >= EFCSN_MIN_SOURCES_PER_FACT_CHECK),
+        func.sum(count).filter(sources_count < EFCSN_MIN_SOURCES_PER_FACT_CHECK),
+        func.sum(count).filter(FactCheckDailyRollup.day >= _month_start(now, 0).date()),
+    )
+    result = await db.execute(stmt)
+    total, meeting_minimum, below_minimum, this_month = result.one()
+    return {
+        "total": int(total or 0),
+        "meeting_minimum": int(meeting_minimum or 0),
+        "below_minimum": int(below_minimum or 0),
+        "this_month": int(this_month or 0),
+    }
+
+
+def _empty_time_to_publication() -> dict[str, Any]:
+    return {
+        "average_hours": 0.0,
+        "median_hours": 0.0,
+        "p90_hours": 0.0,
+        "p99_hours": 0.0,
+        "min_hours": 0.0,
+        "max_hours": 0.0,
+        "total_published": 0,
+    }
+
+
+def _rank_percentiles(rows: list[Any]) -> list[float]:
+    """
+    percentile_cont values from the rows around each percentile's rank.
+
+    Each row is (rank, latency, count); interpolates linearly between the
+    rows at the floor and ceiling of percentile * (count - 1).
+    """
+    by_rank: dict[int, float] = {int(row[0]): float(row[1]) for row in rows}
+    last: int = int(rows[0][2]) - 1
+    values: list[float] = []
+    for percentile in PUBLICATION_PERCENTILES:
+        position: float = percentile * last
+        lower: int = int(position)
+        upper: int = min(lower + 1, last)
+        values.append(by_rank[lower] + (by_rank[upper] - by_rank[lower]) * (position - lower))
+    return values
+
+
+async def _query_time_to_publication(
+    db: AsyncSession, now: datetime, days: int = 90
+) -> dict[str, Any]:
+    """
+    Time-to-publication statistics for submissions published in the last days.
+
+    Aggregates the materialized Submission.publication_latency_seconds in the
+    database: PostgreSQL computes the percentiles with percentile_cont; other
+    databases fetch only the few ranked rows around each percentile.
+    """
+    latency = Submission.publication_latency_seconds
+    window = (Submission.published_at >= now - timedelta(days=days), latency.is_not(None))
+
+    percentiles: list[float]
+    if db.get_bind().dialect.name == "postgresql":
+        result = await db.execute(
+            select(
+                func.count(latency),
+                func.avg(latency),
+                func.min(latency),
+                func.max(latency),
+                *(
+                    func.percentile_cont(percentile).within_group(latency)
+                    for percentile in PUBLICATION_PERCENTILES
+                ),
+            ).where(*window)
+        )
+        total, average, minimum, maximum, *percentiles = result.one()
+        if not total:
+            return _empty_time_to_publication()
+    else:
+        ranked = (
+            select(
+                (func.row_number().over(order_by=latency) - 1).label("rank"),
+                latency.label("latency"),
+                func.count().over().label("total"),
+                func.avg(latency).over().label("average"),
+                func.min(latency).over().label("minimum"),
+                func.max(latency).over().label("maximum"),
+            )
+            .where(*window)
+            .subquery()
+        )
+        positions = [
+            cast(percentile * (ranked.c.total - 1), Integer)
+            for percentile in PUBLICATION_PERCENTILES
+        ]
+        result = await db.execute(
+            select(
+                ranked.c.rank,
+                ranked.c.latency,
+                ranked.c.total,
+                ranked.c.average,
+                ranked.c.minimum,
+                ranked.c.maximum,
+            ).where(or_(*(ranked.c.rank.between(position, position + 1) for position in positions)))
+        )
+        rows: list[Any] = list(result.all())
+        if not rows:
+            return _empty_time_to_publication()
+        _, _, total, average, minimum, maximum = rows[0]
+        percentiles = _rank_percentiles(rows)
+
+    median, p90, p99 = (float(value) / 3600 for value in percentiles)
+    return {
+        "average_hours": round(float(average) / 3600, 2),
+        "median_hours": round(median, 2),
+        "p90_hours": round(p90, 2),
+        "p99_hours": round(p99, 2),
+        "min_hours": round(float(minimum) / 3600, 2),
+        "max_hours": round(float(maximum) / 3600, 2),
+        "total_published": int(total),
+    }
+
+
+async def _query_rating_distribution(
+    db: AsyncSession, start_date: datetime | None, end_date: datetime | None
+) -> dict[str, Any]:
+    """
+    Fact-checks per verdict with percentages.
+
+    Reads the daily rollup for the all-time distribution; a period bounded by
+    arbitrary timestamps is counted from fact_checks.
+    """
+    stmt: Any
+    if start_date is None and end_date is None:
+        stmt = select(
+            FactCheckDailyRollup.verdict, func.sum(FactCheckDailyRollup.fact_check_count)
+        ).group_by(FactCheckDailyRollup.verdict)
+    else:
+        stmt = select(FactCheck.verdict, func.count(FactCheck.id)).group_by(FactCheck.verdict)
+        if start_date:
+            stmt = stmt.where(FactCheck.created_at >= start_date)
+        if end_date:
+            stmt = stmt.where(FactCheck.created_at <= end_date)
+
+    result = await db.execute(stmt)
+    rows: list[tuple[str, int]] = [
+        (verdict, int(count)) for verdict, count in result.all() if count
+    ]
+    total_count: int = sum(count for _, count in rows)
+
+    ratings: list[dict[str, Any]] = [
+        {
+            "rating": verdict,
+            "count": count,
+            "percentage": round(count / total_count * 100, 1) if total_count > 0 else 0.0,
+        }
+        for verdict, count in rows
+    ]
+    # Sort by count descending
+    ratings.sort(key=lambda x: x["count"], reverse=True)
+
+    return {
+        "ratings": ratings,
+        "total_count": total_count,
+        "period_start": start_date,
+        "period_end": end_date,
+    }
+
+
+async def _query_source_breakdown(db: AsyncSession) -> list[tuple[Any, ...]]:
+    """Sources per (type, relevance) with credibility score sums, from the rollup"""
+    stmt = select(
+        SourceRollup.source_type,
+        SourceRollup.relevance,
+        SourceRollup.source_count,
+        SourceRollup.scored_count,
+        SourceRollup.credibility_sum,
+    ).where(SourceRollup.source_count > 0)
+    result = await db.execute(stmt)
+    return [
+        (
+            source_type,
+            None if relevance == NO_RELEVANCE else relevance,
+            count,
+            scored,
+            scores,
+        )
+        for source_type, relevance, count, scored, scores in result.all()
+    ]
+
+
+async def _query_correction_breakdown(db: AsyncSession) -> list[tuple[Any, ...]]:
+    """Corrections per (status, type), from the rollup"""
+    stmt = select(
+        CorrectionRollup.status, CorrectionRollup.correction_type, CorrectionRollup.correction_count
+    ).where(CorrectionRollup.correction_count > 0)
+    result = await db.execute(stmt)
+    return [
+        (CorrectionStatus(status), correction_type, count)
+        for status, correction_type, count in result.all()
+    ]
+
+
+# ==============================================================================
+# METRIC BUILDERS
+# ==============================================================================
+
+
+def _build_source_quality(
+    fact_checks: dict[str, int], source_rows: list[tuple[Any, ...]]
+) -> dict[str, Any]:
+    """Source quality metrics from fact-check totals and the source breakdown"""
+    total_sources: int = 0
+    scored_sources: int = 0
+    score_sum: float = 0.0
+    sources_by_type: dict[str, int] = {}
+    sources_by_relevance: dict[str, int] = {}
+
+    for source_type, relevance, count, scored, scores in source_rows:
+        total_sources += int(count)
+        scored_sources += int(scored)
+        score_sum += float(scores or 0)
+        type_key: str = _label(source_type)
+        sources_by_type[type_key] = sources_by_type.get(type_key, 0) + int(count)
+        if relevance is not None:
+            relevance_key: str = _label(relevance)
+            sources_by_relevance[relevance_key] = sources_by_relevance.get(relevance_key, 0) + int(
+                count
+            )
+
+    total_fact_checks: int = fact_checks["total"]
+    avg_sources: float = total_sources / total_fact_checks if total_fact_checks > 0 else 0.0
+    # Average credibility only over sources that have a score
+    avg_credibility: float = score_sum / scored_sources if scored_sources > 0 else 0.0
+
+    return {
+        "average_sources_per_fact_check": round(avg_sources, 2),
+        "average_credibility_score": round(avg_credibility, 2),
+        "total_sources": total_sources,
+        "sources_by_type": sources_by_type,
+        "sources_by_relevance": sources_by_relevance,
+        "fact_checks_meeting_minimum": fact_checks["meeting_minimum"],
+        "fact_checks_below_minimum": fact_checks["below_minimum"],
+    }
+
+
+def _build_correction_rate(
+    fact_checks: dict[str, int], correction_rows: list[tuple[Any, ...]]
+) -> dict[str, Any]:
+    """Correction metrics from fact-check totals and the correction breakdown"""
+    by_status: dict[CorrectionStatus, int] = {}
+    corrections_by_type: dict[str, int] = {}
+    for status, correction_type, count in correction_rows:
+        by_status[status] = by_status.get(status, 0) + int(count)
+        type_key: str = _label(correction_type)
+        corrections_by_type[type_key] = corrections_by_type.get(type_key, 0) + int(count)
+
+    total_fact_checks: int = fact_checks["total"]
+    total_corrections: int = sum(by_status.values())
+    correction_rate: float = total_corrections / total_fact_checks if total_fact_checks > 0 else 0.0
+
+    return {
+        "total_fact_checks": total_fact_checks,
+        "total_corrections": total_corrections,
+        "corrections_accepted": by_status.get(CorrectionStatus.ACCEPTED, 0),
+        "corrections_rejected": by_status.get(CorrectionStatus.REJECTED, 0),
+        "corrections_pending": by_status.get(CorrectionStatus.PENDING, 0),
+        "correction_rate": round(correction_rate, 2),
+        "corrections_by_type": corrections_by_type,
+    }
+
+
+def _build_efcsn_compliance(fact_checks: dict[str, int], now: datetime) -> dict[str, Any]:
+    """EFCSN compliance checklist from fact-check totals"""
+    checklist: list[dict[str, Any]] = []
+    compliant_count: int = 0
+    total_checks: int = 0
+
+    # ==========================================================================
+    # Check 1: Monthly Fact-Check Minimum
+    # ==========================================================================
+    total_checks += 1
+    monthly_count: int = fact_checks["this_month"]
+
+    monthly_status: str = (
+        "compliant" if monthly_count >= EFCSN_MIN_FACT_CHECKS_PER_MONTH else "non_compliant"
+    )
+    if monthly_status == "compliant":
+        compliant_count += 1
+
+    checklist.append(
+        {
+            "requirement": "Monthly Fact-Check Minimum",
+            "status": monthly_status,
+            "details": f"{monthly_count} fact-checks published this month",
+            "value": str(monthly_count),
+            "threshold": str(EFCSN_MIN_FACT_CHECKS_PER_MONTH),
+        }
+    )
+
+    # ==========================================================================
+    # Check 2: Source Documentation
+    # ==========================================================================
+    total_checks += 1
+    meeting_min: int = fact_checks["meeting_minimum"]
+    total_fc: int = meeting_min + fact_checks["below_minimum"]
+
+    source_compliance_pct: float = (meeting_min / total_fc * 100) if total_fc > 0 else 100.0
+
+    source_status: str
+    if source_compliance_pct >= 90:
+        source_status = "compliant"
+        compliant_count += 1
+    elif source_compliance_pct >= 75:
+        source_status = "warning"
+    else:
+        source_status = "non_compliant"
+
+    checklist.append(
+        {
+            "requirement": "Source Documentation",
+            "status": source_status,
+            "details": f"{meeting_min}/{total_fc} fact-checks have 2+ sources ({source_compliance_pct:.1f}%)",
+            "value": f"{source_compliance_pct:.1f}%",
+            "threshold": "90%",
+        }
+    )
+
+    # ==========================================================================
+    # Check 3: Corrections Policy
+    # ==========================================================================
+    total_checks += 1
+    # This is a placeholder - in a real implementation, this would check
+    # if the corrections policy transparency page exists and is up to date
+    corrections_policy_exists: bool = True  # Assume policy exists for now
+
+    corrections_status: str = "compliant" if corrections_policy_exists else "non_compliant"
+    if corrections_status == "compliant":
+        compliant_count += 1
+
+    checklist.append(
+        {
+            "requirement": "Corrections Policy",
+            "status": corrections_status,
+            "details": "Corrections policy is in place and publicly accessible",
+            "value": "Available" if corrections_policy_exists else "Missing",
+            "threshold": "Required",
+        }
+    )
+
+    # ==========================================================================
+    # Calculate Overall Status
+    # ==========================================================================
+    compliance_score: float = (compliant_count / total_checks * 100) if total_checks > 0 else 0.0
+
+    overall_status: str
+    if compliance_score == 100:
+        overall_status = "compliant"
+    elif compliance_score >= 66:
+        overall_status = "at_risk"
+    else:
+        overall_status = "non_compliant"
+
+    return {
+        "overall_status": overall_status,
+        "checklist": checklist,
+        "last_checked": now,
+        "compliance_score": round(compliance_score, 1),
+    }
+
+
+def _summarize_monthly(month_data: list[dict[str, Any]], months: int) -> dict[str, Any]:
+    """Monthly counts with total and average"""
+    total_count: int = sum(m["count"] for m in month_data)
+    average: float = total_count / months if months > 0 else 0.0
+    return {
+        "months": month_data,
+        "total_count": total_count,
+        "average_per_month": round(average, 2),
+    }
+
 
 # ==============================================================================
 # ANALYTICS SERVICE CLASS
@@ -86,47 +542,8 @@ class AnalyticsService:
             - average_per_month: Average fact-checks per month
         """
         now: datetime = datetime.now(timezone.utc)
-
-        # Calculate date range
-        month_data: list[dict[str, Any]] = []
-        total_count: int = 0
-
-        for i in range(months):
-            # Calculate month boundaries
-            year: int = now.year
-            month: int = now.month - i
-
-            # Handle year rollover
-            while month <= 0:
-                month += 12
-                year -= 1
-
-            # Get count for this month using created_at
-            stmt = select(func.count(FactCheck.id)).where(
-                func.extract("year", FactCheck.created_at) == year,
-                func.extract("month", FactCheck.created_at) == month,
-            )
-            result = await self.db.execute(stmt)
-            count: int = result.scalar() or 0
-
-            month_data.append(
-                {
-                    "year": year,
-                    "month": month,
-                    "count": count,
-                    "meets_efcsn_minimum": count >= EFCSN_MIN_FACT_CHECKS_PER_MONTH,
-                }
-            )
-            total_count += count
-
-        # Calculate average
-        average: float = total_count / months if months > 0 else 0.0
-
-        return {
-            "months": month_data,
-            "total_count": total_count,
-            "average_per_month": round(average, 2),
-        }
+        month_data = await _query_monthly_counts(self.db, months, now)
+        return _summarize_monthly(month_data, months)
 
     # ==========================================================================
     # TIME-TO-PUBLICATION METRICS
@@ -136,8 +553,8 @@ class AnalyticsService:
         """
         Calculate time-to-publication metrics.
 
-        Measures the time from fact-check creation to now (placeholder for
-        actual publication timestamp when workflow is complete).
+        Measures the time from a submission's SUBMITTED transition to its
+        first publication, for submissions published in the last days.
 
         Args:
             days: Number of days to analyze (default 90)
@@ -145,53 +562,7 @@ class AnalyticsService:
         Returns:
             Dictionary containing time-to-publication statistics
         """
-        # Get all fact-checks
-        stmt = select(FactCheck)
-        result = await self.db.execute(stmt)
-        fact_checks: list[FactCheck] = list(result.scalars().all())
-
-        if not fact_checks:
-            return {
-                "average_hours": 0.0,
-                "median_hours": 0.0,
-                "min_hours": 0.0,
-                "max_hours": 0.0,
-                "total_published": 0,
-            }
-
-        # Calculate publication times (using created_at as proxy for now)
-        # In a full implementation, this would use the workflow publication timestamp
-        publication_hours: list[float] = []
-        now: datetime = datetime.now(timezone.utc)
-
-        for fc in fact_checks:
-            created_at: datetime = fc.created_at
-            # Normalize timezone
-            if created_at.tzinfo is None:
-                created_at = created_at.replace(tzinfo=timezone.utc)
-
-            # For now, calculate time since creation (placeholder metric)
-            delta = now - created_at
-            hours: float = delta.total_seconds() / 3600
-            publication_hours.append(hours)
-
-        # Calculate statistics
-        publication_hours.sort()
-        total: int = len(publication_hours)
-        avg: float = sum(publication_hours) / total
-        median: float = (
-            publication_hours[total // 2]
-            if total % 2 == 1
-            else (publication_hours[total // 2 - 1] + publication_hours[total // 2]) / 2
-        )
-
-        return {
-            "average_hours": round(avg, 2),
-            "median_hours": round(median, 2),
-            "min_hours": round(min(publication_hours), 2),
-            "max_hours": round(max(publication_hours), 2),
-            "total_published": total,
-        }
+        return await _query_time_to_publication(self.db, datetime.now(timezone.utc), days)
 
     # ==========================================================================
     # RATING DISTRIBUTION
@@ -212,53 +583,7 @@ class AnalyticsService:
         Returns:
             Dictionary containing rating distribution with percentages
         """
-        # Build query
-        stmt = select(FactCheck.verdict, func.count(FactCheck.id).label("count")).group_by(
-            FactCheck.verdict
-        )
-
-        # Apply date filters if provided
-        if start_date:
-            stmt = stmt.where(FactCheck.created_at >= start_date)
-        if end_date:
-            stmt = stmt.where(FactCheck.created_at <= end_date)
-
-        result = await self.db.execute(stmt)
-        rows = result.all()
-
-        if not rows:
-            return {
-                "ratings": [],
-                "total_count": 0,
-                "period_start": start_date,
-                "period_end": end_date,
-            }
-
-        # Calculate total - use index [1] since row is (verdict, count) tuple
-        total_count: int = sum(int(row[1]) for row in rows)
-
-        # Build distribution
-        ratings: list[dict[str, Any]] = []
-        for row in rows:
-            count_val = int(row[1])  # row[1] is the count column
-            percentage: float = (count_val / total_count * 100) if total_count > 0 else 0.0
-            ratings.append(
-                {
-                    "rating": row[0],  # row[0] is the verdict column
-                    "count": count_val,
-                    "percentage": round(percentage, 1),
-                }
-            )
-
-        # Sort by count descending
-        ratings.sort(key=lambda x: x["count"], reverse=True)
-
-        return {
-            "ratings": ratings,
-            "total_count": total_count,
-            "period_start": start_date,
-            "period_end": end_date,
-        }
+        return await _query_rating_distribution(self.db, start_date, end_date)
 
     # ==========================================================================
     # SOURCE QUALITY METRICS
@@ -273,75 +598,10 @@ class AnalyticsService:
         Returns:
             Dictionary containing source quality statistics
         """
-        # Get total sources
-        total_sources_stmt = select(func.count(Source.id))
-        total_sources_result = await self.db.execute(total_sources_stmt)
-        total_sources: int = total_sources_result.scalar() or 0
-
-        # Get total fact-checks
-        total_fc_stmt = select(func.count(FactCheck.id))
-        total_fc_result = await self.db.execute(total_fc_stmt)
-        total_fact_checks: int = total_fc_result.scalar() or 0
-
-        # Calculate average sources per fact-check
-        avg_sources: float = total_sources / total_fact_checks if total_fact_checks > 0 else 0.0
-
-        # Get average credibility score (only for sources with scores)
-        avg_cred_stmt = select(func.avg(Source.credibility_score)).where(
-            Source.credibility_score.isnot(None)
-        )
-        avg_cred_result = await self.db.execute(avg_cred_stmt)
-        avg_credibility: float = float(avg_cred_result.scalar() or 0.0)
-
-        # Get sources by type
-        sources_by_type_stmt = select(
-            Source.source_type, func.count(Source.id).label("count")
-        ).group_by(Source.source_type)
-        sources_by_type_result = await self.db.execute(sources_by_type_stmt)
-        sources_by_type: dict[str, int] = {
-            (row[0].value if hasattr(row[0], "value") else str(row[0])): int(
-                row[1]
-            )  # row[0]=source_type, row[1]=count
-            for row in sources_by_type_result.all()
-        }
-
-        # Get sources by relevance
-        sources_by_relevance_stmt = (
-            select(Source.relevance, func.count(Source.id).label("count"))
-            .where(Source.relevance.isnot(None))
-            .group_by(Source.relevance)
-        )
-        sources_by_relevance_result = await self.db.execute(sources_by_relevance_stmt)
-        sources_by_relevance: dict[str, int] = {
-            (row[0].value if hasattr(row[0], "value") else str(row[0])): int(
-                row[1]
-            )  # row[0]=relevance, row[1]=count
-            for row in sources_by_relevance_result.all()
-        }
-
-        # Count fact-checks meeting/below EFCSN minimum (2 sources)
-        # Using sources_count column from FactCheck model
-        meeting_min_stmt = select(func.count(FactCheck.id)).where(
-            FactCheck.sources_count >= EFCSN_MIN_SOURCES_PER_FACT_CHECK
-        )
-        meeting_min_result = await self.db.execute(meeting_min_stmt)
-        fact_checks_meeting_minimum: int = meeting_min_result.scalar() or 0
-
-        below_min_stmt = select(func.count(FactCheck.id)).where(
-            FactCheck.sources_count < EFCSN_MIN_SOURCES_PER_FACT_CHECK
-        )
-        below_min_result = await self.db.execute(below_min_stmt)
-        fact_checks_below_minimum: int = below_min_result.scalar() or 0
-
-        return {
-            "average_sources_per_fact_check": round(avg_sources, 2),
-            "average_credibility_score": round(avg_credibility, 2),
-            "total_sources": total_sources,
-            "sources_by_type": sources_by_type,
-            "sources_by_relevance": sources_by_relevance,
-            "fact_checks_meeting_minimum": fact_checks_meeting_minimum,
-            "fact_checks_below_minimum": fact_checks_below_minimum,
-        }
+        now: datetime = datetime.now(timezone.utc)
+        fact_checks = await _query_fact_check_totals(self.db, now)
+        source_rows = await _query_source_breakdown(self.db)
+        return _build_source_quality(fact_checks, source_rows)
 
     # ==========================================================================
     # CORRECTION RATE METRICS
@@ -354,61 +614,10 @@ class AnalyticsService:
         Returns:
             Dictionary containing correction statistics
         """
-        # Get total fact-checks
-        total_fc_stmt = select(func.count(FactCheck.id))
-        total_fc_result = await self.db.execute(total_fc_stmt)
-        total_fact_checks: int = total_fc_result.scalar() or 0
-
-        # Get total corrections
-        total_corr_stmt = select(func.count(Correction.id))
-        total_corr_result = await self.db.execute(total_corr_stmt)
-        total_corrections: int = total_corr_result.scalar() or 0
-
-        # Get corrections by status
-        accepted_stmt = select(func.count(Correction.id)).where(
-            Correction.status == CorrectionStatus.ACCEPTED
-        )
-        accepted_result = await self.db.execute(accepted_stmt)
-        corrections_accepted: int = accepted_result.scalar() or 0
-
-        rejected_stmt = select(func.count(Correction.id)).where(
-            Correction.status == CorrectionStatus.REJECTED
-        )
-        rejected_result = await self.db.execute(rejected_stmt)
-        corrections_rejected: int = rejected_result.scalar() or 0
-
-        pending_stmt = select(func.count(Correction.id)).where(
-            Correction.status == CorrectionStatus.PENDING
-        )
-        pending_result = await self.db.execute(pending_stmt)
-        corrections_pending: int = pending_result.scalar() or 0
-
-        # Calculate correction rate
-        correction_rate: float = (
-            total_corrections / total_fact_checks if total_fact_checks > 0 else 0.0
-        )
-
-        # Get corrections by type
-        corr_by_type_stmt = select(
-            Correction.correction_type, func.count(Correction.id).label("count")
-        ).group_by(Correction.correction_type)
-        corr_by_type_result = await self.db.execute(corr_by_type_stmt)
-        corrections_by_type: dict[str, int] = {
-            (row[0].value if hasattr(row[0], "value") else str(row[0])): int(
-                row[1]
-            )  # row[0]=correction_type, row[1]=count
-            for row in corr_by_type_result.all()
-        }
-
-        return {
-            "total_fact_checks": total_fact_checks,
-            "total_corrections": total_corrections,
-            "corrections_accepted": corrections_accepted,
-            "corrections_rejected": corrections_rejected,
-            "corrections_pending": corrections_pending,
-            "correction_rate": round(correction_rate, 2),
-            "corrections_by_type": corrections_by_type,
-        }
+        now: datetime = datetime.now(timezone.utc)
+        fact_checks = await _query_fact_check_totals(self.db, now)
+        correction_rows = await _query_correction_breakdown(self.db)
+        return _build_correction_rate(fact_checks, correction_rows)
 
     # ==========================================================================
     # EFCSN COMPLIANCE CHECKLIST
@@ -427,116 +636,8 @@ class AnalyticsService:
             Dictionary containing compliance status and checklist
         """
         now: datetime = datetime.now(timezone.utc)
-        checklist: list[dict[str, Any]] = []
-        compliant_count: int = 0
-        total_checks: int = 0
-
-        # ==========================================================================
-        # Check 1: Monthly Fact-Check Minimum
-        # ==========================================================================
-        total_checks += 1
-        current_month: int = now.month
-        current_year: int = now.year
-
-        monthly_count_stmt = select(func.count(FactCheck.id)).where(
-            func.extract("year", FactCheck.created_at) == current_year,
-            func.extract("month", FactCheck.created_at) == current_month,
-        )
-        monthly_count_result = await self.db.execute(monthly_count_stmt)
-        monthly_count: int = monthly_count_result.scalar() or 0
-
-        monthly_status: str = (
-            "compliant" if monthly_count >= EFCSN_MIN_FACT_CHECKS_PER_MONTH else "non_compliant"
-        )
-        if monthly_status == "compliant":
-            compliant_count += 1
-
-        checklist.append(
-            {
-                "requirement": "Monthly Fact-Check Minimum",
-                "status": monthly_status,
-                "details": f"{monthly_count} fact-checks published this month",
-                "value": str(monthly_count),
-                "threshold": str(EFCSN_MIN_FACT_CHECKS_PER_MONTH),
-            }
-        )
-
-        # ==========================================================================
-        # Check 2: Source Documentation
-        # ==========================================================================
-        total_checks += 1
-        source_metrics: dict[str, Any] = await self.get_source_quality_metrics()
-
-        total_fc: int = (
-            source_metrics["fact_checks_meeting_minimum"]
-            + source_metrics["fact_checks_below_minimum"]
-        )
-        meeting_min: int = source_metrics["fact_checks_meeting_minimum"]
-
-        source_compliance_pct: float = (meeting_min / total_fc * 100) if total_fc > 0 else 100.0
-
-        source_status: str
-        if source_compliance_pct >= 90:
-            source_status = "compliant"
-            compliant_count += 1
-        elif source_compliance_pct >= 75:
-            source_status = "warning"
-        else:
-            source_status = "non_compliant"
-
-        checklist.append(
-            {
-                "requirement": "Source Documentation",
-                "status": source_status,
-                "details": f"{meeting_min}/{total_fc} fact-checks have 2+ sources ({source_compliance_pct:.1f}%)",
-                "value": f"{source_compliance_pct:.1f}%",
-                "threshold": "90%",
-            }
-        )
-
-        # ==========================================================================
-        # Check 3: Corrections Policy
-        # ==========================================================================
-        total_checks += 1
-        # This is a placeholder - in a real implementation, this would check
-        # if the corrections policy transparency page exists and is up to date
-        corrections_policy_exists: bool = True  # Assume policy exists for now
-
-        corrections_status: str = "compliant" if corrections_policy_exists else "non_compliant"
-        if corrections_status == "compliant":
-            compliant_count += 1
-
-        checklist.append(
-            {
-                "requirement": "Corrections Policy",
-                "status": corrections_status,
-                "details": "Corrections policy is in place and publicly accessible",
-                "value": "Available" if corrections_policy_exists else "Missing",
-                "threshold": "Required",
-            }
-        )
-
-        # ==========================================================================
-        # Calculate Overall Status
-        # ==========================================================================
-        compliance_score: float = (
-            (compliant_count / total_checks * 100) if total_checks > 0 else 0.0
-        )
-
-        overall_status: str
-        if compliance_score == 100:
-            overall_status = "compliant"
-        elif compliance_score >= 66:
-            overall_status = "at_risk"
-        else:
-            overall_status = "non_compliant"
-
-        return {
-            "overall_status": overall_status,
-            "checklist": checklist,
-            "last_checked": now,
-            "compliance_score": round(compliance_score, 1),
-        }
+        fact_checks = await _query_fact_check_totals(self.db, now)
+        return _build_efcsn_compliance(fact_checks, now)
 
     # ==========================================================================
     # COMPLETE DASHBOARD
@@ -546,25 +647,37 @@ class AnalyticsService:
         """
         Generate complete analytics dashboard combining all metrics.
 
+        Runs six aggregate queries concurrently; the fact-check totals are
+        shared by the source quality, correction rate and compliance groups.
+
         Returns:
             Dictionary containing all analytics components
         """
         now: datetime = datetime.now(timezone.utc)
 
-        # Gather all metrics
-        monthly_fact_checks: dict[str, Any] = await self.get_monthly_fact_check_counts(months=12)
-        time_to_publication: dict[str, Any] = await self.get_time_to_publication_metrics()
-        rating_distribution: dict[str, Any] = await self.get_rating_distribution()
-        source_quality: dict[str, Any] = await self.get_source_quality_metrics()
-        correction_rate: dict[str, Any] = await self.get_correction_rate_metrics()
-        efcsn_compliance: dict[str, Any] = await self.get_efcsn_compliance()
+        (
+            month_data,
+            time_to_publication,
+            rating_distribution,
+            fact_checks,
+            source_rows,
+            correction_rows,
+        ) = await run_concurrently(
+            self.db,
+            lambda db: _query_monthly_counts(db, 12, now),
+            lambda db: _query_time_to_publication(db, now),
+            lambda db: _query_rating_distribution(db, None, None),
+            lambda db: _query_fact_check_totals(db, now),
+            _query_source_breakdown,
+            _query_correction_breakdown,
+        )
 
         return {
-            "monthly_fact_checks": monthly_fact_checks,
+            "monthly_fact_checks": _summarize_monthly(month_data, 12),
             "time_to_publication": time_to_publication,
             "rating_distribution": rating_distribution,
-            "source_quality": source_quality,
-            "correction_rate": correction_rate,
-            "efcsn_compliance": efcsn_compliance,
+            "source_quality": _build_source_quality(fact_checks, source_rows),
+            "correction_rate": _build_correction_rate(fact_checks, correction_rows),
+            "efcsn_compliance": _build_efcsn_compliance(fact_checks, now),
             "generated_at": now,
         }
@@ -19,6 +19,8 @@ from typing import Optional
 
 import httpx
 
+from app.core.http_clients import UPSTREAM_WAYBACK, get_http_client
+
 
 class ArchiveServiceError(Exception):
     """Base exception for Archive Service errors."""
@@ -71,6 +73,9 @@ class ArchiveService:
         max_retries: Maximum number of retry attempts
         retry_delay: Initial delay between retries (exponential backoff)
         timeout: HTTP request timeout in seconds
+
+    Requests go through the shared pooled Wayback client, so repeated
+    archive and lookup calls reuse the same connections.
     """
 
     WAYBACK_SAVE_URL = "https://web.archive.org/save/"
@@ -135,22 +140,23 @@ class ArchiveService:
             The archived URL if one exists, None otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.wayback_check_url,
-                    params={"url": url},
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                snapshots = data.get("archived_snapshots", {})
-                closest = snapshots.get("closest", {})
+            client = get_http_client(UPSTREAM_WAYBACK)
+            response = await client.get(
+                self.wayback_check_url,
+                params={"url": url},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            snapshots = data.get("archived_snapshots", {})
+            closest = snapshots.get("closest", {})
+
+            if closest.get("available"):
+                archived_url: str | None = closest.get("url")
+                return archived_url
 
-                if closest.get("available"):
-                    archived_url: str | None = closest.get("url")
-                    return archived_url
-
-                return None
+            return None
 
         except (httpx.HTTPError, Exception):
             # If we can't check, return None and proceed with archiving
@@ -225,23 +231,23 @@ class ArchiveService:
 
         while attempt < self.max_retries:
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    save_url = f"{self.wayback_save_url}{normalized_url}"
-                    response = await client.get(save_url)
-
-                    # Check for success (200-299 or redirect 3xx)
-                    if response.status_code < 400:
-                        archived_url = self._extract_archived_url(response, normalized_url)
-                        return ArchiveResult(
-                            success=True,
-                            original_url=normalized_url,
-                            archived_url=archived_url,
-                            archived_at=datetime.now(timezone.utc),
-                            method="wayback",
-                        )
-
-                    # Raise for status to trigger retry logic
-                    response.raise_for_status()
+                client = get_http_client(UPSTREAM_WAYBACK)
+                save_url = f"{self.wayback_save_url}{normalized_url}"
+                response = await client.get(save_url, timeout=self.timeout)
+
+                # Check for success (200-299 or redirect 3xx)
+                if response.status_code < 400:
+                    archived_url = self._extract_archived_url(response, normalized_url)
+                    return ArchiveResult(
+                        success=True,
+                        original_url=normalized_url,
+                        archived_url=archived_url,
+                        archived_at=datetime.now(timezone.utc),
+                        method="wayback",
+                    )
+
+                # Raise for status to trigger retry logic
+                response.raise_for_status()
 
             except Exception as e:
                 last_error = e
@@ -4,16 +4,31 @@ Audio extraction service for Snapchat Spotlight videos
 Issue #175: Audio Extraction and Whisper Transcription
 Uses yt-dlp for downloading audio from Spotlight URLs and FFmpeg for
 extracting audio from local video files.
+
+In streaming mode the video is never stored: the HTTP response body is piped
+straight into FFmpeg's stdin and only the compressed audio is written.
+
+Long audio is split into bounded-length chunks at silence boundaries
+(FFmpeg silencedetect) so each chunk stays under the Whisper upload limit
+and chunks can be transcribed in parallel.
 """
 
 import asyncio
 import logging
 import os
+import re
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
+import aiofiles  # type: ignore[import-untyped]
+import httpx
+
+from app.core.config import settings
+from app.core.http_clients import UPSTREAM_SNAPCHAT_MEDIA, get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,6 +38,12 @@ class AudioExtractionError(Exception):
     pass
 
 
+class StreamingUnsupportedError(AudioExtractionError):
+    """FFmpeg could not decode the video from a pipe (but may from a file)"""
+
+    pass
+
+
 @dataclass
 class AudioExtractionResult:
     """Result of audio extraction"""
@@ -33,6 +54,94 @@ class AudioExtractionResult:
     file_size_bytes: Optional[int]
 
 
+@dataclass
+class AudioChunk:
+    """A segment of an audio file, positioned on the source timeline"""
+
+    audio_path: str
+    start_seconds: float
+    end_seconds: float
+
+    @property
+    def duration_seconds(self) -> float:
+        """Length of the chunk in seconds"""
+        return self.end_seconds - self.start_seconds
+
+
+# Read size for piping HTTP bodies into FFmpeg
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# FFmpeg errors caused by reading from a pipe rather than by the video itself:
+# an MP4 index (moov atom) at the end of the file, or a demuxer that needs to seek
+STREAMING_UNSUPPORTED_PATTERN = re.compile(
+    r"moov atom not found|partial file|illegal seek|(?:cannot|unable to) seek|broken pipe",
+    re.IGNORECASE,
+)
+
+SILENCE_START_PATTERN = re.compile(r"silence_start:\s*(-?[\d.]+)")
+SILENCE_END_PATTERN = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
+
+def parse_silences(ffmpeg_output: str) -> list[tuple[float, float]]:
+    """Parse silence intervals from FFmpeg silencedetect output
+
+    Args:
+        ffmpeg_output: stderr of an FFmpeg run with the silencedetect filter
+
+    Returns:
+        List of (start, end) silence intervals in seconds, in order
+    """
+    silences: list[tuple[float, float]] = []
+    start: Optional[float] = None
+    for line in ffmpeg_output.splitlines():
+        start_match = SILENCE_START_PATTERN.search(line)
+        if start_match:
+            start = max(0.0, float(start_match.group(1)))
+            continue
+        end_match = SILENCE_END_PATTERN.search(line)
+        if end_match and start is not None:
+            silences.append((start, float(end_match.group(1))))
+            start = None
+    return silences
+
+
+def plan_chunks(
+    duration: float,
+    silences: list[tuple[float, float]],
+    max_chunk_seconds: float,
+    min_chunk_seconds: float,
+) -> list[tuple[float, float]]:
+    """Choose chunk boundaries, preferring the middle of silent intervals
+
+    Each chunk is at most max_chunk_seconds long. The cut point is the
+    midpoint of the last silence that falls between min_chunk_seconds and
+    max_chunk_seconds into the chunk; without such a silence the chunk is
+    cut hard at max_chunk_seconds.
+
+    Args:
+        duration: Total audio length in seconds
+        silences: Silence intervals as returned by parse_silences
+        max_chunk_seconds: Upper bound on chunk length
+        min_chunk_seconds: Lower bound on chunk length when cutting at silence
+
+    Returns:
+        List of (start, end) chunk boundaries covering the whole duration
+    """
+    midpoints: list[float] = [(start + end) / 2 for start, end in silences]
+    chunks: list[tuple[float, float]] = []
+    start: float = 0.0
+
+    while duration - start > max_chunk_seconds:
+        limit: float = start + max_chunk_seconds
+        candidates: list[float] = [m for m in midpoints if start + min_chunk_seconds <= m <= limit]
+        end: float = candidates[-1] if candidates else limit
+        chunks.append((start, end))
+        start = end
+
+    chunks.append((start, duration))
+    return chunks
+
+
 class AudioExtractionService:
     """Service for extracting audio from video files and Spotlight URLs
 
@@ -180,6 +289,71 @@ class AudioExtractionService:
             logger.error(f"Audio extraction failed for {spotlight_url}: {e}")
             raise AudioExtractionError(f"Audio extraction failed: {str(e)}") from e
 
+    async def extract_audio_from_stream(
+        self,
+        video_url: str,
+        spotlight_id: str,
+        output_format: Optional[str] = None,
+    ) -> AudioExtractionResult:
+        """Extract audio from a video URL without storing the video
+
+        The HTTP response is piped chunk by chunk into FFmpeg's stdin, so
+        only the compressed audio touches the disk. MP4 files whose index
+        (moov atom) sits at the end cannot be decoded from a pipe; for those
+        the video is downloaded to a temporary file, extracted, and the
+        temporary file removed.
+
+        Args:
+            video_url: Direct URL of the video file
+            spotlight_id: Unique identifier for the spotlight content
+            output_format: Desired audio format (default: mp3)
+
+        Returns:
+            AudioExtractionResult containing the extracted audio path and metadata
+
+        Raises:
+            AudioExtractionError: If URL is invalid, download fails or extraction fails
+        """
+        if not self._is_valid_url(video_url):
+            raise AudioExtractionError(f"Invalid URL: {video_url}")
+
+        audio_format: str = output_format or self.default_format
+        if audio_format not in self.SUPPORTED_FORMATS:
+            raise AudioExtractionError(
+                f"Unsupported audio format: {audio_format}. "
+                f"Supported formats: {self.SUPPORTED_FORMATS}"
+            )
+
+        output_path: str = str(self.audio_dir / f"{spotlight_id}.{audio_format}")
+
+        try:
+            await self._stream_to_ffmpeg(video_url, output_path, audio_format)
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to stream video from {video_url}: {e}")
+            await self.cleanup_audio_file(output_path)
+            raise AudioExtractionError(f"Failed to download video: {str(e)}") from e
+        except StreamingUnsupportedError as e:
+            logger.warning(
+                f"Video from {video_url} cannot be decoded from a pipe, "
+                f"retrying from a temporary file: {e}"
+            )
+            await self.cleanup_audio_file(output_path)
+            return await self._extract_via_temp_file(video_url, spotlight_id, audio_format)
+        except AudioExtractionError:
+            # The video itself is unusable (corrupt, no audio stream); a second
+            # download would fail the same way
+            await self.cleanup_audio_file(output_path)
+            raise
+
+        logger.info(f"Successfully streamed audio from {video_url} to {output_path}")
+        audio_file: Path = Path(output_path)
+        return AudioExtractionResult(
+            audio_path=output_path,
+            format=audio_format,
+            duration_seconds=None,
+            file_size_bytes=audio_file.stat().st_size if audio_file.exists() else None,
+        )
+
     async def cleanup_audio_file(self, audio_path: str) -> None:
         """Remove an audio file after processing
 
@@ -248,6 +422,126 @@ class AudioExtractionService:
 
         return output_path
 
+    async def _stream_to_ffmpeg(
+        self,
+        video_url: str,
+        output_path: str,
+        audio_format: str,
+    ) -> None:
+        """Pipe an HTTP response body into FFmpeg and write the audio
+
+        Args:
+            video_url: Source video URL
+            output_path: Path for output audio file
+            audio_format: Target audio format
+
+        Raises:
+            httpx.HTTPError: If the download fails
+            StreamingUnsupportedError: If FFmpeg fails because its input is a pipe
+            AudioExtractionError: If FFmpeg fails for any other reason
+        """
+        cmd: list[str] = self._stream_ffmpeg_command(output_path, audio_format)
+        logger.debug(f"Running streaming FFmpeg command: {' '.join(cmd)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        assert process.stdin is not None and process.stderr is not None
+        # Drain stderr concurrently so a chatty FFmpeg never blocks on a full pipe
+        stderr_task: asyncio.Task[bytes] = asyncio.create_task(process.stderr.read())
+
+        try:
+            client: httpx.AsyncClient = get_http_client(UPSTREAM_SNAPCHAT_MEDIA)
+            async with client.stream("GET", video_url) as response:
+                response.raise_for_status()
+                try:
+                    async for chunk in response.aiter_bytes(chunk_size=STREAM_CHUNK_BYTES):
+                        process.stdin.write(chunk)
+                        await process.stdin.drain()
+                except (BrokenPipeError, ConnectionResetError):
+                    # FFmpeg exited early; its exit code below reports why
+                    pass
+        except BaseException:
+            process.stdin.close()
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            stderr_task.cancel()
+            raise
+
+        process.stdin.close()
+
+        stderr: bytes = await stderr_task
+        await process.wait()
+
+        if process.returncode != 0:
+            error_message: str = stderr.decode(errors="replace") if stderr else "Unknown error"
+            error_class: type[AudioExtractionError] = (
+                StreamingUnsupportedError
+                if STREAMING_UNSUPPORTED_PATTERN.search(error_message)
+                else AudioExtractionError
+            )
+            raise error_class(f"FFmpeg failed with exit code {process.returncode}: {error_message}")
+
+    def _stream_ffmpeg_command(self, output_path: str, audio_format: str) -> list[str]:
+        """Build the FFmpeg command that reads video from stdin
+
+        Args:
+            output_path: Path for output audio file
+            audio_format: Target audio format
+
+        Returns:
+            FFmpeg command and arguments
+        """
+        return [
+            "ffmpeg",
+            "-i",
+            "pipe:0",
+            "-vn",  # No video
+            "-acodec",
+            self._get_audio_codec(audio_format),
+            "-y",  # Overwrite output file
+            output_path,
+        ]
+
+    async def _extract_via_temp_file(
+        self,
+        video_url: str,
+        spotlight_id: str,
+        audio_format: str,
+    ) -> AudioExtractionResult:
+        """Download to a temporary file, extract audio and remove the file
+
+        Args:
+            video_url: Source video URL
+            spotlight_id: Unique identifier for the spotlight content
+            audio_format: Target audio format
+
+        Returns:
+            AudioExtractionResult for the extracted audio
+
+        Raises:
+            AudioExtractionError: If download or extraction fails
+        """
+        fd, temp_path = tempfile.mkstemp(suffix=".mp4", prefix=f"{spotlight_id}_")
+        os.close(fd)
+        try:
+            client: httpx.AsyncClient = get_http_client(UPSTREAM_SNAPCHAT_MEDIA)
+            async with client.stream("GET", video_url) as response:
+                response.raise_for_status()
+                async with aiofiles.open(temp_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=STREAM_CHUNK_BYTES):
+                        await f.write(chunk)
+
+            return await self.extract_audio_from_video(temp_path, spotlight_id, audio_format)
+        except httpx.HTTPError as e:
+            raise AudioExtractionError(f"Failed to download video: {str(e)}") from e
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
     async def _run_ytdlp(
         self,
         url: str,
@@ -298,6 +592,182 @@ class AudioExtractionService:
 
         return output_path
 
+    async def split_audio(
+        self,
+        audio_path: str,
+        max_chunk_seconds: Optional[float] = None,
+    ) -> list[AudioChunk]:
+        """Split an audio file into chunks at silence boundaries
+
+        Audio no longer than max_chunk_seconds (or of unknown length) is
+        returned as a single chunk pointing at the original file. Longer audio
+        is cut with stream copy (no re-encoding) into files next to the source.
+
+        Args:
+            audio_path: Path to the audio file
+            max_chunk_seconds: Maximum chunk length, defaults to
+                TRANSCRIPTION_CHUNK_MAX_SECONDS
+
+        Returns:
+            Chunks in timeline order
+
+        Raises:
+            AudioExtractionError: If FFmpeg fails while cutting the chunks
+        """
+        if max_chunk_seconds is None:
+            max_chunk_seconds = settings.TRANSCRIPTION_CHUNK_MAX_SECONDS
+
+        duration: Optional[float] = await self.get_duration(audio_path)
+        if duration is None or duration <= max_chunk_seconds:
+            return [
+                AudioChunk(audio_path=audio_path, start_seconds=0.0, end_seconds=duration or 0.0)
+            ]
+
+        silences: list[tuple[float, float]] = await self.detect_silences(audio_path)
+        boundaries: list[tuple[float, float]] = plan_chunks(
+            duration,
+            silences,
+            max_chunk_seconds=max_chunk_seconds,
+            min_chunk_seconds=min(settings.TRANSCRIPTION_CHUNK_MIN_SECONDS, max_chunk_seconds),
+        )
+
+        source: Path = Path(audio_path)
+        chunks: list[AudioChunk] = [
+            AudioChunk(
+                audio_path=str(source.with_name(f"{source.stem}.part{i:03d}{source.suffix}")),
+                start_seconds=start,
+                end_seconds=end,
+            )
+            for i, (start, end) in enumerate(boundaries)
+        ]
+
+        try:
+            await asyncio.gather(*(self._cut_chunk(audio_path, chunk) for chunk in chunks))
+        except Exception:
+            await self.cleanup_chunks(chunks, keep=audio_path)
+            raise
+
+        logger.info(
+            f"Split {audio_path} ({duration:.1f}s) into {len(chunks)} chunks "
+            f"at {len(silences)} detected silences"
+        )
+        return chunks
+
+    async def cleanup_chunks(self, chunks: list[AudioChunk], keep: Optional[str] = None) -> None:
+        """Remove chunk files created by split_audio
+
+        Args:
+            chunks: Chunks to remove
+            keep: Path that must not be removed (the source audio file)
+        """
+        for chunk in chunks:
+            if chunk.audio_path != keep:
+                await self.cleanup_audio_file(chunk.audio_path)
+
+    async def get_duration(self, audio_path: str) -> Optional[float]:
+        """Read the duration of a media file with ffprobe
+
+        Args:
+            audio_path: Path to the media file
+
+        Returns:
+            Duration in seconds, or None if it cannot be determined
+        """
+        cmd: list[str] = [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            audio_path,
+        ]
+        try:
+            stdout, _ = await self._run_process(cmd, "ffprobe")
+            return float(stdout.strip())
+        except (AudioExtractionError, ValueError) as e:
+            logger.warning(f"Could not determine duration of {audio_path}: {e}")
+            return None
+
+    async def detect_silences(self, audio_path: str) -> list[tuple[float, float]]:
+        """Find silent intervals with FFmpeg's silencedetect filter
+
+        Args:
+            audio_path: Path to the audio file
+
+        Returns:
+            List of (start, end) silence intervals in seconds; empty if
+            detection fails
+        """
+        silence_filter: str = (
+            f"silencedetect=noise={settings.TRANSCRIPTION_SILENCE_THRESHOLD_DB}dB"
+            f":d={settings.TRANSCRIPTION_SILENCE_MIN_SECONDS}"
+        )
+        cmd: list[str] = ["ffmpeg", "-i", audio_path, "-af", silence_filter, "-f", "null", "-"]
+        try:
+            _, stderr = await self._run_process(cmd, "FFmpeg")
+        except AudioExtractionError as e:
+            logger.warning(f"Silence detection failed for {audio_path}: {e}")
+            return []
+        return parse_silences(stderr)
+
+    async def _cut_chunk(self, audio_path: str, chunk: AudioChunk) -> None:
+        """Write one chunk of the source file using stream copy
+
+        Args:
+            audio_path: Source audio file
+            chunk: Chunk to write
+
+        Raises:
+            AudioExtractionError: If FFmpeg fails
+        """
+        cmd: list[str] = [
+            "ffmpeg",
+            "-ss",
+            f"{chunk.start_seconds:.3f}",
+            "-to",
+            f"{chunk.end_seconds:.3f}",
+            "-i",
+            audio_path,
+            "-c",
+            "copy",
+            "-y",
+            chunk.audio_path,
+        ]
+        await self._run_process(cmd, "FFmpeg")
+
+    async def _run_process(self, cmd: list[str], tool: str) -> tuple[str, str]:
+        """Run a command and return its decoded output
+
+        Args:
+            cmd: Command and arguments
+            tool: Tool name used in error messages
+
+        Returns:
+            Tuple of (stdout, stderr)
+
+        Raises:
+            AudioExtractionError: If the process exits with a non-zero code
+        """
+        logger.debug(f"Running {tool} command: {' '.join(cmd)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        stdout, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            error_message: str = stderr.decode() if stderr else "Unknown error"
+            raise AudioExtractionError(
+                f"{tool} failed with exit code {process.returncode}: {error_message}"
+            )
+
+        return stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
     def _get_audio_codec(self, audio_format: str) -> str:
         """Get the appropriate audio codec for FFmpeg based on format
 
@@ -15,19 +15,29 @@ from dataclasses import dataclass
 from typing import Any, Optional
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models.claim import Claim
-from app.services.claim_similarity_service import ClaimSimilarityService
-from app.services.embedding_service import EmbeddingService, EmbeddingServiceError
+from app.models.loading import SUBMISSION_CLAIMS
+from app.models.spotlight import SpotlightContent
+from app.models.submission import Submission
+from app.services.claim_similarity_service import ClaimSimilarityService, SimilarClaim
+from app.services.embedding_cache import get_embedding_cache
+from app.services.embedding_service import (
+    EmbeddingService,
+    EmbeddingServiceError,
+    get_embedding_service,
+)
 from app.services.llm_claim_extraction_service import (
     ClaimExtractionResult,
     ExtractedClaim,
     LLMClaimExtractionError,
     LLMClaimExtractionService,
 )
+from app.services.vector_similarity import cosine_one_to_many
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +88,8 @@ class ClaimService:
         Args:
             db: Database session for claim operations
             llm_service: Optional LLM service (creates new if not provided)
-            embedding_service: Optional embedding service (creates new if not provided)
+            embedding_service: Optional embedding service (uses the shared, cached
+                service if not provided)
         """
         self.db: AsyncSession = db
         self._llm_service: Optional[LLMClaimExtractionService] = llm_service
@@ -96,7 +107,7 @@ class ClaimService:
     def embedding_service(self) -> EmbeddingService:
         """Lazily initialize embedding service"""
         if self._embedding_service is None:
-            self._embedding_service = EmbeddingService()
+            self._embedding_service = get_embedding_service()
         return self._embedding_service
 
     @property
@@ -118,8 +129,8 @@ class ClaimService:
 
         This is the main entry point for claim processing. It:
         1. Extracts claims from transcription and optional comment using GPT-4
-        2. Generates embeddings for each claim
-        3. Checks for duplicates if enabled
+        2. Generates embeddings for all claims in one batch request
+        3. Checks all claims for duplicates in one batched query if enabled
         4. Creates new claims or links to existing duplicates
 
         Args:
@@ -161,22 +172,17 @@ class ClaimService:
                 f"{submission_id}, language: {extraction_result.language}"
             )
 
-            # Step 2: Process each extracted claim
-            for extracted_claim in extraction_result.claims:
-                try:
-                    claim, is_duplicate = await self._process_single_claim(
-                        extracted_claim=extracted_claim,
-                        submission_id=submission_id,
-                        deduplicate=deduplicate,
-                    )
-                    claims.append(claim)
-                    if is_duplicate:
-                        duplicates_found += 1
-
-                except Exception as e:
-                    error_msg: str = f"Failed to process claim: {str(e)}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
+            # Step 2: Embed, deduplicate (single batched query) and store claims
+            processed: list[tuple[Claim, bool]] = await self._process_claims_batch(
+                extracted_claims=extraction_result.claims,
+                submission_id=submission_id,
+                deduplicate=deduplicate,
+                errors=errors,
+            )
+            for claim, is_duplicate in processed:
+                claims.append(claim)
+                if is_duplicate:
+                    duplicates_found += 1
 
         except LLMClaimExtractionError as e:
             error_msg = f"LLM extraction failed: {str(e)}"
@@ -198,59 +204,152 @@ class ClaimService:
             errors=errors,
         )
 
-    async def _process_single_claim(
+    async def _process_claims_batch(
         self,
-        extracted_claim: ExtractedClaim,
+        extracted_claims: list[ExtractedClaim],
         submission_id: UUID,
         deduplicate: bool,
-    ) -> tuple[Claim, bool]:
-        """Process a single extracted claim
+        errors: list[str],
+    ) -> list[tuple[Claim, bool]]:
+        """Process all extracted claims of a submission together
 
-        Generates embedding, checks for duplicates, and creates/retrieves claim.
+        Generates all embeddings with one batch API request, checks every
+        claim for duplicates with a single batched similarity query, and
+        creates/retrieves claims.
+        Claims that duplicate an earlier claim from the same batch are
+        linked to that claim, as they would have been when claims were
+        flushed and checked one at a time.
 
         Args:
-            extracted_claim: The extracted claim from LLM
+            extracted_claims: The extracted claims from LLM
             submission_id: Parent submission UUID
             deduplicate: Whether to check for duplicates
+            errors: List that per-claim error messages are appended to
 
         Returns:
-            Tuple of (Claim object, is_duplicate)
+            List of (Claim object, is_duplicate) tuples for the claims
+            that were processed successfully
         """
-        is_duplicate: bool = False
-        embedding: Optional[list[float]] = None
+        embeddings: list[Optional[list[float]]] = [None] * len(extracted_claims)
 
-        # Generate embedding for similarity search
+        # Generate embeddings for all claims with a single batch request
         try:
-            embedding = await self.embedding_service.generate_embedding(extracted_claim.content)
+            batch: list[list[float]] = await self.embedding_service.generate_embeddings_batch(
+                [extracted_claim.content for extracted_claim in extracted_claims]
+            )
+            embeddings = [embedding or None for embedding in batch]
         except EmbeddingServiceError as e:
-            logger.warning(f"Failed to generate embedding: {e}")
-            # Continue without embedding - claim can still be created
+            logger.warning(f"Failed to generate embeddings: {e}")
+            # Continue without embeddings - claims can still be created
+
+        # Check all embedded claims for duplicates in one round trip
+        existing_matches: dict[int, Claim] = {}
+        if deduplicate:
+            existing_matches = await self._find_existing_duplicates(embeddings)
+
+        processed: list[tuple[Claim, bool]] = []
+        created: list[tuple[Claim, list[float]]] = []
+
+        for i, extracted_claim in enumerate(extracted_claims):
+            embedding: Optional[list[float]] = embeddings[i]
+
+            if i in existing_matches:
+                processed.append((existing_matches[i], True))
+                continue
+
+            if deduplicate and embedding:
+                batch_duplicate: Optional[Claim] = self._find_batch_duplicate(embedding, created)
+                if batch_duplicate is not None:
+                    logger.info(f"Found duplicate claim {batch_duplicate.id} within submission")
+                    processed.append((batch_duplicate, True))
+                    continue
+
+            try:
+                claim: Claim = await create_claim(
+                    db=self.db,
+                    content=extracted_claim.content,
+                    source=str(submission_id),
+                    embedding=embedding,
+                )
+            except Exception as e:
+                error_msg: str = f"Failed to process claim: {str(e)}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                continue
 
-        # Check for duplicates if enabled and embedding was generated
-        if deduplicate and embedding:
-            is_dup, existing_claim = await self.similarity_service.is_duplicate(
-                embedding=embedding,
-            )
+            processed.append((claim, False))
+            if embedding:
+                created.append((claim, embedding))
 
-            if is_dup and existing_claim:
-                # Return the existing claim
-                claim: Optional[Claim] = await get_claim(self.db, existing_claim.claim_id)
-                if claim:
-                    logger.info(
-                        f"Found duplicate claim {existing_claim.claim_id} "
-                        f"(similarity: {existing_claim.similarity:.2f})"
-                    )
-                    return claim, True
-
-        # Create new claim
-        claim = await create_claim(
-            db=self.db,
-            content=extracted_claim.content,
-            source=str(submission_id),
-            embedding=embedding,
+        return processed
+
+    async def _find_existing_duplicates(
+        self, embeddings: list[Optional[list[float]]]
+    ) -> dict[int, Claim]:
+        """Find stored duplicates for a batch of embeddings
+
+        Args:
+            embeddings: Embeddings per extracted claim (None if generation failed)
+
+        Returns:
+            Mapping of input index to the existing duplicate Claim
+        """
+        indices: list[int] = [i for i, embedding in enumerate(embeddings) if embedding]
+        if not indices:
+            return {}
+
+        results: list[tuple[bool, Optional[SimilarClaim]]] = (
+            await self.similarity_service.find_duplicates_batch(
+                embeddings=[embeddings[i] or [] for i in indices],
+            )
         )
 
-        return claim, is_duplicate
+        similar_by_index: dict[int, SimilarClaim] = {
+            index: similar
+            for index, (is_dup, similar) in zip(indices, results)
+            if is_dup and similar is not None
+        }
+        if not similar_by_index:
+            return {}
+
+        # Load all matched claims with one query
+        claim_ids: set[UUID] = {similar.claim_id for similar in similar_by_index.values()}
+        result = await self.db.execute(select(Claim).where(Claim.id.in_(claim_ids)))
+        claims_by_id: dict[UUID, Claim] = {claim.id: claim for claim in result.scalars().all()}
+
+        matches: dict[int, Claim] = {}
+        for index, similar in similar_by_index.items():
+            claim: Optional[Claim] = claims_by_id.get(similar.claim_id)
+            if claim:
+                logger.info(
+                    f"Found duplicate claim {similar.claim_id} "
+                    f"(similarity: {similar.similarity:.2f})"
+                )
+                matches[index] = claim
+
+        return matches
+
+    def _find_batch_duplicate(
+        self,
+        embedding: list[float],
+        created: list[tuple[Claim, list[float]]],
+    ) -> Optional[Claim]:
+        """Find a claim created earlier in the same batch that this one duplicates
+
+        Args:
+            embedding: Embedding of the claim being processed
+            created: (claim, embedding) pairs created earlier in this batch
+
+        Returns:
+            The duplicated Claim, or None
+        """
+        if not created:
+            return None
+
+        threshold: float = self.similarity_service.default_threshold
+        similarities = cosine_one_to_many(embedding, [vector for _, vector in created])
+        matches = np.flatnonzero(similarities >= threshold)
+        return created[int(matches[0])][0] if len(matches) else None
 
 
 # Legacy functions for backward compatibility
@@ -392,3 +491,103 @@ async def link_claim_to_submission(db: AsyncSession, claim_id: UUID, submission_
     # We just need to add the claim to the submission's claims list
     # This is done in the submission_service
     pass
+
+
+async def extract_spotlight_claims(
+    db: AsyncSession, submission_id: str, spotlight_content_id: str
+) -> dict[str, Any]:
+    """
+    Extract claims from a Spotlight transcription and link them to its submission.
+
+    Args:
+        db: Database session
+        submission_id: UUID of the submission
+        spotlight_content_id: UUID of the spotlight content
+
+    Returns:
+        Dictionary with success status and extracted claims
+    """
+    try:
+        # Fetch SpotlightContent with transcription
+        stmt = select(SpotlightContent).where(SpotlightContent.id == UUID(spotlight_content_id))
+        result = await db.execute(stmt)
+        spotlight: Optional[SpotlightContent] = result.scalar_one_or_none()
+
+        if not spotlight:
+            logger.error(f"SpotlightContent not found: {spotlight_content_id}")
+            return {
+                "success": False,
+                "submission_id": submission_id,
+                "error": "SpotlightContent not found",
+            }
+
+        if not spotlight.transcription:
+            logger.warning(f"No transcription available for {spotlight_content_id}")
+            return {
+                "success": False,
+                "submission_id": submission_id,
+                "error": "No transcription available",
+            }
+
+        # Extract claims using LLM service
+        llm_service = LLMClaimExtractionService()
+        extraction_result = await llm_service.extract_claims(
+            transcription=spotlight.transcription,
+            source_type="transcription",
+            language_hint=spotlight.transcription_language or "en",
+        )
+
+        # Link extracted claims to the submission
+        stmt_sub = (
+            select(Submission)
+            .where(Submission.id == UUID(submission_id))
+            .options(*SUBMISSION_CLAIMS)
+        )
+        result_sub = await db.execute(stmt_sub)
+        submission: Optional[Submission] = result_sub.scalar_one_or_none()
+
+        if submission and extraction_result.claims:
+            # Fresh API client per task (each task runs its own event loop),
+            # process-wide embedding cache
+            embedding_service = EmbeddingService(cache=get_embedding_cache())
+
+            # Generate embeddings for all claims in one batch request
+            embeddings = await embedding_service.generate_embeddings_batch(
+                [extracted_claim.content for extracted_claim in extraction_result.claims]
+            )
+
+            for extracted_claim, embedding in zip(extraction_result.claims, embeddings):
+                # Create claim in database
+                claim = Claim(
+                    content=extracted_claim.content,
+                    source="transcription",
+                    language=extracted_claim.language,
+                    embedding=embedding or None,
+                )
+                db.add(claim)
+                await db.flush()
+
+                # Link claim to submission
+                if claim not in submission.claims:
+                    submission.claims.append(claim)
+
+            await db.commit()
+
+        logger.info(
+            f"Extracted {extraction_result.total_claims_found} claims from submission {submission_id}"
+        )
+
+        return {
+            "success": True,
+            "submission_id": submission_id,
+            "total_claims": extraction_result.total_claims_found,
+            "claims_count": len(extraction_result.claims),
+        }
+
+    except Exception as e:
+        logger.exception(f"Unexpected error extracting claims from {submission_id}: {e}")
+        return {
+            "success": False,
+            "submission_id": submission_id,
+            "error": f"Unexpected error: {str(e)}",
+        }
@@ -18,9 +18,89 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models.claim import Claim
+from app.services.search_service import SearchFilters
+from app.services.vector_similarity import InMemoryVectorIndex
 
 logger = logging.getLogger(__name__)
 
+# Search modes for similarity queries
+SEARCH_MODE_EXACT = "exact"
+SEARCH_MODE_ANN = "ann"
+SEARCH_MODES = (SEARCH_MODE_EXACT, SEARCH_MODE_ANN)
+
+# ef_search multiplier for filtered ANN queries, so enough candidates survive the filters
+FILTERED_EF_SEARCH_FACTOR = 4
+
+# Exact search: threshold filter over every row (sequential scan)
+EXACT_SIMILARITY_SQL = """
+    SELECT
+        id,
+        content,
+        1 - (embedding <=> :embedding) AS similarity
+    FROM claims c
+    WHERE embedding IS NOT NULL
+        AND 1 - (embedding <=> :embedding) >= :threshold
+        {exclude_clause}
+        {filter_clause}
+    ORDER BY similarity DESC
+    LIMIT :limit
+"""
+
+# ANN search: ORDER BY distance + LIMIT is served by the HNSW index,
+# the threshold is applied to the nearest neighbours afterwards. Filters are
+# checked on the candidates the index returns, so a selective filter can
+# leave fewer than :limit rows (ef_search is raised to compensate).
+ANN_SIMILARITY_SQL = """
+    SELECT id, content, similarity
+    FROM (
+        SELECT
+            id,
+            content,
+            1 - (embedding <=> :embedding) AS similarity
+        FROM claims c
+        WHERE embedding IS NOT NULL
+            {exclude_clause}
+            {filter_clause}
+        ORDER BY embedding <=> :embedding
+        LIMIT :limit
+    ) AS nearest
+    WHERE similarity >= :threshold
+    ORDER BY similarity DESC
+"""
+
+# Batched duplicate detection: best match per query vector in one statement
+EXACT_BATCH_DUPLICATE_SQL = """
+    SELECT q.idx, best.id, best.content, best.similarity
+    FROM (VALUES {values}) AS q(idx, embedding)
+    CROSS JOIN LATERAL (
+        SELECT
+            c.id,
+            c.content,
+            1 - (c.embedding <=> q.embedding) AS similarity
+        FROM claims c
+        WHERE c.embedding IS NOT NULL
+            AND 1 - (c.embedding <=> q.embedding) >= :threshold
+        ORDER BY similarity DESC
+        LIMIT 1
+    ) AS best
+"""
+
+ANN_BATCH_DUPLICATE_SQL = """
+    SELECT q.idx, best.id, best.content, best.similarity
+    FROM (VALUES {values}) AS q(idx, embedding)
+    CROSS JOIN LATERAL (
+        SELECT
+            c.id,
+            c.content,
+            1 - (c.embedding <=> q.embedding) AS similarity
+        FROM claims c
+        WHERE c.embedding IS NOT NULL
+        ORDER BY c.embedding <=> q.embedding
+        LIMIT 1
+    ) AS best
+    WHERE best.similarity >= :threshold
+"""
+
 
 @dataclass
 class SimilarClaim:
@@ -39,13 +119,16 @@ class ClaimSimilarityService:
     - Finding similar claims above a threshold
     - Checking if a claim is a duplicate
     - Batch duplicate detection
+    - Exact (sequential scan) or approximate (HNSW index) search modes
 
-    Note: When running with SQLite (tests), vector operations are mocked
-    since SQLite doesn't support pgvector.
+    Note: When the database is not PostgreSQL (e.g. SQLite in tests), the
+    stored embeddings are loaded into an InMemoryVectorIndex and searched
+    with NumPy instead of pgvector.
 
     Attributes:
         db: Database session
         default_threshold: Default similarity threshold for deduplication
+        default_search_mode: Default search mode ("ann" or "exact")
 
     Example:
         >>> service = ClaimSimilarityService(db_session)
@@ -62,6 +145,7 @@ class ClaimSimilarityService:
         """
         self.db: AsyncSession = db
         self.default_threshold: float = settings.CLAIM_SIMILARITY_THRESHOLD
+        self.default_search_mode: str = settings.CLAIM_SIMILARITY_SEARCH_MODE
 
     async def find_similar_claims(
         self,
@@ -69,6 +153,10 @@ class ClaimSimilarityService:
         threshold: Optional[float] = None,
         limit: int = 5,
         exclude_claim_id: Optional[UUID] = None,
+        search_mode: Optional[str] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        filters: Optional[SearchFilters] = None,
     ) -> list[SimilarClaim]:
         """Find claims with similar embeddings using cosine similarity
 
@@ -80,6 +168,11 @@ class ClaimSimilarityService:
             threshold: Minimum similarity score (0.0-1.0), defaults to config value
             limit: Maximum number of results to return
             exclude_claim_id: Optional claim ID to exclude from results
+            search_mode: "ann" (index scan) or "exact" (sequential scan),
+                defaults to config value
+            ef_search: HNSW candidate list size for this query (ANN mode only)
+            probes: IVFFlat lists to probe for this query (ANN mode only)
+            filters: Optional workflow state, verdict and date restrictions
 
         Returns:
             List of SimilarClaim objects sorted by similarity (highest first)
@@ -92,6 +185,10 @@ class ClaimSimilarityService:
             threshold=threshold,
             limit=limit,
             exclude_claim_id=exclude_claim_id,
+            search_mode=search_mode,
+            ef_search=ef_search,
+            probes=probes,
+            filters=filters,
         )
 
         logger.debug(
@@ -107,48 +204,68 @@ class ClaimSimilarityService:
         threshold: float,
         limit: int,
         exclude_claim_id: Optional[UUID] = None,
+        search_mode: Optional[str] = None,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        filters: Optional[SearchFilters] = None,
     ) -> list[SimilarClaim]:
         """Execute the pgvector similarity query
 
         This method contains the actual database query using pgvector's
-        cosine distance operator. The query:
+        cosine distance operator.
+
+        In exact mode the query:
         1. Filters to claims with embeddings
         2. Calculates cosine similarity (1 - cosine_distance)
         3. Filters by threshold
         4. Orders by similarity descending
         5. Limits results
 
+        The threshold predicate cannot be answered from an index, so exact
+        mode always scans the whole table. In ANN mode the query instead
+        orders by raw distance with a LIMIT (which the HNSW index on
+        claims.embedding can serve) and applies the threshold to the
+        nearest neighbours afterwards.
+
         Args:
             embedding: Query embedding vector
             threshold: Minimum similarity threshold
             limit: Maximum results
             exclude_claim_id: Claim ID to exclude
+            search_mode: "ann" or "exact", defaults to config value
+            ef_search: HNSW candidate list size (ANN mode only)
+            probes: IVFFlat lists to probe (ANN mode only)
+            filters: Optional workflow state, verdict and date restrictions
 
         Returns:
             List of SimilarClaim objects
+
+        Raises:
+            ValueError: If search_mode is not a supported mode
         """
-        # Build the query using pgvector's cosine distance
-        # Note: cosine_distance returns 0-2, we convert to similarity 0-1
-        # similarity = 1 - (cosine_distance / 2) or simply use <=> operator
+        if search_mode is None:
+            search_mode = self.default_search_mode
+
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Invalid search mode '{search_mode}'. Must be one of: {', '.join(SEARCH_MODES)}"
+            )
+
+        if not self._pgvector_available():
+            index = await self._load_vector_index(exclude_claim_id, filters)
+            return [
+                SimilarClaim(claim_id=claim_id, content=content, similarity=similarity)
+                for (claim_id, content), similarity in index.search(embedding, threshold, limit)
+            ]
 
         # Using raw SQL for pgvector operations
         # Format embedding as PostgreSQL array literal
         embedding_str: str = "[" + ",".join(str(x) for x in embedding) + "]"
 
-        sql: str = """
-            SELECT
-                id,
-                content,
-                1 - (embedding <=> :embedding) AS similarity
-            FROM claims
-            WHERE embedding IS NOT NULL
-                AND 1 - (embedding <=> :embedding) >= :threshold
-                {exclude_clause}
-            ORDER BY similarity DESC
-            LIMIT :limit
-        """
+        sql: str = ANN_SIMILARITY_SQL if search_mode == SEARCH_MODE_ANN else EXACT_SIMILARITY_SQL
 
         exclude_clause: str = ""
+        filter_clause: str = ""
         params: dict[str, Any] = {
             "embedding": embedding_str,
             "threshold": threshold,
@@ -159,9 +276,20 @@ class ClaimSimilarityService:
             exclude_clause = "AND id != :exclude_id"
             params["exclude_id"] = str(exclude_claim_id)
 
-        sql = sql.format(exclude_clause=exclude_clause)
+        if filters is not None:
+            filter_clause, filter_params = filters.sql("c")
+            params.update(filter_params)
+
+        sql = sql.format(exclude_clause=exclude_clause, filter_clause=filter_clause)
 
         try:
+            if search_mode == SEARCH_MODE_ANN:
+                await self._apply_ann_settings(
+                    ef_search=ef_search,
+                    probes=probes,
+                    limit=limit * FILTERED_EF_SEARCH_FACTOR if filter_clause else limit,
+                )
+
             result = await self.db.execute(text(sql), params)
             rows = result.fetchall()
 
@@ -178,6 +306,75 @@ class ClaimSimilarityService:
             logger.warning(f"Vector similarity query failed (expected in tests): {e}")
             return []
 
+    def _pgvector_available(self) -> bool:
+        """Whether the session is bound to PostgreSQL, where pgvector queries run
+
+        Returns:
+            True for PostgreSQL, False for other dialects (e.g. SQLite in tests)
+        """
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    async def _load_vector_index(
+        self,
+        exclude_claim_id: Optional[UUID] = None,
+        filters: Optional[SearchFilters] = None,
+    ) -> InMemoryVectorIndex[tuple[UUID, str]]:
+        """Load all claim embeddings into an in-memory index
+
+        Fallback for databases without pgvector. Loads every embedded claim,
+        so it is only suitable for small corpora such as test databases.
+
+        Args:
+            exclude_claim_id: Optional claim ID to leave out of the index
+            filters: Optional restrictions on the indexed claims
+
+        Returns:
+            Index of (claim_id, content) items
+        """
+        query = select(Claim.id, Claim.content, Claim.embedding).where(Claim.embedding.isnot(None))
+        if exclude_claim_id:
+            query = query.where(Claim.id != exclude_claim_id)
+        if filters is not None:
+            query = query.where(*filters.conditions())
+
+        rows = (await self.db.execute(query)).all()
+        return InMemoryVectorIndex(
+            [(row.id, row.content) for row in rows],
+            [list(row.embedding) for row in rows],
+        )
+
+    async def _apply_ann_settings(
+        self,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+        limit: int = 1,
+    ) -> None:
+        """Set pgvector index search parameters for the current transaction
+
+        Uses set_config(..., is_local => true) so the values only apply to
+        the current transaction and never leak to other requests sharing
+        the pooled connection.
+
+        Args:
+            ef_search: HNSW candidate list size, defaults to config value
+            probes: IVFFlat lists to probe, defaults to config value
+            limit: Requested result count; HNSW returns at most ef_search
+                rows, so ef_search is raised to at least this value
+        """
+        if ef_search is None:
+            ef_search = settings.CLAIM_SIMILARITY_HNSW_EF_SEARCH
+        ef_search = max(ef_search, limit)
+        if probes is None:
+            probes = settings.CLAIM_SIMILARITY_IVFFLAT_PROBES
+
+        await self.db.execute(
+            text(
+                "SELECT set_config('hnsw.ef_search', :ef_search, true), "
+                "set_config('ivfflat.probes', :probes, true)"
+            ),
+            {"ef_search": str(int(ef_search)), "probes": str(int(probes))},
+        )
+
     async def is_duplicate(
         self,
         embedding: list[float],
@@ -214,15 +411,18 @@ class ClaimSimilarityService:
         self,
         embeddings: list[list[float]],
         threshold: Optional[float] = None,
+        search_mode: Optional[str] = None,
     ) -> list[tuple[bool, Optional[SimilarClaim]]]:
         """Check multiple embeddings for duplicates
 
-        Efficiently checks multiple claim embeddings for duplicates
-        in a single batch operation.
+        Sends every query vector to the database in a single statement
+        (a VALUES list joined LATERAL against claims), so checking N claims
+        costs one round trip instead of N.
 
         Args:
             embeddings: List of embedding vectors to check
             threshold: Similarity threshold for duplicate detection
+            search_mode: "ann" or "exact", defaults to config value
 
         Returns:
             List of (is_duplicate, matching_claim) tuples, one per input embedding
@@ -230,20 +430,98 @@ class ClaimSimilarityService:
         if not embeddings:
             return []
 
-        results: list[tuple[bool, Optional[SimilarClaim]]] = []
+        if threshold is None:
+            threshold = self.default_threshold
+
+        matches: dict[int, SimilarClaim] = await self._query_duplicates_batch(
+            embeddings=embeddings,
+            threshold=threshold,
+            search_mode=search_mode,
+        )
 
-        for embedding in embeddings:
-            is_dup, existing_claim = await self.is_duplicate(
-                embedding=embedding,
-                threshold=threshold,
-            )
-            results.append((is_dup, existing_claim))
+        results: list[tuple[bool, Optional[SimilarClaim]]] = [
+            (i in matches, matches.get(i)) for i in range(len(embeddings))
+        ]
 
         duplicate_count: int = sum(1 for is_dup, _ in results if is_dup)
         logger.info(f"Batch duplicate check: {duplicate_count}/{len(embeddings)} duplicates found")
 
         return results
 
+    async def _query_duplicates_batch(
+        self,
+        embeddings: list[list[float]],
+        threshold: float,
+        search_mode: Optional[str] = None,
+    ) -> dict[int, SimilarClaim]:
+        """Execute the batched pgvector best-match query
+
+        Each query vector is bound as its own parameter in a VALUES list,
+        and a LATERAL subquery finds the nearest claim per vector. In ANN
+        mode the LATERAL subquery is served by the HNSW index and the
+        threshold is applied afterwards; in exact mode the threshold is
+        applied inside the scan, as in _query_similar_claims.
+
+        Args:
+            embeddings: Query embedding vectors
+            threshold: Minimum similarity threshold
+            search_mode: "ann" or "exact", defaults to config value
+
+        Returns:
+            Mapping of input index to best matching claim, for inputs that
+            have a match above the threshold
+
+        Raises:
+            ValueError: If search_mode is not a supported mode
+        """
+        if search_mode is None:
+            search_mode = self.default_search_mode
+
+        if search_mode not in SEARCH_MODES:
+            raise ValueError(
+                f"Invalid search mode '{search_mode}'. Must be one of: {', '.join(SEARCH_MODES)}"
+            )
+
+        if not self._pgvector_available():
+            index = await self._load_vector_index()
+            return {
+                i: SimilarClaim(
+                    claim_id=best[0][0][0], content=best[0][0][1], similarity=best[0][1]
+                )
+                for i, best in enumerate(index.search_many(embeddings, threshold, limit=1))
+                if best
+            }
+
+        params: dict[str, Any] = {"threshold": threshold}
+        values: list[str] = []
+        for i, embedding in enumerate(embeddings):
+            params[f"embedding_{i}"] = "[" + ",".join(str(x) for x in embedding) + "]"
+            values.append(f"({i}, CAST(:embedding_{i} AS vector))")
+
+        sql: str = (
+            ANN_BATCH_DUPLICATE_SQL if search_mode == SEARCH_MODE_ANN else EXACT_BATCH_DUPLICATE_SQL
+        ).format(values=", ".join(values))
+
+        try:
+            if search_mode == SEARCH_MODE_ANN:
+                await self._apply_ann_settings()
+
+            result = await self.db.execute(text(sql), params)
+            rows = result.fetchall()
+
+            return {
+                int(row[0]): SimilarClaim(
+                    claim_id=row[1],
+                    content=row[2],
+                    similarity=float(row[3]),
+                )
+                for row in rows
+            }
+        except Exception as e:
+            # Log but don't fail - SQLite doesn't support pgvector
+            logger.warning(f"Batch vector similarity query failed (expected in tests): {e}")
+            return {}
+
     async def get_claim_with_embedding(self, claim_id: UUID) -> Optional[Claim]:
         """Get a claim by ID including its embedding
 
@@ -28,6 +28,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.response_cache import ANALYTICS, CORRECTIONS_LOG, invalidate_responses
 from app.models.correction import (
     Correction,
     CorrectionApplication,
@@ -263,6 +264,7 @@ class CorrectionApplicationService:
 
         await self.db.commit()
         await self.db.refresh(correction)
+        await invalidate_responses(CORRECTIONS_LOG, ANALYTICS)
 
         return correction
 
@@ -315,6 +317,7 @@ class CorrectionApplicationService:
 
         await self.db.commit()
         await self.db.refresh(correction)
+        await invalidate_responses(CORRECTIONS_LOG, ANALYTICS)
 
         # Send rejection email if requester provided email
         if correction.requester_email:
@@ -433,6 +436,7 @@ class CorrectionApplicationService:
         self.db.add(application)
         await self.db.commit()
         await self.db.refresh(application)
+        await invalidate_responses(CORRECTIONS_LOG, ANALYTICS)
 
         # Send resolution email if requester provided email
         if correction.requester_email:
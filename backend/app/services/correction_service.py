@@ -26,6 +26,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CountMode, KeysetPage, count_total, fetch_keyset_page
 from app.models.correction import Correction, CorrectionStatus, CorrectionType
 from app.models.fact_check import FactCheck
 from app.services.email_service import EmailService
@@ -453,7 +454,9 @@ class CorrectionService:
         self,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[Correction], int]:
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> KeysetPage[Correction]:
         """
         Get public corrections log for EFCSN transparency.
 
@@ -465,36 +468,47 @@ class CorrectionService:
         - UPDATE: Appended explanatory note required
         - MINOR: No public notice required (excluded from public log)
 
+        Ordered newest first on (reviewed_at, id) and paged with a cursor.
+
         Args:
             limit: Maximum number of corrections to return (default 100)
-            offset: Number of corrections to skip (default 0)
+            offset: Number of corrections to skip when no cursor is given
+            cursor: next_cursor of the previous page
+            count: How to compute the total (see app.core.pagination.CountMode)
 
         Returns:
-            Tuple of (list of corrections, total count)
+            Page of corrections with next_cursor and total
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
         """
-        from sqlalchemy import func as sql_func
         from sqlalchemy import or_
 
         # Build query for public log
         # Only ACCEPTED corrections of type SUBSTANTIAL or UPDATE
+        # (accepting a correction always sets reviewed_at)
         stmt = select(Correction).where(
             Correction.status == CorrectionStatus.ACCEPTED,
             or_(
                 Correction.correction_type == CorrectionType.SUBSTANTIAL,
                 Correction.correction_type == CorrectionType.UPDATE,
             ),
+            Correction.reviewed_at.is_not(None),
         )
 
-        # Get total count
-        count_stmt = select(sql_func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total_count: int = total_result.scalar() or 0
+        total_count: Optional[int] = await count_total(
+            self.db, stmt, count, cache_key="corrections:public-log"
+        )
 
         # Order by reviewed_at (newest first) for public visibility
-        stmt = stmt.order_by(Correction.reviewed_at.desc())
-        stmt = stmt.limit(limit).offset(offset)
-
-        result = await self.db.execute(stmt)
-        corrections: list[Correction] = list(result.scalars().all())
-
-        return corrections, total_count
+        page: KeysetPage[Correction] = await fetch_keyset_page(
+            self.db,
+            stmt,
+            Correction.reviewed_at,
+            Correction.id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+        page.total = total_count
+        return page
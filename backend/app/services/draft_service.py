@@ -14,11 +14,12 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.core.principal_cache import Principal
 from app.models.fact_check import FactCheck
+from app.models.loading import FACT_CHECK_SUBMISSIONS
 from app.models.submission_reviewer import SubmissionReviewer
-from app.models.user import User, UserRole
+from app.models.user import UserRole
 from app.models.workflow_transition import WorkflowState
 from app.schemas.draft import DraftContent, DraftResponse, DraftUpdate
 
@@ -72,13 +73,9 @@ async def get_fact_check_with_claim(db: AsyncSession, fact_check_id: UUID) -> Op
         fact_check_id: UUID of the fact-check
 
     Returns:
-        FactCheck with claim loaded, or None if not found
+        FactCheck with claim and its submissions loaded, or None if not found
     """
-    stmt = (
-        select(FactCheck)
-        .options(selectinload(FactCheck.claim))
-        .where(FactCheck.id == fact_check_id)
-    )
+    stmt = select(FactCheck).options(*FACT_CHECK_SUBMISSIONS).where(FactCheck.id == fact_check_id)
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
@@ -121,7 +118,7 @@ async def is_user_assigned_reviewer(db: AsyncSession, submission_id: UUID, user_
 
 
 async def check_draft_access(
-    db: AsyncSession, fact_check: FactCheck, user: User, for_write: bool = False
+    db: AsyncSession, fact_check: FactCheck, user: Principal, for_write: bool = False
 ) -> None:
     """
     Check if user has permission to access draft.
@@ -176,7 +173,7 @@ async def save_draft(
     db: AsyncSession,
     fact_check_id: UUID,
     draft_data: DraftUpdate,
-    user: User,
+    user: Principal,
 ) -> DraftResponse:
     """
     Save or update draft content for a fact-check.
@@ -273,7 +270,7 @@ async def save_draft(
 async def get_draft(
     db: AsyncSession,
     fact_check_id: UUID,
-    user: User,
+    user: Principal,
 ) -> DraftResponse:
     """
     Get draft content for a fact-check.
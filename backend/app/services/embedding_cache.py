@@ -0,0 +1,286 @@
+"""
+Content-addressed cache for claim text embeddings
+
+Issue #176: LLM-based Claim Extraction - Embedding generation for similarity search
+
+Identical claim texts (e.g. the same viral rumour submitted by many people)
+would otherwise be re-embedded through the OpenAI API on every submission.
+This cache stores embeddings keyed by a hash of (model, dimensions,
+normalized text) in two tiers:
+
+- Tier 1: in-process LRU with TTL (no network round trip)
+- Tier 2: Redis, shared across API workers and Celery workers
+
+Vectors are stored as packed float32 bytes (6 KB for 1536 dimensions) in
+both tiers. Redis failures never fail an embedding request; the cache then
+behaves as memory-only.
+"""
+
+import hashlib
+import logging
+import time
+import unicodedata
+from array import array
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "embedding:"
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different inputs share a cache entry
+
+    Applies Unicode NFC normalization and collapses whitespace.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Normalized text
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(model: str, dimensions: int, text: str) -> str:
+    """Build the content-addressed cache key for an embedding
+
+    Args:
+        model: Embedding model name
+        dimensions: Embedding dimensions
+        text: Text being embedded
+
+    Returns:
+        Hex SHA-256 digest of model, dimensions and normalized text
+    """
+    payload: str = f"{model}\x00{dimensions}\x00{normalize_text(text)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def pack_embedding(embedding: list[float]) -> bytes:
+    """Pack an embedding as float32 bytes"""
+    return array("f", embedding).tobytes()
+
+
+def unpack_embedding(data: bytes) -> list[float]:
+    """Unpack float32 bytes into an embedding"""
+    values: array[float] = array("f")
+    values.frombytes(data)
+    return values.tolist()
+
+
+class EmbeddingCache:
+    """Two-tier (in-process LRU + Redis) embedding cache
+
+    Attributes:
+        max_entries: Maximum entries in the in-process tier
+        ttl_seconds: Time-to-live for entries in both tiers
+        use_shared_redis: Whether to use the application Redis client when
+            no explicit client is given
+        memory_hits: Lookups answered from the in-process tier
+        redis_hits: Lookups answered from Redis
+        misses: Lookups answered by neither tier
+        evictions: In-process entries evicted to respect max_entries
+        redis_errors: Redis operations that failed and were skipped
+
+    Example:
+        >>> cache = EmbeddingCache(redis_client=redis)
+        >>> key = make_cache_key("text-embedding-3-small", 1536, "Vaccines cause autism")
+        >>> await cache.get_many([key])
+        [None]
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        redis_client: Optional[Any] = None,
+        use_shared_redis: bool = False,
+    ) -> None:
+        """Initialize EmbeddingCache
+
+        Args:
+            max_entries: In-process tier capacity, defaults to config value
+            ttl_seconds: Entry time-to-live, defaults to config value
+            redis_client: Optional async Redis client for the shared tier
+            use_shared_redis: Use app.core.redis's client when redis_client
+                is not given (resolved per call, so it follows the running
+                event loop)
+        """
+        self.max_entries: int = (
+            max_entries if max_entries is not None else settings.EMBEDDING_CACHE_MAX_ENTRIES
+        )
+        self.ttl_seconds: int = (
+            ttl_seconds if ttl_seconds is not None else settings.EMBEDDING_CACHE_TTL_SECONDS
+        )
+        self.use_shared_redis: bool = use_shared_redis
+        self._redis_client: Optional[Any] = redis_client
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+        self.memory_hits: int = 0
+        self.redis_hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.redis_errors: int = 0
+
+    async def get_many(self, keys: list[str]) -> list[Optional[list[float]]]:
+        """Look up several embeddings
+
+        Checks the in-process tier first, then fetches all remaining keys
+        from Redis with a single MGET. Redis hits are promoted to the
+        in-process tier.
+
+        Args:
+            keys: Cache keys from make_cache_key
+
+        Returns:
+            Embeddings in key order (None for misses)
+        """
+        results: list[Optional[list[float]]] = [None] * len(keys)
+        missing: list[int] = []
+
+        for i, key in enumerate(keys):
+            data: Optional[bytes] = self._memory_get(key)
+            if data is None:
+                missing.append(i)
+            else:
+                self.memory_hits += 1
+                results[i] = unpack_embedding(data)
+
+        redis: Optional[Any] = self._get_redis()
+        if missing and redis is not None:
+            try:
+                values: list[Optional[bytes]] = await redis.mget(
+                    [REDIS_KEY_PREFIX + keys[i] for i in missing]
+                )
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Embedding cache Redis lookup failed: {e}")
+                values = [None] * len(missing)
+
+            still_missing: list[int] = []
+            for i, value in zip(missing, values):
+                if value is None:
+                    still_missing.append(i)
+                else:
+                    self.redis_hits += 1
+                    self._memory_set(keys[i], value)
+                    results[i] = unpack_embedding(value)
+            missing = still_missing
+
+        self.misses += len(missing)
+        return results
+
+    async def get(self, key: str) -> Optional[list[float]]:
+        """Look up a single embedding
+
+        Args:
+            key: Cache key from make_cache_key
+
+        Returns:
+            The cached embedding, or None
+        """
+        return (await self.get_many([key]))[0]
+
+    async def set_many(self, items: dict[str, list[float]]) -> None:
+        """Store several embeddings in both tiers
+
+        Args:
+            items: Mapping of cache key to embedding
+        """
+        if not items:
+            return
+
+        packed: dict[str, bytes] = {key: pack_embedding(value) for key, value in items.items()}
+        for key, data in packed.items():
+            self._memory_set(key, data)
+
+        redis: Optional[Any] = self._get_redis()
+        if redis is not None:
+            try:
+                pipe = redis.pipeline(transaction=False)
+                for key, data in packed.items():
+                    pipe.set(REDIS_KEY_PREFIX + key, data, ex=self.ttl_seconds)
+                await pipe.execute()
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Embedding cache Redis write failed: {e}")
+
+    async def set(self, key: str, embedding: list[float]) -> None:
+        """Store a single embedding in both tiers
+
+        Args:
+            key: Cache key from make_cache_key
+            embedding: The embedding vector
+        """
+        await self.set_many({key: embedding})
+
+    def clear(self) -> None:
+        """Clear the in-process tier (Redis entries expire via TTL)"""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters
+
+        Returns:
+            Dictionary of hit/miss/eviction/error counters and current size
+        """
+        return {
+            "memory_hits": self.memory_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "redis_errors": self.redis_errors,
+            "memory_entries": len(self._entries),
+        }
+
+    def _get_redis(self) -> Optional[Any]:
+        """Return the Redis client for the shared tier, if enabled"""
+        if self._redis_client is not None:
+            return self._redis_client
+        if self.use_shared_redis:
+            return get_redis_client()
+        return None
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        """Get an unexpired entry from the in-process tier and mark it recently used"""
+        entry: Optional[tuple[float, bytes]] = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, data = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return data
+
+    def _memory_set(self, key: str, data: bytes) -> None:
+        """Insert into the in-process tier, evicting least recently used entries"""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, data)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Singleton instance for use across the application
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get or create EmbeddingCache singleton instance
+
+    Returns:
+        EmbeddingCache instance (Redis tier enabled per configuration)
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(use_shared_redis=settings.EMBEDDING_CACHE_REDIS_ENABLED)
+    return _embedding_cache
@@ -11,16 +11,27 @@ text-embedding-3-small model. These embeddings are used for:
 The embeddings are 1536-dimensional vectors suitable for pgvector storage.
 """
 
+import asyncio
 import logging
 import math
+import weakref
 from typing import Optional
 
+import httpx
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.http_clients import UPSTREAM_OPENAI, get_http_client
+from app.services.embedding_cache import EmbeddingCache, get_embedding_cache, make_cache_key
 
 logger = logging.getLogger(__name__)
 
+# OpenAI embeddings API request limits
+MAX_INPUTS_PER_REQUEST = 2048
+MAX_TOKENS_PER_REQUEST = 300_000
+# Rough token estimate for batch sizing (~4 characters per token)
+CHARS_PER_TOKEN = 4
+
 
 class EmbeddingServiceError(Exception):
     """Exception raised for embedding service errors"""
@@ -38,6 +49,7 @@ class EmbeddingService:
     Attributes:
         model: The embedding model to use
         dimensions: Dimensionality of the embeddings
+        cache: Optional content-addressed embedding cache
 
     Example:
         >>> service = EmbeddingService()
@@ -46,9 +58,12 @@ class EmbeddingService:
         1536
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache: Optional[EmbeddingCache] = None) -> None:
         """Initialize EmbeddingService with OpenAI API key
 
+        Args:
+            cache: Optional embedding cache; cached texts skip the API call
+
         Raises:
             ValueError: If OPENAI_API_KEY is not configured
         """
@@ -60,13 +75,21 @@ class EmbeddingService:
         self.api_key: str = settings.OPENAI_API_KEY
         self.model: str = settings.OPENAI_EMBEDDING_MODEL
         self.dimensions: int = settings.OPENAI_EMBEDDING_DIMENSIONS
+        self.cache: Optional[EmbeddingCache] = cache
         self._client: Optional[AsyncOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Lazily initialize and return AsyncOpenAI client"""
-        if self._client is None:
-            self._client = AsyncOpenAI(api_key=self.api_key)
+        """Return an AsyncOpenAI client on the shared pooled OpenAI connections
+
+        The client is rebuilt when the running event loop has a different
+        pooled HTTP client (each Celery task runs in its own loop).
+        """
+        http_client: httpx.AsyncClient = get_http_client(UPSTREAM_OPENAI)
+        if self._client is None or self._http_client is not http_client:
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+            self._http_client = http_client
         return self._client
 
     async def generate_embedding(self, text: str) -> list[float]:
@@ -85,9 +108,19 @@ class EmbeddingService:
         if not text or not text.strip():
             raise EmbeddingServiceError("Cannot generate embedding for empty text")
 
+        cache_key: Optional[str] = None
+        if self.cache is not None:
+            cache_key = make_cache_key(self.model, self.dimensions, text)
+            cached: Optional[list[float]] = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             embedding: list[float] = await self._call_embedding_api(text.strip())
 
+            if self.cache is not None and cache_key is not None:
+                await self.cache.set(cache_key, embedding)
+
             logger.debug(
                 f"Generated embedding for text ({len(text)} chars), "
                 f"dimensions: {len(embedding)}"
@@ -105,7 +138,8 @@ class EmbeddingService:
         """Generate embeddings for multiple texts in a single batch request
 
         This is more efficient than calling generate_embedding multiple times
-        as it makes a single API call for all texts.
+        as it makes a single API call for all texts (or as few calls as the
+        API's per-request input and token limits allow).
 
         Args:
             texts: List of texts to generate embeddings for
@@ -132,7 +166,7 @@ class EmbeddingService:
             return [[] for _ in texts]
 
         try:
-            embeddings: list[list[float]] = await self._call_embedding_api_batch(valid_texts)
+            embeddings: list[list[float]] = await self._embed_with_cache(valid_texts)
 
             # Reconstruct result with empty vectors for invalid texts
             result: list[list[float]] = [[] for _ in texts]
@@ -149,6 +183,49 @@ class EmbeddingService:
             logger.error(f"Batch embedding generation failed: {e}")
             raise EmbeddingServiceError(f"Batch embedding generation failed: {str(e)}") from e
 
+    async def _embed_with_cache(self, texts: list[str]) -> list[list[float]]:
+        """Embed non-empty texts, answering cached texts without an API call
+
+        Cache misses are sent in as few API requests as the per-request
+        input and token limits allow, then written back to the cache.
+
+        Args:
+            texts: Non-empty, stripped texts
+
+        Returns:
+            List of embedding vectors (one per input text)
+        """
+        cached: list[Optional[list[float]]] = [None] * len(texts)
+        cache_keys: list[str] = []
+        if self.cache is not None:
+            cache_keys = [make_cache_key(self.model, self.dimensions, t) for t in texts]
+            cached = await self.cache.get_many(cache_keys)
+
+        uncached: list[int] = [i for i, embedding in enumerate(cached) if embedding is None]
+
+        fetched: list[list[float]] = []
+        for chunk in chunk_texts_for_api(
+            [texts[i] for i in uncached],
+            max_inputs=MAX_INPUTS_PER_REQUEST,
+            max_tokens=MAX_TOKENS_PER_REQUEST,
+        ):
+            fetched.extend(await self._call_embedding_api_batch(chunk))
+
+        if self.cache is not None and fetched:
+            await self.cache.set_many(
+                {cache_keys[i]: embedding for i, embedding in zip(uncached, fetched)}
+            )
+
+        for i, embedding in zip(uncached, fetched):
+            cached[i] = embedding
+
+        if len(uncached) < len(texts):
+            logger.debug(
+                f"Embedding cache answered {len(texts) - len(uncached)}/{len(texts)} texts"
+            )
+
+        return [embedding or [] for embedding in cached]
+
     async def _call_embedding_api(self, text: str) -> list[float]:
         """Make the actual API call to OpenAI embeddings API
 
@@ -225,9 +302,205 @@ class EmbeddingService:
         return dot_product / (mag1 * mag2)
 
 
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text for request sizing
+
+    Args:
+        text: The text to estimate
+
+    Returns:
+        Approximate number of tokens (at least 1)
+    """
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def chunk_texts_for_api(
+    texts: list[str],
+    max_inputs: int = MAX_INPUTS_PER_REQUEST,
+    max_tokens: int = MAX_TOKENS_PER_REQUEST,
+) -> list[list[str]]:
+    """Split texts into consecutive chunks that fit in one embeddings request
+
+    Args:
+        texts: Texts to embed, in order
+        max_inputs: Maximum number of inputs per request
+        max_tokens: Maximum (estimated) total tokens per request
+
+    Returns:
+        List of chunks preserving input order
+    """
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_tokens: int = 0
+
+    for text in texts:
+        tokens: int = estimate_tokens(text)
+        if current and (len(current) >= max_inputs or current_tokens + tokens > max_tokens):
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append(text)
+        current_tokens += tokens
+
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+class EmbeddingBatcher:
+    """Micro-batching coalescer for concurrent embedding requests
+
+    Requests arriving within a short window (from any caller on the same
+    event loop) are merged into one generate_embeddings_batch call, so
+    concurrent API requests share a single OpenAI round trip. A batch is
+    sent early when it reaches the API's per-request input or token limit.
+
+    Attributes:
+        embedding_service: Service used to send merged batches
+        window_seconds: How long to wait for more requests before sending
+        max_inputs: Maximum inputs per merged batch
+        max_tokens: Maximum estimated tokens per merged batch
+        requests_total: Number of texts submitted
+        batches_sent: Number of merged batches sent to the API
+
+    Example:
+        >>> batcher = get_embedding_batcher()
+        >>> embedding = await batcher.embed("Vaccines cause autism")
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        window_seconds: Optional[float] = None,
+        max_inputs: int = MAX_INPUTS_PER_REQUEST,
+        max_tokens: int = MAX_TOKENS_PER_REQUEST,
+    ) -> None:
+        """Initialize EmbeddingBatcher
+
+        Args:
+            embedding_service: Service used to send merged batches
+            window_seconds: Coalescing window, defaults to config value
+            max_inputs: Maximum inputs per merged batch
+            max_tokens: Maximum estimated tokens per merged batch
+        """
+        self.embedding_service: EmbeddingService = embedding_service
+        self.window_seconds: float = (
+            window_seconds
+            if window_seconds is not None
+            else settings.EMBEDDING_COALESCE_WINDOW_MS / 1000
+        )
+        self.max_inputs: int = max_inputs
+        self.max_tokens: int = max_tokens
+        self.requests_total: int = 0
+        self.batches_sent: int = 0
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._pending_tokens: int = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def embed(self, text: str) -> list[float]:
+        """Generate an embedding, sharing an API call with concurrent requests
+
+        Args:
+            text: The text to generate embedding for
+
+        Returns:
+            The embedding vector
+
+        Raises:
+            EmbeddingServiceError: If text is empty or the API call fails
+        """
+        if not text or not text.strip():
+            raise EmbeddingServiceError("Cannot generate embedding for empty text")
+
+        text = text.strip()
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        tokens: int = estimate_tokens(text)
+
+        if self._pending and self._pending_tokens + tokens > self.max_tokens:
+            self._flush()
+
+        self._pending.append((text, future))
+        self._pending_tokens += tokens
+        self.requests_total += 1
+
+        if len(self._pending) >= self.max_inputs:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+
+        return await future
+
+    async def embed_many(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts through the coalescer
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embedding vectors (one per input text)
+
+        Raises:
+            EmbeddingServiceError: If any text is empty or the API call fails
+        """
+        return list(await asyncio.gather(*(self.embed(text) for text in texts)))
+
+    def _flush(self) -> None:
+        """Send all pending requests as one batch"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = []
+        self._pending_tokens = 0
+        self.batches_sent += 1
+
+        task: asyncio.Task[None] = asyncio.ensure_future(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        """Embed one merged batch and resolve each caller's future
+
+        Args:
+            batch: (text, future) pairs to resolve
+        """
+        try:
+            embeddings: list[list[float]] = await self.embedding_service.generate_embeddings_batch(
+                [text for text, _ in batch]
+            )
+        except Exception as e:
+            error: Exception = (
+                e
+                if isinstance(e, EmbeddingServiceError)
+                else EmbeddingServiceError(f"Batch embedding generation failed: {str(e)}")
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        logger.debug(f"Coalesced {len(batch)} embedding requests into one batch")
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+
 # Singleton instance for use across the application
 _embedding_service: Optional[EmbeddingService] = None
 
+# One coalescer per event loop (futures cannot be shared across loops)
+_embedding_batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, EmbeddingBatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def get_embedding_service() -> EmbeddingService:
     """Get or create EmbeddingService singleton instance
@@ -240,5 +513,22 @@ def get_embedding_service() -> EmbeddingService:
     """
     global _embedding_service
     if _embedding_service is None:
-        _embedding_service = EmbeddingService()
+        _embedding_service = EmbeddingService(cache=get_embedding_cache())
     return _embedding_service
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get or create the EmbeddingBatcher for the running event loop
+
+    Returns:
+        EmbeddingBatcher wrapping the EmbeddingService singleton
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not configured
+    """
+    loop = asyncio.get_running_loop()
+    batcher: Optional[EmbeddingBatcher] = _embedding_batchers.get(loop)
+    if batcher is None:
+        batcher = EmbeddingBatcher(get_embedding_service())
+        _embedding_batchers[loop] = batcher
+    return batcher
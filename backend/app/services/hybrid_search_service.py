@@ -0,0 +1,244 @@
+"""
+Hybrid lexical + vector retrieval of claims
+
+Combines the two existing rankings in one call:
+- lexical: full-text search over claims and fact-checks (SearchService)
+- vector: pgvector ANN search on the embedding of the query text
+  (ClaimSimilarityService)
+
+Both run concurrently, each on its own pooled connection, and their top
+candidates are merged with reciprocal-rank fusion: a claim scores
+sum(1 / (k + rank)) over the rankings it appears in. RRF needs no score
+normalisation, so ts_rank_cd and cosine similarity never have to be compared,
+and claims found by both rankings rise to the top.
+
+Results are the fused top candidates; there is no cursor, since neither
+ranking can be continued past its candidate list.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import run_concurrently
+from app.models.claim import Claim
+from app.models.fact_check import FactCheck
+from app.services.claim_similarity_service import (
+    SEARCH_MODE_ANN,
+    ClaimSimilarityService,
+    SimilarClaim,
+)
+from app.services.embedding_service import get_embedding_batcher
+from app.services.search_service import SearchFilters, SearchHit, SearchService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HybridHit:
+    """A claim returned by hybrid search
+
+    Attributes:
+        claim_id: Matching claim
+        claim_content: Full claim text
+        claim_created_at: When the claim was recorded
+        fact_check_id: Latest fact-check of the claim, if any
+        verdict: Verdict of that fact-check
+        score: Reciprocal-rank fusion score
+        lexical_rank: 1-based position in the full-text ranking, if matched
+        vector_rank: 1-based position in the vector ranking, if matched
+        similarity: Cosine similarity to the query text, if matched
+        content_highlight: HTML-escaped excerpt with <mark> tags (lexical matches only)
+    """
+
+    claim_id: UUID
+    claim_content: str
+    claim_created_at: datetime
+    fact_check_id: Optional[UUID]
+    verdict: Optional[str]
+    score: float
+    lexical_rank: Optional[int] = None
+    vector_rank: Optional[int] = None
+    similarity: Optional[float] = None
+    content_highlight: Optional[str] = None
+
+
+def reciprocal_rank_fusion(rankings: list[list[UUID]], k: int) -> dict[UUID, float]:
+    """Fuse rankings of claim ids
+
+    Args:
+        rankings: Claim ids per ranking, best first
+        k: Fusion constant; larger values flatten the gap between ranks
+
+    Returns:
+        Fused score per claim id
+    """
+    scores: dict[UUID, float] = {}
+    for ranking in rankings:
+        for rank, claim_id in enumerate(ranking, start=1):
+            scores[claim_id] = scores.get(claim_id, 0.0) + 1.0 / (k + rank)
+    return scores
+
+
+class HybridSearchService:
+    """Service fusing full-text and vector search over claims
+
+    Attributes:
+        db: Database session
+        candidates: Results taken from each ranking before fusion
+        rrf_k: Reciprocal-rank fusion constant
+        min_similarity: Cosine similarity floor for vector candidates
+
+    Example:
+        >>> service = HybridSearchService(db_session)
+        >>> hits = await service.search("5G masten verspreiden corona", limit=10)
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize HybridSearchService with database session
+
+        Args:
+            db: AsyncSession for database operations
+        """
+        self.db: AsyncSession = db
+        self.candidates: int = settings.HYBRID_SEARCH_CANDIDATES
+        self.rrf_k: int = settings.HYBRID_SEARCH_RRF_K
+        self.min_similarity: float = settings.HYBRID_SEARCH_MIN_SIMILARITY
+
+    async def search(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        limit: int = 20,
+        filters: Optional[SearchFilters] = None,
+    ) -> list[HybridHit]:
+        """Search claims by text, fusing lexical and vector rankings
+
+        The query text is embedded while the full-text ranking runs; the
+        ANN query follows as soon as the embedding is available.
+
+        Args:
+            query: Search text
+            language: "nl" or "en" to parse the full-text query in one
+                language only; both by default
+            limit: Maximum results
+            filters: Restrictions applied to both rankings
+
+        Returns:
+            Hits ordered by fused score (highest first)
+
+        Raises:
+            ValueError: If language is not supported
+            EmbeddingServiceError: If the query text cannot be embedded
+        """
+        candidates: int = max(self.candidates, limit)
+
+        async def lexical(session: AsyncSession) -> list[SearchHit]:
+            page = await SearchService(session).search(
+                query, language=language, limit=candidates, filters=filters
+            )
+            return page.items
+
+        async def vector(session: AsyncSession) -> list[SimilarClaim]:
+            embedding: list[float] = await get_embedding_batcher().embed(query)
+            return await ClaimSimilarityService(session).find_similar_claims(
+                embedding=embedding,
+                threshold=self.min_similarity,
+                limit=candidates,
+                search_mode=SEARCH_MODE_ANN,
+                filters=filters,
+            )
+
+        lexical_hits, vector_hits = await run_concurrently(self.db, lexical, vector)
+
+        scores: dict[UUID, float] = reciprocal_rank_fusion(
+            [[hit.claim_id for hit in lexical_hits], [hit.claim_id for hit in vector_hits]],
+            self.rrf_k,
+        )
+        ranked: list[UUID] = sorted(scores, key=lambda claim_id: (-scores[claim_id], claim_id))[
+            :limit
+        ]
+
+        lexical_by_id: dict[UUID, tuple[int, SearchHit]] = {
+            hit.claim_id: (rank, hit) for rank, hit in enumerate(lexical_hits, start=1)
+        }
+        vector_by_id: dict[UUID, tuple[int, SimilarClaim]] = {
+            hit.claim_id: (rank, hit) for rank, hit in enumerate(vector_hits, start=1)
+        }
+
+        # Vector-only claims still need their date and latest fact-check
+        details: dict[UUID, tuple[datetime, Optional[FactCheck]]] = await self._load_details(
+            [claim_id for claim_id in ranked if claim_id not in lexical_by_id]
+        )
+
+        hits: list[HybridHit] = []
+        for claim_id in ranked:
+            hit: HybridHit
+            if claim_id in lexical_by_id:
+                lexical_rank, lexical_hit = lexical_by_id[claim_id]
+                hit = HybridHit(
+                    claim_id=claim_id,
+                    claim_content=lexical_hit.claim_content,
+                    claim_created_at=lexical_hit.claim_created_at,
+                    fact_check_id=lexical_hit.fact_check_id,
+                    verdict=lexical_hit.verdict,
+                    score=scores[claim_id],
+                    lexical_rank=lexical_rank,
+                    content_highlight=lexical_hit.content_highlight,
+                )
+            else:
+                if claim_id not in details:
+                    # Deleted between the ranking and the lookup
+                    continue
+                created_at, fact_check = details[claim_id]
+                hit = HybridHit(
+                    claim_id=claim_id,
+                    claim_content=vector_by_id[claim_id][1].content,
+                    claim_created_at=created_at,
+                    fact_check_id=fact_check.id if fact_check is not None else None,
+                    verdict=fact_check.verdict if fact_check is not None else None,
+                    score=scores[claim_id],
+                )
+            if claim_id in vector_by_id:
+                hit.vector_rank, similar = vector_by_id[claim_id]
+                hit.similarity = similar.similarity
+            hits.append(hit)
+
+        logger.debug(
+            f"Hybrid search fused {len(lexical_hits)} lexical and {len(vector_hits)} "
+            f"vector candidates into {len(hits)} results"
+        )
+        return hits
+
+    async def _load_details(
+        self, claim_ids: list[UUID]
+    ) -> dict[UUID, tuple[datetime, Optional[FactCheck]]]:
+        """Load creation time and latest fact-check for claims
+
+        Args:
+            claim_ids: Claims to load
+
+        Returns:
+            (created_at, latest fact-check or None) per existing claim
+        """
+        if not claim_ids:
+            return {}
+
+        rows = (
+            await self.db.execute(
+                select(Claim.id, Claim.created_at, FactCheck)
+                .outerjoin(FactCheck, FactCheck.claim_id == Claim.id)
+                .where(Claim.id.in_(claim_ids))
+                .order_by(FactCheck.created_at)
+            )
+        ).all()
+        details: dict[UUID, tuple[datetime, Optional[FactCheck]]] = {}
+        for row in rows:
+            details[row[0]] = (row[1], row[2])
+        return details
@@ -0,0 +1,135 @@
+"""
+Multi-keyword matching with an Aho-Corasick automaton
+
+Peer-review triggers check submissions against keyword lists that admins can
+grow without bound. Testing each keyword with a substring search costs one
+scan of the content per keyword; KeywordMatcher compiles every keyword into a
+single automaton and finds all of them in one pass over the content,
+however many keywords there are.
+
+A keyword matches at the start of a word and may continue into the rest of
+it, so stems also find inflections and compounds ("vaccine" matches
+"vaccines", "verkiezing" matches "verkiezingscampagne") but not text inside
+another word ("law" does not match "outlaw"). Matching ignores diacritics
+("reëel" matches "reeel", "cafe" matches "café"), and case unless the matcher
+is case-sensitive. Both the keywords and the content are folded the same way
+before matching.
+"""
+
+import unicodedata
+from collections import deque
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+
+def fold_text(text: str, case_sensitive: bool = False) -> str:
+    """Strip diacritics (and case, unless case_sensitive) for matching
+
+    Compatibility decomposition also splits ligatures such as the Dutch
+    "ĳ" into "ij".
+
+    Args:
+        text: Text to fold
+        case_sensitive: Keep the case of the text
+
+    Returns:
+        Folded text
+    """
+    decomposed: str = unicodedata.normalize("NFKD", text)
+    stripped: str = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return stripped if case_sensitive else stripped.casefold()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a fixed set of keywords
+
+    Built once; find() then runs in time linear in the content length plus
+    the number of matches.
+
+    Attributes:
+        keywords: The keywords, in the order given (index = keyword id)
+        case_sensitive: Whether matching respects case
+
+    Example:
+        >>> matcher = KeywordMatcher(["verkiezing", "minister-president"])
+        >>> matcher.matched("De Minister-President over de VERKIEZING")
+        {0, 1}
+    """
+
+    def __init__(self, keywords: Iterable[str], case_sensitive: bool = False) -> None:
+        """Compile the keywords
+
+        Args:
+            keywords: Keywords or phrases to find; blank ones never match
+            case_sensitive: Respect case when matching
+        """
+        self.keywords: list[str] = list(keywords)
+        self.case_sensitive: bool = case_sensitive
+        # State 0 is the root; each state has goto edges, a failure link and
+        # the (keyword id, folded length) pairs ending in it
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[tuple[int, int]]] = [[]]
+
+        for keyword_id, keyword in enumerate(self.keywords):
+            folded: str = fold_text(keyword.strip(), case_sensitive)
+            if not folded:
+                continue
+            state: int = 0
+            for ch in folded:
+                next_state: Optional[int] = self._goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][ch] = next_state
+                state = next_state
+            self._output[state].append((keyword_id, len(folded)))
+
+        self._link_failures()
+
+    def _link_failures(self) -> None:
+        """Set failure links breadth-first and merge the outputs they reach"""
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            state: int = queue.popleft()
+            for ch, child in self._goto[state].items():
+                fallback: int = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+
+    def find(self, text: str) -> Iterator[tuple[int, int]]:
+        """Find every keyword occurrence starting at a word boundary
+
+        Args:
+            text: Content to search
+
+        Yields:
+            (keyword id, start offset in the folded text), in order of the
+            end of the occurrence
+        """
+        folded: str = fold_text(text, self.case_sensitive)
+        goto: list[dict[str, int]] = self._goto
+        fail: list[int] = self._fail
+        output: list[list[tuple[int, int]]] = self._output
+        state: int = 0
+        for end, ch in enumerate(folded, start=1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for keyword_id, length in output[state]:
+                start: int = end - length
+                if start == 0 or not _is_word_char(folded[start - 1]):
+                    yield keyword_id, start
+
+    def matched(self, text: str) -> set[int]:
+        """Ids of the keywords occurring in text at the start of a word"""
+        return {keyword_id for keyword_id, _ in self.find(text)}
@@ -15,9 +15,11 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+import httpx
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.http_clients import UPSTREAM_OPENAI, get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -172,12 +174,19 @@ class LLMClaimExtractionService:
         self.model: str = settings.OPENAI_GPT_MODEL
         self.max_claims: int = settings.CLAIM_EXTRACTION_MAX_CLAIMS
         self._client: Optional[AsyncOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
 
     @property
     def client(self) -> AsyncOpenAI:
-        """Lazily initialize and return AsyncOpenAI client"""
-        if self._client is None:
-            self._client = AsyncOpenAI(api_key=self.api_key)
+        """Return an AsyncOpenAI client on the shared pooled OpenAI connections
+
+        The client is rebuilt when the running event loop has a different
+        pooled HTTP client (each Celery task runs in its own loop).
+        """
+        http_client: httpx.AsyncClient = get_http_client(UPSTREAM_OPENAI)
+        if self._client is None or self._http_client is not http_client:
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+            self._http_client = http_client
         return self._client
 
     async def extract_claims(
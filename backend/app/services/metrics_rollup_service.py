@@ -0,0 +1,171 @@
+"""
+Rebuild of the EFCSN analytics rollup tables.
+
+Issue #88: Backend Analytics Service & EFCSN Compliance Metrics
+ADR 0005: EFCSN Compliance Architecture
+
+The rollups in app.models.metrics_rollup are kept current by an ORM flush
+listener. This service recomputes them from the raw tables, which is needed:
+- once, to backfill existing history (scripts/backfill_metric_rollups.py)
+- after bulk DELETE/UPDATE statements, which bypass the ORM listener
+"""
+
+import logging
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Date, cast, delete, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.correction import Correction
+from app.models.fact_check import FactCheck
+from app.models.metrics_rollup import (
+    NO_RELEVANCE,
+    CorrectionRollup,
+    FactCheckDailyRollup,
+    SourceRollup,
+    rollup_label,
+)
+from app.models.source import Source
+
+logger = logging.getLogger(__name__)
+
+
+def _is_postgresql(db: AsyncSession) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+async def _lock_for_rebuild(db: AsyncSession, table: str) -> None:
+    """Block writers to table until the rebuild commits, so no delta is lost"""
+    if _is_postgresql(db):
+        await db.execute(text(f"LOCK TABLE {table} IN SHARE MODE"))
+
+
+async def rebuild_fact_check_rollups(db: AsyncSession) -> int:
+    """
+    Recompute fact_check_daily_rollups from fact_checks.
+
+    Args:
+        db: Database session; the caller commits
+
+    Returns:
+        Number of rollup rows written
+    """
+    await _lock_for_rebuild(db, "fact_checks")
+
+    # Bucket by UTC day, matching the flush listener
+    day_col: Any = (
+        cast(func.timezone("UTC", FactCheck.created_at), Date)
+        if _is_postgresql(db)
+        else func.date(FactCheck.created_at)
+    )
+    result = await db.execute(
+        select(
+            day_col, FactCheck.verdict, FactCheck.sources_count, func.count(FactCheck.id)
+        ).group_by(day_col, FactCheck.verdict, FactCheck.sources_count)
+    )
+    rows: list[dict[str, Any]] = [
+        {
+            "day": day if isinstance(day, date) else date.fromisoformat(day),
+            "verdict": verdict,
+            "sources_count": sources_count or 0,
+            "fact_check_count": int(count),
+        }
+        for day, verdict, sources_count, count in result.all()
+    ]
+
+    await db.execute(delete(FactCheckDailyRollup))
+    if rows:
+        await db.execute(insert(FactCheckDailyRollup), rows)
+    return len(rows)
+
+
+async def rebuild_source_rollups(db: AsyncSession) -> int:
+    """
+    Recompute source_rollups from sources.
+
+    Args:
+        db: Database session; the caller commits
+
+    Returns:
+        Number of rollup rows written
+    """
+    await _lock_for_rebuild(db, "sources")
+
+    result = await db.execute(
+        select(
+            Source.source_type,
+            Source.relevance,
+            func.count(Source.id),
+            func.count(Source.credibility_score),
+            func.sum(Source.credibility_score),
+        ).group_by(Source.source_type, Source.relevance)
+    )
+    rows: list[dict[str, Any]] = [
+        {
+            "source_type": rollup_label(source_type),
+            "relevance": NO_RELEVANCE if relevance is None else rollup_label(relevance),
+            "source_count": int(count),
+            "scored_count": int(scored),
+            "credibility_sum": int(scores or 0),
+        }
+        for source_type, relevance, count, scored, scores in result.all()
+    ]
+
+    await db.execute(delete(SourceRollup))
+    if rows:
+        await db.execute(insert(SourceRollup), rows)
+    return len(rows)
+
+
+async def rebuild_correction_rollups(db: AsyncSession) -> int:
+    """
+    Recompute correction_rollups from corrections.
+
+    Args:
+        db: Database session; the caller commits
+
+    Returns:
+        Number of rollup rows written
+    """
+    await _lock_for_rebuild(db, "corrections")
+
+    result = await db.execute(
+        select(Correction.status, Correction.correction_type, func.count(Correction.id)).group_by(
+            Correction.status, Correction.correction_type
+        )
+    )
+    rows: list[dict[str, Any]] = [
+        {
+            "status": rollup_label(status),
+            "correction_type": rollup_label(correction_type),
+            "correction_count": int(count),
+        }
+        for status, correction_type, count in result.all()
+    ]
+
+    await db.execute(delete(CorrectionRollup))
+    if rows:
+        await db.execute(insert(CorrectionRollup), rows)
+    return len(rows)
+
+
+async def rebuild_metric_rollups(db: AsyncSession) -> dict[str, int]:
+    """
+    Recompute every rollup table in one transaction and commit.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Number of rollup rows written per table
+    """
+    summary: dict[str, int] = {
+        "fact_check_daily_rollups": await rebuild_fact_check_rollups(db),
+        "source_rollups": await rebuild_source_rollups(db),
+        "correction_rollups": await rebuild_correction_rollups(db),
+    }
+    await db.commit()
+
+    logger.info(f"Rebuilt metric rollups: {summary}")
+    return summary
@@ -32,6 +32,7 @@ from app.models.peer_review import ApprovalStatus, PeerReview
 from app.models.peer_review_trigger import PeerReviewTrigger, TriggerType
 from app.models.submission import Submission
 from app.models.user import User
+from app.services.peer_review_trigger_cache import TriggerRule, get_trigger_cache
 
 # ==============================================================================
 # CUSTOM EXCEPTIONS
@@ -229,6 +230,9 @@ class PeerReviewService:
         3. Engagement thresholds (ENGAGEMENT_THRESHOLD trigger type)
         4. Manual review flag (submission.requires_peer_review)
 
+        Triggers come from the per-process trigger cache, so evaluation is one
+        pass over the content and no query once the triggers are compiled.
+
         Args:
             submission: The submission to evaluate
             engagement_metrics: Optional dict with 'views', 'shares', 'comments'
@@ -242,9 +246,14 @@ class PeerReviewService:
         # Check if manually flagged
         self._check_manual_flag(submission, triggered_by, reasons)
 
-        # Get all enabled triggers and process them
-        triggers = await self.get_enabled_triggers()
-        self._process_triggers(triggers, submission, engagement_metrics, triggered_by, reasons)
+        # Match the enabled triggers, compiled and cached per process
+        compiled = await get_trigger_cache().get(self.db)
+        matches = compiled.match(submission.content)
+        for rule_index, rule in enumerate(compiled.rules):
+            result = self._evaluate_rule(rule, matches.get(rule_index, []), engagement_metrics)
+            if result:
+                triggered_by.append(rule.trigger_type)
+                reasons.append(result)
 
         # Calculate confidence based on number of triggers
         should_trigger = len(triggered_by) > 0
@@ -271,109 +280,77 @@ class PeerReviewService:
                 reason = f"{reason}: {submission.peer_review_reason}"
             reasons.append(reason)
 
-    def _process_triggers(
+    def _evaluate_rule(
         self,
-        triggers: list[PeerReviewTrigger],
-        submission: Submission,
-        engagement_metrics: Optional[dict[str, Any]],
-        triggered_by: list[TriggerType],
-        reasons: list[str],
-    ) -> None:
-        """Process all enabled triggers against the submission."""
-        for trigger in triggers:
-            result = self._evaluate_single_trigger(trigger, submission, engagement_metrics)
-            if result:
-                triggered_by.append(trigger.trigger_type)
-                reasons.append(result)
-
-    def _evaluate_single_trigger(
-        self,
-        trigger: PeerReviewTrigger,
-        submission: Submission,
+        rule: TriggerRule,
+        matched: list[str],
         engagement_metrics: Optional[dict[str, Any]],
     ) -> Optional[str]:
-        """Evaluate a single trigger against the submission."""
-        if trigger.trigger_type == TriggerType.POLITICAL_KEYWORD:
-            return self._check_keyword_trigger(submission, trigger)
-        elif trigger.trigger_type == TriggerType.SENSITIVE_TOPIC:
-            return self._check_sensitive_topic_trigger(submission, trigger)
-        elif trigger.trigger_type == TriggerType.ENGAGEMENT_THRESHOLD:
+        """Evaluate a single trigger given the keywords it matched."""
+        if rule.trigger_type == TriggerType.POLITICAL_KEYWORD:
+            return self._check_keyword_trigger(rule, matched)
+        elif rule.trigger_type == TriggerType.SENSITIVE_TOPIC:
+            return self._check_sensitive_topic_trigger(rule, matched)
+        elif rule.trigger_type == TriggerType.ENGAGEMENT_THRESHOLD:
             if engagement_metrics:
-                return self._check_engagement_trigger(engagement_metrics, trigger)
+                return self._check_engagement_trigger(engagement_metrics, rule)
         return None
 
     def _check_keyword_trigger(
         self,
-        submission: Submission,
-        trigger: PeerReviewTrigger,
+        rule: TriggerRule,
+        matched: list[str],
     ) -> Optional[str]:
         """
         Check if submission content matches political keyword trigger.
 
         Args:
-            submission: The submission to check
-            trigger: The keyword trigger configuration
+            rule: The keyword trigger configuration
+            matched: Keywords of the trigger found in the content (at word starts,
+                ignoring diacritics and, unless case_sensitive, case)
 
         Returns:
             Reason string if triggered, None otherwise
         """
-        if trigger.threshold_value is None:
+        if rule.threshold_value is None:
             return None
 
-        keywords = trigger.threshold_value.get("keywords", [])
-        min_occurrences = trigger.threshold_value.get("min_occurrences", 1)
-        case_sensitive = trigger.threshold_value.get("case_sensitive", False)
-
-        content = submission.content
-        if not case_sensitive:
-            content = content.lower()
-            keywords = [k.lower() for k in keywords]
+        min_occurrences = rule.threshold_value.get("min_occurrences", 1)
+        if not rule.case_sensitive:
+            matched = list(dict.fromkeys(k.lower() for k in matched))
 
-        matched_keywords: list[str] = []
-        for keyword in keywords:
-            if keyword in content:
-                matched_keywords.append(keyword)
-
-        if len(matched_keywords) >= min_occurrences:
-            return f"Contains political keywords: {', '.join(matched_keywords)}"
+        if len(matched) >= min_occurrences:
+            return f"Contains political keywords: {', '.join(matched)}"
 
         return None
 
     def _check_sensitive_topic_trigger(
         self,
-        submission: Submission,
-        trigger: PeerReviewTrigger,
+        rule: TriggerRule,
+        matched: list[str],
     ) -> Optional[str]:
         """
         Check if submission content matches sensitive topic trigger.
 
         Args:
-            submission: The submission to check
-            trigger: The sensitive topic trigger configuration
+            rule: The sensitive topic trigger configuration
+            matched: Topics of the trigger found in the content
 
         Returns:
             Reason string if triggered, None otherwise
         """
-        if trigger.threshold_value is None:
+        if rule.threshold_value is None:
             return None
 
-        topics = trigger.threshold_value.get("topics", [])
-        content = submission.content.lower()
-
-        matched_topics: list[str] = []
-        for topic in topics:
-            if topic.lower() in content:
-                matched_topics.append(topic)
-
-        if matched_topics:
-            return f"Contains sensitive health/safety topics: {', '.join(matched_topics)}"
+        if matched:
+            return f"Contains sensitive health/safety topics: {', '.join(matched)}"
 
         return None
 
     def _check_engagement_trigger(
         self,
         engagement_metrics: dict[str, Any],
-        trigger: PeerReviewTrigger,
+        trigger: TriggerRule,
     ) -> Optional[str]:
         """
         Check if engagement metrics exceed threshold trigger.
@@ -0,0 +1,259 @@
+"""
+Compiled peer-review triggers, cached per process
+
+Evaluating a submission used to load the enabled triggers from the database
+and scan the content once per keyword. The enabled triggers are now loaded
+once, their keywords and topics compiled into KeywordMatchers, and the result
+kept in process until triggers change, so evaluation is a single pass over
+the content with no query.
+
+The cache is dropped when triggers change:
+- in this process, after any commit that inserted, updated or deleted a
+  PeerReviewTrigger through the ORM
+- in every process, when invalidate_peer_review_triggers() publishes on a
+  Redis channel (PATCH /peer-review/triggers)
+A TTL bounds staleness if a message is missed.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from app.core.config import settings
+from app.core.pubsub import ChannelListener
+from app.core.redis import get_redis_client
+from app.models.peer_review_trigger import PeerReviewTrigger, TriggerType
+from app.services.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "peer-review-triggers:invalidate"
+
+# threshold_value key holding the word list, per trigger type
+_KEYWORD_KEYS: dict[TriggerType, str] = {
+    TriggerType.POLITICAL_KEYWORD: "keywords",
+    TriggerType.SENSITIVE_TOPIC: "topics",
+}
+
+# Session.info flag set when a flush wrote PeerReviewTrigger rows
+_CHANGED_FLAG = "peer_review_triggers_changed"
+
+
+@dataclass(frozen=True)
+class TriggerRule:
+    """Snapshot of an enabled trigger, detached from any session
+
+    Attributes:
+        trigger_id: PeerReviewTrigger id
+        trigger_type: Type of the trigger
+        threshold_value: Trigger configuration
+        keywords: Keywords or topics to match, in configured order
+        case_sensitive: Whether keywords match case-sensitively
+    """
+
+    trigger_id: UUID
+    trigger_type: TriggerType
+    threshold_value: Optional[dict[str, Any]]
+    keywords: tuple[str, ...] = ()
+    case_sensitive: bool = False
+
+
+@dataclass
+class CompiledTriggers:
+    """Enabled triggers with their keywords compiled into matchers
+
+    Attributes:
+        rules: Enabled triggers
+        matchers: Case-insensitive and (if needed) case-sensitive matchers
+            over the keywords of every rule
+        owners: Per matcher, the (rule index, keyword) pairs of each keyword id
+    """
+
+    rules: list[TriggerRule]
+    matchers: list[KeywordMatcher] = field(default_factory=list)
+    owners: list[list[list[tuple[int, str]]]] = field(default_factory=list)
+
+    @classmethod
+    def compile(cls, triggers: list[PeerReviewTrigger]) -> "CompiledTriggers":
+        """Snapshot the triggers and compile their keywords
+
+        Args:
+            triggers: Enabled triggers
+
+        Returns:
+            CompiledTriggers ready for matching
+        """
+        rules: list[TriggerRule] = []
+        # case_sensitive -> folded-equal keywords share one automaton entry
+        keyword_ids: dict[bool, dict[str, int]] = {False: {}, True: {}}
+        owners: dict[bool, list[list[tuple[int, str]]]] = {False: [], True: []}
+
+        for trigger in triggers:
+            threshold_value: dict[str, Any] = trigger.threshold_value or {}
+            key: Optional[str] = _KEYWORD_KEYS.get(trigger.trigger_type)
+            keywords: tuple[str, ...] = (
+                tuple(str(k) for k in threshold_value.get(key, [])) if key else ()
+            )
+            case_sensitive: bool = bool(threshold_value.get("case_sensitive", False))
+            rule_index: int = len(rules)
+            rules.append(
+                TriggerRule(
+                    trigger_id=trigger.id,
+                    trigger_type=trigger.trigger_type,
+                    threshold_value=trigger.threshold_value,
+                    keywords=keywords,
+                    case_sensitive=case_sensitive,
+                )
+            )
+            for keyword in keywords:
+                ids: dict[str, int] = keyword_ids[case_sensitive]
+                if keyword not in ids:
+                    ids[keyword] = len(ids)
+                    owners[case_sensitive].append([])
+                owners[case_sensitive][ids[keyword]].append((rule_index, keyword))
+
+        compiled: CompiledTriggers = cls(rules=rules)
+        for case_sensitive in (False, True):
+            if keyword_ids[case_sensitive]:
+                compiled.matchers.append(
+                    KeywordMatcher(keyword_ids[case_sensitive], case_sensitive=case_sensitive)
+                )
+                compiled.owners.append(owners[case_sensitive])
+        return compiled
+
+    def match(self, content: str) -> dict[int, list[str]]:
+        """Find the keywords of every rule in content
+
+        Args:
+            content: Submission content
+
+        Returns:
+            Matched keywords per rule index, in the rule's configured order
+        """
+        found: dict[int, set[str]] = defaultdict(set)
+        for matcher, owners in zip(self.matchers, self.owners):
+            for keyword_id in matcher.matched(content):
+                for rule_index, keyword in owners[keyword_id]:
+                    found[rule_index].add(keyword)
+        return {
+            rule_index: [k for k in dict.fromkeys(self.rules[rule_index].keywords) if k in words]
+            for rule_index, words in found.items()
+        }
+
+
+class TriggerCache:
+    """In-process cache of the compiled enabled triggers
+
+    Attributes:
+        ttl_seconds: Lifetime of the compiled triggers
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds: float = ttl_seconds
+        self._entry: Optional[tuple[float, CompiledTriggers]] = None
+        # Bumped on every invalidation, so a load that raced one is not stored
+        self._generation: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    async def get(self, db: AsyncSession) -> CompiledTriggers:
+        """Return the compiled triggers, loading them on a miss
+
+        Args:
+            db: Session used to load the triggers on a miss
+
+        Returns:
+            CompiledTriggers for the enabled triggers
+        """
+        with self._lock:
+            entry: Optional[tuple[float, CompiledTriggers]] = self._entry
+            generation: int = self._generation
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        result = await db.execute(
+            select(PeerReviewTrigger).where(PeerReviewTrigger.enabled.is_(True))
+        )
+        compiled: CompiledTriggers = CompiledTriggers.compile(list(result.scalars().all()))
+        with self._lock:
+            if generation == self._generation and self.ttl_seconds > 0:
+                self._entry = (time.monotonic() + self.ttl_seconds, compiled)
+        return compiled
+
+    def clear(self) -> None:
+        """Drop the compiled triggers"""
+        with self._lock:
+            self._entry = None
+            self._generation += 1
+
+
+# Singleton instance for use across the application
+_trigger_cache: Optional[TriggerCache] = None
+
+
+def get_trigger_cache() -> TriggerCache:
+    """Get or create the TriggerCache singleton
+
+    Returns:
+        TriggerCache instance
+    """
+    global _trigger_cache
+    if _trigger_cache is None:
+        _trigger_cache = TriggerCache(ttl_seconds=settings.PEER_REVIEW_TRIGGER_CACHE_TTL_SECONDS)
+    return _trigger_cache
+
+
+async def invalidate_peer_review_triggers() -> None:
+    """Drop the compiled triggers in this and every other API process"""
+    get_trigger_cache().clear()
+    try:
+        await get_redis_client().publish(INVALIDATION_CHANNEL, b"1")
+    except Exception as e:
+        # Other processes fall back to the TTL
+        logger.warning(f"Failed to publish peer review trigger invalidation: {e}")
+
+
+def create_trigger_invalidation_listener(**kwargs: Any) -> ChannelListener:
+    """Build the listener applying invalidations published by other processes
+
+    Args:
+        **kwargs: Passed to ChannelListener (retry_delay, poll_timeout)
+
+    Returns:
+        ChannelListener to start from the FastAPI lifespan
+    """
+    return ChannelListener(
+        INVALIDATION_CHANNEL,
+        on_message=lambda data: get_trigger_cache().clear(),
+        on_error=lambda: get_trigger_cache().clear(),
+        **kwargs,
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _note_trigger_changes(session: Session, flush_context: UOWTransaction) -> None:
+    """Remember that this transaction wrote PeerReviewTrigger rows"""
+    if any(
+        isinstance(obj, PeerReviewTrigger)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    ):
+        session.info[_CHANGED_FLAG] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_after_trigger_commit(session: Session) -> None:
+    """Drop the local compiled triggers once trigger changes are committed"""
+    if session.info.pop(_CHANGED_FLAG, False):
+        get_trigger_cache().clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_changes(session: Session) -> None:
+    session.info.pop(_CHANGED_FLAG, None)
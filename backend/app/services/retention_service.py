@@ -3,19 +3,29 @@ Data Retention Service
 
 Issue #91: Data Retention Policies & Auto-Cleanup
 Implements automated data retention policies per GDPR requirements
+
+On PostgreSQL analytics_events is partitioned by month, so its retention
+drops whole partitions instead of deleting rows (see
+app.services.analytics_partition_service).
 """
 
+import logging
 from datetime import datetime, timedelta, timezone
-from typing import cast
+from typing import Any, cast
 
 from sqlalchemy import delete
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.models.analytics_event import AnalyticsEvent
 from app.models.correction import Correction, CorrectionStatus
 from app.models.submission import Submission
 from app.models.workflow_transition import WorkflowState
+from app.services import analytics_partition_service
+from app.services.metrics_rollup_service import rebuild_correction_rollups
+
+logger = logging.getLogger(__name__)
 
 
 class RetentionService:
@@ -28,6 +38,8 @@ class RetentionService:
         self.draft_evidence_days: int = settings.RETENTION_DRAFT_EVIDENCE_DAYS
         self.rejected_claims_days: int = settings.RETENTION_REJECTED_CLAIMS_DAYS
         self.correction_requests_days: int = settings.RETENTION_CORRECTION_REQUESTS_DAYS
+        self.analytics_events_days: int = settings.RETENTION_ANALYTICS_EVENTS_DAYS
+        self.analytics_partition_premake_months: int = settings.ANALYTICS_PARTITION_PREMAKE_MONTHS
 
     async def cleanup_unpublished_submissions(self, db: AsyncSession) -> int:
         """
@@ -118,10 +130,81 @@ class RetentionService:
         )
 
         result = cast(CursorResult[tuple[int]], await db.execute(stmt))
+        # Bulk DELETE bypasses the ORM listener that maintains the rollups
+        if result.rowcount:
+            await rebuild_correction_rollups(db)
         await db.commit()
 
         return result.rowcount or 0
 
+    async def cleanup_analytics_events(self, db: AsyncSession) -> int:
+        """
+        Remove analytics events older than retention period
+
+        On PostgreSQL expired monthly partitions are detached and dropped, so
+        events are removed a whole month at a time once the month has fully
+        expired. Elsewhere (e.g. SQLite) expired rows are deleted.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of events removed (estimated from planner statistics for
+            dropped partitions)
+        """
+        cutoff_date: datetime = datetime.now(timezone.utc) - timedelta(
+            days=self.analytics_events_days
+        )
+
+        if analytics_partition_service.is_partitioned(db):
+            dropped = await analytics_partition_service.drop_expired_partitions(db, cutoff_date)
+            await db.commit()
+            return dropped.estimated_rows
+
+        stmt = delete(AnalyticsEvent).where(AnalyticsEvent.occurred_at < cutoff_date)
+        result = cast(CursorResult[tuple[int]], await db.execute(stmt))
+        await db.commit()
+
+        return result.rowcount or 0
+
+    async def maintain_analytics_partitions(self, db: AsyncSession) -> dict[str, Any]:
+        """
+        Pre-create upcoming analytics_events partitions and apply retention
+
+        Args:
+            db: Database session
+
+        Returns:
+            Dictionary with the partitions created, the number of events
+            removed by cleanup_analytics_events, and the rows that fell into
+            the default partition (which should stay empty)
+        """
+        summary: dict[str, Any] = {
+            "created_partitions": [],
+            "analytics_events": 0,
+            "default_partition_rows": 0,
+        }
+
+        if analytics_partition_service.is_partitioned(db):
+            summary["created_partitions"] = await analytics_partition_service.ensure_partitions(
+                db, self.analytics_partition_premake_months
+            )
+            await db.commit()
+
+        summary["analytics_events"] = await self.cleanup_analytics_events(db)
+
+        if analytics_partition_service.is_partitioned(db):
+            summary["default_partition_rows"] = (
+                await analytics_partition_service.default_partition_rows(db)
+            )
+            if summary["default_partition_rows"]:
+                logger.warning(
+                    f"{summary['default_partition_rows']} analytics events are in the default "
+                    "partition; check that partition maintenance is running"
+                )
+
+        return summary
+
     async def run_all(self, db: AsyncSession) -> dict[str, int]:
         """
         Run all cleanup tasks and return summary
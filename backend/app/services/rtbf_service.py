@@ -16,9 +16,12 @@ from datetime import date, datetime, timezone
 from typing import Any, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CountMode, KeysetPage, count_total, fetch_keyset_page
+from app.core.principal_cache import invalidate_principal
+from app.models.loading import SUBMISSION_EXPORT
 from app.models.rtbf_request import RTBFRequest, RTBFRequestStatus
 from app.models.submission import Submission
 from app.models.user import User
@@ -138,35 +141,58 @@ class RTBFService:
         status: Optional[RTBFRequestStatus] = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[RTBFRequest], int]:
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> KeysetPage[RTBFRequest]:
         """
-        List all RTBF requests with optional filtering.
+        List all RTBF requests with optional filtering, newest first.
 
         Args:
             status: Optional status filter
             limit: Maximum number of results
-            offset: Offset for pagination
+            offset: Offset for pagination when no cursor is given
+            cursor: next_cursor of the previous page
+            count: How to compute the total (see app.core.pagination.CountMode)
 
         Returns:
-            Tuple of (list of requests, total count)
+            Page of requests with next_cursor and total
+
+        Raises:
+            InvalidCursorError: If the cursor cannot be decoded
         """
-        base_stmt = select(RTBFRequest)
+        stmt = select(RTBFRequest)
         if status:
-            base_stmt = base_stmt.where(RTBFRequest.status == status)
+            stmt = stmt.where(RTBFRequest.status == status)
 
-        # Get total count
-        count_stmt = select(RTBFRequest.id)
-        if status:
-            count_stmt = count_stmt.where(RTBFRequest.status == status)
-        count_result = await self.db.execute(count_stmt)
-        total: int = len(count_result.all())
+        total: Optional[int] = await count_total(
+            self.db, stmt, count, cache_key=f"rtbf-requests:{status.value if status else '*'}"
+        )
 
-        # Get paginated results
-        stmt = base_stmt.order_by(RTBFRequest.created_at.desc()).limit(limit).offset(offset)
-        result = await self.db.execute(stmt)
-        requests: list[RTBFRequest] = list(result.scalars().all())
+        page: KeysetPage[RTBFRequest] = await fetch_keyset_page(
+            self.db,
+            stmt,
+            RTBFRequest.created_at,
+            RTBFRequest.id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+        )
+        page.total = total
+        return page
 
-        return requests, total
+    async def count_by_status(self) -> dict[RTBFRequestStatus, int]:
+        """
+        Count RTBF requests per status in a single grouped query.
+
+        Returns:
+            Number of requests for every status (0 when there are none)
+        """
+        stmt = select(RTBFRequest.status, func.count()).group_by(RTBFRequest.status)
+        result = await self.db.execute(stmt)
+        counts: dict[RTBFRequestStatus, int] = dict.fromkeys(RTBFRequestStatus, 0)
+        for row_status, row_count in result.all():
+            counts[row_status] = row_count
+        return counts
 
     def is_minor(self, date_of_birth: date) -> bool:
         """
@@ -336,6 +362,7 @@ class RTBFService:
         result["user_anonymized"] = True
 
         await self.db.commit()
+        await invalidate_principal(user_id=user_id)
         return result
 
     async def export_user_data(self, user_id: UUID) -> dict[str, Any]:
@@ -360,6 +387,7 @@ class RTBFService:
         submissions_stmt = (
             select(Submission)
             .where(Submission.user_id == user_id)
+            .options(*SUBMISSION_EXPORT)
             .order_by(Submission.created_at.desc())
         )
         submissions_result = await self.db.execute(submissions_stmt)
@@ -0,0 +1,518 @@
+"""
+Full-text search over claims and fact-checks
+
+Answers "was this rumour already checked?" for reviewers. A query is
+matched against the generated tsvector columns added by migration
+t0u1v2w3x4y5:
+- claims.search_vector: claim content
+- fact_checks.search_vector: verdict, reasoning and draft content
+- fact_check_ratings.search_vector: rating justification (migration
+  v2w3x4y5z6a7), counted for the claim of the rated fact-check; only
+  current ratings match
+
+All columns hold dutch and english lexemes, so the query is parsed with
+websearch_to_tsquery in the requested configuration (or both), matched
+through the GIN indexes and ranked with ts_rank_cd. Results are claims with
+their latest fact-check, ordered by (score, claim id) and paged with a
+keyset cursor; ts_headline runs only for the rows on the page.
+
+When the full-text query matches nothing (typos, partial words) the search
+falls back to pg_trgm word similarity on claim content, served by a
+trigram GIN index.
+
+SearchFilters (workflow state, verdict, claim date) narrow both rankings and
+are shared with vector search in ClaimSimilarityService.
+
+Note: When the database is not PostgreSQL (e.g. SQLite in tests), claims
+are loaded and matched in Python, which is only suitable for small corpora.
+"""
+
+import html
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.pagination import KeysetPage, decode_score_cursor, encode_score_cursor
+from app.models.claim import Claim
+from app.models.fact_check import FactCheck
+from app.models.fact_check_rating import FactCheckRating
+from app.models.submission import Submission
+from app.models.workflow_transition import WorkflowState
+
+logger = logging.getLogger(__name__)
+
+# Ranking that produced a result (also stored in the page cursor)
+MATCH_FULLTEXT = "fulltext"
+MATCH_FUZZY = "fuzzy"
+
+# Text search configuration per supported query language
+LANGUAGE_CONFIGS: dict[str, str] = {"nl": "dutch", "en": "english"}
+
+# Control characters marking matches in ts_headline output; the text is
+# HTML-escaped afterwards and the markers become <mark> tags
+_START_MARK = "\x02"
+_STOP_MARK = "\x03"
+_HEADLINE_OPTIONS = (
+    f"StartSel={_START_MARK}, StopSel={_STOP_MARK}, MaxWords=35, MinWords=15, MaxFragments=2"
+)
+
+FULLTEXT_SEARCH_SQL = """
+    WITH q AS (SELECT {tsquery} AS query),
+    matches AS (
+        SELECT c.id AS claim_id, ts_rank_cd(c.search_vector, q.query, 32) AS rank
+        FROM claims c, q
+        WHERE c.search_vector @@ q.query
+        UNION ALL
+        SELECT f.claim_id, ts_rank_cd(f.search_vector, q.query, 32)
+        FROM fact_checks f, q
+        WHERE f.search_vector @@ q.query
+        UNION ALL
+        SELECT f.claim_id, ts_rank_cd(r.search_vector, q.query, 32)
+        FROM fact_check_ratings r
+        JOIN fact_checks f ON f.id = r.fact_check_id
+        CROSS JOIN q
+        WHERE r.search_vector @@ q.query AND r.is_current
+    ),
+    ranked AS (
+        SELECT m.claim_id, sum(m.rank)::float8 AS score
+        FROM matches m
+        JOIN claims c ON c.id = m.claim_id
+        WHERE true {filter_clause}
+        GROUP BY m.claim_id
+    ),
+    page AS (
+        SELECT claim_id, score
+        FROM ranked
+        {after_clause}
+        ORDER BY score DESC, claim_id DESC
+        LIMIT :limit
+    )
+    SELECT
+        page.claim_id,
+        page.score,
+        c.content,
+        c.created_at,
+        fc.id,
+        fc.verdict,
+        ts_headline(CAST(:headline_config AS regconfig), c.content, q.query, :options),
+        ts_headline(CAST(:headline_config AS regconfig), fc.reasoning, q.query, :options)
+    FROM page
+    JOIN claims c ON c.id = page.claim_id
+    CROSS JOIN q
+    LEFT JOIN LATERAL (
+        SELECT id, verdict, reasoning
+        FROM fact_checks
+        WHERE claim_id = page.claim_id
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) fc ON true
+    ORDER BY page.score DESC, page.claim_id DESC
+"""
+
+# "query <% content" is answered by the trigram GIN index on claims.content
+FUZZY_SEARCH_SQL = """
+    WITH similar AS (
+        SELECT c.id AS claim_id, word_similarity(:query, c.content)::float8 AS score
+        FROM claims c
+        WHERE :query <% c.content {filter_clause}
+    )
+    SELECT
+        page.claim_id,
+        page.score,
+        c.content,
+        c.created_at,
+        fc.id,
+        fc.verdict,
+        NULL,
+        NULL
+    FROM (
+        SELECT claim_id, score
+        FROM similar
+        {after_clause}
+        ORDER BY score DESC, claim_id DESC
+        LIMIT :limit
+    ) page
+    JOIN claims c ON c.id = page.claim_id
+    LEFT JOIN LATERAL (
+        SELECT id, verdict
+        FROM fact_checks
+        WHERE claim_id = page.claim_id
+        ORDER BY created_at DESC
+        LIMIT 1
+    ) fc ON true
+    ORDER BY page.score DESC, page.claim_id DESC
+"""
+
+_AFTER_CLAUSE = "WHERE (score, claim_id) < (:after_score, :after_id)"
+
+
+@dataclass(frozen=True)
+class SearchFilters:
+    """Restrictions applied to claim searches
+
+    Attributes:
+        workflow_state: Claim belongs to a submission in this state
+        verdict: Claim's latest fact-check has this verdict
+        created_from: Claim recorded at or after this moment
+        created_to: Claim recorded before this moment
+    """
+
+    workflow_state: Optional[WorkflowState] = None
+    verdict: Optional[str] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+    def sql(self, claim_alias: str = "c") -> tuple[str, dict[str, Any]]:
+        """Render the filters for raw SQL over claims
+
+        Args:
+            claim_alias: Alias of the claims table in the statement
+
+        Returns:
+            An " AND ..." fragment (empty without filters) and its parameters
+        """
+        clauses: list[str] = []
+        params: dict[str, Any] = {}
+        if self.workflow_state is not None:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM submission_claims sc "
+                "JOIN submissions s ON s.id = sc.submission_id "
+                f"WHERE sc.claim_id = {claim_alias}.id "
+                "AND s.workflow_state = :filter_workflow_state)"
+            )
+            params["filter_workflow_state"] = self.workflow_state.value
+        if self.verdict is not None:
+            # Only the latest fact-check counts, as in the displayed verdict
+            clauses.append(
+                "(SELECT fv.verdict FROM fact_checks fv "
+                f"WHERE fv.claim_id = {claim_alias}.id "
+                "ORDER BY fv.created_at DESC LIMIT 1) = :filter_verdict"
+            )
+            params["filter_verdict"] = self.verdict
+        if self.created_from is not None:
+            clauses.append(f"{claim_alias}.created_at >= :filter_created_from")
+            params["filter_created_from"] = self.created_from
+        if self.created_to is not None:
+            clauses.append(f"{claim_alias}.created_at < :filter_created_to")
+            params["filter_created_to"] = self.created_to
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    def conditions(self) -> list[ColumnElement[bool]]:
+        """The same filters as ORM conditions on Claim (for in-memory fallbacks)"""
+        conditions: list[ColumnElement[bool]] = []
+        if self.workflow_state is not None:
+            conditions.append(
+                Claim.submissions.any(Submission.workflow_state == self.workflow_state)
+            )
+        if self.verdict is not None:
+            latest_verdict = (
+                select(FactCheck.verdict)
+                .where(FactCheck.claim_id == Claim.id)
+                .order_by(FactCheck.created_at.desc())
+                .limit(1)
+                .correlate(Claim)
+                .scalar_subquery()
+            )
+            conditions.append(latest_verdict == self.verdict)
+        if self.created_from is not None:
+            conditions.append(Claim.created_at >= self.created_from)
+        if self.created_to is not None:
+            conditions.append(Claim.created_at < self.created_to)
+        return conditions
+
+
+@dataclass
+class SearchHit:
+    """A claim matching a search query
+
+    Attributes:
+        claim_id: Matching claim
+        claim_content: Full claim text
+        claim_created_at: When the claim was recorded
+        fact_check_id: Latest fact-check of the claim, if any
+        verdict: Verdict of that fact-check
+        score: Relevance (ts_rank_cd sum, or word similarity for fuzzy matches)
+        match: MATCH_FULLTEXT or MATCH_FUZZY
+        content_highlight: HTML-escaped claim excerpt with matches in <mark>
+        reasoning_highlight: Same for the fact-check reasoning, if it matched
+    """
+
+    claim_id: UUID
+    claim_content: str
+    claim_created_at: datetime
+    fact_check_id: Optional[UUID]
+    verdict: Optional[str]
+    score: float
+    match: str
+    content_highlight: str
+    reasoning_highlight: Optional[str] = None
+
+
+def _render_headline(headline: str) -> str:
+    """HTML-escape a ts_headline result and turn its markers into <mark> tags"""
+    return html.escape(headline).replace(_START_MARK, "<mark>").replace(_STOP_MARK, "</mark>")
+
+
+def _plain_excerpt(content: str, max_chars: int = 200) -> str:
+    """HTML-escaped start of content, for results without highlighted terms"""
+    excerpt: str = content if len(content) <= max_chars else content[:max_chars].rstrip() + "…"
+    return html.escape(excerpt)
+
+
+class SearchService:
+    """Service for ranked full-text search over claims and fact-checks
+
+    Attributes:
+        db: Database session
+        fuzzy_threshold: Minimum pg_trgm word similarity for fuzzy matches
+
+    Example:
+        >>> service = SearchService(db_session)
+        >>> page = await service.search("vaccin autisme", language="nl")
+        >>> for hit in page.items:
+        ...     print(hit.verdict, hit.content_highlight)
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """Initialize SearchService with database session
+
+        Args:
+            db: AsyncSession for database operations
+        """
+        self.db: AsyncSession = db
+        self.fuzzy_threshold: float = settings.SEARCH_FUZZY_THRESHOLD
+
+    async def search(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        filters: Optional[SearchFilters] = None,
+    ) -> KeysetPage[SearchHit]:
+        """Search claims and fact-checks, best matches first
+
+        Args:
+            query: Search text (web search syntax: "quoted phrases", -exclusion, OR)
+            language: "nl" or "en" to parse the query in one configuration;
+                None matches both
+            limit: Maximum results on the page
+            cursor: next_cursor of the previous page
+            filters: Restrictions on the matching claims
+
+        Returns:
+            The page of hits, with next_cursor set when more follow
+
+        Raises:
+            ValueError: If language is not supported
+            InvalidCursorError: If the cursor cannot be decoded
+        """
+        if language is not None and language not in LANGUAGE_CONFIGS:
+            raise ValueError(
+                f"Unsupported language '{language}'. Must be one of: "
+                f"{', '.join(LANGUAGE_CONFIGS)}"
+            )
+
+        filters = filters or SearchFilters()
+        kind: str = MATCH_FULLTEXT
+        after: Optional[tuple[float, UUID]] = None
+        if cursor is not None:
+            kind, after_score, after_id = decode_score_cursor(cursor)
+            after = (after_score, after_id)
+
+        hits: list[SearchHit] = []
+        if kind == MATCH_FULLTEXT:
+            hits = await self._query(MATCH_FULLTEXT, query, language, limit + 1, after, filters)
+            # Fuzzy matching only when the query has no full-text match at all
+            if not hits and after is None:
+                kind = MATCH_FUZZY
+        if kind == MATCH_FUZZY:
+            hits = await self._query(MATCH_FUZZY, query, language, limit + 1, after, filters)
+
+        next_cursor: Optional[str] = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            next_cursor = encode_score_cursor(kind, hits[-1].score, hits[-1].claim_id)
+        return KeysetPage(items=hits, next_cursor=next_cursor)
+
+    async def _query(
+        self,
+        kind: str,
+        query: str,
+        language: Optional[str],
+        limit: int,
+        after: Optional[tuple[float, UUID]],
+        filters: SearchFilters,
+    ) -> list[SearchHit]:
+        """Run one ranking (full-text or fuzzy) for a page"""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return await self._search_in_memory(kind, query, limit, after, filters)
+
+        filter_clause, filter_params = filters.sql("c")
+        params: dict[str, Any] = {"query": query, "limit": limit, **filter_params}
+        after_clause: str = ""
+        if after is not None:
+            after_clause = _AFTER_CLAUSE
+            params["after_score"], params["after_id"] = after
+
+        if kind == MATCH_FULLTEXT:
+            configs: list[str] = (
+                [LANGUAGE_CONFIGS[language]] if language else list(LANGUAGE_CONFIGS.values())
+            )
+            tsquery: str = " || ".join(
+                f"websearch_to_tsquery('{config}', :query)" for config in configs
+            )
+            sql: str = FULLTEXT_SEARCH_SQL.format(
+                tsquery=tsquery, filter_clause=filter_clause, after_clause=after_clause
+            )
+            params["headline_config"] = configs[0]
+            params["options"] = _HEADLINE_OPTIONS
+        else:
+            sql = FUZZY_SEARCH_SQL.format(filter_clause=filter_clause, after_clause=after_clause)
+            await self.db.execute(
+                text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)"),
+                {"threshold": str(self.fuzzy_threshold)},
+            )
+
+        result = await self.db.execute(text(sql), params)
+        return [
+            SearchHit(
+                claim_id=row[0],
+                claim_content=row[2],
+                claim_created_at=row[3],
+                fact_check_id=row[4],
+                verdict=row[5],
+                score=float(row[1]),
+                match=kind,
+                content_highlight=(
+                    _render_headline(row[6]) if row[6] is not None else _plain_excerpt(row[2])
+                ),
+                # ts_headline returns an excerpt even without a match; only keep matches
+                reasoning_highlight=(
+                    _render_headline(row[7]) if row[7] and _START_MARK in row[7] else None
+                ),
+            )
+            for row in result.all()
+        ]
+
+    async def _search_in_memory(
+        self,
+        kind: str,
+        query: str,
+        limit: int,
+        after: Optional[tuple[float, UUID]],
+        filters: SearchFilters,
+    ) -> list[SearchHit]:
+        """Match claims in Python on databases without text search
+
+        Full-text scores are the share of query words found in the claim
+        (weight 1) and its latest fact-check or that fact-check's current
+        rating justification (weight 0.5); fuzzy scores are
+        the mean best SequenceMatcher ratio of each query word against the
+        claim's words.
+        """
+        terms: list[str] = re.findall(r"\w+", query.lower())
+        if not terms:
+            return []
+
+        rows = (
+            await self.db.execute(
+                select(Claim.id, Claim.content, Claim.created_at, FactCheck)
+                .outerjoin(FactCheck, FactCheck.claim_id == Claim.id)
+                .where(*filters.conditions())
+                .order_by(FactCheck.created_at)
+            )
+        ).all()
+        latest: dict[UUID, tuple[str, datetime, Optional[FactCheck]]] = {}
+        for row in rows:
+            latest[row[0]] = (row[1], row[2], row[3])
+
+        justifications: dict[UUID, list[str]] = (
+            await self._current_justifications(
+                [fact_check.id for _, _, fact_check in latest.values() if fact_check is not None]
+            )
+            if kind == MATCH_FULLTEXT
+            else {}
+        )
+
+        hits: list[SearchHit] = []
+        for claim_id, (content, created_at, fact_check) in latest.items():
+            words: list[str] = re.findall(r"\w+", content.lower())
+            score: float
+            reasoning_highlight: Optional[str] = None
+            if kind == MATCH_FULLTEXT:
+                fact_check_words: set[str] = set()
+                if fact_check is not None:
+                    fact_check_text: str = " ".join(
+                        [
+                            fact_check.verdict,
+                            fact_check.reasoning,
+                            *justifications.get(fact_check.id, []),
+                        ]
+                    )
+                    fact_check_words = set(re.findall(r"\w+", fact_check_text.lower()))
+                score = sum(
+                    (1.0 if term in words else 0.0) + (0.5 if term in fact_check_words else 0.0)
+                    for term in terms
+                ) / len(terms)
+                if fact_check is not None and set(terms) & set(
+                    re.findall(r"\w+", fact_check.reasoning.lower())
+                ):
+                    reasoning_highlight = _highlight_terms(fact_check.reasoning, terms)
+            else:
+                score = sum(
+                    max((SequenceMatcher(None, term, word).ratio() for word in words), default=0.0)
+                    for term in terms
+                ) / len(terms)
+                if score < self.fuzzy_threshold:
+                    continue
+            if score <= 0 or (after is not None and (score, claim_id) >= after):
+                continue
+            hits.append(
+                SearchHit(
+                    claim_id=claim_id,
+                    claim_content=content,
+                    claim_created_at=created_at,
+                    fact_check_id=fact_check.id if fact_check is not None else None,
+                    verdict=fact_check.verdict if fact_check is not None else None,
+                    score=score,
+                    match=kind,
+                    content_highlight=(
+                        _highlight_terms(content, terms)
+                        if kind == MATCH_FULLTEXT
+                        else _plain_excerpt(content)
+                    ),
+                    reasoning_highlight=reasoning_highlight,
+                )
+            )
+
+        hits.sort(key=lambda hit: (hit.score, hit.claim_id), reverse=True)
+        return hits[:limit]
+
+    async def _current_justifications(self, fact_check_ids: list[UUID]) -> dict[UUID, list[str]]:
+        """Justifications of the current ratings, per fact-check id"""
+        rows = await self.db.execute(
+            select(FactCheckRating.fact_check_id, FactCheckRating.justification).where(
+                FactCheckRating.fact_check_id.in_(fact_check_ids),
+                FactCheckRating.is_current.is_(True),
+            )
+        )
+        justifications: dict[UUID, list[str]] = {}
+        for fact_check_id, justification in rows.all():
+            justifications.setdefault(fact_check_id, []).append(justification)
+        return justifications
+
+
+def _highlight_terms(content: str, terms: list[str]) -> str:
+    """HTML-escape content and wrap whole-word occurrences of terms in <mark>"""
+    pattern = re.compile(r"\b(" + "|".join(re.escape(term) for term in terms) + r")\b", re.I)
+    marked: str = pattern.sub(lambda m: f"{_START_MARK}{m.group(0)}{_STOP_MARK}", content)
+    return _render_headline(marked)
@@ -10,6 +10,8 @@ import aiofiles  # type: ignore[import-untyped]
 import httpx
 from fastapi import HTTPException, status
 
+from app.core.http_clients import UPSTREAM_SNAPCHAT_API, UPSTREAM_SNAPCHAT_MEDIA, get_http_client
+
 
 class SnapchatService:
     """Service for interacting with Snapchat Spotlight API via RapidAPI"""
@@ -45,30 +47,30 @@ class SnapchatService:
         }
         params = {"spotlight_link": spotlight_link}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                data: dict[str, Any] = response.json()
-
-                if not data.get("success"):
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail="Failed to fetch Spotlight content from Snapchat API",
-                    )
+        client = get_http_client(UPSTREAM_SNAPCHAT_API)
+        try:
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            data: dict[str, Any] = response.json()
 
-                result: dict[str, Any] = data["data"]
-                return result
-            except httpx.HTTPStatusError as e:
+            if not data.get("success"):
                 raise HTTPException(
-                    status_code=e.response.status_code,
-                    detail=f"Snapchat API error: {e.response.text}",
-                ) from e
-            except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Failed to connect to Snapchat API: {str(e)}",
-                ) from e
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Failed to fetch Spotlight content from Snapchat API",
+                )
+
+            result: dict[str, Any] = data["data"]
+            return result
+        except httpx.HTTPStatusError as e:
+            raise HTTPException(
+                status_code=e.response.status_code,
+                detail=f"Snapchat API error: {e.response.text}",
+            ) from e
+        except httpx.RequestError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Failed to connect to Snapchat API: {str(e)}",
+            ) from e
 
     async def download_video(self, video_url: str, spotlight_id: str) -> str:
         """
@@ -88,36 +90,36 @@ class SnapchatService:
         filename = f"{spotlight_id}.mp4"
         file_path = self.MEDIA_DIR / filename
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                # Stream download to handle large files
-                async with client.stream("GET", video_url) as response:
-                    response.raise_for_status()
-
-                    async with aiofiles.open(file_path, "wb") as f:
-                        async for chunk in response.aiter_bytes(chunk_size=8192):
-                            await f.write(chunk)
-
-                return str(file_path)
+        client = get_http_client(UPSTREAM_SNAPCHAT_MEDIA)
+        try:
+            # Stream download to handle large files
+            async with client.stream("GET", video_url) as response:
+                response.raise_for_status()
 
-            except httpx.HTTPStatusError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_502_BAD_GATEWAY,
-                    detail=f"Failed to download video: {e.response.status_code}",
-                ) from e
-            except httpx.RequestError as e:
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail=f"Failed to connect to video server: {str(e)}",
-                ) from e
-            except Exception as e:
-                # Clean up partial file if exists
-                if file_path.exists():
-                    file_path.unlink()
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to save video: {str(e)}",
-                ) from e
+                async with aiofiles.open(file_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(chunk_size=8192):
+                        await f.write(chunk)
+
+            return str(file_path)
+
+        except httpx.HTTPStatusError as e:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=f"Failed to download video: {e.response.status_code}",
+            ) from e
+        except httpx.RequestError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=f"Failed to connect to video server: {str(e)}",
+            ) from e
+        except Exception as e:
+            # Clean up partial file if exists
+            if file_path.exists():
+                file_path.unlink()
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to save video: {str(e)}",
+            ) from e
 
     def parse_spotlight_metadata(self, data: dict[str, Any]) -> dict[str, Any]:
         """
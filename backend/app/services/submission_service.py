@@ -2,13 +2,14 @@
 Service layer for submission operations
 """
 
-from typing import List, Optional, Sequence, cast
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.claim import Claim
+from app.core.pagination import CountMode, count_total, fetch_keyset_page
+from app.models.loading import SUBMISSION_DETAIL, SUBMISSION_LIST, LoadingProfile
 from app.models.submission import Submission
 from app.models.submission_reviewer import SubmissionReviewer
 from app.models.user import User, UserRole
@@ -91,33 +92,30 @@ async def create_submission(
 
     await db.commit()
 
-    # Manually refresh with claims loaded
-    await db.refresh(submission)
-    # Load claims eagerly
-    stmt = (
-        select(Claim)
-        .join(submission_claims)
-        .where(submission_claims.c.submission_id == submission.id)
-    )
-    result = await db.execute(stmt)
-    claims_result: Sequence[Claim] = cast(Sequence[Claim], result.scalars().all())
-    submission.claims = list(claims_result)
+    # Reload with the relationships SubmissionResponse renders
+    created = await get_submission(db, submission.id, SUBMISSION_DETAIL)
+    assert created is not None
+    return created
 
-    return submission
 
-
-async def get_submission(db: AsyncSession, submission_id: UUID) -> Optional[Submission]:
+async def get_submission(
+    db: AsyncSession, submission_id: UUID, profile: LoadingProfile = ()
+) -> Optional[Submission]:
     """
     Get a submission by ID
 
     Args:
         db: Database session
         submission_id: Submission UUID
+        profile: Loading profile for the relationships the caller reads
+            (see app.models.loading); none are loaded by default
 
     Returns:
         Submission if found, None otherwise
     """
-    result = await db.execute(select(Submission).where(Submission.id == submission_id))
+    result = await db.execute(
+        select(Submission).where(Submission.id == submission_id).options(*profile)
+    )
     return result.scalar_one_or_none()
 
 
@@ -129,36 +127,42 @@ async def list_submissions(
     user_role: Optional[UserRole] = None,
     assigned_to_me: Optional[bool] = None,
     status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    count: CountMode = CountMode.EXACT,
 ) -> SubmissionListResponse:
     """
     List submissions with pagination and role-based filtering
 
+    Pages are ordered newest first on (created_at, id). Pass the previous
+    response's next_cursor to fetch the next page; page numbers still work
+    but skip rows with OFFSET, which gets slower the deeper the page.
+
     Args:
         db: Database session
-        page: Page number (1-indexed)
+        page: Page number (1-indexed), ignored when cursor is given
         page_size: Number of items per page
         user_id: Optional user ID for filtering (submitters see only their own)
         user_role: Optional user role for access control
         assigned_to_me: Optional filter for reviewers to see only assigned submissions
         status: Optional filter by submission status
+        cursor: Optional next_cursor from the previous page
+        count: How to compute the total (see app.core.pagination.CountMode)
 
     Returns:
         Paginated list of submissions
-    """
-    from sqlalchemy.orm import selectinload
-
-    from app.models.submission_reviewer import SubmissionReviewer
-
-    # Calculate offset
-    offset = (page - 1) * page_size
 
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded
+    """
     # Build base query with eager loading of reviewer assignments
-    stmt = select(Submission).options(selectinload(Submission.reviewer_assignments))
+    stmt = select(Submission).options(*SUBMISSION_LIST)
+    scope: str = "all"
 
     # Apply role-based filtering
     if user_role == UserRole.SUBMITTER and user_id:
         # Submitters only see their own submissions
         stmt = stmt.where(Submission.user_id == user_id)
+        scope = f"user:{user_id}"
     # REVIEWER, ADMIN, SUPER_ADMIN see all submissions (no filter by default)
 
     # Apply assigned_to_me filter for REVIEWERS only
@@ -166,27 +170,31 @@ async def list_submissions(
     if assigned_to_me is True and user_role == UserRole.REVIEWER and user_id:
         # Join with submission_reviewers to filter by assignment
         stmt = stmt.join(SubmissionReviewer).where(SubmissionReviewer.reviewer_id == user_id)
+        scope = f"reviewer:{user_id}"
 
     # Apply status filter if provided
     if status:
         stmt = stmt.where(Submission.status == status)
 
-    # Apply status filter if provided
-    if status:
-        stmt = stmt.where(Submission.status == status)
-
-    # Get total count with filters
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar_one()
+    total: Optional[int] = await count_total(
+        db, stmt, count, cache_key=f"submissions:{scope}:{status or '*'}"
+    )
 
-    # Get submissions with pagination
-    stmt = stmt.order_by(Submission.created_at.desc()).offset(offset).limit(page_size)
-    result = await db.execute(stmt)
-    submissions = result.scalars().all()
+    result_page = await fetch_keyset_page(
+        db,
+        stmt,
+        Submission.created_at,
+        Submission.id,
+        limit=page_size,
+        cursor=cursor,
+        offset=(page - 1) * page_size,
+    )
+    submissions: list[Submission] = result_page.items
 
     # Calculate total pages
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+    total_pages: Optional[int] = None
+    if total is not None:
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
     # Build response items with reviewer info and is_assigned_to_me flag
     items = []
@@ -212,6 +220,7 @@ async def list_submissions(
             "content": submission.content,
             "submission_type": submission.submission_type,
             "status": submission.status,
+            "ingestion_error": submission.ingestion_error,
             "created_at": submission.created_at,
             "updated_at": submission.updated_at,
             "reviewers": reviewers,
@@ -226,6 +235,7 @@ async def list_submissions(
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        next_cursor=result_page.next_cursor,
     )
 
 
@@ -6,10 +6,179 @@ preventing compromised tokens from being used even if they haven't expired.
 
 Security requirement: Tokens must be invalidated immediately to prevent
 unauthorized access after logout or token compromise.
+
+Almost no tokens are ever blacklisted, so each API process keeps a bloom
+filter of blacklisted JTIs and only asks Redis about filter positives. The
+filter is kept in sync through Redis pub/sub when a token is blacklisted and
+rebuilt periodically from a key scan. Until a process has subscribed and
+built its filter (or after the subscription fails) every lookup goes to
+Redis.
 """
 
+import asyncio
+import logging
+from contextlib import suppress
+from dataclasses import dataclass
 from typing import Any, Optional
 
+from app.core.bloom_filter import BloomFilter
+from app.core.config import settings
+from app.core.pubsub import ChannelListener
+from app.core.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+BLACKLIST_KEY_PREFIX = "blacklist:"
+BLACKLIST_CHANNEL = "token-blacklist:revoked"
+
+
+@dataclass
+class BlacklistFilterMetrics:
+    """Lookup statistics for the blacklist filter (per process)"""
+
+    lookups: int = 0
+    filtered: int = 0
+    rebuilds: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dict"""
+        return {
+            "lookups": self.lookups,
+            "filtered": self.filtered,
+            "redis_checks": self.lookups - self.filtered,
+            "rebuilds": self.rebuilds,
+        }
+
+
+class BlacklistFilter:
+    """In-process bloom filter of blacklisted JTIs
+
+    Attributes:
+        capacity: Minimum number of JTIs each filter is sized for
+        error_rate: False positive rate at capacity
+        metrics: Lookup statistics
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Initialize an empty filter that is not ready until rebuilt
+
+        Args:
+            capacity: Minimum number of JTIs each filter is sized for
+            error_rate: False positive rate at capacity
+        """
+        self.capacity: int = capacity
+        self.error_rate: float = error_rate
+        self.metrics: BlacklistFilterMetrics = BlacklistFilterMetrics()
+        self._bloom: BloomFilter = BloomFilter(capacity, error_rate)
+        self._ready: bool = False
+        # JTIs added while a rebuild is scanning, merged into the new filter
+        self._pending: Optional[set[str]] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether negative answers can be trusted"""
+        return self._ready
+
+    def add(self, jti: str) -> None:
+        """Record a blacklisted JTI"""
+        self._bloom.add(jti)
+        if self._pending is not None:
+            self._pending.add(jti)
+
+    def might_contain(self, jti: str) -> bool:
+        """Return False only if the JTI is definitely not blacklisted"""
+        self.metrics.lookups += 1
+        if self._ready and jti not in self._bloom:
+            self.metrics.filtered += 1
+            return False
+        return True
+
+    def mark_stale(self) -> None:
+        """Send every lookup to Redis until the next rebuild"""
+        self._ready = False
+
+    async def rebuild(self, redis_client: Any) -> None:
+        """Replace the filter with one built from the blacklist keys in Redis
+
+        Args:
+            redis_client: Async Redis client to scan
+        """
+        self._pending = set()
+        try:
+            jtis: list[str] = []
+            async for key in redis_client.scan_iter(match=f"{BLACKLIST_KEY_PREFIX}*", count=1000):
+                name: str = key.decode() if isinstance(key, bytes) else key
+                jtis.append(name[len(BLACKLIST_KEY_PREFIX) :])
+
+            bloom = BloomFilter(max(self.capacity, 2 * len(jtis)), self.error_rate)
+            for jti in [*jtis, *self._pending]:
+                bloom.add(jti)
+            self._bloom = bloom
+            self._ready = True
+            self.metrics.rebuilds += 1
+        finally:
+            self._pending = None
+
+
+class BlacklistFilterSync:
+    """Keeps a BlacklistFilter in sync with Redis
+
+    Subscribes to blacklist announcements from other processes, rebuilds the
+    filter after every (re)subscription and periodically, so entries whose
+    keys expired are dropped and missed announcements are picked up. Started
+    and stopped from the FastAPI lifespan.
+    """
+
+    def __init__(
+        self, blacklist_filter: BlacklistFilter, rebuild_interval: float, **listener_kwargs: Any
+    ) -> None:
+        """Initialize the sync
+
+        Args:
+            blacklist_filter: Filter to keep in sync
+            rebuild_interval: Seconds between full rebuilds
+            **listener_kwargs: Passed to ChannelListener (retry_delay, poll_timeout)
+        """
+        self.filter: BlacklistFilter = blacklist_filter
+        self.rebuild_interval: float = rebuild_interval
+        self._listener: ChannelListener = ChannelListener(
+            BLACKLIST_CHANNEL,
+            on_message=lambda data: self.filter.add(data.decode()),
+            on_subscribed=self._rebuild,
+            on_error=self.filter.mark_stale,
+            **listener_kwargs,
+        )
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def _rebuild(self) -> None:
+        """Rebuild the filter from the shared Redis client"""
+        await self.filter.rebuild(get_redis_client())
+
+    async def _rebuild_periodically(self) -> None:
+        """Rebuild the filter every rebuild_interval seconds"""
+        while True:
+            await asyncio.sleep(self.rebuild_interval)
+            try:
+                await self._rebuild()
+            except Exception as e:
+                logger.warning(f"Token blacklist filter rebuild failed: {e}")
+                self.filter.mark_stale()
+
+    def start(self) -> None:
+        """Start syncing on the running event loop"""
+        self._listener.start()
+        self._task = asyncio.create_task(self._rebuild_periodically())
+
+    async def stop(self) -> None:
+        """Stop syncing; the filter is stale from then on"""
+        self.filter.mark_stale()
+        await self._listener.stop()
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
 
 class TokenBlacklistService:
     """
@@ -17,16 +186,22 @@ class TokenBlacklistService:
 
     Uses Redis for fast lookups and automatic TTL-based expiration.
     Keys are stored with format: blacklist:{jti}
+    Lookups are answered locally when the process's BlacklistFilter rules
+    the token out.
     """
 
-    def __init__(self, redis_client: Any) -> None:
+    def __init__(
+        self, redis_client: Any, blacklist_filter: Optional[BlacklistFilter] = None
+    ) -> None:
         """
         Initialize the TokenBlacklistService.
 
         Args:
             redis_client: Async Redis client instance
+            blacklist_filter: Filter to consult first (defaults to the process filter)
         """
         self.redis: Any = redis_client
+        self.filter: BlacklistFilter = blacklist_filter or get_blacklist_filter()
 
     async def blacklist_token(self, jti: str, expires_in_seconds: int) -> None:
         """
@@ -42,11 +217,19 @@ class TokenBlacklistService:
         if not jti:
             return  # Handle empty JTI gracefully
 
-        key = f"blacklist:{jti}"
+        key = f"{BLACKLIST_KEY_PREFIX}{jti}"
         # Store the token with TTL matching its expiration time
         # Value doesn't matter (we only check existence), so use "1"
         await self.redis.setex(key, expires_in_seconds, "1")
 
+        # Update this process's filter now and announce the JTI to the others
+        self.filter.add(jti)
+        try:
+            await self.redis.publish(BLACKLIST_CHANNEL, jti)
+        except Exception as e:
+            # Other processes pick the JTI up on their next rebuild
+            logger.warning(f"Failed to announce blacklisted token: {e}")
+
     async def is_token_blacklisted(self, jti: Optional[str]) -> bool:
         """
         Check if a token is blacklisted.
@@ -57,16 +240,52 @@ class TokenBlacklistService:
         Returns:
             True if token is blacklisted, False otherwise
 
-        Performance: O(1) Redis lookup, typically < 1ms
+        Performance: local bloom filter check; O(1) Redis lookup (typically
+        < 1ms) only for filter positives or while the filter is not ready
         """
         if not jti:
             return False  # Handle None/empty JTI gracefully
 
-        key = f"blacklist:{jti}"
+        if not self.filter.might_contain(jti):
+            return False
+
+        key = f"{BLACKLIST_KEY_PREFIX}{jti}"
         exists: int = await self.redis.exists(key)
         return bool(exists == 1)
 
 
+# Singleton filter shared by every TokenBlacklistService in the process
+_blacklist_filter: Optional[BlacklistFilter] = None
+
+
+def get_blacklist_filter() -> BlacklistFilter:
+    """
+    Get or create the process-wide BlacklistFilter.
+
+    Returns:
+        BlacklistFilter instance
+    """
+    global _blacklist_filter
+    if _blacklist_filter is None:
+        _blacklist_filter = BlacklistFilter(
+            capacity=settings.TOKEN_BLACKLIST_FILTER_CAPACITY,
+            error_rate=settings.TOKEN_BLACKLIST_FILTER_ERROR_RATE,
+        )
+    return _blacklist_filter
+
+
+def create_blacklist_filter_sync() -> BlacklistFilterSync:
+    """
+    Build the sync for the process-wide BlacklistFilter.
+
+    Returns:
+        BlacklistFilterSync to start from the FastAPI lifespan
+    """
+    return BlacklistFilterSync(
+        get_blacklist_filter(), rebuild_interval=settings.TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS
+    )
+
+
 # Global service instance (will be initialized with Redis client)
 _blacklist_service: Optional[TokenBlacklistService] = None
 
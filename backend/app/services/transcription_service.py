@@ -0,0 +1,193 @@
+"""
+Spotlight transcription service
+
+Issue #175: Audio Extraction and Whisper Transcription
+Extracts audio from a stored Spotlight video, transcribes it with OpenAI
+Whisper and stores the transcription on the SpotlightContent. Used by the
+transcription and Spotlight ingestion Celery tasks.
+"""
+
+import logging
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.spotlight import SpotlightContent
+from app.services.audio_extraction_service import (
+    AudioChunk,
+    AudioExtractionError,
+    AudioExtractionResult,
+    AudioExtractionService,
+    get_audio_extraction_service,
+)
+from app.services.whisper_service import (
+    TranscriptionResult,
+    WhisperServiceError,
+    get_whisper_service,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _extract_audio(
+    audio_service: AudioExtractionService,
+    spotlight: SpotlightContent,
+) -> Optional[AudioExtractionResult]:
+    """Extract audio from the best available video source
+
+    Prefers the local video file, then streams the remote video into FFmpeg
+    (or, with TRANSCRIPTION_STREAM_AUDIO disabled, downloads it with yt-dlp).
+
+    Args:
+        audio_service: Audio extraction service
+        spotlight: SpotlightContent to extract audio for
+
+    Returns:
+        AudioExtractionResult, or None if the content has no video source
+
+    Raises:
+        AudioExtractionError: If extraction fails
+    """
+    if spotlight.video_local_path:
+        return await audio_service.extract_audio_from_video(
+            video_path=spotlight.video_local_path,
+            spotlight_id=spotlight.spotlight_id,
+        )
+    if spotlight.video_url and settings.TRANSCRIPTION_STREAM_AUDIO:
+        return await audio_service.extract_audio_from_stream(
+            video_url=spotlight.video_url,
+            spotlight_id=spotlight.spotlight_id,
+        )
+    if spotlight.video_url:
+        return await audio_service.extract_audio_from_url(
+            spotlight_url=spotlight.video_url,
+            spotlight_id=spotlight.spotlight_id,
+        )
+    return None
+
+
+async def transcribe_spotlight_content(
+    db: AsyncSession,
+    spotlight_content_id: str,
+) -> dict[str, Any]:
+    """Transcribe a Spotlight video and store the transcription
+
+    This function:
+    1. Retrieves the SpotlightContent from database
+    2. Extracts audio from the video file (or downloads from URL)
+    3. Splits long audio into chunks at silence boundaries
+    4. Transcribes the chunks in parallel using OpenAI Whisper
+    5. Updates the SpotlightContent with transcription data
+
+    Args:
+        db: Database session
+        spotlight_content_id: UUID of the SpotlightContent to transcribe
+
+    Returns:
+        Dict containing transcription results or error information
+    """
+    try:
+        # Fetch SpotlightContent
+        stmt = select(SpotlightContent).where(SpotlightContent.id == UUID(spotlight_content_id))
+        result = await db.execute(stmt)
+        spotlight: Optional[SpotlightContent] = result.scalar_one_or_none()
+
+        if not spotlight:
+            logger.error(f"SpotlightContent not found: {spotlight_content_id}")
+            return {
+                "success": False,
+                "spotlight_content_id": spotlight_content_id,
+                "error": "SpotlightContent not found",
+            }
+
+        # Get services
+        audio_service = get_audio_extraction_service()
+        whisper_service = get_whisper_service()
+
+        # Determine audio source - prefer local file, fallback to URL
+        audio_path: Optional[str] = None
+
+        try:
+            extraction_result: Optional[AudioExtractionResult] = await _extract_audio(
+                audio_service, spotlight
+            )
+            if extraction_result is None:
+                return {
+                    "success": False,
+                    "spotlight_content_id": spotlight_content_id,
+                    "error": "No video source available for transcription",
+                }
+            audio_path = extraction_result.audio_path
+
+        except AudioExtractionError as e:
+            logger.error(f"Audio extraction failed for {spotlight_content_id}: {e}")
+            return {
+                "success": False,
+                "spotlight_content_id": spotlight_content_id,
+                "error": f"Audio extraction failed: {str(e)}",
+            }
+
+        # Transcribe the audio, in parallel chunks for long recordings
+        chunks: list[AudioChunk] = []
+        try:
+            chunks = await audio_service.split_audio(audio_path)
+            transcription: TranscriptionResult = await whisper_service.transcribe_chunks(chunks)
+        except (AudioExtractionError, WhisperServiceError) as e:
+            logger.error(f"Transcription failed for {spotlight_content_id}: {e}")
+            # Cleanup audio files
+            await audio_service.cleanup_chunks(chunks, keep=audio_path)
+            if audio_path:
+                await audio_service.cleanup_audio_file(audio_path)
+            error_prefix: str = (
+                "OpenAI API error"
+                if isinstance(e, WhisperServiceError)
+                else "Audio extraction failed"
+            )
+            return {
+                "success": False,
+                "spotlight_content_id": spotlight_content_id,
+                "error": f"{error_prefix}: {str(e)}",
+            }
+
+        # Update SpotlightContent with transcription data
+        spotlight.transcription = transcription.text
+        spotlight.transcription_language = transcription.language
+        spotlight.transcription_confidence = transcription.confidence
+
+        await db.commit()
+        logger.info(
+            f"Successfully transcribed spotlight {spotlight_content_id}: "
+            f"language={transcription.language}, "
+            f"confidence={transcription.confidence}"
+        )
+
+        # Cleanup audio files after successful transcription
+        await audio_service.cleanup_chunks(chunks, keep=audio_path)
+        if audio_path:
+            await audio_service.cleanup_audio_file(audio_path)
+
+        # Handle empty transcription (no speech detected)
+        message: Optional[str] = None
+        if not transcription.text.strip():
+            message = "No speech detected in audio"
+
+        return {
+            "success": True,
+            "spotlight_content_id": spotlight_content_id,
+            "submission_id": str(spotlight.submission_id),
+            "transcription": transcription.text,
+            "language": transcription.language,
+            "confidence": transcription.confidence,
+            "message": message,
+        }
+
+    except Exception as e:
+        logger.exception(f"Unexpected error transcribing {spotlight_content_id}: {e}")
+        return {
+            "success": False,
+            "spotlight_content_id": spotlight_content_id,
+            "error": f"Unexpected error: {str(e)}",
+        }
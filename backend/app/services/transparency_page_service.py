@@ -10,9 +10,17 @@ Implements:
 - Automatic versioning on updates
 - Version history and diff generation
 - Annual review tracking
+
+Diffs are served without running difflib per request: the diff between
+consecutive versions is computed once when the next version is saved and
+stored on the version row, and any other range is computed once and kept in
+an in-process LRU. Version contents never change, so cached diffs never go
+stale.
 """
 
 import difflib
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 from uuid import UUID
@@ -20,8 +28,13 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.response_cache import TRANSPARENCY_PAGES, invalidate_responses
 from app.models.transparency_page import TransparencyPage, TransparencyPageVersion
 
+# (page id, from version, to version, language) -> {"title": {...}, "content": {...}}
+DiffKey = tuple[UUID, int, int, Optional[str]]
+
 
 async def get_page_by_slug(
     db: AsyncSession,
@@ -169,6 +182,15 @@ async def update_page(
     if content is not None:
         page.content = content
 
+    # Diff once here so the public diff endpoint never has to
+    version_record.diff_to_next = compute_diff(
+        version_record.title,
+        version_record.content,
+        page.title,
+        page.content,
+        from_version=page.version,
+        to_version=page.version + 1,
+    )
     page.version += 1
 
     # Update review dates (marks as reviewed, sets next annual review)
@@ -178,6 +200,7 @@ async def update_page(
 
     await db.commit()
     await db.refresh(page)
+    await invalidate_responses(TRANSPARENCY_PAGES)
 
     return page
 
@@ -214,6 +237,195 @@ async def get_version_history(
     return list(result.scalars().all())
 
 
+class DiffCache:
+    """In-process LRU of computed diffs
+
+    Attributes:
+        max_entries: Diffs kept before the least recently used is evicted
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[DiffKey, dict[str, Any]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: DiffKey) -> Optional[dict[str, Any]]:
+        """Return a cached diff and mark it recently used"""
+        with self._lock:
+            diff: Optional[dict[str, Any]] = self._entries.get(key)
+            if diff is not None:
+                self._entries.move_to_end(key)
+            return diff
+
+    def set(self, key: DiffKey, diff: dict[str, Any]) -> None:
+        """Cache a diff"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = diff
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Singleton instance for use across the application
+_diff_cache: Optional[DiffCache] = None
+
+
+def get_diff_cache() -> DiffCache:
+    """Get or create the DiffCache singleton
+
+    Returns:
+        DiffCache instance
+    """
+    global _diff_cache
+    if _diff_cache is None:
+        _diff_cache = DiffCache(max_entries=settings.TRANSPARENCY_DIFF_CACHE_MAX_ENTRIES)
+    return _diff_cache
+
+
+def _unified_range(start: int, length: int) -> str:
+    """Hunk range in unified diff notation (as difflib writes it)"""
+    if length == 1:
+        return str(start)
+    return f"{start if length else start - 1},{length}"
+
+
+def _text_diff(old: str, new: str, from_version: int, to_version: int) -> str:
+    """
+    Unified diff of two texts.
+
+    difflib's matching is quadratic in the worst case, so texts longer than
+    TRANSPARENCY_DIFF_MAX_LINES are shown as a single whole-text replacement.
+    """
+    old_lines: list[str] = old.splitlines(keepends=True)
+    new_lines: list[str] = new.splitlines(keepends=True)
+
+    if max(len(old_lines), len(new_lines)) <= settings.TRANSPARENCY_DIFF_MAX_LINES:
+        return "".join(
+            difflib.unified_diff(
+                old_lines,
+                new_lines,
+                fromfile=f"v{from_version}",
+                tofile=f"v{to_version}",
+                lineterm="",
+            )
+        )
+
+    if old == new:
+        return ""
+    return "".join(
+        [
+            f"--- v{from_version}",
+            f"+++ v{to_version}",
+            f"@@ -{_unified_range(1, len(old_lines))} +{_unified_range(1, len(new_lines))} @@",
+            *(f"-{line}" for line in old_lines),
+            *(f"+{line}" for line in new_lines),
+        ]
+    )
+
+
+def compute_diff(
+    from_title: dict[str, Any],
+    from_content: dict[str, Any],
+    to_title: dict[str, Any],
+    to_content: dict[str, Any],
+    from_version: int,
+    to_version: int,
+    language: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Diff the title and content of two versions of a page.
+
+    Args:
+        from_title: Multilingual title of the starting version
+        from_content: Multilingual content of the starting version
+        to_title: Multilingual title of the ending version
+        to_content: Multilingual content of the ending version
+        from_version: Starting version number (for the diff headers)
+        to_version: Ending version number (for the diff headers)
+        language: Only diff this language (default: every content language)
+
+    Returns:
+        {"title": {lang: unified diff}, "content": {lang: unified diff}}
+    """
+    languages = [language] if language else sorted(set(from_content) | set(to_content))
+
+    diff: dict[str, Any] = {"title": {}, "content": {}}
+    for lang in languages:
+        diff["title"][lang] = _text_diff(
+            str(from_title.get(lang, "")), str(to_title.get(lang, "")), from_version, to_version
+        )
+        diff["content"][lang] = _text_diff(
+            str(from_content.get(lang, "")),
+            str(to_content.get(lang, "")),
+            from_version,
+            to_version,
+        )
+    return diff
+
+
+def _select_language(diff: dict[str, Any], language: Optional[str]) -> dict[str, Any]:
+    """Narrow an all-language diff to one language"""
+    if language is None:
+        return diff
+    return {part: {language: diff[part].get(language, "")} for part in ("title", "content")}
+
+
+async def _load_diff(
+    db: AsyncSession,
+    page: TransparencyPage,
+    from_version: int,
+    to_version: int,
+    language: Optional[str],
+) -> Optional[dict[str, Any]]:
+    """Stored diff for consecutive versions, else a diff of both versions' snapshots"""
+    if to_version == from_version + 1:
+        stored = await db.execute(
+            select(TransparencyPageVersion.diff_to_next).where(
+                TransparencyPageVersion.page_id == page.id,
+                TransparencyPageVersion.version == from_version,
+            )
+        )
+        diff_to_next: Optional[dict[str, Any]] = stored.scalar_one_or_none()
+        if diff_to_next is not None:
+            return _select_language(diff_to_next, language)
+
+    # Snapshots of both versions: the page itself is the current version
+    snapshots: dict[int, tuple[dict[str, Any], dict[str, Any]]] = {
+        page.version: (page.title, page.content)
+    }
+    historical: set[int] = {from_version, to_version} - {page.version}
+    if historical:
+        result = await db.execute(
+            select(
+                TransparencyPageVersion.version,
+                TransparencyPageVersion.title,
+                TransparencyPageVersion.content,
+            ).where(
+                TransparencyPageVersion.page_id == page.id,
+                TransparencyPageVersion.version.in_(historical),
+            )
+        )
+        snapshots.update({version: (title, content) for version, title, content in result.all()})
+
+    if from_version not in snapshots or to_version not in snapshots:
+        return None
+    from_title, from_content = snapshots[from_version]
+    to_title, to_content = snapshots[to_version]
+    return compute_diff(
+        from_title, from_content, to_title, to_content, from_version, to_version, language
+    )
+
+
 async def generate_diff(
     db: AsyncSession,
     slug: str,
@@ -224,7 +436,9 @@ async def generate_diff(
     """
     Generate a diff between two versions of a page.
 
-    Uses Python's difflib to compute unified diff of content.
+    Consecutive versions are served from the diff stored when the later one
+    was saved; other ranges are computed from both snapshots (one query) and
+    cached in process.
 
     Args:
         db: Database session
@@ -255,81 +469,21 @@ async def generate_diff(
     if page is None:
         return None
 
-    # Get from_version content
-    from_content: Optional[dict[str, Any]] = None
-    from_title: Optional[dict[str, Any]] = None
-
-    if from_version == page.version:
-        # Current version
-        from_content = page.content
-        from_title = page.title
-    else:
-        # Historical version
-        from_ver = await get_page_version(db, slug, from_version)
-        if from_ver is None:
-            return None
-        from_content = from_ver.content
-        from_title = from_ver.title
-
-    # Get to_version content
-    to_content: Optional[dict[str, Any]] = None
-    to_title: Optional[dict[str, Any]] = None
-
-    if to_version == page.version:
-        # Current version
-        to_content = page.content
-        to_title = page.title
-    else:
-        # Historical version
-        to_ver = await get_page_version(db, slug, to_version)
-        if to_ver is None:
+    # Keyed by page id: a page re-created under the same slug restarts at version 1
+    cache: DiffCache = get_diff_cache()
+    key: DiffKey = (page.id, from_version, to_version, language)
+    diff: Optional[dict[str, Any]] = cache.get(key)
+    if diff is None:
+        diff = await _load_diff(db, page, from_version, to_version, language)
+        if diff is None:
             return None
-        to_content = to_ver.content
-        to_title = to_ver.title
-
-    # Generate diffs
-    diff_result: dict[str, Any] = {
-        "title": {},
-        "content": {},
-    }
-
-    # Determine which languages to diff
-    languages = [language] if language else list(set(from_content.keys()) | set(to_content.keys()))
-
-    for lang in languages:
-        # Title diff
-        from_title_text = str(from_title.get(lang, ""))
-        to_title_text = str(to_title.get(lang, ""))
-        title_diff = list(
-            difflib.unified_diff(
-                from_title_text.splitlines(keepends=True),
-                to_title_text.splitlines(keepends=True),
-                fromfile=f"v{from_version}",
-                tofile=f"v{to_version}",
-                lineterm="",
-            )
-        )
-        diff_result["title"][lang] = "".join(title_diff)
-
-        # Content diff
-        from_content_text = str(from_content.get(lang, ""))
-        to_content_text = str(to_content.get(lang, ""))
-        content_diff = list(
-            difflib.unified_diff(
-                from_content_text.splitlines(keepends=True),
-                to_content_text.splitlines(keepends=True),
-                fromfile=f"v{from_version}",
-                tofile=f"v{to_version}",
-                lineterm="",
-            )
-        )
-        diff_result["content"][lang] = "".join(content_diff)
+        cache.set(key, diff)
 
     return {
         "slug": slug,
         "from_version": from_version,
         "to_version": to_version,
-        "diff": diff_result,
+        "diff": {part: dict(diffs) for part, diffs in diff.items()},
         "language": language,
     }
 
@@ -398,6 +552,7 @@ async def delete_page(db: AsyncSession, slug: str) -> bool:
 
     await db.delete(page)
     await db.commit()
+    await invalidate_responses(TRANSPARENCY_PAGES)
     return True
 
 
@@ -22,6 +22,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.response_cache import TRANSPARENCY_REPORTS, invalidate_responses
 from app.models.transparency_report import TransparencyReport
 from app.models.user import User, UserRole
 from app.services.analytics_service import AnalyticsService
@@ -128,6 +129,8 @@ class TransparencyReportService:
             existing_report.generated_at = now
             await self.db.commit()
             await self.db.refresh(existing_report)
+            if existing_report.is_published:
+                await invalidate_responses(TRANSPARENCY_REPORTS)
             logger.info(f"Regenerated report for {year}-{month:02d}")
             return existing_report
 
@@ -160,17 +163,14 @@ class TransparencyReportService:
         Returns:
             Dictionary containing all report metrics
         """
-        # Get all analytics data
-        monthly_fact_checks: dict[str, Any] = (
-            await self.analytics_service.get_monthly_fact_check_counts(months=12)
-        )
-        time_to_publication: dict[str, Any] = (
-            await self.analytics_service.get_time_to_publication_metrics()
-        )
-        rating_distribution: dict[str, Any] = await self.analytics_service.get_rating_distribution()
-        source_quality: dict[str, Any] = await self.analytics_service.get_source_quality_metrics()
-        correction_rate: dict[str, Any] = await self.analytics_service.get_correction_rate_metrics()
-        efcsn_compliance: dict[str, Any] = await self.analytics_service.get_efcsn_compliance()
+        # Get all analytics data in one concurrent pass
+        dashboard: dict[str, Any] = await self.analytics_service.get_dashboard()
+        monthly_fact_checks: dict[str, Any] = dashboard["monthly_fact_checks"]
+        time_to_publication: dict[str, Any] = dashboard["time_to_publication"]
+        rating_distribution: dict[str, Any] = dashboard["rating_distribution"]
+        source_quality: dict[str, Any] = dashboard["source_quality"]
+        correction_rate: dict[str, Any] = dashboard["correction_rate"]
+        efcsn_compliance: dict[str, Any] = dashboard["efcsn_compliance"]
 
         # Convert datetime objects to ISO strings for JSON serialization
         if efcsn_compliance.get("last_checked"):
@@ -327,6 +327,7 @@ class TransparencyReportService:
 
         await self.db.commit()
         await self.db.refresh(report)
+        await invalidate_responses(TRANSPARENCY_REPORTS)
 
         logger.info(f"Published report {report_id}")
         return report
@@ -353,6 +354,7 @@ class TransparencyReportService:
 
         await self.db.commit()
         await self.db.refresh(report)
+        await invalidate_responses(TRANSPARENCY_REPORTS)
 
         logger.info(f"Unpublished report {report_id}")
         return report
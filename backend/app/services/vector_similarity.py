@@ -0,0 +1,208 @@
+"""
+Vectorized similarity kernels for claim embeddings
+
+Issue #176: LLM-based Claim Extraction - Deduplication using vector similarity
+
+NumPy float32 implementations of the similarity operations used for claim
+deduplication. They replace per-element Python loops over 1536 floats with
+single BLAS calls:
+
+- normalize_many: L2-normalize a batch of vectors
+- cosine_one_to_many / cosine_many_to_many: cosine similarity matrices
+- top_k: best-k selection via argpartition (O(n) instead of a full sort)
+- InMemoryVectorIndex: exact matrix search, used by ClaimSimilarityService
+  when pgvector is not available (e.g. the SQLite test database)
+"""
+
+from collections.abc import Sequence
+from typing import Generic, TypeVar, Union
+
+import numpy as np
+import numpy.typing as npt
+
+FloatMatrix = npt.NDArray[np.float32]
+VectorInput = Union[Sequence[Sequence[float]], Sequence[float], FloatMatrix]
+
+T = TypeVar("T")
+
+
+def as_matrix(vectors: VectorInput) -> FloatMatrix:
+    """Convert vectors to a 2-D float32 array
+
+    Args:
+        vectors: A single vector or a sequence of equal-length vectors
+
+    Returns:
+        Array of shape (n, dimensions)
+    """
+    matrix: FloatMatrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    return matrix
+
+
+def normalize_many(vectors: VectorInput) -> FloatMatrix:
+    """L2-normalize each row; zero vectors are left as zeros
+
+    Args:
+        vectors: Vectors to normalize
+
+    Returns:
+        Array of unit-length rows
+    """
+    matrix: FloatMatrix = as_matrix(vectors)
+    norms: FloatMatrix = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def cosine_one_to_many(
+    query: Sequence[float] | FloatMatrix,
+    vectors: Sequence[Sequence[float]] | FloatMatrix,
+) -> FloatMatrix:
+    """Cosine similarity of one query vector against many vectors
+
+    Args:
+        query: Query vector
+        vectors: Candidate vectors, shape (n, dimensions)
+
+    Returns:
+        Array of n similarity scores
+    """
+    result: FloatMatrix = cosine_many_to_many(query, vectors)[0]
+    return result
+
+
+def cosine_many_to_many(
+    queries: VectorInput,
+    vectors: Sequence[Sequence[float]] | FloatMatrix,
+) -> FloatMatrix:
+    """Cosine similarity of every query against every vector
+
+    Args:
+        queries: Query vectors, shape (m, dimensions)
+        vectors: Candidate vectors, shape (n, dimensions)
+
+    Returns:
+        Array of shape (m, n) with similarity scores
+    """
+    result: FloatMatrix = normalize_many(queries) @ normalize_many(vectors).T
+    return result
+
+
+def top_k(scores: FloatMatrix, k: int) -> tuple[npt.NDArray[np.intp], FloatMatrix]:
+    """Select the k highest scores in descending order
+
+    Uses argpartition so only the k winners are sorted.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of results
+
+    Returns:
+        Tuple of (indices, scores) for the best k entries, best first
+    """
+    n: int = scores.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+    if k < n:
+        candidates: npt.NDArray[np.intp] = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(n)
+
+    order: npt.NDArray[np.intp] = candidates[np.argsort(-scores[candidates], kind="stable")]
+    return order, scores[order]
+
+
+class InMemoryVectorIndex(Generic[T]):
+    """Exact cosine search over an in-memory float32 matrix
+
+    Vectors are normalized once on construction, so each search is a single
+    matrix-vector product followed by argpartition.
+
+    Attributes:
+        items: Payload returned for each indexed vector
+
+    Example:
+        >>> index = InMemoryVectorIndex(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        >>> index.search([1.0, 0.1], threshold=0.5, limit=5)
+        [('a', 0.995...)]
+    """
+
+    def __init__(
+        self,
+        items: Sequence[T],
+        vectors: Sequence[Sequence[float]] | FloatMatrix,
+    ) -> None:
+        """Initialize the index
+
+        Args:
+            items: Payload per vector (e.g. claim id and content)
+            vectors: Vectors to index, same order as items
+
+        Raises:
+            ValueError: If items and vectors have different lengths
+        """
+        if len(items) != len(vectors):
+            raise ValueError("items and vectors must have the same length")
+
+        self.items: list[T] = list(items)
+        self._matrix: FloatMatrix = (
+            normalize_many(vectors) if len(self.items) else np.empty((0, 0), dtype=np.float32)
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def search(
+        self,
+        query: Sequence[float],
+        threshold: float,
+        limit: int,
+    ) -> list[tuple[T, float]]:
+        """Find the most similar items above a threshold
+
+        Args:
+            query: Query vector
+            threshold: Minimum cosine similarity
+            limit: Maximum number of results
+
+        Returns:
+            List of (item, similarity) sorted by similarity (highest first)
+        """
+        return self.search_many([query], threshold, limit)[0]
+
+    def search_many(
+        self,
+        queries: Sequence[Sequence[float]],
+        threshold: float,
+        limit: int,
+    ) -> list[list[tuple[T, float]]]:
+        """Find the most similar items for several queries at once
+
+        Args:
+            queries: Query vectors
+            threshold: Minimum cosine similarity
+            limit: Maximum number of results per query
+
+        Returns:
+            One result list per query, each sorted by similarity (highest first)
+        """
+        if not len(self.items) or not len(queries):
+            return [[] for _ in queries]
+
+        scores: FloatMatrix = normalize_many(queries) @ self._matrix.T
+
+        results: list[list[tuple[T, float]]] = []
+        for row in scores:
+            indices, best = top_k(row, limit)
+            results.append(
+                [
+                    (self.items[int(i)], float(score))
+                    for i, score in zip(indices, best)
+                    if score >= threshold
+                ]
+            )
+        return results
@@ -8,14 +8,20 @@ Supports Dutch (nl) and English (en) language transcription as required
 by EFCSN compliance (ADR 0005).
 """
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import weakref
+from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from openai import OpenAI
+import httpx
+from openai import APITimeoutError, AsyncOpenAI
 
 from app.core.config import settings
+from app.core.http_clients import UPSTREAM_OPENAI, get_http_client
+from app.services.audio_extraction_service import AudioChunk
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +32,15 @@ class WhisperServiceError(Exception):
     pass
 
 
+@dataclass
+class TranscriptionSegment:
+    """A timed piece of a transcription"""
+
+    start: float
+    end: float
+    text: str
+
+
 @dataclass
 class TranscriptionResult:
     """Result of audio transcription"""
@@ -33,6 +48,62 @@ class TranscriptionResult:
     text: str
     language: str
     confidence: Optional[float]
+    segments: list[TranscriptionSegment] = field(default_factory=list)
+
+
+def stitch_transcriptions(
+    results: list[TranscriptionResult],
+    chunks: list[AudioChunk],
+) -> TranscriptionResult:
+    """Combine per-chunk transcriptions into one result
+
+    Segment timestamps are shifted by each chunk's start offset. The language
+    is the one covering the most audio; confidence is the duration-weighted
+    average over chunks that report one.
+
+    Args:
+        results: Transcriptions, one per chunk
+        chunks: The chunks that were transcribed, same order as results
+
+    Returns:
+        Single TranscriptionResult for the whole audio
+    """
+    if len(results) == 1:
+        return results[0]
+
+    segments: list[TranscriptionSegment] = []
+    language_seconds: dict[str, float] = defaultdict(float)
+    weighted_confidence: float = 0.0
+    confidence_seconds: float = 0.0
+
+    for result, chunk in zip(results, chunks):
+        weight: float = max(chunk.duration_seconds, 0.0)
+        segments.extend(
+            TranscriptionSegment(
+                start=segment.start + chunk.start_seconds,
+                end=segment.end + chunk.start_seconds,
+                text=segment.text,
+            )
+            for segment in result.segments
+        )
+        if result.text.strip():
+            language_seconds[result.language] += weight
+        if result.confidence is not None:
+            weighted_confidence += result.confidence * weight
+            confidence_seconds += weight
+
+    return TranscriptionResult(
+        text=" ".join(result.text.strip() for result in results if result.text.strip()),
+        language=(
+            max(language_seconds, key=lambda code: language_seconds[code])
+            if language_seconds
+            else results[0].language
+        ),
+        confidence=(
+            round(weighted_confidence / confidence_seconds, 4) if confidence_seconds else None
+        ),
+        segments=segments,
+    )
 
 
 class WhisperService:
@@ -42,9 +113,17 @@ class WhisperService:
     videos. It uses the OpenAI Whisper API to convert audio to text, supporting
     multiple languages including Dutch (nl) and English (en).
 
+    API calls use the async OpenAI client, so a transcription never blocks
+    the event loop. The number of in-flight API calls per event loop is
+    capped by WHISPER_MAX_CONCURRENCY; further callers wait for a slot.
+    Ingestion and transcription tasks share one loop per worker process
+    (app.core.task_loop), so for them the cap applies per process.
+
     Attributes:
         SUPPORTED_LANGUAGES: List of supported language codes
         model: The Whisper model to use for transcription
+        timeout: Per-request timeout in seconds
+        max_concurrency: Maximum concurrent API calls per event loop
 
     Example:
         >>> service = WhisperService()
@@ -68,15 +147,44 @@ class WhisperService:
             )
         self.api_key: str = settings.OPENAI_API_KEY
         self.model: str = settings.OPENAI_WHISPER_MODEL
-        self._client: Optional[OpenAI] = None
+        self.timeout: float = settings.WHISPER_REQUEST_TIMEOUT_SECONDS
+        self.max_concurrency: int = settings.WHISPER_MAX_CONCURRENCY
+        self._client: Optional[AsyncOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._semaphores: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]"
+        ) = weakref.WeakKeyDictionary()
 
     @property
-    def client(self) -> OpenAI:
-        """Lazily initialize and return OpenAI client"""
-        if self._client is None:
-            self._client = OpenAI(api_key=self.api_key)
+    def client(self) -> AsyncOpenAI:
+        """Return an AsyncOpenAI client on the shared pooled OpenAI connections
+
+        The client is rebuilt when the running event loop has a different
+        pooled HTTP client (each Celery task runs in its own loop).
+        """
+        http_client: httpx.AsyncClient = get_http_client(UPSTREAM_OPENAI)
+        if self._client is None or self._http_client is not http_client:
+            self._client = AsyncOpenAI(api_key=self.api_key, http_client=http_client)
+            self._http_client = http_client
         return self._client
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency limiter for the running event loop
+
+        A semaphore cannot be shared between loops, so one is kept per loop.
+        Celery tasks that transcribe run on the worker's shared task loop, so
+        they all wait on the same one.
+
+        Returns:
+            Semaphore bounding concurrent Whisper API calls
+        """
+        loop = asyncio.get_running_loop()
+        semaphore: Optional[asyncio.Semaphore] = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+            self._semaphores[loop] = semaphore
+        return semaphore
+
     async def transcribe_audio(
         self,
         audio_file_path: str,
@@ -102,7 +210,10 @@ class WhisperService:
             raise WhisperServiceError(f"Audio file not found: {audio_file_path}")
 
         try:
-            result: TranscriptionResult = await self._call_whisper_api(audio_path, language_hint)
+            async with self._get_semaphore():
+                result: TranscriptionResult = await self._call_whisper_api(
+                    audio_path, language_hint
+                )
             logger.info(
                 f"Successfully transcribed audio: {audio_file_path}, "
                 f"language: {result.language}, confidence: {result.confidence}"
@@ -110,10 +221,45 @@ class WhisperService:
             return result
         except WhisperServiceError:
             raise
+        except APITimeoutError as e:
+            logger.error(f"Transcription timed out after {self.timeout}s for {audio_file_path}")
+            raise WhisperServiceError(f"Transcription timed out after {self.timeout}s") from e
         except Exception as e:
             logger.error(f"Transcription failed for {audio_file_path}: {e}")
             raise WhisperServiceError(f"Transcription failed: {str(e)}") from e
 
+    async def transcribe_chunks(
+        self,
+        chunks: list[AudioChunk],
+        language_hint: Optional[str] = None,
+    ) -> TranscriptionResult:
+        """Transcribe audio chunks concurrently and stitch the results
+
+        Chunks are uploaded in parallel, bounded by WHISPER_MAX_CONCURRENCY,
+        so wall-clock time for long audio scales with the chunk length
+        rather than the total length.
+
+        Args:
+            chunks: Chunks from AudioExtractionService.split_audio
+            language_hint: Optional language code hint for every chunk
+
+        Returns:
+            TranscriptionResult for the whole audio with segment timestamps
+            on the source timeline
+
+        Raises:
+            WhisperServiceError: If any chunk fails to transcribe
+        """
+        if not chunks:
+            raise WhisperServiceError("No audio chunks to transcribe")
+
+        results: list[TranscriptionResult] = list(
+            await asyncio.gather(
+                *(self.transcribe_audio(chunk.audio_path, language_hint) for chunk in chunks)
+            )
+        )
+        return stitch_transcriptions(results, chunks)
+
     async def _call_whisper_api(
         self,
         audio_path: Path,
@@ -128,21 +274,25 @@ class WhisperService:
         Returns:
             TranscriptionResult with transcription data
         """
-        with open(audio_path, "rb") as audio_file:
-            # Call Whisper API with explicit parameters
-            if language_hint and language_hint in self.SUPPORTED_LANGUAGES:
-                response = self.client.audio.transcriptions.create(
-                    file=audio_file,
-                    model=self.model,
-                    response_format="verbose_json",
-                    language=language_hint,
-                )
-            else:
-                response = self.client.audio.transcriptions.create(
-                    file=audio_file,
-                    model=self.model,
-                    response_format="verbose_json",
-                )
+        # Read the file in a worker thread so disk I/O does not block the loop
+        audio_bytes: bytes = await asyncio.to_thread(audio_path.read_bytes)
+
+        # Call Whisper API with explicit parameters
+        if language_hint and language_hint in self.SUPPORTED_LANGUAGES:
+            response = await self.client.audio.transcriptions.create(
+                file=(audio_path.name, audio_bytes),
+                model=self.model,
+                response_format="verbose_json",
+                language=language_hint,
+                timeout=self.timeout,
+            )
+        else:
+            response = await self.client.audio.transcriptions.create(
+                file=(audio_path.name, audio_bytes),
+                model=self.model,
+                response_format="verbose_json",
+                timeout=self.timeout,
+            )
 
         # Extract results
         text: str = response.text if hasattr(response, "text") else ""
@@ -157,8 +307,29 @@ class WhisperService:
             text=text,
             language=language,
             confidence=confidence,
+            segments=self._extract_segments(response),
         )
 
+    def _extract_segments(self, response: object) -> list[TranscriptionSegment]:
+        """Extract timed segments from a verbose_json response
+
+        Args:
+            response: Whisper API response object
+
+        Returns:
+            List of segments, empty if the response has none
+        """
+        segments = getattr(response, "segments", None) or []
+        return [
+            TranscriptionSegment(
+                start=float(segment.start),
+                end=float(segment.end),
+                text=str(segment.text).strip(),
+            )
+            for segment in segments
+            if hasattr(segment, "start") and hasattr(segment, "end") and hasattr(segment, "text")
+        ]
+
     def _calculate_confidence(self, response: object) -> Optional[float]:
         """Calculate average confidence from transcription segments
 
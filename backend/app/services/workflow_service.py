@@ -12,17 +12,19 @@ including:
 """
 
 import logging
+from datetime import datetime, timezone
 from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.fact_check import FactCheck
+from app.models.loading import SUBMISSION_CLAIMS, SUBMISSION_WORKFLOW
 from app.models.submission import Submission
 from app.models.user import User, UserRole
 from app.models.workflow_transition import WorkflowState, WorkflowTransition
+from app.services.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -264,6 +266,9 @@ HEALTH_KEYWORDS: set[str] = {
     "mortality",
 }
 
+# Both keyword sets in one automaton, so the check is a single pass over the content
+_PEER_REVIEW_KEYWORD_MATCHER = KeywordMatcher(sorted(POLITICAL_KEYWORDS | HEALTH_KEYWORDS))
+
 
 class WorkflowService:
     """
@@ -317,7 +322,9 @@ class WorkflowService:
 
     async def _get_submission(self, submission_id: UUID) -> Submission:
         """Get submission by ID."""
-        result = await self.db.execute(select(Submission).where(Submission.id == submission_id))
+        result = await self.db.execute(
+            select(Submission).where(Submission.id == submission_id).options(*SUBMISSION_WORKFLOW)
+        )
         submission = result.scalar_one_or_none()
         if submission is None:
             raise SubmissionNotFoundError(f"Submission {submission_id} not found")
@@ -364,17 +371,9 @@ class WorkflowService:
         Returns:
             True if peer review is required, False otherwise
         """
-        content_lower = submission.content.lower()
-
-        # Check for political keywords
-        for keyword in POLITICAL_KEYWORDS:
-            if keyword in content_lower:
-                return True
-
-        # Check for health keywords
-        for keyword in HEALTH_KEYWORDS:
-            if keyword in content_lower:
-                return True
+        # Check for political and health keywords (at word starts, ignoring case and diacritics)
+        if next(_PEER_REVIEW_KEYWORD_MATCHER.find(submission.content), None) is not None:
+            return True
 
         # Check if already flagged
         if submission.requires_peer_review:
@@ -403,9 +402,7 @@ class WorkflowService:
         """
         # Fetch submission with claims eagerly loaded
         result = await self.db.execute(
-            select(Submission)
-            .where(Submission.id == submission_id)
-            .options(selectinload(Submission.claims))
+            select(Submission).where(Submission.id == submission_id).options(*SUBMISSION_CLAIMS)
         )
         submission = result.scalar_one_or_none()
 
@@ -511,6 +508,10 @@ class WorkflowService:
         # Update submission state
         submission.workflow_state = to_state
 
+        # Materialize time-to-publication on the first publication
+        if to_state == WorkflowState.PUBLISHED and submission.published_at is None:
+            await self._record_publication(submission)
+
         # Check if peer review should be auto-triggered
         if to_state == WorkflowState.ADMIN_REVIEW:
             if await self.check_peer_review_required(submission):
@@ -550,6 +551,32 @@ class WorkflowService:
 
         return submission
 
+    async def _record_publication(self, submission: Submission) -> None:
+        """
+        Store when a submission was first published and how long it took.
+
+        The interval starts at the submission's SUBMITTED transition, or at
+        its creation for submissions without one.
+
+        Args:
+            submission: Submission being published
+        """
+        result = await self.db.execute(
+            select(func.min(WorkflowTransition.created_at)).where(
+                WorkflowTransition.submission_id == submission.id,
+                WorkflowTransition.to_state == WorkflowState.SUBMITTED,
+            )
+        )
+        submitted_at: datetime = result.scalar_one_or_none() or submission.created_at
+        if submitted_at.tzinfo is None:
+            submitted_at = submitted_at.replace(tzinfo=timezone.utc)
+
+        published_at: datetime = datetime.now(timezone.utc)
+        submission.published_at = published_at
+        submission.publication_latency_seconds = max(
+            (published_at - submitted_at).total_seconds(), 0.0
+        )
+
     async def get_transition_history(self, submission_id: UUID) -> list[WorkflowTransition]:
         """
         Get the complete transition history for a submission.
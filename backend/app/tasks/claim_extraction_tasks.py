@@ -9,13 +9,11 @@ import logging
 from typing import Any
 
 from celery import Task
-from sqlalchemy import select
 
 from app.core.celery_app import celery_app
 from app.core.database import AsyncSessionLocal
-from app.models.spotlight import SpotlightContent
-from app.models.submission import Submission
-from app.services.llm_claim_extraction_service import LLMClaimExtractionService
+from app.core.http_clients import closing_http_clients
+from app.services.claim_service import extract_spotlight_claims
 
 logger = logging.getLogger(__name__)
 
@@ -31,85 +29,7 @@ async def _extract_claims_async(submission_id: str, spotlight_content_id: str) -
         Dictionary with success status and extracted claims
     """
     async with AsyncSessionLocal() as db:
-        try:
-            # Fetch SpotlightContent with transcription
-            stmt = select(SpotlightContent).where(SpotlightContent.id == spotlight_content_id)
-            result = await db.execute(stmt)
-            spotlight: SpotlightContent | None = result.scalar_one_or_none()
-
-            if not spotlight:
-                logger.error(f"SpotlightContent not found: {spotlight_content_id}")
-                return {
-                    "success": False,
-                    "submission_id": submission_id,
-                    "error": "SpotlightContent not found",
-                }
-
-            if not spotlight.transcription:
-                logger.warning(f"No transcription available for {spotlight_content_id}")
-                return {
-                    "success": False,
-                    "submission_id": submission_id,
-                    "error": "No transcription available",
-                }
-
-            # Extract claims using LLM service
-            llm_service = LLMClaimExtractionService()
-            extraction_result = await llm_service.extract_claims(
-                transcription=spotlight.transcription,
-                source_type="transcription",
-                language_hint=spotlight.transcription_language or "en",
-            )
-
-            # Link extracted claims to the submission
-            stmt_sub = select(Submission).where(Submission.id == submission_id)
-            result_sub = await db.execute(stmt_sub)
-            submission: Submission | None = result_sub.scalar_one_or_none()
-
-            if submission and extraction_result.claims:
-                from app.models.claim import Claim
-                from app.services.embedding_service import EmbeddingService
-
-                embedding_service = EmbeddingService()
-
-                for extracted_claim in extraction_result.claims:
-                    # Generate embedding for the claim
-                    embedding = await embedding_service.generate_embedding(extracted_claim.content)
-
-                    # Create claim in database
-                    claim = Claim(
-                        content=extracted_claim.content,
-                        source="transcription",
-                        language=extracted_claim.language,
-                        embedding=embedding,
-                    )
-                    db.add(claim)
-                    await db.flush()
-
-                    # Link claim to submission
-                    if claim not in submission.claims:
-                        submission.claims.append(claim)
-
-                await db.commit()
-
-            logger.info(
-                f"Extracted {extraction_result.total_claims_found} claims from submission {submission_id}"
-            )
-
-            return {
-                "success": True,
-                "submission_id": submission_id,
-                "total_claims": extraction_result.total_claims_found,
-                "claims_count": len(extraction_result.claims),
-            }
-
-        except Exception as e:
-            logger.exception(f"Unexpected error extracting claims from {submission_id}: {e}")
-            return {
-                "success": False,
-                "submission_id": submission_id,
-                "error": f"Unexpected error: {str(e)}",
-            }
+        return await extract_spotlight_claims(db, submission_id, spotlight_content_id)
 
 
 @celery_app.task(
@@ -151,7 +71,7 @@ def extract_claims_from_transcription(
 
     try:
         result: dict[str, Any] = asyncio.run(
-            _extract_claims_async(submission_id, spotlight_content_id)
+            closing_http_clients(_extract_claims_async(submission_id, spotlight_content_id))
         )
 
         if result["success"]:
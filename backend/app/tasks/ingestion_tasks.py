@@ -0,0 +1,296 @@
+"""
+Celery tasks for Snapchat Spotlight ingestion
+
+Runs the slow part of a Spotlight submission outside the request path:
+metadata fetch (RapidAPI), video download, transcription and claim
+extraction. The API creates the submission in the "fetching" state and
+returns immediately; this task moves it through the ingestion stages,
+which clients can follow via the submission's status.
+
+The ingestion worker runs on a thread pool and every task runs on the
+process's shared task loop (app.core.task_loop), so a worker process
+ingests --concurrency videos at the same time.
+"""
+
+import logging
+from collections.abc import Callable
+from typing import Any, Optional
+from uuid import UUID
+
+from celery import Task
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.task_loop import run_in_task_loop
+from app.models.spotlight import SpotlightContent
+from app.models.submission import Submission
+from app.services.claim_service import extract_spotlight_claims
+from app.services.transcription_service import transcribe_spotlight_content
+
+logger = logging.getLogger(__name__)
+
+# Submission.status values used during Spotlight ingestion
+STATUS_FETCHING = "fetching"
+STATUS_TRANSCRIBING = "transcribing"
+STATUS_EXTRACTING_CLAIMS = "extracting_claims"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+ProgressCallback = Callable[[str], None]
+
+
+def build_spotlight_content(
+    submission_id: UUID,
+    spotlight_link: str,
+    spotlight_data: dict[str, Any],
+    parsed_metadata: dict[str, Any],
+    video_local_path: Optional[str],
+) -> SpotlightContent:
+    """Create a SpotlightContent record from parsed RapidAPI metadata
+
+    Args:
+        submission_id: Submission the content belongs to
+        spotlight_link: Submitted Spotlight URL
+        spotlight_data: Raw API response
+        parsed_metadata: Output of SnapchatService.parse_spotlight_metadata
+        video_local_path: Path of the downloaded video, if it was stored
+
+    Returns:
+        Unsaved SpotlightContent instance
+    """
+    return SpotlightContent(
+        submission_id=submission_id,
+        spotlight_link=spotlight_link,
+        spotlight_id=parsed_metadata["spotlight_id"],
+        video_url=parsed_metadata["video_url"],
+        video_local_path=video_local_path,
+        thumbnail_url=parsed_metadata["thumbnail_url"],
+        duration_ms=parsed_metadata.get("duration_ms"),
+        width=parsed_metadata.get("width"),
+        height=parsed_metadata.get("height"),
+        creator_username=parsed_metadata.get("creator_username"),
+        creator_name=parsed_metadata.get("creator_name"),
+        creator_url=parsed_metadata.get("creator_url"),
+        view_count=parsed_metadata.get("view_count"),
+        share_count=parsed_metadata.get("share_count"),
+        comment_count=parsed_metadata.get("comment_count"),
+        boost_count=parsed_metadata.get("boost_count"),
+        recommend_count=parsed_metadata.get("recommend_count"),
+        upload_timestamp=parsed_metadata.get("upload_timestamp"),
+        raw_metadata=spotlight_data,
+    )
+
+
+async def _set_submission_status(
+    submission_id: str, status: str, error: Optional[str] = None
+) -> None:
+    """Persist a new status for a submission
+
+    Args:
+        submission_id: UUID of the submission
+        status: New Submission.status value
+        error: Failure reason to record with STATUS_FAILED
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Submission).where(Submission.id == UUID(submission_id)))
+        submission: Optional[Submission] = result.scalar_one_or_none()
+        if submission is not None:
+            submission.status = status
+            submission.ingestion_error = error
+            await db.commit()
+
+
+async def _fetch_spotlight_async(submission_id: str, spotlight_link: str) -> dict[str, Any]:
+    """Fetch metadata, download the video and store the SpotlightContent
+
+    Args:
+        submission_id: UUID of the submission in the "fetching" state
+        spotlight_link: Submitted Spotlight URL
+
+    Returns:
+        Dict with success flag and spotlight_content_id or error
+    """
+    from app.services.snapchat import snapchat_service
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Submission).where(Submission.id == UUID(submission_id)))
+        submission: Optional[Submission] = result.scalar_one_or_none()
+
+        if submission is None:
+            logger.error(f"Submission not found for Spotlight ingestion: {submission_id}")
+            return {"success": False, "error": "Submission not found"}
+
+        # A retried task must not fetch (or insert) the content a second time
+        existing: Optional[SpotlightContent] = (
+            await db.execute(
+                select(SpotlightContent).where(SpotlightContent.submission_id == submission.id)
+            )
+        ).scalar_one_or_none()
+        if existing is not None:
+            return {"success": True, "spotlight_content_id": str(existing.id)}
+
+        try:
+            spotlight_data: dict[str, Any] = await snapchat_service.fetch_spotlight_data(
+                spotlight_link
+            )
+            parsed_metadata: dict[str, Any] = snapchat_service.parse_spotlight_metadata(
+                spotlight_data
+            )
+
+            video_local_path: Optional[str] = None
+            if settings.SPOTLIGHT_DOWNLOAD_VIDEO:
+                video_local_path = await snapchat_service.download_video(
+                    parsed_metadata["video_url"], parsed_metadata["spotlight_id"]
+                )
+        except Exception as e:
+            error: str = e.detail if isinstance(e, HTTPException) else str(e)
+            logger.error(f"Spotlight fetch failed for submission {submission_id}: {error}")
+            submission.status = STATUS_FAILED
+            submission.ingestion_error = f"Failed to fetch Spotlight content: {error}"
+            await db.commit()
+            return {"success": False, "error": submission.ingestion_error}
+
+        spotlight_content: SpotlightContent = build_spotlight_content(
+            submission.id, spotlight_link, spotlight_data, parsed_metadata, video_local_path
+        )
+        db.add(spotlight_content)
+        submission.content = (
+            f"Snapchat Spotlight: {parsed_metadata.get('creator_name', 'Unknown')} - "
+            f"{spotlight_link}"
+        )
+        submission.status = STATUS_TRANSCRIBING
+        await db.commit()
+        await db.refresh(spotlight_content)
+
+        return {"success": True, "spotlight_content_id": str(spotlight_content.id)}
+
+
+async def _ingest_spotlight_async(
+    submission_id: str,
+    spotlight_link: str,
+    report_progress: Optional[ProgressCallback] = None,
+) -> dict[str, Any]:
+    """Run the full Spotlight ingestion pipeline
+
+    Stages (each reflected in Submission.status):
+    1. fetching: metadata fetch and video download
+    2. transcribing: audio extraction and Whisper transcription
+    3. extracting_claims: LLM claim extraction
+    4. completed
+
+    A failed fetch or transcription marks the submission "failed" and
+    records the error in Submission.ingestion_error. Claim extraction
+    errors are only reported in the result, as a transcription without
+    claims is still reviewable.
+
+    Args:
+        submission_id: UUID of the submission in the "fetching" state
+        spotlight_link: Submitted Spotlight URL
+        report_progress: Optional callback receiving each stage name
+
+    Returns:
+        Dict describing the outcome of every stage that ran
+    """
+
+    def progress(stage: str) -> None:
+        if report_progress is not None:
+            report_progress(stage)
+
+    progress(STATUS_FETCHING)
+    fetched: dict[str, Any] = await _fetch_spotlight_async(submission_id, spotlight_link)
+    if not fetched["success"]:
+        progress(STATUS_FAILED)
+        return {"success": False, "submission_id": submission_id, "error": fetched["error"]}
+
+    spotlight_content_id: str = fetched["spotlight_content_id"]
+    result: dict[str, Any] = {
+        "success": True,
+        "submission_id": submission_id,
+        "spotlight_content_id": spotlight_content_id,
+    }
+
+    progress(STATUS_TRANSCRIBING)
+    async with AsyncSessionLocal() as db:
+        transcription: dict[str, Any] = await transcribe_spotlight_content(db, spotlight_content_id)
+    result["transcription"] = transcription
+
+    if not transcription["success"]:
+        error: str = f"Transcription failed: {transcription.get('error')}"
+        await _set_submission_status(submission_id, STATUS_FAILED, error)
+        progress(STATUS_FAILED)
+        return {**result, "success": False, "error": error}
+
+    await _set_submission_status(submission_id, STATUS_EXTRACTING_CLAIMS)
+    progress(STATUS_EXTRACTING_CLAIMS)
+    async with AsyncSessionLocal() as db:
+        result["claim_extraction"] = await extract_spotlight_claims(
+            db, submission_id, spotlight_content_id
+        )
+
+    await _set_submission_status(submission_id, STATUS_COMPLETED)
+    progress(STATUS_COMPLETED)
+    return result
+
+
+@celery_app.task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=60,
+    name="app.tasks.ingestion_tasks.ingest_spotlight",
+)
+def ingest_spotlight(
+    self: "Task[Any, Any]",
+    submission_id: str,
+    spotlight_link: str,
+) -> dict[str, Any]:
+    """Celery task to ingest a Snapchat Spotlight submission
+
+    Progress is published as Celery task state "PROGRESS" with
+    meta={"submission_id": ..., "stage": ...} and mirrored in
+    Submission.status.
+
+    Args:
+        self: Celery task instance (bound)
+        submission_id: UUID string of the submission
+        spotlight_link: Submitted Spotlight URL
+
+    Returns:
+        Dict with the outcome of each ingestion stage
+
+    Retry Logic:
+        - Max retries: 3
+        - Retry delay: 60 seconds
+        - Retries on unexpected failures (e.g. database unavailable)
+    """
+    logger.info(f"Starting Spotlight ingestion for submission: {submission_id}")
+
+    # The request context is thread-local; progress is reported from the task loop's thread
+    task_id: Optional[str] = self.request.id
+
+    def report_progress(stage: str) -> None:
+        if task_id:
+            self.update_state(
+                task_id=task_id,
+                state="PROGRESS",
+                meta={"submission_id": submission_id, "stage": stage},
+            )
+
+    try:
+        # Run on the worker's shared loop, alongside the other videos in flight
+        result: dict[str, Any] = run_in_task_loop(
+            _ingest_spotlight_async(submission_id, spotlight_link, report_progress)
+        )
+    except Exception as e:
+        logger.exception(f"Spotlight ingestion failed for {submission_id}: {e}")
+        raise self.retry(exc=e) from e
+
+    if result["success"]:
+        logger.info(f"Spotlight ingestion completed for submission {submission_id}")
+    else:
+        logger.warning(
+            f"Spotlight ingestion failed for submission {submission_id}: {result.get('error')}"
+        )
+    return result
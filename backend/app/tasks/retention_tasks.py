@@ -103,3 +103,49 @@ def run_retention_cleanup(self: "Task[Any, Any]") -> dict[str, Any]:
             "total_deleted": 0,
             "error": f"Task failed: {exc}",
         }
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=300)
+def maintain_analytics_partitions(self: "Task[Any, Any]") -> dict[str, Any]:
+    """
+    Celery task to maintain the monthly analytics_events partitions
+
+    Creates the partitions for the current month and the next
+    ANALYTICS_PARTITION_PREMAKE_MONTHS, then detaches and drops the
+    partitions older than RETENTION_ANALYTICS_EVENTS_DAYS (or deletes expired
+    rows on databases without partitioning).
+
+    Scheduled to run daily at 1 AM UTC via Celery Beat
+
+    Returns:
+        Dictionary with maintenance summary:
+        {
+            "success": bool,
+            "created_partitions": list[str],
+            "analytics_events": int,
+            "default_partition_rows": int,
+            "error": None
+        }
+
+    Retry Logic:
+        - Max retries: 3
+        - Retry delay: 5 minutes (300 seconds)
+    """
+    import asyncio
+
+    from app.core.database import AsyncSessionLocal
+    from app.services.retention_service import RetentionService
+
+    async def _run_maintenance() -> dict[str, Any]:
+        """Async wrapper for partition maintenance"""
+        async with AsyncSessionLocal() as db:
+            service: RetentionService = RetentionService()
+            summary: dict[str, Any] = await service.maintain_analytics_partitions(db)
+            logger.info("Analytics partition maintenance completed", extra={"summary": summary})
+            return {"success": True, **summary, "error": None}
+
+    try:
+        return asyncio.run(_run_maintenance())
+    except Exception as exc:
+        logger.exception("Analytics partition maintenance failed")
+        raise self.retry(exc=exc) from exc
@@ -0,0 +1,93 @@
+"""
+Tests for the hybrid claim search API endpoint
+
+Endpoints:
+- POST /api/v1/claims/hybrid-search - Full-text + vector search fused with RRF
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.models.claim import Claim
+from app.models.user import User, UserRole
+from app.services.embedding_service import EmbeddingServiceError
+
+
+async def _auth_headers(db_session: AsyncSession, role: UserRole) -> dict[str, str]:
+    user = User(
+        email=f"hybrid-{uuid4()}@example.com",
+        password_hash="hashed_password",
+        role=role,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+
+def _embedding_batcher(**embed: object) -> MagicMock:
+    batcher: MagicMock = MagicMock()
+    batcher.embed = AsyncMock(**embed)
+    return batcher
+
+
+class TestHybridSearchEndpoint:
+    """Tests for POST /api/v1/claims/hybrid-search"""
+
+    async def test_reviewer_gets_fused_results(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test a claim found by both rankings is returned with both ranks"""
+        embedding: list[float] = [0.01] * 1536
+        claim = Claim(content="Windmolens veroorzaken kanker", source="test", embedding=embedding)
+        db_session.add(claim)
+        headers = await _auth_headers(db_session, UserRole.REVIEWER)
+
+        with patch(
+            "app.services.hybrid_search_service.get_embedding_batcher",
+            return_value=_embedding_batcher(return_value=embedding),
+        ):
+            response = client.post(
+                "/api/v1/claims/hybrid-search",
+                json={"query": "windmolens", "created_from": "2000-01-01T00:00:00Z"},
+                headers=headers,
+            )
+
+        assert response.status_code == 200
+        results = response.json()
+        assert [result["claim_id"] for result in results] == [str(claim.id)]
+        assert results[0]["lexical_rank"] == 1
+        assert results[0]["vector_rank"] == 1
+        assert results[0]["content_highlight"] == "<mark>Windmolens</mark> veroorzaken kanker"
+
+    async def test_embedding_failure_returns_503(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test an unavailable embedding service is reported as 503"""
+        headers = await _auth_headers(db_session, UserRole.ADMIN)
+
+        with patch(
+            "app.services.hybrid_search_service.get_embedding_batcher",
+            return_value=_embedding_batcher(side_effect=EmbeddingServiceError("down")),
+        ):
+            response = client.post(
+                "/api/v1/claims/hybrid-search", json={"query": "windmolens"}, headers=headers
+            )
+
+        assert response.status_code == 503
+
+    async def test_submitter_is_forbidden(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test submitters cannot use hybrid search"""
+        headers = await _auth_headers(db_session, UserRole.SUBMITTER)
+
+        response = client.post(
+            "/api/v1/claims/hybrid-search", json={"query": "windmolens"}, headers=headers
+        )
+
+        assert response.status_code == 403
@@ -1092,6 +1092,55 @@ class TestPublicCorrectionsLog:
         # Second should be older (substantial type)
         assert data["corrections"][1]["correction_type"] == "substantial"
 
+    @pytest.mark.asyncio
+    async def test_public_log_cursor_pagination(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test following next_cursor walks the log by reviewed_at (newest first)."""
+        from datetime import timedelta
+
+        claim: Claim = Claim(content="Cursor test", source="test")
+        db_session.add(claim)
+        await db_session.commit()
+        await db_session.refresh(claim)
+
+        fact_check: FactCheck = FactCheck(
+            claim_id=claim.id,
+            verdict="false",
+            confidence=0.75,
+            reasoning="Test",
+            sources=["https://example.com"],
+        )
+        db_session.add(fact_check)
+        await db_session.commit()
+        await db_session.refresh(fact_check)
+
+        now: datetime = datetime.now(timezone.utc)
+        for days_ago in range(5):
+            db_session.add(
+                Correction(
+                    fact_check_id=fact_check.id,
+                    correction_type=CorrectionType.UPDATE,
+                    request_details=f"Reviewed {days_ago} days ago.",
+                    status=CorrectionStatus.ACCEPTED,
+                    reviewed_at=now - timedelta(days=days_ago),
+                )
+            )
+        await db_session.commit()
+
+        details: list[str] = []
+        params: dict[str, Any] = {"limit": 2}
+        while True:
+            response = client.get("/api/v1/corrections/public-log", params=params)
+            assert response.status_code == 200
+            data: dict[str, Any] = response.json()
+            details.extend(c["request_details"] for c in data["corrections"])
+            if data["next_cursor"] is None:
+                break
+            params = {"limit": 2, "cursor": data["next_cursor"], "count": "none"}
+
+        assert details == [f"Reviewed {d} days ago." for d in range(5)]
+
     @pytest.mark.asyncio
     async def test_public_log_empty_when_no_applied_corrections(
         self, client: TestClient, db_session: AsyncSession
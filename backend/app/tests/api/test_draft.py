@@ -84,6 +84,7 @@ class TestSaveDraft:
         await db_session.refresh(claim)
 
         # Link claim to submission
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -179,6 +180,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -252,6 +254,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -326,6 +329,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -386,6 +390,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -452,6 +457,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -522,6 +528,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -588,6 +595,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -693,6 +701,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -759,6 +768,7 @@ class TestSaveDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -834,6 +844,7 @@ class TestGetDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -919,6 +930,7 @@ class TestGetDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -987,6 +999,7 @@ class TestGetDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -1056,6 +1069,7 @@ class TestGetDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -1113,6 +1127,7 @@ class TestGetDraft:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
@@ -1287,6 +1302,7 @@ class TestDraftEditableStates:
         await db_session.commit()
         await db_session.refresh(claim)
 
+        await db_session.refresh(submission, ["claims"])
         submission.claims.append(claim)
         await db_session.commit()
 
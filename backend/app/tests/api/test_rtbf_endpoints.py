@@ -4,7 +4,7 @@ Tests for RTBF API endpoints - Issue #92
 Following TDD approach: tests are written FIRST before implementation.
 """
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import pytest
@@ -189,6 +189,55 @@ class TestRTBFAdminEndpoints:
         data: dict[str, Any] = response.json()
         assert data["pending_count"] == 3
 
+    @pytest.mark.asyncio
+    async def test_list_requests_cursor_pagination(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test admin list pages with next_cursor and counts every status"""
+        from app.models.rtbf_request import RTBFRequest, RTBFRequestStatus
+
+        admin: User = User(
+            email="admin-rtbf-pages@example.com",
+            password_hash="hashed_password",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        db_session.add(admin)
+        await db_session.commit()
+        await db_session.refresh(admin)
+
+        base: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        statuses: list[RTBFRequestStatus] = [RTBFRequestStatus.PENDING] * 3 + [
+            RTBFRequestStatus.PROCESSING
+        ] * 2
+        for i, request_status in enumerate(statuses):
+            db_session.add(
+                RTBFRequest(
+                    user_id=admin.id,
+                    reason=f"Request {i}",
+                    status=request_status,
+                    created_at=base + timedelta(hours=i),
+                )
+            )
+        await db_session.commit()
+
+        headers: dict[str, str] = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"
+        }
+        first = client.get("/api/v1/rtbf/requests?limit=2", headers=headers).json()
+        second = client.get(
+            "/api/v1/rtbf/requests",
+            params={"limit": 2, "cursor": first["next_cursor"]},
+            headers=headers,
+        ).json()
+
+        assert first["total"] == 5
+        assert first["pending_count"] == 3
+        assert first["processing_count"] == 2
+        assert [r["reason"] for r in first["items"]] == ["Request 4", "Request 3"]
+        assert [r["reason"] for r in second["items"]] == ["Request 2", "Request 1"]
+        assert second["next_cursor"] is not None
+
     @pytest.mark.asyncio
     async def test_list_requests_non_admin_forbidden(
         self, client: TestClient, db_session: AsyncSession
@@ -0,0 +1,84 @@
+"""
+Tests for the search API endpoint
+
+Endpoints:
+- GET /api/v1/search - Ranked full-text search over claims and fact-checks
+"""
+
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.models.claim import Claim
+from app.models.fact_check import FactCheck
+from app.models.user import User, UserRole
+
+
+async def _auth_headers(db_session: AsyncSession, role: UserRole) -> dict[str, str]:
+    user = User(
+        email=f"search-{uuid4()}@example.com",
+        password_hash="hashed_password",
+        role=role,
+        is_active=True,
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+
+class TestSearchEndpoint:
+    """Tests for GET /api/v1/search"""
+
+    async def test_reviewer_finds_checked_claim(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test a reviewer finds a claim with its latest verdict and highlights"""
+        claim = Claim(content="Windmolens veroorzaken kanker", source="test")
+        db_session.add(claim)
+        await db_session.flush()
+        db_session.add(
+            FactCheck(
+                claim_id=claim.id,
+                verdict="false",
+                confidence=0.95,
+                reasoning="Er is geen bewijs dat windmolens kanker veroorzaken",
+                sources=["https://example.com"],
+            )
+        )
+        headers = await _auth_headers(db_session, UserRole.REVIEWER)
+
+        response = client.get("/api/v1/search", params={"q": "windmolens"}, headers=headers)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["next_cursor"] is None
+        assert len(data["results"]) == 1
+        result = data["results"][0]
+        assert result["claim_id"] == str(claim.id)
+        assert result["verdict"] == "false"
+        assert result["match"] == "fulltext"
+        assert result["content_highlight"] == "<mark>Windmolens</mark> veroorzaken kanker"
+
+    async def test_submitters_cannot_search(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test search is limited to reviewers and admins"""
+        headers = await _auth_headers(db_session, UserRole.SUBMITTER)
+
+        response = client.get("/api/v1/search", params={"q": "test"}, headers=headers)
+
+        assert response.status_code == 403
+
+    async def test_invalid_cursor_is_rejected(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test a malformed cursor gets 400"""
+        headers = await _auth_headers(db_session, UserRole.REVIEWER)
+
+        response = client.get(
+            "/api/v1/search", params={"q": "test", "cursor": "not-a-cursor"}, headers=headers
+        )
+
+        assert response.status_code == 400
@@ -5,6 +5,7 @@ These tests are written BEFORE implementation and should FAIL initially (RED pha
 Once implementation is complete, these tests should pass (GREEN phase).
 """
 
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import pytest
@@ -539,6 +540,64 @@ class TestSubmissionsListPagination:
         assert data["page"] == 4
         assert len(data["items"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(
+        self,
+        client: TestClient,
+        db_session: AsyncSession,
+        reviewer_user: Any,
+        submitter_user: Any,
+    ) -> None:
+        """Test following next_cursor returns every submission once, newest first"""
+        reviewer, reviewer_token = reviewer_user
+        submitter, _ = submitter_user
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        # Two submissions share each timestamp to exercise the id tie-breaker
+        for i in range(7):
+            submission = Submission(
+                user_id=submitter.id,
+                content=f"Submission {i}",
+                submission_type="text",
+                status="pending",
+                created_at=base + timedelta(minutes=i // 2),
+            )
+            db_session.add(submission)
+
+        await db_session.commit()
+
+        headers = {"Authorization": f"Bearer {reviewer_token}"}
+        response = client.get("/api/v1/submissions?page_size=3", headers=headers)
+        data = response.json()
+        assert data["total"] == 7
+        contents = [item["content"] for item in data["items"]]
+
+        while data["next_cursor"]:
+            response = client.get(
+                "/api/v1/submissions",
+                params={"page_size": 3, "cursor": data["next_cursor"], "count": "none"},
+                headers=headers,
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            contents.extend(item["content"] for item in data["items"])
+
+        assert sorted(contents) == sorted(f"Submission {i}" for i in range(7))
+        assert contents[0] == "Submission 6"
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_rejected(self, client: TestClient, reviewer_user: Any) -> None:
+        """Test a malformed cursor returns 400"""
+        _, reviewer_token = reviewer_user
+
+        response = client.get(
+            "/api/v1/submissions?cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {reviewer_token}"},
+        )
+
+        assert response.status_code == 400
+
 
 # ============================================================================
 # Response Format Tests
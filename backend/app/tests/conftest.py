@@ -19,19 +19,24 @@ os.environ["CORS_ORIGINS"] = (
     "https://staging.ans.postxsociety.cloud,"
     "https://ans.postxsociety.cloud"
 )
+# Tests share one Redis; cached responses would leak between test databases
+os.environ["RESPONSE_CACHE_ENABLED"] = "false"
 
 from redis.asyncio import Redis  # noqa: E402
 
 from app.core.config import settings  # noqa: E402
 from app.core.database import get_db  # noqa: E402
+from app.core.principal_cache import get_principal_cache  # noqa: E402
 from app.core.redis import get_redis  # noqa: E402
 from app.core.security import create_access_token  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models.base import Base  # noqa: E402
 from app.models.user import User, UserRole  # noqa: E402
+from app.services.peer_review_trigger_cache import get_trigger_cache  # noqa: E402
 
 # Reload settings to pick up test environment variables
 settings.CORS_ORIGINS = os.environ["CORS_ORIGINS"]
+settings.RESPONSE_CACHE_ENABLED = False
 
 
 # Override Redis dependency for tests to create new client per test
@@ -84,6 +89,9 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         yield session
 
+    # Compiled triggers belong to this test's database
+    get_trigger_cache().clear()
+
     # Drop tables after test
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -112,6 +120,7 @@ def client(db_session: AsyncSession, test_redis_client: Any) -> Generator[TestCl
         yield test_client
 
     app.dependency_overrides.clear()
+    get_principal_cache().clear()
 
 
 @pytest_asyncio.fixture
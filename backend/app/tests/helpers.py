@@ -2,10 +2,17 @@
 Shared test helpers for the backend test suite.
 
 These helpers address cross-database compatibility issues between
-SQLite (used in tests) and PostgreSQL (production).
+SQLite (used in tests) and PostgreSQL (production), and count the SQL
+statements an endpoint issues.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 def normalize_dt(dt: datetime) -> datetime:
@@ -32,3 +39,51 @@ def normalize_dt(dt: datetime) -> datetime:
         assert (normalize_dt(now) - normalize_dt(last_reviewed)).total_seconds() < 60
     """
     return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+
+class QueryCounter:
+    """SQL statements executed while a count_queries block was active
+
+    Attributes:
+        statements: SQL text of each statement, in execution order
+    """
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        """Number of statements executed"""
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(session: AsyncSession) -> Iterator[QueryCounter]:
+    """Count the SQL statements sent through a session's engine.
+
+    Used to pin the number of queries an endpoint issues, so a loading
+    profile change that adds a query (or an N+1) fails a test.
+
+    Args:
+        session: Session whose engine to watch (the test db_session)
+
+    Yields:
+        A QueryCounter filled in as statements execute
+
+    Example:
+        db_session.expunge_all()
+        with count_queries(db_session) as queries:
+            client.get(f"/api/v1/submissions/{submission_id}", headers=headers)
+        assert queries.count == 7, queries.statements
+    """
+    counter = QueryCounter()
+    engine: Engine = cast(Engine, session.get_bind())
+
+    def record(*args: Any) -> None:
+        counter.statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,231 @@
+"""
+Tests for buffered analytics event ingestion.
+
+Covers:
+- Bulk writes in batches of batch_size
+- Dropping events when the buffer is full
+- Sampling view events under backpressure
+- Requeueing a batch whose write failed
+- Dropping events the database keeps rejecting
+- POST /analytics/events
+"""
+
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from typing import Any, Optional
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.analytics_ingestion_service as ingestion_module
+from app.models.analytics_event import AnalyticsEvent
+from app.services.analytics_ingestion_service import AnalyticsEventBuffer
+
+
+def _session_factory(db: AsyncSession) -> Callable[[], Any]:
+    """Session factory handing out the test session"""
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[AsyncSession]:
+        yield db
+
+    return factory
+
+
+def _buffer(db: AsyncSession, **kwargs: Any) -> AnalyticsEventBuffer:
+    options: dict[str, Any] = {
+        "capacity": 100,
+        "batch_size": 10,
+        "flush_interval": 1.0,
+        "sample_above": 0.8,
+        "sample_rate": 0.5,
+        **kwargs,
+    }
+    return AnalyticsEventBuffer(session_factory=_session_factory(db), **options)
+
+
+def _events(count: int, event_type: str = "view") -> list[dict[str, Any]]:
+    return [
+        {"event_type": event_type, "entity_type": "fact_check", "entity_id": uuid4()}
+        for _ in range(count)
+    ]
+
+
+async def _stored(db: AsyncSession) -> int:
+    return int((await db.execute(select(func.count(AnalyticsEvent.id)))).scalar_one())
+
+
+class TestAnalyticsEventBuffer:
+    """Tests for buffering and bulk writes"""
+
+    async def test_flush_writes_in_batches(self, db_session: AsyncSession) -> None:
+        """Test buffered events are written in batches of batch_size"""
+        event_buffer = _buffer(db_session)
+        event_buffer.record(_events(25, "share"))
+
+        written: int = await event_buffer.flush()
+
+        assert written == 25
+        assert len(event_buffer) == 0
+        assert await _stored(db_session) == 25
+        assert event_buffer.metrics.snapshot()["batches"] == 3
+        assert event_buffer.metrics.snapshot()["avg_batch_size"] == 8.3
+
+    async def test_metadata_is_stored(self, db_session: AsyncSession) -> None:
+        """Test event metadata round-trips and missing metadata stays NULL"""
+        event_buffer = _buffer(db_session)
+        event_buffer.record(
+            [{**_events(1, "share")[0], "event_metadata": {"channel": "whatsapp"}}, *_events(1)]
+        )
+        await event_buffer.flush()
+
+        result = await db_session.execute(
+            select(AnalyticsEvent.event_type, AnalyticsEvent.event_metadata).order_by(
+                AnalyticsEvent.event_type
+            )
+        )
+        assert [tuple(row) for row in result.all()] == [
+            ("share", {"channel": "whatsapp"}),
+            ("view", None),
+        ]
+
+    async def test_full_buffer_drops_events(self, db_session: AsyncSession) -> None:
+        """Test events beyond capacity are dropped and counted"""
+        event_buffer = _buffer(db_session, capacity=5)
+
+        accepted: int = event_buffer.record(_events(8, "share"))
+
+        assert accepted == 5
+        assert len(event_buffer) == 5
+        assert event_buffer.metrics.dropped == 3
+
+    async def test_views_are_sampled_under_backpressure(self, db_session: AsyncSession) -> None:
+        """Test views above the watermark are sampled and carry a weight"""
+        event_buffer = _buffer(db_session, capacity=10, sample_above=0.5, sample_rate=0.5)
+        event_buffer.record(_events(5))
+
+        with patch(
+            "app.services.analytics_ingestion_service.random.random", side_effect=[0.2, 0.7]
+        ):
+            accepted: int = event_buffer.record(_events(2))
+        shares: int = event_buffer.record(_events(2, "share"))
+        await event_buffer.flush()
+
+        assert (accepted, shares) == (1, 2)
+        assert event_buffer.metrics.sampled_out == 1
+        weights = await db_session.execute(
+            select(AnalyticsEvent.event_metadata).where(AnalyticsEvent.event_metadata.is_not(None))
+        )
+        assert weights.scalars().all() == [{"sample_weight": 2.0}]
+
+    async def test_failed_write_is_requeued(self, db_session: AsyncSession) -> None:
+        """Test a batch whose write fails stays buffered for the next flush"""
+        event_buffer = _buffer(db_session)
+        event_buffer.record(_events(15, "share"))
+        original_write = event_buffer._write
+
+        with patch.object(event_buffer, "_write", side_effect=ConnectionError("db down")):
+            assert await event_buffer.flush() == 0
+            assert await event_buffer.flush() == 0
+        assert len(event_buffer) == 15
+        assert event_buffer.metrics.flush_errors == 2
+
+        with patch.object(event_buffer, "_write", side_effect=original_write):
+            assert await event_buffer.flush() == 15
+        assert await _stored(db_session) == 15
+        assert event_buffer.metrics.lost == 0
+
+    async def test_rejected_event_is_dropped_on_retry(self, db_session: AsyncSession) -> None:
+        """Test an event the database always rejects is isolated and dropped"""
+        event_buffer = _buffer(db_session)
+        event_buffer.record(_events(25, "share"))
+        poison_id = event_buffer._events[14]["id"]
+        original_write = event_buffer._write
+
+        async def write(batch: list[dict[str, Any]]) -> None:
+            if any(row["id"] == poison_id for row in batch):
+                raise ValueError("unsupported Unicode escape sequence")
+            await original_write(batch)
+
+        with patch.object(event_buffer, "_write", side_effect=write):
+            assert await event_buffer.flush() == 10
+            assert len(event_buffer) == 15
+            assert await event_buffer.flush() == 14
+
+        assert len(event_buffer) == 0
+        assert await _stored(db_session) == 24
+        assert event_buffer.metrics.lost == 1
+        assert event_buffer._failed_ids == set()
+
+
+@pytest.fixture
+def test_event_buffer(
+    client: TestClient, db_session: AsyncSession
+) -> Iterator[AnalyticsEventBuffer]:
+    """Install an event buffer writing to the test database (after app startup)"""
+    event_buffer = _buffer(db_session)
+    original: Optional[AnalyticsEventBuffer] = ingestion_module._event_buffer
+    ingestion_module._event_buffer = event_buffer
+    yield event_buffer
+    ingestion_module._event_buffer = original
+
+
+class TestRecordEventsEndpoint:
+    """Tests for POST /analytics/events"""
+
+    async def test_events_are_accepted_and_written(
+        self, client: TestClient, db_session: AsyncSession, test_event_buffer: AnalyticsEventBuffer
+    ) -> None:
+        """Test a public batch is accepted with 202 and written on flush"""
+        response = client.post(
+            "/api/v1/analytics/events",
+            json={
+                "events": [
+                    {"event_type": "view", "entity_type": "fact_check", "entity_id": str(uuid4())},
+                    {
+                        "event_type": "share",
+                        "entity_type": "fact_check",
+                        "entity_id": str(uuid4()),
+                        "event_metadata": {"channel": "x"},
+                    },
+                ]
+            },
+        )
+        await test_event_buffer.flush()
+
+        assert response.status_code == 202
+        assert response.json() == {"accepted": 2, "dropped": 0}
+        assert await _stored(db_session) == 2
+
+    async def test_invalid_events_are_rejected(
+        self, client: TestClient, test_event_buffer: AnalyticsEventBuffer
+    ) -> None:
+        """Test unknown event types, empty batches and oversized or NUL metadata get 422"""
+        entity_id: str = str(uuid4())
+        bad_type = {"event_type": "click", "entity_type": "fact_check", "entity_id": entity_id}
+        oversized = {
+            "event_type": "view",
+            "entity_type": "fact_check",
+            "entity_id": entity_id,
+            "event_metadata": {"blob": "x" * 5000},
+        }
+        nul = {
+            "event_type": "view",
+            "entity_type": "fact_check",
+            "entity_id": entity_id,
+            "event_metadata": {"query": ["vaccin\u0000"]},
+        }
+
+        body: dict[str, Any]
+        for body in (
+            {"events": [bad_type]},
+            {"events": []},
+            {"events": [oversized]},
+            {"events": [nul]},
+        ):
+            assert client.post("/api/v1/analytics/events", json=body).status_code == 422
+        assert len(test_event_buffer) == 0
@@ -0,0 +1,91 @@
+"""
+Tests for the monthly analytics_events partition management.
+
+Covers:
+- Partition naming and month arithmetic
+- Pre-creating upcoming partitions
+- Dropping only partitions whose whole month has expired
+"""
+
+from datetime import date, datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services import analytics_partition_service
+from app.services.analytics_partition_service import (
+    add_months,
+    drop_expired_partitions,
+    ensure_partitions,
+    partition_month,
+    partition_name,
+)
+
+
+def _postgres_session(partitions: list[str], reltuples: int = 0) -> MagicMock:
+    """AsyncSession stand-in that answers the catalog queries"""
+    session: MagicMock = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    statements: list[str] = []
+
+    async def execute(statement: Any, params: Any = None) -> MagicMock:
+        sql: str = str(statement)
+        statements.append(sql)
+        result: MagicMock = MagicMock()
+        result.scalars.return_value.all.return_value = partitions
+        result.scalar_one_or_none.return_value = reltuples
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    session.statements = statements
+    return session
+
+
+class TestPartitionNames:
+    """Tests for partition naming helpers"""
+
+    def test_add_months_crosses_years(self) -> None:
+        """Test month arithmetic across year boundaries"""
+        assert add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+        assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+    def test_name_round_trip(self) -> None:
+        """Test partition names map back to their month and ignore other tables"""
+        assert partition_name(date(2026, 3, 1)) == "analytics_events_2026_03"
+        assert partition_month("analytics_events_2026_03") == date(2026, 3, 1)
+        assert partition_month(analytics_partition_service.DEFAULT_PARTITION) is None
+
+
+class TestPartitionMaintenance:
+    """Tests for creating and dropping partitions"""
+
+    async def test_ensure_creates_missing_months(self) -> None:
+        """Test only missing partitions up to months_ahead are created"""
+        session: MagicMock = _postgres_session(["analytics_events_2026_10"])
+
+        created: list[str] = await ensure_partitions(session, 2, today=date(2026, 10, 16))
+
+        assert created == ["analytics_events_2026_11", "analytics_events_2026_12"]
+        assert any(
+            "PARTITION OF analytics_events FOR VALUES FROM ('2026-12-01 00:00:00+00') "
+            "TO ('2027-01-01 00:00:00+00')" in sql
+            for sql in session.statements
+        )
+
+    async def test_drop_keeps_partially_expired_month(self) -> None:
+        """Test a partition is kept while any of its month is within retention"""
+        session: MagicMock = _postgres_session(
+            [
+                "analytics_events_2024_08",
+                "analytics_events_2024_09",
+                "analytics_events_2024_10",
+                analytics_partition_service.DEFAULT_PARTITION,
+            ],
+            reltuples=1000,
+        )
+
+        dropped = await drop_expired_partitions(session, datetime(2024, 10, 1, tzinfo=timezone.utc))
+
+        assert dropped.names == ["analytics_events_2024_08", "analytics_events_2024_09"]
+        assert dropped.estimated_rows == 2000
+        assert "DETACH PARTITION analytics_events_2024_09" in " ".join(session.statements)
+        assert "DROP TABLE analytics_events_default" not in session.statements
@@ -14,7 +14,7 @@ Tests cover:
 - EFCSN compliance checklist
 """
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import pytest
@@ -24,7 +24,10 @@ from app.models.claim import Claim
 from app.models.correction import Correction, CorrectionStatus, CorrectionType
 from app.models.fact_check import FactCheck
 from app.models.source import Source, SourceRelevance, SourceType
+from app.models.submission import Submission
 from app.models.user import User, UserRole
+from app.models.workflow_transition import WorkflowState
+from app.tests.helpers import count_queries
 
 
 class TestAnalyticsServiceMonthlyFactCheckCount:
@@ -148,42 +151,46 @@ class TestAnalyticsServiceTimeToPublication:
     async def test_get_time_to_publication_metrics_calculates_average(
         self, db_session: AsyncSession
     ) -> None:
-        """Test that time-to-publication average is calculated correctly."""
+        """Test that time-to-publication statistics come from publication latencies."""
         from app.services.analytics_service import AnalyticsService
 
-        # Create fact-checks with known creation times
-        claims: list[Claim] = []
-        for i in range(3):
-            claim: Claim = Claim(content=f"Test claim {i}", source="test")
-            db_session.add(claim)
-            claims.append(claim)
+        user: User = User(email="ttp@example.com", password_hash="hash", role=UserRole.ADMIN)
+        db_session.add(user)
         await db_session.commit()
 
-        for claim in claims:
-            await db_session.refresh(claim)
-
-        # Create fact-checks
-        for i, claim in enumerate(claims):
-            fc: FactCheck = FactCheck(
-                claim_id=claim.id,
-                verdict="true",
-                confidence=0.9,
-                reasoning=f"Fact check {i}",
-                sources=["https://example.com"],
+        now: datetime = datetime.now(timezone.utc)
+        # Latencies 1..10 hours published recently, plus one outside the window
+        for hours, published_at in [(h, now - timedelta(days=1)) for h in range(1, 11)] + [
+            (100, now - timedelta(days=200))
+        ]:
+            db_session.add(
+                Submission(
+                    user_id=user.id,
+                    content=f"Published after {hours}h",
+                    submission_type="text",
+                    workflow_state=WorkflowState.PUBLISHED,
+                    published_at=published_at,
+                    publication_latency_seconds=hours * 3600.0,
+                )
             )
-            db_session.add(fc)
+        # Unpublished submissions are ignored
+        db_session.add(Submission(user_id=user.id, content="Pending", submission_type="text"))
         await db_session.commit()
 
         service: AnalyticsService = AnalyticsService(db_session)
-        result: dict[str, Any] = await service.get_time_to_publication_metrics()
+        result: dict[str, Any] = await service.get_time_to_publication_metrics(days=90)
 
-        # Assert structure
-        assert "average_hours" in result
-        assert "median_hours" in result
-        assert "min_hours" in result
-        assert "max_hours" in result
-        assert "total_published" in result
-        assert result["total_published"] == 3
+        assert result["total_published"] == 10
+        assert result["average_hours"] == 5.5
+        assert result["median_hours"] == 5.5
+        assert result["p90_hours"] == 9.1
+        assert result["p99_hours"] == 9.91
+        assert result["min_hours"] == 1.0
+        assert result["max_hours"] == 10.0
+
+        wider: dict[str, Any] = await service.get_time_to_publication_metrics(days=365)
+        assert wider["total_published"] == 11
+        assert wider["max_hours"] == 100.0
 
     @pytest.mark.asyncio
     async def test_get_time_to_publication_metrics_empty_database(
@@ -197,6 +204,7 @@ class TestAnalyticsServiceTimeToPublication:
 
         assert result["average_hours"] == 0.0
         assert result["median_hours"] == 0.0
+        assert result["p99_hours"] == 0.0
         assert result["total_published"] == 0
 
 
@@ -723,3 +731,100 @@ class TestAnalyticsServiceDashboard:
         # Verify data is populated
         assert result["monthly_fact_checks"]["total_count"] >= 1
         assert result["rating_distribution"]["total_count"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_get_dashboard_runs_six_aggregate_queries(self, db_session: AsyncSession) -> None:
+        """Test the dashboard costs a fixed handful of statements and matches each metric."""
+        from app.services.analytics_service import AnalyticsService
+
+        claim: Claim = Claim(content="Dashboard claim", source="test")
+        db_session.add(claim)
+        await db_session.commit()
+        await db_session.refresh(claim)
+
+        for i, verdict in enumerate(["true", "false", "false"]):
+            fc: FactCheck = FactCheck(
+                claim_id=claim.id,
+                verdict=verdict,
+                confidence=0.9,
+                reasoning=f"Fact check {i}",
+                sources=["https://example.com"],
+                sources_count=i + 1,
+            )
+            db_session.add(fc)
+            await db_session.flush()
+            db_session.add(
+                Source(
+                    fact_check_id=fc.id,
+                    source_type=SourceType.PRIMARY,
+                    title=f"Source {i}",
+                    url="https://example.com",
+                    access_date=date.today(),
+                    credibility_score=i + 2,
+                    relevance=SourceRelevance.SUPPORTS if i else None,
+                )
+            )
+            db_session.add(
+                Correction(
+                    fact_check_id=fc.id,
+                    correction_type=CorrectionType.MINOR,
+                    request_details=f"Correction {i}",
+                    status=CorrectionStatus.ACCEPTED if i else CorrectionStatus.PENDING,
+                )
+            )
+        await db_session.commit()
+
+        service: AnalyticsService = AnalyticsService(db_session)
+        with count_queries(db_session) as queries:
+            result: dict[str, Any] = await service.get_dashboard()
+
+        assert queries.count == 6, queries.statements
+        assert result["source_quality"] == await service.get_source_quality_metrics()
+        assert result["correction_rate"] == await service.get_correction_rate_metrics()
+        assert result["rating_distribution"] == await service.get_rating_distribution()
+        assert result["source_quality"]["average_credibility_score"] == 3.0
+        assert result["source_quality"]["sources_by_relevance"] == {"supports": 2}
+        assert result["correction_rate"]["corrections_accepted"] == 2
+        assert result["efcsn_compliance"]["checklist"][1]["value"] == "66.7%"
+
+    @pytest.mark.asyncio
+    async def test_get_monthly_fact_check_counts_buckets_by_month(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test fact-checks land in their own calendar month and older ones are excluded."""
+        from app.services.analytics_service import AnalyticsService, _month_start
+
+        claim: Claim = Claim(content="Monthly claim", source="test")
+        db_session.add(claim)
+        await db_session.commit()
+        await db_session.refresh(claim)
+
+        now: datetime = datetime.now(timezone.utc)
+        created: list[datetime] = [
+            now,
+            _month_start(now, 1) + timedelta(days=2),
+            _month_start(now, 1) + timedelta(days=3),
+            _month_start(now, 5),
+        ]
+        for i, created_at in enumerate(created):
+            db_session.add(
+                FactCheck(
+                    claim_id=claim.id,
+                    verdict="true",
+                    confidence=0.9,
+                    reasoning=f"Fact check {i}",
+                    sources=[],
+                    created_at=created_at,
+                )
+            )
+        await db_session.commit()
+
+        service: AnalyticsService = AnalyticsService(db_session)
+        result: dict[str, Any] = await service.get_monthly_fact_check_counts(months=3)
+
+        assert [m["count"] for m in result["months"]] == [1, 2, 0]
+        assert result["total_count"] == 3
+        assert (result["months"][1]["year"], result["months"][1]["month"]) == (
+            _month_start(now, 1).year,
+            _month_start(now, 1).month,
+        )
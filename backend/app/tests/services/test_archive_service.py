@@ -145,7 +145,7 @@ class TestWaybackMachineArchiving:
             "Content-Location": "/web/20251231120000/https://example.com/article"
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -168,7 +168,7 @@ class TestWaybackMachineArchiving:
         mock_response.status_code = 200
         mock_response.headers = {"Content-Location": "/web/20251231120000/https://example.com/page"}
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -191,7 +191,7 @@ class TestWaybackMachineArchiving:
             "Location": "https://web.archive.org/web/20251231/https://example.com"
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -222,7 +222,7 @@ class TestRetryLogic:
             response.headers = {"Content-Location": "/web/20251231/https://example.com"}
             return response
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get = mock_get
             mock_instance.__aenter__.return_value = mock_instance
@@ -249,7 +249,7 @@ class TestRetryLogic:
             response.headers = {"Content-Location": "/web/20251231/https://example.com"}
             return response
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get = mock_get
             mock_instance.__aenter__.return_value = mock_instance
@@ -285,7 +285,7 @@ class TestRetryLogic:
                 response.raise_for_status = MagicMock()
             return response
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get = mock_get
             mock_instance.__aenter__.return_value = mock_instance
@@ -300,7 +300,7 @@ class TestRetryLogic:
     @pytest.mark.asyncio
     async def test_archive_url_fails_after_max_retries(self) -> None:
         """Test that archive_url fails after exhausting all retries."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.side_effect = httpx.ConnectError("Connection failed")
             mock_instance.__aenter__.return_value = mock_instance
@@ -323,7 +323,7 @@ class TestRetryLogic:
             delays.append(delay)
 
         with (
-            patch("httpx.AsyncClient") as mock_client,
+            patch("app.services.archive_service.get_http_client") as mock_client,
             patch("asyncio.sleep", side_effect=mock_sleep),
         ):
             mock_instance = AsyncMock()
@@ -350,7 +350,7 @@ class TestErrorHandling:
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
@@ -371,7 +371,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_archive_url_handles_network_error_gracefully(self) -> None:
         """Test that network errors are handled gracefully."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.side_effect = httpx.RequestError("Network unreachable")
             mock_instance.__aenter__.return_value = mock_instance
@@ -387,7 +387,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_archive_url_returns_result_not_raises_on_failure(self) -> None:
         """Test that failures return ArchiveResult, not raise exceptions."""
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.side_effect = Exception("Unexpected error")
             mock_instance.__aenter__.return_value = mock_instance
@@ -422,7 +422,7 @@ class TestExistingArchiveCheck:
 
         service = ArchiveService()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -443,7 +443,7 @@ class TestExistingArchiveCheck:
 
         service = ArchiveService()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -475,7 +475,7 @@ class TestArchiveServiceClass:
 
         service = ArchiveService()
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -498,7 +498,7 @@ class TestModuleLevelFunction:
         mock_response.status_code = 200
         mock_response.headers = {"Content-Location": "/web/20251231/https://example.com"}
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -516,7 +516,7 @@ class TestModuleLevelFunction:
         mock_response.status_code = 200
         mock_response.headers = {"Content-Location": "/web/20251231/https://example.com"}
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -546,7 +546,7 @@ class TestEdgeCases:
         mock_response.status_code = 200
         mock_response.headers = {"Content-Location": f"/web/20251231/{long_url}"}
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -566,7 +566,7 @@ class TestEdgeCases:
         mock_response.status_code = 200
         mock_response.headers = {"Content-Location": f"/web/20251231/{special_url}"}
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -588,7 +588,7 @@ class TestEdgeCases:
             "Content-Location": "/web/20251231/https://example.com/path/%E6%97%A5%E6%9C%AC%E8%AA%9E"
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -606,7 +606,7 @@ class TestEdgeCases:
         mock_response.status_code = 200
         mock_response.headers = {}  # No Content-Location
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -626,7 +626,7 @@ class TestEdgeCases:
         mock_response.status_code = 200
         mock_response.headers = {"Content-Location": "/web/20251231/https://example.com"}
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -653,7 +653,7 @@ class TestSourceArchivingIntegration:
             "Content-Location": "/web/20251231/https://source.example.com/article"
         }
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.return_value = mock_response
             mock_instance.__aenter__.return_value = mock_instance
@@ -690,7 +690,7 @@ class TestSourceArchivingIntegration:
         """Test that archive_source_url handles failures gracefully."""
         from app.services.archive_service import archive_source_url
 
-        with patch("httpx.AsyncClient") as mock_client:
+        with patch("app.services.archive_service.get_http_client") as mock_client:
             mock_instance = AsyncMock()
             mock_instance.get.side_effect = httpx.ConnectError("Connection failed")
             mock_instance.__aenter__.return_value = mock_instance
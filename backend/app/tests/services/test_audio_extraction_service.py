@@ -5,14 +5,21 @@ Following TDD approach: Tests written FIRST before implementation
 Issue #175: Audio Extraction and Whisper Transcription
 """
 
+from collections.abc import Iterator
+from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
+from app.core.http_clients import HttpClientRegistry
 from app.services.audio_extraction_service import (
+    AudioChunk,
     AudioExtractionError,
     AudioExtractionResult,
     AudioExtractionService,
+    parse_silences,
+    plan_chunks,
 )
 
 
@@ -283,3 +290,223 @@ class TestSupportedFormats:
         supported: list[str] = audio_service.SUPPORTED_FORMATS
         assert "mp3" in supported
         assert "wav" in supported
+
+
+class TestSilenceAwareChunking:
+    """Test splitting long audio at silence boundaries"""
+
+    @pytest.fixture
+    def audio_service(self) -> AudioExtractionService:
+        """Provide AudioExtractionService instance"""
+        with patch.dict("os.environ", {"MEDIA_DIR": "/tmp/test_media"}):
+            with patch("pathlib.Path.mkdir"):
+                return AudioExtractionService()
+
+    def test_parse_silences(self) -> None:
+        """Test silencedetect output is parsed into intervals"""
+        output: str = (
+            "[silencedetect @ 0x1] silence_start: 12.5\n"
+            "[silencedetect @ 0x1] silence_end: 13.5 | silence_duration: 1\n"
+            "size=N/A time=00:01:00.00\n"
+            "[silencedetect @ 0x1] silence_start: -0.01\n"
+            "[silencedetect @ 0x1] silence_end: 0.8 | silence_duration: 0.81\n"
+        )
+
+        assert parse_silences(output) == [(12.5, 13.5), (0.0, 0.8)]
+
+    def test_plan_chunks_cuts_at_last_silence_in_window(self) -> None:
+        """Test chunks end in the middle of the latest usable silence"""
+        silences: list[tuple[float, float]] = [(100.0, 102.0), (250.0, 252.0), (580.0, 582.0)]
+
+        chunks = plan_chunks(1000.0, silences, max_chunk_seconds=600.0, min_chunk_seconds=60.0)
+
+        assert chunks == [(0.0, 581.0), (581.0, 1000.0)]
+
+    def test_plan_chunks_hard_cut_without_silence(self) -> None:
+        """Test chunks are cut at the maximum length when no silence is found"""
+        chunks = plan_chunks(1300.0, [], max_chunk_seconds=600.0, min_chunk_seconds=60.0)
+
+        assert chunks == [(0.0, 600.0), (600.0, 1200.0), (1200.0, 1300.0)]
+
+    def test_plan_chunks_ignores_silence_before_minimum(self) -> None:
+        """Test silences too close to the chunk start do not produce tiny chunks"""
+        chunks = plan_chunks(700.0, [(10.0, 12.0)], max_chunk_seconds=600.0, min_chunk_seconds=60.0)
+
+        assert chunks == [(0.0, 600.0), (600.0, 700.0)]
+
+    @pytest.mark.asyncio
+    async def test_split_audio_short_file_is_single_chunk(
+        self, audio_service: AudioExtractionService
+    ) -> None:
+        """Test audio under the limit is not re-cut"""
+        with patch.object(audio_service, "get_duration", new_callable=AsyncMock) as mock_duration:
+            mock_duration.return_value = 42.0
+            with patch.object(audio_service, "_cut_chunk", new_callable=AsyncMock) as mock_cut:
+                chunks: list[AudioChunk] = await audio_service.split_audio(
+                    "/tmp/a.mp3", max_chunk_seconds=600.0
+                )
+
+        assert chunks == [AudioChunk(audio_path="/tmp/a.mp3", start_seconds=0.0, end_seconds=42.0)]
+        mock_cut.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_split_audio_long_file(self, audio_service: AudioExtractionService) -> None:
+        """Test long audio is cut into chunk files next to the source"""
+        with (
+            patch.object(audio_service, "get_duration", new_callable=AsyncMock) as mock_duration,
+            patch.object(audio_service, "detect_silences", new_callable=AsyncMock) as mock_silences,
+            patch.object(audio_service, "_cut_chunk", new_callable=AsyncMock) as mock_cut,
+        ):
+            mock_duration.return_value = 900.0
+            mock_silences.return_value = [(400.0, 402.0)]
+
+            chunks: list[AudioChunk] = await audio_service.split_audio(
+                "/tmp/media/clip.mp3", max_chunk_seconds=600.0
+            )
+
+        assert [(c.start_seconds, c.end_seconds) for c in chunks] == [
+            (0.0, 401.0),
+            (401.0, 900.0),
+        ]
+        assert chunks[0].audio_path == "/tmp/media/clip.part000.mp3"
+        assert mock_cut.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cleanup_chunks_keeps_source(self, audio_service: AudioExtractionService) -> None:
+        """Test chunk cleanup never removes the source audio file"""
+        chunks: list[AudioChunk] = [
+            AudioChunk(audio_path="/tmp/a.mp3", start_seconds=0.0, end_seconds=1.0),
+            AudioChunk(audio_path="/tmp/a.part001.mp3", start_seconds=1.0, end_seconds=2.0),
+        ]
+
+        with patch.object(
+            audio_service, "cleanup_audio_file", new_callable=AsyncMock
+        ) as mock_cleanup:
+            await audio_service.cleanup_chunks(chunks, keep="/tmp/a.mp3")
+
+        mock_cleanup.assert_called_once_with("/tmp/a.part001.mp3")
+
+
+class TestStreamingExtraction:
+    """Test piping a remote video straight into FFmpeg"""
+
+    VIDEO_BYTES: bytes = b"fake-mp4-payload" * 10000
+
+    @pytest.fixture
+    def audio_service(self, tmp_path: Path) -> AudioExtractionService:
+        """Provide AudioExtractionService writing into a temporary media dir"""
+        with patch.dict("os.environ", {"MEDIA_DIR": str(tmp_path)}):
+            return AudioExtractionService()
+
+    @pytest.fixture
+    def mock_http(self) -> Iterator[list[str]]:
+        """Serve VIDEO_BYTES for every request and record requested URLs"""
+        requested: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(str(request.url))
+            return httpx.Response(200, content=self.VIDEO_BYTES)
+
+        registry = HttpClientRegistry(http2=False, transport=httpx.MockTransport(handler))
+        with patch("app.core.http_clients._registry", registry):
+            yield requested
+
+    @pytest.mark.asyncio
+    async def test_stream_pipes_http_body_into_ffmpeg(
+        self, audio_service: AudioExtractionService, mock_http: list[str]
+    ) -> None:
+        """Test the whole response body reaches FFmpeg's stdin and no video is stored"""
+        with patch.object(
+            audio_service,
+            "_stream_ffmpeg_command",
+            side_effect=lambda output_path, fmt: ["sh", "-c", f"cat > {output_path}"],
+        ):
+            result: AudioExtractionResult = await audio_service.extract_audio_from_stream(
+                "https://cdn.example.com/video.mp4", "stream_1"
+            )
+
+        assert Path(result.audio_path).read_bytes() == self.VIDEO_BYTES
+        assert result.file_size_bytes == len(self.VIDEO_BYTES)
+        assert mock_http == ["https://cdn.example.com/video.mp4"]
+        assert not list(Path(audio_service.media_dir).glob("*.mp4"))
+
+    @pytest.mark.asyncio
+    async def test_stream_falls_back_to_temp_file(
+        self, audio_service: AudioExtractionService, mock_http: list[str]
+    ) -> None:
+        """Test unpipeable input is retried from a temporary file that is removed"""
+        seen: dict[str, bytes] = {}
+
+        async def extract_from_file(
+            video_path: str, spotlight_id: str, output_format: str
+        ) -> AudioExtractionResult:
+            seen["video"] = Path(video_path).read_bytes()
+            seen["path"] = video_path.encode()
+            return AudioExtractionResult("/tmp/out.mp3", "mp3", None, None)
+
+        with (
+            patch.object(
+                audio_service,
+                "_stream_ffmpeg_command",
+                return_value=[
+                    "sh",
+                    "-c",
+                    "cat > /dev/null; echo 'pipe:0: moov atom not found' >&2; exit 1",
+                ],
+            ),
+            patch.object(audio_service, "extract_audio_from_video", side_effect=extract_from_file),
+        ):
+            result: AudioExtractionResult = await audio_service.extract_audio_from_stream(
+                "https://cdn.example.com/video.mp4", "stream_2"
+            )
+
+        assert result.audio_path == "/tmp/out.mp3"
+        assert seen["video"] == self.VIDEO_BYTES
+        assert not Path(seen["path"].decode()).exists()
+        assert len(mock_http) == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_ffmpeg_failure_is_not_retried(
+        self, audio_service: AudioExtractionService, mock_http: list[str]
+    ) -> None:
+        """Test a video FFmpeg cannot decode at all is not downloaded a second time"""
+        with patch.object(
+            audio_service,
+            "_stream_ffmpeg_command",
+            return_value=[
+                "sh",
+                "-c",
+                "cat > /dev/null; echo 'Output file #0 does not contain any stream' >&2; exit 1",
+            ],
+        ):
+            with pytest.raises(AudioExtractionError, match="does not contain any stream"):
+                await audio_service.extract_audio_from_stream(
+                    "https://cdn.example.com/video.mp4", "stream_4"
+                )
+
+        assert len(mock_http) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_http_error_raises(self, audio_service: AudioExtractionService) -> None:
+        """Test download failures surface as AudioExtractionError"""
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(404))
+        registry = HttpClientRegistry(http2=False, transport=transport)
+        with (
+            patch("app.core.http_clients._registry", registry),
+            patch.object(
+                audio_service,
+                "_stream_ffmpeg_command",
+                return_value=["sh", "-c", "cat > /dev/null"],
+            ),
+        ):
+            with pytest.raises(AudioExtractionError, match="Failed to download video"):
+                await audio_service.extract_audio_from_stream(
+                    "https://cdn.example.com/missing.mp4", "stream_3"
+                )
+
+    @pytest.mark.asyncio
+    async def test_stream_invalid_url(self, audio_service: AudioExtractionService) -> None:
+        """Test invalid URLs are rejected before starting FFmpeg"""
+        with pytest.raises(AudioExtractionError, match="Invalid URL"):
+            await audio_service.extract_audio_from_stream("not-a-url", "stream_4")
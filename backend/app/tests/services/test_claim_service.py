@@ -0,0 +1,177 @@
+"""
+Tests for ClaimService claim processing pipeline
+
+Issue #176: LLM-based Claim Extraction - Deduplication using vector similarity
+
+Tests that extracted claims are embedded, deduplicated in a single batched
+similarity query, and stored or linked to existing claims.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.claim import Claim
+from app.services.claim_service import ClaimService
+from app.services.claim_similarity_service import SimilarClaim
+from app.services.embedding_service import EmbeddingService, EmbeddingServiceError
+from app.services.llm_claim_extraction_service import ClaimExtractionResult, ExtractedClaim
+
+
+def _extracted(content: str) -> ExtractedClaim:
+    """Build an ExtractedClaim with default metadata"""
+    return ExtractedClaim(
+        content=content, confidence=0.9, source_type="transcription", language="en"
+    )
+
+
+@pytest.fixture
+def mock_llm_service() -> MagicMock:
+    """Provide an LLM service returning three extracted claims"""
+    service: MagicMock = MagicMock()
+    service.extract_claims = AsyncMock(
+        return_value=ClaimExtractionResult(
+            claims=[
+                _extracted("Vaccines cause autism"),
+                _extracted("The earth is flat"),
+                _extracted("5G spreads viruses"),
+            ],
+            language="en",
+            source_text="transcription",
+        )
+    )
+    return service
+
+
+@pytest.fixture
+def mock_embedding_service() -> MagicMock:
+    """Provide an embedding service returning orthogonal embeddings"""
+    service: MagicMock = MagicMock(spec=EmbeddingService)
+    vectors: dict[str, list[float]] = {
+        "Vaccines cause autism": [1.0, 0.0, 0.0],
+        "The earth is flat": [0.0, 1.0, 0.0],
+        "5G spreads viruses": [0.0, 0.0, 1.0],
+    }
+    service.generate_embeddings_batch = AsyncMock(
+        side_effect=lambda texts: [vectors[text] for text in texts]
+    )
+    service.cosine_similarity = EmbeddingService.cosine_similarity.__get__(service)
+    return service
+
+
+class TestExtractAndProcessClaims:
+    """Test the batched claim processing pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_all_claims_in_one_batch_call(
+        self,
+        db_session: AsyncSession,
+        mock_llm_service: MagicMock,
+        mock_embedding_service: MagicMock,
+    ) -> None:
+        """Test duplicate detection is one batched call and duplicates are linked"""
+        existing: Claim = Claim(content="Vaccines cause autism (older)", source="test")
+        db_session.add(existing)
+        await db_session.flush()
+
+        service: ClaimService = ClaimService(
+            db_session, llm_service=mock_llm_service, embedding_service=mock_embedding_service
+        )
+        service.similarity_service.find_duplicates_batch = AsyncMock(  # type: ignore[method-assign]
+            return_value=[
+                (
+                    True,
+                    SimilarClaim(claim_id=existing.id, content=existing.content, similarity=0.97),
+                ),
+                (False, None),
+                (False, None),
+            ]
+        )
+
+        result = await service.extract_and_process_claims(
+            transcription="some transcription", submission_id=uuid4()
+        )
+
+        mock_embedding_service.generate_embeddings_batch.assert_awaited_once()
+        service.similarity_service.find_duplicates_batch.assert_awaited_once()
+        embeddings = service.similarity_service.find_duplicates_batch.call_args.kwargs["embeddings"]
+        assert len(embeddings) == 3
+        assert result.claims[0].id == existing.id
+        assert result.duplicates_found == 1
+        assert result.new_claims_created == 2
+        assert result.errors == []
+
+    @pytest.mark.asyncio
+    async def test_links_duplicates_within_same_submission(
+        self,
+        db_session: AsyncSession,
+        mock_llm_service: MagicMock,
+        mock_embedding_service: MagicMock,
+    ) -> None:
+        """Test a claim repeated within one submission is stored only once"""
+        mock_llm_service.extract_claims.return_value = ClaimExtractionResult(
+            claims=[_extracted("The earth is flat"), _extracted("The earth is flat")],
+            language="en",
+            source_text="transcription",
+        )
+        service: ClaimService = ClaimService(
+            db_session, llm_service=mock_llm_service, embedding_service=mock_embedding_service
+        )
+        service.similarity_service.find_duplicates_batch = AsyncMock(  # type: ignore[method-assign]
+            return_value=[(False, None), (False, None)]
+        )
+
+        result = await service.extract_and_process_claims(
+            transcription="some transcription", submission_id=uuid4()
+        )
+
+        assert result.claims[0] is result.claims[1]
+        assert result.new_claims_created == 1
+        assert result.duplicates_found == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_deduplication_when_disabled(
+        self,
+        db_session: AsyncSession,
+        mock_llm_service: MagicMock,
+        mock_embedding_service: MagicMock,
+    ) -> None:
+        """Test deduplicate=False creates every claim without similarity queries"""
+        service: ClaimService = ClaimService(
+            db_session, llm_service=mock_llm_service, embedding_service=mock_embedding_service
+        )
+        service.similarity_service.find_duplicates_batch = AsyncMock()  # type: ignore[method-assign]
+
+        result = await service.extract_and_process_claims(
+            transcription="some transcription", submission_id=uuid4(), deduplicate=False
+        )
+
+        service.similarity_service.find_duplicates_batch.assert_not_called()
+        assert result.new_claims_created == 3
+        assert result.duplicates_found == 0
+
+    @pytest.mark.asyncio
+    async def test_creates_claims_without_embeddings_on_embedding_failure(
+        self,
+        db_session: AsyncSession,
+        mock_llm_service: MagicMock,
+        mock_embedding_service: MagicMock,
+    ) -> None:
+        """Test claims are still created when the batch embedding request fails"""
+        mock_embedding_service.generate_embeddings_batch.side_effect = EmbeddingServiceError(
+            "rate limited"
+        )
+        service: ClaimService = ClaimService(
+            db_session, llm_service=mock_llm_service, embedding_service=mock_embedding_service
+        )
+        service.similarity_service.find_duplicates_batch = AsyncMock()  # type: ignore[method-assign]
+
+        result = await service.extract_and_process_claims(
+            transcription="some transcription", submission_id=uuid4()
+        )
+
+        service.similarity_service.find_duplicates_batch.assert_not_called()
+        assert result.new_claims_created == 3
+        assert all(claim.embedding is None for claim in result.claims)
@@ -8,7 +8,7 @@ Tests claim similarity search and deduplication using pgvector cosine similarity
 """
 
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
@@ -21,6 +21,17 @@ from app.services.claim_similarity_service import (
 )
 
 
+def postgres_session_mock() -> AsyncMock:
+    """Mock session that reports a PostgreSQL bind so pgvector SQL is used"""
+    db: AsyncMock = AsyncMock()
+    db.get_bind = MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    result = MagicMock()
+    result.fetchall.return_value = []
+    db.execute.return_value = result
+    return db
+
+
 class TestClaimSimilarityServiceInitialization:
     """Test ClaimSimilarityService initialization"""
 
@@ -337,17 +348,12 @@ class TestFindDuplicatesForClaims:
         existing_claim_id = uuid4()
 
         with patch.object(
-            similarity_service, "is_duplicate", new_callable=AsyncMock
-        ) as mock_is_dup:
+            similarity_service, "_query_duplicates_batch", new_callable=AsyncMock
+        ) as mock_query:
             # First claim is duplicate, others are unique
-            mock_is_dup.side_effect = [
-                (
-                    True,
-                    SimilarClaim(claim_id=existing_claim_id, content="Existing", similarity=0.95),
-                ),
-                (False, None),
-                (False, None),
-            ]
+            mock_query.return_value = {
+                0: SimilarClaim(claim_id=existing_claim_id, content="Existing", similarity=0.95),
+            }
 
             # Act
             results: list[tuple[bool, Any]] = await similarity_service.find_duplicates_batch(
@@ -357,8 +363,10 @@ class TestFindDuplicatesForClaims:
             # Assert
             assert len(results) == 3
             assert results[0][0] is True  # First is duplicate
-            assert results[1][0] is False  # Second is unique
-            assert results[2][0] is False  # Third is unique
+            assert results[0][1].claim_id == existing_claim_id
+            assert results[1] == (False, None)  # Second is unique
+            assert results[2] == (False, None)  # Third is unique
+            mock_query.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_find_duplicates_empty_list(
@@ -373,3 +381,177 @@ class TestFindDuplicatesForClaims:
 
         # Assert
         assert results == []
+
+    @pytest.mark.asyncio
+    async def test_find_duplicates_batch_uses_single_statement(self) -> None:
+        """Test all query vectors are sent to the database in one statement"""
+        mock_db: AsyncMock = postgres_session_mock()
+        result = MagicMock()
+        existing_claim_id = uuid4()
+        result.fetchall.return_value = [(1, existing_claim_id, "Existing", 0.97)]
+        mock_db.execute.return_value = result
+        service: ClaimSimilarityService = ClaimSimilarityService(mock_db)
+
+        results = await service.find_duplicates_batch(
+            embeddings=[[0.1] * 4, [0.2] * 4, [0.3] * 4],
+            search_mode="exact",
+        )
+
+        mock_db.execute.assert_called_once()
+        sql: str = str(mock_db.execute.call_args.args[0])
+        params: dict[str, Any] = mock_db.execute.call_args.args[1]
+        assert "CROSS JOIN LATERAL" in sql
+        assert sql.count("CAST(:embedding_") == 3
+        assert params["embedding_2"] == "[0.3,0.3,0.3,0.3]"
+        assert results[0] == (False, None)
+        is_dup, match = results[1]
+        assert is_dup is True
+        assert match is not None
+        assert match.claim_id == existing_claim_id
+        assert results[2] == (False, None)
+
+
+class TestSearchModes:
+    """Test exact vs. approximate (HNSW) search query construction"""
+
+    @pytest.fixture
+    def mock_db(self) -> AsyncMock:
+        """Provide a mock database session that records executed statements"""
+        return postgres_session_mock()
+
+    @pytest.mark.asyncio
+    async def test_ann_mode_orders_by_distance_and_sets_ef_search(self, mock_db: AsyncMock) -> None:
+        """Test ANN mode sets per-transaction index params and uses the index-friendly query"""
+        service: ClaimSimilarityService = ClaimSimilarityService(mock_db)
+
+        await service.find_similar_claims(
+            embedding=[0.1] * 1536,
+            threshold=0.85,
+            limit=5,
+            search_mode="ann",
+            ef_search=100,
+            probes=10,
+        )
+
+        assert mock_db.execute.call_count == 2
+        settings_call, query_call = mock_db.execute.call_args_list
+        assert "set_config('hnsw.ef_search'" in str(settings_call.args[0])
+        assert settings_call.args[1] == {"ef_search": "100", "probes": "10"}
+        sql: str = str(query_call.args[0])
+        assert "ORDER BY embedding <=> :embedding" in sql
+        assert "AS nearest" in sql
+
+    @pytest.mark.asyncio
+    async def test_ann_mode_raises_ef_search_to_limit(self, mock_db: AsyncMock) -> None:
+        """Test ef_search is never lower than the requested result count"""
+        service: ClaimSimilarityService = ClaimSimilarityService(mock_db)
+
+        await service.find_similar_claims(
+            embedding=[0.1] * 1536, limit=50, search_mode="ann", ef_search=10
+        )
+
+        settings_call = mock_db.execute.call_args_list[0]
+        assert settings_call.args[1]["ef_search"] == "50"
+
+    @pytest.mark.asyncio
+    async def test_exact_mode_uses_threshold_scan(self, mock_db: AsyncMock) -> None:
+        """Test exact mode issues a single threshold-filtered query"""
+        service: ClaimSimilarityService = ClaimSimilarityService(mock_db)
+
+        await service.find_similar_claims(embedding=[0.1] * 1536, search_mode="exact")
+
+        mock_db.execute.assert_called_once()
+        sql: str = str(mock_db.execute.call_args.args[0])
+        assert "1 - (embedding <=> :embedding) >= :threshold" in sql
+        assert "set_config" not in sql
+
+    @pytest.mark.asyncio
+    async def test_default_search_mode_from_settings(self, mock_db: AsyncMock) -> None:
+        """Test search mode defaults to the configured value"""
+        with patch("app.services.claim_similarity_service.settings") as mock_settings:
+            mock_settings.CLAIM_SIMILARITY_THRESHOLD = 0.85
+            mock_settings.CLAIM_SIMILARITY_SEARCH_MODE = "exact"
+            service: ClaimSimilarityService = ClaimSimilarityService(mock_db)
+
+        await service.find_similar_claims(embedding=[0.1] * 1536)
+
+        mock_db.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalid_search_mode_raises(self, mock_db: AsyncMock) -> None:
+        """Test unknown search modes are rejected"""
+        service: ClaimSimilarityService = ClaimSimilarityService(mock_db)
+
+        with pytest.raises(ValueError, match="Invalid search mode"):
+            await service.find_similar_claims(embedding=[0.1] * 1536, search_mode="brute")
+
+
+class TestInMemoryFallback:
+    """Test the NumPy search used when pgvector is not available (SQLite)"""
+
+    @staticmethod
+    def _vector(hot: int) -> list[float]:
+        """Build a 1536-dimension vector dominated by one component"""
+        vector: list[float] = [0.01] * 1536
+        vector[hot] = 1.0
+        return vector
+
+    @pytest.fixture
+    async def stored_claims(self, db_session: AsyncSession) -> list[Claim]:
+        """Store claims with embeddings plus one claim without"""
+        claims: list[Claim] = [
+            Claim(content="Claim A", source="test", embedding=self._vector(0)),
+            Claim(content="Claim B", source="test", embedding=self._vector(1)),
+            Claim(content="No embedding", source="test"),
+        ]
+        db_session.add_all(claims)
+        await db_session.commit()
+        return claims
+
+    @pytest.mark.asyncio
+    async def test_find_similar_claims_uses_in_memory_index(
+        self, db_session: AsyncSession, stored_claims: list[Claim]
+    ) -> None:
+        """Test similar claims are found without pgvector"""
+        service: ClaimSimilarityService = ClaimSimilarityService(db_session)
+
+        results: list[SimilarClaim] = await service.find_similar_claims(
+            embedding=self._vector(0), threshold=0.9
+        )
+
+        assert len(results) == 1
+        assert results[0].claim_id == stored_claims[0].id
+        assert results[0].content == "Claim A"
+        assert results[0].similarity == pytest.approx(1.0, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_find_similar_claims_excludes_claim(
+        self, db_session: AsyncSession, stored_claims: list[Claim]
+    ) -> None:
+        """Test exclude_claim_id is honoured by the fallback"""
+        service: ClaimSimilarityService = ClaimSimilarityService(db_session)
+
+        results: list[SimilarClaim] = await service.find_similar_claims(
+            embedding=self._vector(0),
+            threshold=0.0,
+            exclude_claim_id=stored_claims[0].id,
+        )
+
+        assert [r.claim_id for r in results] == [stored_claims[1].id]
+
+    @pytest.mark.asyncio
+    async def test_find_duplicates_batch_uses_in_memory_index(
+        self, db_session: AsyncSession, stored_claims: list[Claim]
+    ) -> None:
+        """Test batched duplicate detection without pgvector"""
+        service: ClaimSimilarityService = ClaimSimilarityService(db_session)
+
+        results = await service.find_duplicates_batch(
+            embeddings=[self._vector(1), self._vector(5)], threshold=0.9
+        )
+
+        is_dup, match = results[0]
+        assert is_dup is True
+        assert match is not None
+        assert match.claim_id == stored_claims[1].id
+        assert results[1] == (False, None)
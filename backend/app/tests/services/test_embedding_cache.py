@@ -0,0 +1,144 @@
+"""
+Tests for the two-tier content-addressed embedding cache
+
+Issue #176: LLM-based Claim Extraction - Embedding generation for similarity search
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.embedding_cache import (
+    REDIS_KEY_PREFIX,
+    EmbeddingCache,
+    make_cache_key,
+    pack_embedding,
+    unpack_embedding,
+)
+from app.services.embedding_service import EmbeddingService
+
+
+class TestCacheKeys:
+    """Test content-addressed cache keys and float32 packing"""
+
+    def test_key_ignores_whitespace_differences(self) -> None:
+        """Test trivially different texts share a cache key"""
+        assert make_cache_key("m", 1536, "Vaccines  cause\nautism ") == make_cache_key(
+            "m", 1536, "Vaccines cause autism"
+        )
+
+    def test_key_depends_on_model_and_dimensions(self) -> None:
+        """Test embeddings from different models never collide"""
+        text: str = "Vaccines cause autism"
+        assert make_cache_key("a", 1536, text) != make_cache_key("b", 1536, text)
+        assert make_cache_key("a", 1536, text) != make_cache_key("a", 512, text)
+
+    def test_pack_roundtrip_is_float32(self) -> None:
+        """Test vectors are stored as 4 bytes per dimension"""
+        data: bytes = pack_embedding([0.5, -0.25, 1.0])
+        assert len(data) == 12
+        assert unpack_embedding(data) == [0.5, -0.25, 1.0]
+
+
+class TestMemoryTier:
+    """Test the in-process LRU tier"""
+
+    @pytest.mark.asyncio
+    async def test_set_then_get_hits_memory(self) -> None:
+        """Test stored embeddings are served from memory"""
+        cache: EmbeddingCache = EmbeddingCache(max_entries=10, ttl_seconds=60)
+        await cache.set("k", [0.5, 0.25])
+
+        assert await cache.get("k") == [0.5, 0.25]
+        assert await cache.get("other") is None
+        assert cache.stats()["memory_hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test capacity is enforced by evicting the LRU entry"""
+        cache: EmbeddingCache = EmbeddingCache(max_entries=2, ttl_seconds=60)
+        await cache.set("a", [1.0])
+        await cache.set("b", [2.0])
+        await cache.get("a")  # a is now most recently used
+        await cache.set("c", [3.0])
+
+        assert await cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_not_served(self) -> None:
+        """Test entries past their TTL are treated as misses"""
+        cache: EmbeddingCache = EmbeddingCache(max_entries=10, ttl_seconds=60)
+        with patch("app.services.embedding_cache.time.monotonic", return_value=1000.0):
+            await cache.set("k", [1.0])
+        with patch("app.services.embedding_cache.time.monotonic", return_value=1061.0):
+            assert await cache.get("k") is None
+
+
+class TestRedisTier:
+    """Test the shared Redis tier"""
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_is_promoted_to_memory(self, test_redis_client: Any) -> None:
+        """Test entries written by another worker are found in Redis"""
+        writer: EmbeddingCache = EmbeddingCache(redis_client=test_redis_client, ttl_seconds=60)
+        reader: EmbeddingCache = EmbeddingCache(redis_client=test_redis_client, ttl_seconds=60)
+        await writer.set("k", [0.5, 0.25])
+
+        assert await reader.get("k") == [0.5, 0.25]
+        assert await reader.get("k") == [0.5, 0.25]
+        assert reader.stats()["redis_hits"] == 1
+        assert reader.stats()["memory_hits"] == 1
+        assert await test_redis_client.ttl(REDIS_KEY_PREFIX + "k") > 0
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_degrade_to_memory_only(self) -> None:
+        """Test a failing Redis never fails the lookup"""
+        redis: MagicMock = MagicMock()
+        redis.mget = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache: EmbeddingCache = EmbeddingCache(redis_client=redis)
+
+        assert await cache.get("k") is None
+        assert cache.stats()["redis_errors"] == 1
+
+
+class TestEmbeddingServiceCaching:
+    """Test EmbeddingService only calls the API for cache misses"""
+
+    @pytest.fixture
+    def service(self) -> EmbeddingService:
+        """Provide an EmbeddingService with a memory-only cache"""
+        with patch("app.services.embedding_service.settings") as mock_settings:
+            mock_settings.OPENAI_API_KEY = "test-api-key"
+            mock_settings.OPENAI_EMBEDDING_MODEL = "text-embedding-3-small"
+            mock_settings.OPENAI_EMBEDDING_DIMENSIONS = 1536
+            return EmbeddingService(cache=EmbeddingCache(max_entries=100, ttl_seconds=60))
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_embedded_once(self, service: EmbeddingService) -> None:
+        """Test the same viral claim only costs one API call"""
+        with patch.object(service, "_call_embedding_api", new_callable=AsyncMock) as mock_call:
+            mock_call.return_value = [0.5, 0.25]
+            first: list[float] = await service.generate_embedding("Vaccines cause autism")
+            second: list[float] = await service.generate_embedding("Vaccines  cause autism")
+
+        assert first == second == [0.5, 0.25]
+        mock_call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_batch_only_requests_uncached_texts(self, service: EmbeddingService) -> None:
+        """Test batch embedding skips texts that are already cached"""
+        with patch.object(service, "_call_embedding_api", new_callable=AsyncMock) as mock_single:
+            mock_single.return_value = [1.0]
+            await service.generate_embedding("cached claim")
+
+        with patch.object(
+            service, "_call_embedding_api_batch", new_callable=AsyncMock
+        ) as mock_batch:
+            mock_batch.return_value = [[2.0]]
+            embeddings = await service.generate_embeddings_batch(["cached claim", "new claim"])
+
+        mock_batch.assert_awaited_once_with(["new claim"])
+        assert embeddings == [[1.0], [2.0]]
@@ -7,14 +7,17 @@ Issue #176: LLM-based Claim Extraction - Embedding generation for similarity sea
 Tests embedding generation and caching using text-embedding-3-small model.
 """
 
+import asyncio
 from typing import Generator
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from app.services.embedding_service import (
+    EmbeddingBatcher,
     EmbeddingService,
     EmbeddingServiceError,
+    chunk_texts_for_api,
 )
 
 
@@ -195,6 +198,98 @@ class TestEmbeddingGeneration:
         assert embeddings == []
 
 
+class TestBatchChunking:
+    """Test splitting batch requests under the embeddings API limits"""
+
+    def test_chunk_texts_respects_max_inputs(self) -> None:
+        """Test chunks never exceed the per-request input limit"""
+        chunks: list[list[str]] = chunk_texts_for_api(
+            [f"claim {i}" for i in range(5)], max_inputs=2
+        )
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert sum(chunks, []) == [f"claim {i}" for i in range(5)]
+
+    def test_chunk_texts_respects_max_tokens(self) -> None:
+        """Test chunks never exceed the per-request token budget"""
+        texts: list[str] = ["a" * 400, "b" * 400, "c" * 400]  # ~100 tokens each
+        chunks: list[list[str]] = chunk_texts_for_api(texts, max_tokens=250)
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_batch_splits_large_requests(self) -> None:
+        """Test oversized batches are sent as several API calls in order"""
+        with patch("app.services.embedding_service.settings") as mock_settings:
+            mock_settings.OPENAI_API_KEY = "test-api-key"
+            service: EmbeddingService = EmbeddingService()
+
+        with (
+            patch("app.services.embedding_service.MAX_INPUTS_PER_REQUEST", 2),
+            patch.object(service, "_call_embedding_api_batch", new_callable=AsyncMock) as mock_call,
+        ):
+            mock_call.side_effect = lambda texts: [[float(len(t))] for t in texts]
+            embeddings = await service.generate_embeddings_batch(["a", "bb", "ccc"])
+
+        assert mock_call.await_count == 2
+        assert embeddings == [[1.0], [2.0], [3.0]]
+
+
+class TestEmbeddingBatcher:
+    """Test coalescing of concurrent embedding requests"""
+
+    @pytest.fixture
+    def mock_service(self) -> MagicMock:
+        """Provide an embedding service whose batch call echoes text lengths"""
+        service: MagicMock = MagicMock()
+        service.generate_embeddings_batch = AsyncMock(
+            side_effect=lambda texts: [[float(len(t))] for t in texts]
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_api_call(self, mock_service: MagicMock) -> None:
+        """Test requests within the window are merged into one batch"""
+        batcher: EmbeddingBatcher = EmbeddingBatcher(mock_service, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("bb"), batcher.embed_many(["ccc", "dddd"])
+        )
+
+        assert list(results) == [[1.0], [2.0], [[3.0], [4.0]]]
+        mock_service.generate_embeddings_batch.assert_awaited_once()
+        assert batcher.requests_total == 4
+        assert batcher.batches_sent == 1
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self, mock_service: MagicMock) -> None:
+        """Test a batch at the input limit is flushed immediately"""
+        batcher: EmbeddingBatcher = EmbeddingBatcher(mock_service, window_seconds=60, max_inputs=2)
+
+        results = await asyncio.wait_for(batcher.embed_many(["a", "bb", "ccc", "dddd"]), 1)
+
+        assert results == [[1.0], [2.0], [3.0], [4.0]]
+        assert mock_service.generate_embeddings_batch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_api_error_is_propagated_to_every_caller(self, mock_service: MagicMock) -> None:
+        """Test a failed batch raises EmbeddingServiceError for all merged requests"""
+        mock_service.generate_embeddings_batch.side_effect = Exception("OpenAI API error")
+        batcher: EmbeddingBatcher = EmbeddingBatcher(mock_service, window_seconds=0.01)
+
+        results = await asyncio.gather(
+            batcher.embed("a"), batcher.embed("bb"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, EmbeddingServiceError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_empty_text_rejected(self, mock_service: MagicMock) -> None:
+        """Test empty text is rejected before being queued"""
+        batcher: EmbeddingBatcher = EmbeddingBatcher(mock_service, window_seconds=0.01)
+
+        with pytest.raises(EmbeddingServiceError, match="empty text"):
+            await batcher.embed("   ")
+
+
 class TestEmbeddingNormalization:
     """Test embedding normalization for cosine similarity"""
 
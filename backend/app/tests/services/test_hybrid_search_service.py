@@ -0,0 +1,174 @@
+"""
+Tests for hybrid full-text + vector claim search.
+
+Covers:
+- Reciprocal-rank fusion
+- Fusing lexical and vector matches (in-memory matching on SQLite)
+- Filters applied to both rankings
+- Filtered ANN statements on PostgreSQL
+"""
+
+from typing import Any, Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.claim import Claim
+from app.models.fact_check import FactCheck
+from app.services.claim_similarity_service import ClaimSimilarityService
+from app.services.embedding_service import EmbeddingServiceError
+from app.services.hybrid_search_service import (
+    HybridHit,
+    HybridSearchService,
+    reciprocal_rank_fusion,
+)
+from app.services.search_service import SearchFilters
+
+
+def _vector(hot: int) -> list[float]:
+    """Build a 1536-dimension vector dominated by one component"""
+    vector: list[float] = [0.01] * 1536
+    vector[hot] = 1.0
+    return vector
+
+
+async def _claim(
+    db: AsyncSession, content: str, hot: Optional[int], verdict: Optional[str] = None
+) -> Claim:
+    claim: Claim = Claim(
+        content=content, source="test", embedding=_vector(hot) if hot is not None else None
+    )
+    db.add(claim)
+    await db.flush()
+    if verdict is not None:
+        db.add(
+            FactCheck(
+                claim_id=claim.id,
+                verdict=verdict,
+                confidence=0.9,
+                reasoning="Checked",
+                sources=["https://example.com"],
+            )
+        )
+    await db.commit()
+    return claim
+
+
+def _embedding_batcher(embedding: list[float]) -> MagicMock:
+    batcher: MagicMock = MagicMock()
+    batcher.embed = AsyncMock(return_value=embedding)
+    return batcher
+
+
+class TestReciprocalRankFusion:
+    """Tests for the fusion formula"""
+
+    def test_claims_in_both_rankings_score_highest(self) -> None:
+        """Test a claim ranked by both lists beats the top of a single list"""
+        a, b, c = uuid4(), uuid4(), uuid4()
+
+        scores: dict[UUID, float] = reciprocal_rank_fusion([[a, b], [c, b]], k=60)
+
+        assert scores[b] == pytest.approx(2 / 62)
+        assert scores[a] == scores[c] == pytest.approx(1 / 61)
+        assert max(scores, key=lambda claim_id: scores[claim_id]) == b
+
+
+class TestHybridSearch:
+    """Tests for fusing lexical and vector matches"""
+
+    async def test_fuses_lexical_and_vector_matches(self, db_session: AsyncSession) -> None:
+        """Test lexical-only, vector-only and shared matches are all returned"""
+        both = await _claim(db_session, "5G masts spread the virus", 0, "false")
+        lexical_only = await _claim(db_session, "5G masts are everywhere", None)
+        vector_only = await _claim(db_session, "Radio towers cause covid", 0, "false")
+        await _claim(db_session, "Unrelated claim about cheese", 7)
+
+        with patch(
+            "app.services.hybrid_search_service.get_embedding_batcher",
+            return_value=_embedding_batcher(_vector(0)),
+        ):
+            hits: list[HybridHit] = await HybridSearchService(db_session).search("5G masts")
+
+        assert hits[0].claim_id == both.id
+        assert hits[0].lexical_rank is not None and hits[0].vector_rank is not None
+        assert {hit.claim_id for hit in hits[1:]} == {lexical_only.id, vector_only.id}
+        by_id: dict[UUID, HybridHit] = {hit.claim_id: hit for hit in hits}
+        assert by_id[lexical_only.id].vector_rank is None
+        assert by_id[vector_only.id].lexical_rank is None
+        assert by_id[vector_only.id].verdict == "false"
+        assert by_id[vector_only.id].content_highlight is None
+        assert by_id[vector_only.id].similarity == pytest.approx(1.0, abs=1e-4)
+
+    async def test_filters_apply_to_both_rankings(self, db_session: AsyncSession) -> None:
+        """Test a verdict filter removes lexical and vector matches alike"""
+        kept = await _claim(db_session, "5G masts spread the virus", 0, "false")
+        await _claim(db_session, "5G masts are safe", None, "true")
+        await _claim(db_session, "Radio towers are harmless", 0, "true")
+
+        with patch(
+            "app.services.hybrid_search_service.get_embedding_batcher",
+            return_value=_embedding_batcher(_vector(0)),
+        ):
+            hits: list[HybridHit] = await HybridSearchService(db_session).search(
+                "5G masts", filters=SearchFilters(verdict="false")
+            )
+
+        assert [hit.claim_id for hit in hits] == [kept.id]
+
+    async def test_limit_applies_after_fusion(self, db_session: AsyncSession) -> None:
+        """Test only the best fused results are returned"""
+        for i in range(4):
+            await _claim(db_session, f"Claim {i} about elections", i)
+
+        with patch(
+            "app.services.hybrid_search_service.get_embedding_batcher",
+            return_value=_embedding_batcher(_vector(2)),
+        ):
+            hits: list[HybridHit] = await HybridSearchService(db_session).search(
+                "elections", limit=2
+            )
+
+        assert len(hits) == 2
+        assert hits[0].claim_content == "Claim 2 about elections"
+
+    async def test_embedding_failure_propagates(self, db_session: AsyncSession) -> None:
+        """Test embedding errors reach the caller instead of degrading silently"""
+        batcher: MagicMock = MagicMock()
+        batcher.embed = AsyncMock(side_effect=EmbeddingServiceError("quota exceeded"))
+
+        with patch(
+            "app.services.hybrid_search_service.get_embedding_batcher", return_value=batcher
+        ):
+            with pytest.raises(EmbeddingServiceError):
+                await HybridSearchService(db_session).search("anything")
+
+
+class TestFilteredVectorStatements:
+    """Tests for filtered pgvector statements"""
+
+    async def test_filtered_ann_query_raises_ef_search(self) -> None:
+        """Test ANN filters land in the inner query and widen the candidate list"""
+        db: AsyncMock = AsyncMock()
+        db.get_bind = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        db.execute.return_value.fetchall = MagicMock(return_value=[])
+
+        await ClaimSimilarityService(db).find_similar_claims(
+            embedding=[0.1] * 1536,
+            limit=50,
+            search_mode="ann",
+            ef_search=40,
+            filters=SearchFilters(verdict="false"),
+        )
+
+        settings_call, query_call = db.execute.call_args_list
+        assert settings_call.args[1]["ef_search"] == "200"
+        sql: str = str(query_call.args[0])
+        params: dict[str, Any] = query_call.args[1]
+        assert "FROM claims c" in sql
+        assert "WHERE fv.claim_id = c.id ORDER BY fv.created_at DESC LIMIT 1" in sql
+        assert sql.index(":filter_verdict") < sql.index("AS nearest")
+        assert params["filter_verdict"] == "false"
@@ -0,0 +1,77 @@
+"""
+Tests for the Aho-Corasick keyword matcher.
+
+Covers:
+- Matching at word starts, including inflections, compounds and phrases
+- Overlapping keywords
+- Diacritic- and case-insensitive matching for Dutch text
+- Case-sensitive matchers
+"""
+
+from app.services.keyword_matcher import KeywordMatcher, fold_text
+
+
+class TestFoldText:
+    """Tests for diacritic and case folding"""
+
+    def test_strips_diacritics_and_case(self) -> None:
+        """Test accents, trema and the ij ligature fold to plain letters"""
+        assert fold_text("Reëel Café ĳsbeer") == "reeel cafe ijsbeer"
+
+    def test_case_sensitive_keeps_case(self) -> None:
+        """Test case is kept when requested"""
+        assert fold_text("Coördinatie", case_sensitive=True) == "Coordinatie"
+
+
+class TestKeywordMatcher:
+    """Tests for KeywordMatcher"""
+
+    def test_matches_at_word_start_only(self) -> None:
+        """Test keywords match inflected words but not text inside another word"""
+        matcher = KeywordMatcher(["law", "vote"])
+
+        assert matcher.matched("An outlaw and a bylaw, devoted") == set()
+        assert matcher.matched("New laws on who voted.") == {0, 1}
+
+    def test_stems_match_plurals_and_compounds(self) -> None:
+        """Test English plurals and Dutch compounds of a stem are found"""
+        matcher = KeywordMatcher(["election", "vaccine", "verkiezing", "belasting"])
+
+        assert matcher.matched("The elections were rigged") == {0}
+        assert matcher.matched("New vaccines are dangerous") == {1}
+        assert matcher.matched("De verkiezingscampagne en belastingverhoging") == {2, 3}
+
+    def test_overlapping_keywords_and_phrases(self) -> None:
+        """Test every keyword starting a word is reported, including prefixes of others"""
+        matcher = KeywordMatcher(["he", "she", "hers", "side effect"])
+
+        assert sorted(matcher.find("she said hers, side effects")) == [
+            (0, 9),
+            (1, 0),
+            (2, 9),
+            (3, 15),
+        ]
+
+    def test_dutch_diacritics_are_ignored(self) -> None:
+        """Test content and keywords match regardless of accents and case"""
+        matcher = KeywordMatcher(["coördinatie", "Tweede Kamer", "financiële steun"])
+
+        assert matcher.matched("COORDINATIE met de tweede kamer over financiele steun") == {
+            0,
+            1,
+            2,
+        }
+
+    def test_case_sensitive_matcher(self) -> None:
+        """Test a case-sensitive matcher still ignores diacritics but not case"""
+        matcher = KeywordMatcher(["CDA", "Ëerste"], case_sensitive=True)
+
+        assert matcher.matched("Het CDA en de cda") == {0}
+        assert matcher.matched("Eerste Kamer") == {1}
+
+    def test_blank_keywords_never_match(self) -> None:
+        """Test empty keywords are ignored instead of matching everywhere"""
+        matcher = KeywordMatcher(["", "  ", "vaccin"])
+
+        assert matcher.matched("Een vaccin") == {2}
+        assert matcher.matched("") == set()
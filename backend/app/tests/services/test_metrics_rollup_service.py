@@ -0,0 +1,246 @@
+"""
+Tests for the EFCSN analytics rollup tables.
+
+Covers:
+- Rollup deltas applied on ORM insert, update and delete
+- Rebuild (backfill) from the raw tables
+- Rollup repair after the retention service's bulk delete
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.claim import Claim
+from app.models.correction import Correction, CorrectionStatus, CorrectionType
+from app.models.fact_check import FactCheck
+from app.models.metrics_rollup import CorrectionRollup, FactCheckDailyRollup, SourceRollup
+from app.models.source import Source, SourceRelevance, SourceType
+from app.services.metrics_rollup_service import rebuild_metric_rollups
+
+
+async def _rollups(db: AsyncSession) -> dict[str, set[tuple[Any, ...]]]:
+    """Non-zero rows of every rollup table"""
+    fact_checks = await db.execute(
+        select(
+            FactCheckDailyRollup.day,
+            FactCheckDailyRollup.verdict,
+            FactCheckDailyRollup.sources_count,
+            FactCheckDailyRollup.fact_check_count,
+        ).where(FactCheckDailyRollup.fact_check_count != 0)
+    )
+    sources = await db.execute(
+        select(
+            SourceRollup.source_type,
+            SourceRollup.relevance,
+            SourceRollup.source_count,
+            SourceRollup.scored_count,
+            SourceRollup.credibility_sum,
+        ).where(SourceRollup.source_count != 0)
+    )
+    corrections = await db.execute(
+        select(
+            CorrectionRollup.status,
+            CorrectionRollup.correction_type,
+            CorrectionRollup.correction_count,
+        ).where(CorrectionRollup.correction_count != 0)
+    )
+    return {
+        "fact_checks": {tuple(row) for row in fact_checks.all()},
+        "sources": {tuple(row) for row in sources.all()},
+        "corrections": {tuple(row) for row in corrections.all()},
+    }
+
+
+async def _fact_check(db: AsyncSession, verdict: str, **kwargs: Any) -> FactCheck:
+    claim: Claim = Claim(content=f"Claim for {verdict}", source="test")
+    db.add(claim)
+    await db.flush()
+    fact_check: FactCheck = FactCheck(
+        claim_id=claim.id,
+        verdict=verdict,
+        confidence=0.9,
+        reasoning="Reasoning",
+        sources=[],
+        **kwargs,
+    )
+    db.add(fact_check)
+    await db.flush()
+    return fact_check
+
+
+class TestRollupMaintenance:
+    """Rollups follow ORM writes in the same transaction"""
+
+    async def test_insert_counts_rows(self, db_session: AsyncSession) -> None:
+        created: datetime = datetime(2026, 3, 31, 23, 30, tzinfo=timezone.utc)
+        fact_check: FactCheck = await _fact_check(
+            db_session, "false", created_at=created, sources_count=2
+        )
+        db_session.add(
+            Source(
+                fact_check_id=fact_check.id,
+                source_type=SourceType.PRIMARY,
+                title="Source",
+                access_date=date.today(),
+                credibility_score=4,
+                relevance=SourceRelevance.SUPPORTS,
+            )
+        )
+        db_session.add(
+            Source(
+                fact_check_id=fact_check.id,
+                source_type=SourceType.PRIMARY,
+                title="Unscored",
+                access_date=date.today(),
+            )
+        )
+        db_session.add(
+            Correction(
+                fact_check_id=fact_check.id,
+                correction_type=CorrectionType.UPDATE,
+                request_details="Details",
+            )
+        )
+        await db_session.commit()
+
+        assert await _rollups(db_session) == {
+            "fact_checks": {(date(2026, 3, 31), "false", 2, 1)},
+            "sources": {("primary", "supports", 1, 1, 4), ("primary", "", 1, 0, 0)},
+            "corrections": {("pending", "update", 1)},
+        }
+
+    async def test_updates_move_rows_between_buckets(self, db_session: AsyncSession) -> None:
+        fact_check: FactCheck = await _fact_check(db_session, "true")
+        source: Source = Source(
+            fact_check_id=fact_check.id,
+            source_type=SourceType.SECONDARY,
+            title="Source",
+            access_date=date.today(),
+        )
+        correction: Correction = Correction(
+            fact_check_id=fact_check.id,
+            correction_type=CorrectionType.MINOR,
+            request_details="Details",
+        )
+        db_session.add_all([source, correction])
+        await db_session.commit()
+
+        fact_check.verdict = "partially_true"
+        fact_check.sources_count = 1
+        source.credibility_score = 3
+        source.relevance = SourceRelevance.CONTRADICTS
+        correction.status = CorrectionStatus.ACCEPTED
+        await db_session.commit()
+
+        rollups: dict[str, set[tuple[Any, ...]]] = await _rollups(db_session)
+        assert {(verdict, n, count) for _, verdict, n, count in rollups["fact_checks"]} == {
+            ("partially_true", 1, 1)
+        }
+        assert rollups["sources"] == {("secondary", "contradicts", 1, 1, 3)}
+        assert rollups["corrections"] == {("accepted", "minor", 1)}
+
+    async def test_delete_removes_counts(self, db_session: AsyncSession) -> None:
+        fact_check: FactCheck = await _fact_check(db_session, "true")
+        source: Source = Source(
+            fact_check_id=fact_check.id,
+            source_type=SourceType.EXPERT,
+            title="Source",
+            access_date=date.today(),
+            credibility_score=5,
+        )
+        db_session.add(source)
+        await db_session.commit()
+
+        await db_session.delete(source)
+        await db_session.commit()
+
+        assert (await _rollups(db_session))["sources"] == set()
+
+    async def test_expired_rows_are_loaded_before_delete(self, db_session: AsyncSession) -> None:
+        fact_check: FactCheck = await _fact_check(db_session, "true")
+        correction: Correction = Correction(
+            fact_check_id=fact_check.id,
+            correction_type=CorrectionType.MINOR,
+            request_details="Details",
+        )
+        db_session.add(correction)
+        await db_session.commit()
+        db_session.expire(correction)
+
+        await db_session.delete(correction)
+        await db_session.commit()
+
+        assert (await _rollups(db_session))["corrections"] == set()
+
+
+class TestRollupRebuild:
+    """Rebuilding from the raw tables matches incremental maintenance"""
+
+    async def test_rebuild_matches_incremental_rollups(self, db_session: AsyncSession) -> None:
+        for i, verdict in enumerate(["true", "false", "false"]):
+            fact_check: FactCheck = await _fact_check(
+                db_session,
+                verdict,
+                created_at=datetime.now(timezone.utc) - timedelta(days=40 * i),
+                sources_count=i,
+            )
+            db_session.add(
+                Source(
+                    fact_check_id=fact_check.id,
+                    source_type=SourceType.PRIMARY,
+                    title=f"Source {i}",
+                    access_date=date.today(),
+                    credibility_score=i + 1,
+                )
+            )
+            db_session.add(
+                Correction(
+                    fact_check_id=fact_check.id,
+                    correction_type=CorrectionType.SUBSTANTIAL,
+                    request_details=f"Correction {i}",
+                )
+            )
+        await db_session.commit()
+        incremental: dict[str, set[tuple[Any, ...]]] = await _rollups(db_session)
+
+        summary: dict[str, int] = await rebuild_metric_rollups(db_session)
+
+        assert await _rollups(db_session) == incremental
+        assert summary == {
+            "fact_check_daily_rollups": 3,
+            "source_rollups": 1,
+            "correction_rollups": 1,
+        }
+
+    async def test_retention_cleanup_repairs_correction_rollups(
+        self, db_session: AsyncSession
+    ) -> None:
+        from app.services.retention_service import RetentionService
+
+        fact_check: FactCheck = await _fact_check(db_session, "true")
+        db_session.add(
+            Correction(
+                fact_check_id=fact_check.id,
+                correction_type=CorrectionType.MINOR,
+                request_details="Old",
+                status=CorrectionStatus.REJECTED,
+                created_at=datetime.now(timezone.utc) - timedelta(days=5000),
+            )
+        )
+        db_session.add(
+            Correction(
+                fact_check_id=fact_check.id,
+                correction_type=CorrectionType.MINOR,
+                request_details="Recent",
+                status=CorrectionStatus.REJECTED,
+            )
+        )
+        await db_session.commit()
+
+        deleted: int = await RetentionService().cleanup_correction_requests(db_session)
+
+        assert deleted == 1
+        assert (await _rollups(db_session))["corrections"] == {("rejected", "minor", 1)}
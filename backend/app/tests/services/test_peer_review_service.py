@@ -205,6 +205,38 @@ class TestShouldTriggerReviewPoliticalKeywords:
         assert result.should_trigger is True
         assert TriggerType.POLITICAL_KEYWORD in result.triggered_by
 
+    @pytest.mark.asyncio
+    async def test_keywords_match_plurals_and_compounds(
+        self,
+        db_session: AsyncSession,
+        test_user: User,
+    ) -> None:
+        """Test keyword stems match plurals and Dutch compounds"""
+        from app.services.peer_review_service import PeerReviewService
+
+        trigger = PeerReviewTrigger(
+            trigger_type=TriggerType.POLITICAL_KEYWORD,
+            enabled=True,
+            threshold_value={"keywords": ["politician", "verkiezing"], "min_occurrences": 2},
+            description="Stem keywords",
+        )
+        db_session.add(trigger)
+        submission = Submission(
+            user_id=test_user.id,
+            content="Politicians beloven veel tijdens de verkiezingscampagne.",
+            submission_type="text",
+            status="pending",
+        )
+        db_session.add(submission)
+        await db_session.commit()
+        await db_session.refresh(submission)
+
+        service = PeerReviewService(db_session)
+        result = await service.should_trigger_review(submission)
+
+        assert result.should_trigger is True
+        assert TriggerType.POLITICAL_KEYWORD in result.triggered_by
+
     @pytest.mark.asyncio
     async def test_disabled_trigger_is_ignored(
         self,
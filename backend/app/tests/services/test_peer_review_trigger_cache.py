@@ -0,0 +1,107 @@
+"""
+Tests for the per-process cache of compiled peer-review triggers.
+
+Covers:
+- Compiling keyword and topic triggers into matchers
+- Serving evaluations without querying the database
+- Invalidation when triggers are created or updated
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.peer_review_trigger import PeerReviewTrigger, TriggerType
+from app.services import peer_review_trigger_cache
+from app.services.peer_review_trigger_cache import (
+    CompiledTriggers,
+    TriggerCache,
+    get_trigger_cache,
+    invalidate_peer_review_triggers,
+)
+
+
+def _trigger(trigger_type: TriggerType, **threshold_value: object) -> PeerReviewTrigger:
+    return PeerReviewTrigger(
+        id=uuid4(), trigger_type=trigger_type, enabled=True, threshold_value=threshold_value
+    )
+
+
+class TestCompiledTriggers:
+    """Tests for compiling triggers into matchers"""
+
+    def test_matches_per_rule_in_configured_order(self) -> None:
+        """Test shared keywords are reported for every rule that lists them"""
+        compiled = CompiledTriggers.compile(
+            [
+                _trigger(TriggerType.POLITICAL_KEYWORD, keywords=["verkiezing", "Kabinet"]),
+                _trigger(TriggerType.SENSITIVE_TOPIC, topics=["vaccinatie", "verkiezing"]),
+                _trigger(TriggerType.ENGAGEMENT_THRESHOLD, min_views=10),
+            ]
+        )
+
+        matches = compiled.match("Het kabinet wil vaccinatie vóór de verkiezing")
+
+        assert matches == {0: ["verkiezing", "Kabinet"], 1: ["vaccinatie", "verkiezing"]}
+        assert len(compiled.rules) == 3
+
+    def test_case_sensitive_rules_use_their_own_matcher(self) -> None:
+        """Test case_sensitive keywords only match with the configured case"""
+        compiled = CompiledTriggers.compile(
+            [_trigger(TriggerType.POLITICAL_KEYWORD, keywords=["PVV"], case_sensitive=True)]
+        )
+
+        assert compiled.match("de pvv") == {}
+        assert compiled.match("de PVV") == {0: ["PVV"]}
+
+
+class TestTriggerCache:
+    """Tests for caching and invalidating compiled triggers"""
+
+    async def test_serves_from_cache_until_triggers_change(self, db_session: AsyncSession) -> None:
+        """Test a committed trigger change drops the compiled triggers"""
+        trigger = _trigger(TriggerType.POLITICAL_KEYWORD, keywords=["verkiezing"])
+        db_session.add(trigger)
+        await db_session.commit()
+        cache: TriggerCache = get_trigger_cache()
+
+        first = await cache.get(db_session)
+        assert await cache.get(db_session) is first
+
+        trigger.threshold_value = {"keywords": ["referendum"]}
+        await db_session.commit()
+
+        updated = await cache.get(db_session)
+        assert updated is not first
+        assert updated.match("Een referendum") == {0: ["referendum"]}
+
+    async def test_load_racing_an_invalidation_is_not_stored(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test triggers loaded before an invalidation are not cached"""
+        cache: TriggerCache = TriggerCache(ttl_seconds=300)
+        original_execute = db_session.execute
+
+        async def execute_then_invalidate(*args: Any, **kwargs: Any) -> Any:
+            result = await original_execute(*args, **kwargs)
+            cache.clear()
+            return result
+
+        with patch.object(db_session, "execute", side_effect=execute_then_invalidate):
+            await cache.get(db_session)
+
+        assert cache._entry is None
+
+    async def test_invalidation_is_published(self) -> None:
+        """Test invalidating drops the local copy and notifies other processes"""
+        redis: AsyncMock = AsyncMock()
+        cache: TriggerCache = get_trigger_cache()
+        cache._entry = (float("inf"), CompiledTriggers(rules=[]))
+
+        with patch.object(peer_review_trigger_cache, "get_redis_client", return_value=redis):
+            await invalidate_peer_review_triggers()
+
+        assert cache._entry is None
+        redis.publish.assert_awaited_once_with(peer_review_trigger_cache.INVALIDATION_CHANNEL, b"1")
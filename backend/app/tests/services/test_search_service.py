@@ -0,0 +1,294 @@
+"""
+Tests for full-text search over claims and fact-checks.
+
+Covers:
+- Ranking and highlighting (in-memory matching on SQLite)
+- Matches in the current rating justification
+- Fuzzy fallback when nothing matches exactly
+- Keyset pagination with score cursors
+- Workflow state, verdict and date filters
+- The PostgreSQL statements (tsquery configurations, cursor condition)
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import InvalidCursorError, decode_score_cursor, encode_score_cursor
+from app.models.claim import Claim
+from app.models.fact_check import FactCheck
+from app.models.fact_check_rating import FactCheckRating
+from app.models.submission import Submission
+from app.models.user import User
+from app.models.workflow_transition import WorkflowState
+from app.services.search_service import (
+    MATCH_FULLTEXT,
+    MATCH_FUZZY,
+    SearchFilters,
+    SearchService,
+)
+
+
+async def _claim(
+    db: AsyncSession, content: str, verdict: Optional[str] = None, reasoning: str = ""
+) -> Claim:
+    claim: Claim = Claim(content=content, source="test")
+    db.add(claim)
+    await db.flush()
+    if verdict is not None:
+        db.add(
+            FactCheck(
+                claim_id=claim.id,
+                verdict=verdict,
+                confidence=0.9,
+                reasoning=reasoning,
+                sources=["https://example.com"],
+            )
+        )
+    await db.commit()
+    return claim
+
+
+class TestSearchInMemory:
+    """Tests for search on databases without text search"""
+
+    async def test_claim_and_fact_check_matches_are_ranked(self, db_session: AsyncSession) -> None:
+        """Test a claim matching in its fact-check too ranks above a claim-only match"""
+        both = await _claim(
+            db_session, "Vaccins veroorzaken autisme", "false", "Geen verband tussen vaccins"
+        )
+        claim_only = await _claim(db_session, "Vaccins bevatten microchips")
+        await _claim(db_session, "De maan is van kaas", "false", "Onzin")
+
+        page = await SearchService(db_session).search("vaccins")
+
+        assert [hit.claim_id for hit in page.items] == [both.id, claim_only.id]
+        assert page.items[0].verdict == "false"
+        assert page.items[0].match == MATCH_FULLTEXT
+        assert page.items[0].reasoning_highlight == "Geen verband tussen <mark>vaccins</mark>"
+        assert page.items[1].reasoning_highlight is None
+        assert page.next_cursor is None
+
+    async def test_current_rating_justification_matches(
+        self, db_session: AsyncSession, auth_user: tuple[User, str]
+    ) -> None:
+        """Test a claim is found by its current rating's justification, not older ones"""
+        claim = await _claim(db_session, "Het water is vergiftigd", "false", "Geen bewijs")
+        fact_check = (await SearchService(db_session).search("water")).items[0]
+        for version, justification in enumerate(
+            ["Het drinkwaterbedrijf meldt normale chloorwaarden", "Laboratorium vond lood"], 1
+        ):
+            db_session.add(
+                FactCheckRating(
+                    fact_check_id=fact_check.fact_check_id,
+                    assigned_by_id=auth_user[0].id,
+                    rating="false",
+                    justification=justification,
+                    version=version,
+                    is_current=version == 2,
+                )
+            )
+        await db_session.commit()
+
+        current = await SearchService(db_session).search("laboratorium")
+        superseded = await SearchService(db_session).search("chloorwaarden")
+
+        assert [hit.claim_id for hit in current.items] == [claim.id]
+        assert current.items[0].reasoning_highlight is None
+        assert superseded.items == []
+
+    async def test_highlights_are_html_escaped(self, db_session: AsyncSession) -> None:
+        """Test claim text is escaped around the <mark> tags"""
+        await _claim(db_session, "<script>alert(1)</script> 5G masts")
+
+        page = await SearchService(db_session).search("masts")
+
+        assert page.items[0].content_highlight == (
+            "&lt;script&gt;alert(1)&lt;/script&gt; 5G <mark>masts</mark>"
+        )
+
+    async def test_fuzzy_fallback_for_misspellings(self, db_session: AsyncSession) -> None:
+        """Test a misspelled query falls back to similarity matching"""
+        claim = await _claim(db_session, "Vaccins veroorzaken autisme")
+
+        page = await SearchService(db_session).search("vacins")
+
+        assert [hit.claim_id for hit in page.items] == [claim.id]
+        assert page.items[0].match == MATCH_FUZZY
+
+    async def test_pages_follow_the_cursor(self, db_session: AsyncSession) -> None:
+        """Test keyset pages cover every match exactly once"""
+        for i in range(5):
+            await _claim(db_session, f"Claim {i} about elections")
+        service: SearchService = SearchService(db_session)
+
+        first = await service.search("elections", limit=2)
+        second = await service.search("elections", limit=2, cursor=first.next_cursor)
+        third = await service.search("elections", limit=2, cursor=second.next_cursor)
+
+        seen = [hit.claim_id for page in (first, second, third) for hit in page.items]
+        assert len(seen) == len(set(seen)) == 5
+        assert third.next_cursor is None
+
+    async def test_unsupported_language_is_rejected(self, db_session: AsyncSession) -> None:
+        """Test only nl and en query configurations are accepted"""
+        with pytest.raises(ValueError):
+            await SearchService(db_session).search("test", language="de")
+
+
+class TestSearchFilters:
+    """Tests for narrowing searches with SearchFilters"""
+
+    async def test_verdict_filter(self, db_session: AsyncSession) -> None:
+        """Test only claims with a fact-check of the verdict match"""
+        false_claim = await _claim(db_session, "Vaccins veroorzaken autisme", "false")
+        await _claim(db_session, "Vaccins beschermen tegen mazelen", "true")
+
+        page = await SearchService(db_session).search(
+            "vaccins", filters=SearchFilters(verdict="false")
+        )
+
+        assert [hit.claim_id for hit in page.items] == [false_claim.id]
+
+    async def test_verdict_filter_uses_latest_fact_check(self, db_session: AsyncSession) -> None:
+        """Test a claim re-checked with another verdict no longer matches the old one"""
+        revised = await _claim(db_session, "Vaccins bevatten microchips")
+        checked_at: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for days, verdict in ((0, "false"), (1, "true")):
+            db_session.add(
+                FactCheck(
+                    claim_id=revised.id,
+                    verdict=verdict,
+                    confidence=0.9,
+                    reasoning="Checked",
+                    sources=["https://example.com"],
+                    created_at=checked_at + timedelta(days=days),
+                )
+            )
+        await db_session.commit()
+
+        false_page = await SearchService(db_session).search(
+            "vaccins", filters=SearchFilters(verdict="false")
+        )
+        true_page = await SearchService(db_session).search(
+            "vaccins", filters=SearchFilters(verdict="true")
+        )
+
+        assert false_page.items == []
+        assert [hit.claim_id for hit in true_page.items] == [revised.id]
+
+    async def test_workflow_state_filter(
+        self, db_session: AsyncSession, auth_user: tuple[User, str]
+    ) -> None:
+        """Test only claims of submissions in the workflow state match"""
+        in_review = await _claim(db_session, "Elections were rigged")
+        await _claim(db_session, "Elections are held in March")
+        submission: Submission = Submission(
+            user_id=auth_user[0].id,
+            content="Elections were rigged",
+            submission_type="text",
+            workflow_state=WorkflowState.IN_RESEARCH,
+        )
+        submission.claims.append(in_review)
+        db_session.add(submission)
+        await db_session.commit()
+
+        page = await SearchService(db_session).search(
+            "elections", filters=SearchFilters(workflow_state=WorkflowState.IN_RESEARCH)
+        )
+
+        assert [hit.claim_id for hit in page.items] == [in_review.id]
+
+    def test_date_filter_sql(self) -> None:
+        """Test date bounds become parameters on the claims alias"""
+        start: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        filters: SearchFilters = SearchFilters(
+            verdict="false", created_from=start, created_to=start + timedelta(days=7)
+        )
+
+        clause, params = filters.sql("c")
+
+        assert clause.startswith(" AND (SELECT fv.verdict FROM fact_checks fv")
+        assert "ORDER BY fv.created_at DESC LIMIT 1) = :filter_verdict" in clause
+        assert "c.created_at >= :filter_created_from AND c.created_at < :filter_created_to" in (
+            clause
+        )
+        assert params == {
+            "filter_verdict": "false",
+            "filter_created_from": start,
+            "filter_created_to": start + timedelta(days=7),
+        }
+        assert SearchFilters().sql() == ("", {})
+
+
+class TestScoreCursor:
+    """Tests for score cursor encoding"""
+
+    def test_round_trip(self) -> None:
+        """Test a score cursor decodes to its ranking, score and id"""
+        claim_id: UUID = uuid4()
+        assert decode_score_cursor(encode_score_cursor(MATCH_FUZZY, 0.25, claim_id)) == (
+            MATCH_FUZZY,
+            0.25,
+            claim_id,
+        )
+
+    def test_timestamp_cursor_is_rejected(self) -> None:
+        """Test a cursor of another listing raises InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_score_cursor("WzEsMl0")
+
+
+def _postgres_session() -> MagicMock:
+    """AsyncSession stand-in recording the statements sent to PostgreSQL"""
+    session: MagicMock = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    session.calls = []
+
+    async def execute(statement: Any, params: Any = None) -> MagicMock:
+        session.calls.append((str(statement), params))
+        result: MagicMock = MagicMock()
+        result.all.return_value = []
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+class TestSearchStatements:
+    """Tests for the SQL sent to PostgreSQL"""
+
+    async def test_both_languages_without_cursor(self) -> None:
+        """Test the query is parsed as Dutch and English, then retried fuzzily"""
+        session: MagicMock = _postgres_session()
+
+        await SearchService(session).search("verkiezingen")
+
+        fulltext_sql, params = session.calls[0]
+        assert "websearch_to_tsquery('dutch', :query) || websearch_to_tsquery('english'" in (
+            fulltext_sql
+        )
+        assert "(score, claim_id) <" not in fulltext_sql
+        assert params["limit"] == 21
+        assert "JOIN fact_checks f ON f.id = r.fact_check_id" in fulltext_sql
+        assert "r.search_vector @@ q.query AND r.is_current" in fulltext_sql
+        assert "word_similarity_threshold" in session.calls[1][0]
+        assert "<% c.content" in session.calls[2][0]
+
+    async def test_cursor_continues_its_ranking(self) -> None:
+        """Test a fulltext cursor adds the keyset condition and never goes fuzzy"""
+        session: MagicMock = _postgres_session()
+        claim_id: UUID = uuid4()
+        cursor: str = encode_score_cursor(MATCH_FULLTEXT, 0.5, claim_id)
+
+        await SearchService(session).search("verkiezingen", language="nl", cursor=cursor)
+
+        assert len(session.calls) == 1
+        sql, params = session.calls[0]
+        assert "websearch_to_tsquery('english'" not in sql
+        assert "(score, claim_id) < (:after_score, :after_id)" in sql
+        assert (params["after_score"], params["after_id"]) == (0.5, claim_id)
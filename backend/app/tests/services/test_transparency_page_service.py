@@ -9,7 +9,7 @@ Test Coverage Requirements:
 - get_page_version() - retrieve specific version of a page
 - update_page() - update page with automatic versioning
 - get_version_history() - list all versions of a page
-- generate_diff() - diff between two versions
+- generate_diff() - diff between two versions (stored, cached, bounded)
 - get_pages_due_for_review() - find pages needing annual review
 - send_review_reminders() - send email reminders for pages due for review
 """
@@ -497,6 +497,116 @@ class TestTransparencyPageServiceDiff:
         # Should contain diff info for English content
         assert "diff" in diff
 
+    @pytest.mark.asyncio
+    async def test_update_page_stores_diff_to_next(self, db_session: AsyncSession) -> None:
+        """Test consecutive diffs are computed on update and served without difflib."""
+        from app.services import transparency_page_service
+
+        # Arrange
+        user = User(
+            email="stored-differ@example.com",
+            password_hash="hashed",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        page = TransparencyPage(
+            slug="stored-diff",
+            title={"en": "Stored", "nl": "Opgeslagen"},
+            content={"en": "Line one.\nLine two.\n", "nl": "Regel een.\n"},
+            version=1,
+        )
+        db_session.add_all([user, page])
+        await db_session.commit()
+
+        # Act
+        await transparency_page_service.update_page(
+            db=db_session,
+            slug="stored-diff",
+            title=None,
+            content={"en": "Line one.\nLine 2.\n", "nl": "Regel een.\n"},
+            changed_by_id=user.id,
+            change_summary="Edit",
+        )
+        with patch.object(transparency_page_service, "_text_diff") as text_diff:
+            diff = await transparency_page_service.generate_diff(
+                db_session, "stored-diff", from_version=1, to_version=2, language="en"
+            )
+
+        # Assert
+        text_diff.assert_not_called()
+        assert diff is not None
+        assert diff["diff"] == {
+            "title": {"en": ""},
+            "content": {
+                "en": "--- v1+++ v2@@ -1,2 +1,2 @@ Line one.\n-Line two.\n+Line 2.\n",
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_version_range_diff_is_cached(self, db_session: AsyncSession) -> None:
+        """Test a non-consecutive range is diffed once per process."""
+        from app.services import transparency_page_service
+
+        # Arrange: three versions saved before diffs were stored
+        user = User(
+            email="range-differ@example.com",
+            password_hash="hashed",
+            role=UserRole.ADMIN,
+            is_active=True,
+        )
+        page = TransparencyPage(
+            slug="range-diff",
+            title={"en": "Range"},
+            content={"en": "Three."},
+            version=3,
+        )
+        db_session.add_all([user, page])
+        await db_session.commit()
+        for version, text in [(1, "One."), (2, "Two.")]:
+            db_session.add(
+                TransparencyPageVersion(
+                    page_id=page.id,
+                    version=version,
+                    title={"en": "Range"},
+                    content={"en": text},
+                    changed_by_id=user.id,
+                )
+            )
+        await db_session.commit()
+
+        # Act
+        with patch.object(
+            transparency_page_service,
+            "_text_diff",
+            wraps=transparency_page_service._text_diff,
+        ) as text_diff:
+            first = await transparency_page_service.generate_diff(
+                db_session, "range-diff", from_version=1, to_version=3
+            )
+            second = await transparency_page_service.generate_diff(
+                db_session, "range-diff", from_version=1, to_version=3
+            )
+
+        # Assert: one title and one content diff, both for the first call
+        assert text_diff.call_count == 2
+        assert first == second
+        assert first is not None
+        assert "-One.+Three." in first["diff"]["content"]["en"]
+
+    def test_long_texts_are_diffed_as_replacement(self) -> None:
+        """Test texts over TRANSPARENCY_DIFF_MAX_LINES skip difflib."""
+        from app.core.config import settings
+        from app.services import transparency_page_service
+
+        old = "".join(f"line {i}\n" for i in range(10))
+        new = old.replace("line 5", "line five")
+
+        with patch.object(settings, "TRANSPARENCY_DIFF_MAX_LINES", 5):
+            diff = transparency_page_service._text_diff(old, new, 1, 2)
+
+        assert diff.startswith("--- v1+++ v2@@ -1,10 +1,10 @@")
+        assert diff.count("\n-") + diff.count("@@-") == 10
+
 
 class TestTransparencyPageServiceAnnualReview:
     """Tests for annual review reminder functionality."""
@@ -0,0 +1,119 @@
+"""
+Tests for the vectorized similarity kernels
+
+Issue #176: LLM-based Claim Extraction - Deduplication using vector similarity
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.services.embedding_service import EmbeddingService
+from app.services.vector_similarity import (
+    InMemoryVectorIndex,
+    cosine_many_to_many,
+    cosine_one_to_many,
+    normalize_many,
+    top_k,
+)
+
+
+class TestKernels:
+    """Test normalization, similarity and top-k kernels"""
+
+    def test_normalize_many_returns_unit_rows(self) -> None:
+        """Test rows are scaled to unit length"""
+        result = normalize_many([[3.0, 4.0], [0.0, 2.0]])
+
+        assert result.dtype == np.float32
+        assert np.allclose(np.linalg.norm(result, axis=1), 1.0)
+        assert np.allclose(result[0], [0.6, 0.8])
+
+    def test_normalize_many_keeps_zero_vectors(self) -> None:
+        """Test zero vectors stay zero instead of producing NaN"""
+        result = normalize_many([[0.0, 0.0, 0.0]])
+
+        assert result.tolist() == [[0.0, 0.0, 0.0]]
+
+    def test_cosine_one_to_many_matches_pure_python(self) -> None:
+        """Test results agree with EmbeddingService.cosine_similarity"""
+        rng = np.random.default_rng(42)
+        query: list[float] = rng.standard_normal(64).tolist()
+        vectors: list[list[float]] = rng.standard_normal((10, 64)).tolist()
+
+        result = cosine_one_to_many(query, vectors)
+
+        with patch("app.services.embedding_service.settings") as mock_settings:
+            mock_settings.OPENAI_API_KEY = "test-api-key"
+            service: EmbeddingService = EmbeddingService()
+        expected = [service.cosine_similarity(query, v) for v in vectors]
+        assert result.shape == (10,)
+        assert np.allclose(result, expected, atol=1e-5)
+
+    def test_cosine_many_to_many_shape(self) -> None:
+        """Test the similarity matrix has one row per query"""
+        result = cosine_many_to_many([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], [[1.0, 0.0]])
+
+        assert result.shape == (3, 1)
+        assert np.allclose(result[:, 0], [1.0, 0.0, np.sqrt(0.5)])
+
+    def test_top_k_returns_best_first(self) -> None:
+        """Test top_k selects and orders the highest scores"""
+        scores = np.array([0.1, 0.9, 0.5, 0.7], dtype=np.float32)
+
+        indices, best = top_k(scores, 2)
+
+        assert indices.tolist() == [1, 3]
+        assert np.allclose(best, [0.9, 0.7])
+
+    @pytest.mark.parametrize("k", [0, 4, 10])
+    def test_top_k_bounds(self, k: int) -> None:
+        """Test k of zero or larger than the input"""
+        scores = np.array([0.1, 0.9, 0.5, 0.7], dtype=np.float32)
+
+        indices, _ = top_k(scores, k)
+
+        assert len(indices) == min(k, 4)
+
+
+class TestInMemoryVectorIndex:
+    """Test exact in-memory search"""
+
+    @pytest.fixture
+    def index(self) -> InMemoryVectorIndex[str]:
+        """Index with three orthogonal-ish vectors"""
+        return InMemoryVectorIndex(
+            ["a", "b", "c"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.9, 0.1, 0.0]]
+        )
+
+    def test_search_applies_threshold_and_order(self, index: InMemoryVectorIndex[str]) -> None:
+        """Test results are above threshold and sorted by similarity"""
+        results = index.search([1.0, 0.0, 0.0], threshold=0.5, limit=5)
+
+        assert [item for item, _ in results] == ["a", "c"]
+        assert results[0][1] == pytest.approx(1.0)
+
+    def test_search_applies_limit(self, index: InMemoryVectorIndex[str]) -> None:
+        """Test at most limit results are returned"""
+        results = index.search([1.0, 0.0, 0.0], threshold=0.0, limit=1)
+
+        assert [item for item, _ in results] == ["a"]
+
+    def test_search_many_returns_one_list_per_query(self, index: InMemoryVectorIndex[str]) -> None:
+        """Test batched search"""
+        results = index.search_many([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], threshold=0.9, limit=1)
+
+        assert [[item for item, _ in r] for r in results] == [["a"], ["b"]]
+
+    def test_empty_index(self) -> None:
+        """Test searching an empty index returns no results"""
+        index: InMemoryVectorIndex[str] = InMemoryVectorIndex([], [])
+
+        assert len(index) == 0
+        assert index.search_many([[1.0, 0.0]], threshold=0.0, limit=5) == [[]]
+
+    def test_length_mismatch_raises(self) -> None:
+        """Test items and vectors must line up"""
+        with pytest.raises(ValueError, match="same length"):
+            InMemoryVectorIndex(["a"], [[1.0], [2.0]])
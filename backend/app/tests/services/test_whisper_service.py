@@ -5,15 +5,21 @@ Following TDD approach: Tests written FIRST before implementation
 Issue #175: Audio Extraction and Whisper Transcription
 """
 
+import asyncio
+from pathlib import Path
 from typing import Generator
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from openai import APITimeoutError
 
+from app.services.audio_extraction_service import AudioChunk
 from app.services.whisper_service import (
     TranscriptionResult,
+    TranscriptionSegment,
     WhisperService,
     WhisperServiceError,
+    stitch_transcriptions,
 )
 
 
@@ -56,14 +62,17 @@ class TestWhisperServiceTranscription:
         with patch("app.services.whisper_service.settings") as mock_settings:
             mock_settings.OPENAI_API_KEY = "test-api-key"
             mock_settings.OPENAI_WHISPER_MODEL = "whisper-1"
+            mock_settings.WHISPER_MAX_CONCURRENCY = 2
+            mock_settings.WHISPER_REQUEST_TIMEOUT_SECONDS = 30.0
             service: WhisperService = WhisperService()
             yield service
 
     @pytest.fixture
     def mock_openai_client(self) -> Generator[Mock, None, None]:
-        """Provide mocked OpenAI client"""
-        with patch("app.services.whisper_service.OpenAI") as mock:
+        """Provide mocked AsyncOpenAI client"""
+        with patch("app.services.whisper_service.AsyncOpenAI") as mock:
             mock_instance: Mock = MagicMock()
+            mock_instance.audio.transcriptions.create = AsyncMock()
             mock.return_value = mock_instance
             yield mock_instance
 
@@ -185,6 +194,164 @@ class TestWhisperServiceTranscription:
                 assert result.text == expected_text
 
 
+class TestWhisperServiceConcurrency:
+    """Test the async client, concurrency limit and request timeout"""
+
+    @pytest.fixture
+    def whisper_service(self) -> Generator[WhisperService, None, None]:
+        """Provide WhisperService allowing two concurrent calls"""
+        with patch("app.services.whisper_service.settings") as mock_settings:
+            mock_settings.OPENAI_API_KEY = "test-api-key"
+            mock_settings.OPENAI_WHISPER_MODEL = "whisper-1"
+            mock_settings.WHISPER_MAX_CONCURRENCY = 2
+            mock_settings.WHISPER_REQUEST_TIMEOUT_SECONDS = 30.0
+            service: WhisperService = WhisperService()
+            yield service
+
+    @pytest.mark.asyncio
+    async def test_api_call_uses_async_client_with_timeout(
+        self, whisper_service: WhisperService, tmp_path: Path
+    ) -> None:
+        """Test the audio is uploaded via the async client with the per-request timeout"""
+        audio_file: Path = tmp_path / "audio.mp3"
+        audio_file.write_bytes(b"audio")
+        client: MagicMock = MagicMock()
+        client.audio.transcriptions.create = AsyncMock(
+            return_value=Mock(
+                text="Hallo",
+                language="nl",
+                segments=[Mock(start=0.0, end=1.5, text=" Hallo", no_speech_prob=0.1)],
+            )
+        )
+        with patch("app.services.whisper_service.AsyncOpenAI", return_value=client):
+            result: TranscriptionResult = await whisper_service.transcribe_audio(
+                str(audio_file), "nl"
+            )
+
+        assert result.text == "Hallo"
+        assert result.segments == [TranscriptionSegment(start=0.0, end=1.5, text="Hallo")]
+        kwargs = client.audio.transcriptions.create.call_args.kwargs
+        assert kwargs["file"] == ("audio.mp3", b"audio")
+        assert kwargs["timeout"] == 30.0
+        assert kwargs["language"] == "nl"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_bounded(self, whisper_service: WhisperService) -> None:
+        """Test no more than WHISPER_MAX_CONCURRENCY API calls run at once"""
+        in_flight: int = 0
+        peak: int = 0
+
+        async def slow_call(*args: object) -> TranscriptionResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TranscriptionResult(text="ok", language="en", confidence=None)
+
+        with patch("pathlib.Path.exists", return_value=True):
+            with patch.object(whisper_service, "_call_whisper_api", side_effect=slow_call):
+                results = await asyncio.gather(
+                    *(whisper_service.transcribe_audio(f"/tmp/{i}.mp3") for i in range(6))
+                )
+
+        assert len(results) == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_service_error(self, whisper_service: WhisperService) -> None:
+        """Test API timeouts surface as WhisperServiceError"""
+        with patch("pathlib.Path.exists", return_value=True):
+            with patch.object(
+                whisper_service, "_call_whisper_api", new_callable=AsyncMock
+            ) as mock_call:
+                mock_call.side_effect = APITimeoutError(request=MagicMock())
+
+                with pytest.raises(WhisperServiceError, match="timed out"):
+                    await whisper_service.transcribe_audio("/tmp/test_audio.mp3")
+
+
+class TestChunkedTranscription:
+    """Test parallel transcription of audio chunks"""
+
+    @pytest.fixture
+    def whisper_service(self) -> Generator[WhisperService, None, None]:
+        """Provide WhisperService instance"""
+        with patch("app.services.whisper_service.settings") as mock_settings:
+            mock_settings.OPENAI_API_KEY = "test-api-key"
+            mock_settings.OPENAI_WHISPER_MODEL = "whisper-1"
+            mock_settings.WHISPER_MAX_CONCURRENCY = 4
+            mock_settings.WHISPER_REQUEST_TIMEOUT_SECONDS = 30.0
+            service: WhisperService = WhisperService()
+            yield service
+
+    @pytest.fixture
+    def chunks(self) -> list[AudioChunk]:
+        """Two chunks: 0-600s and 600-700s"""
+        return [
+            AudioChunk(audio_path="/tmp/a.part000.mp3", start_seconds=0.0, end_seconds=600.0),
+            AudioChunk(audio_path="/tmp/a.part001.mp3", start_seconds=600.0, end_seconds=700.0),
+        ]
+
+    def test_stitch_offsets_segments_and_weights_metadata(self, chunks: list[AudioChunk]) -> None:
+        """Test stitched segments sit on the source timeline"""
+        results: list[TranscriptionResult] = [
+            TranscriptionResult(
+                text="Eerste deel.",
+                language="nl",
+                confidence=0.9,
+                segments=[TranscriptionSegment(start=1.0, end=4.0, text="Eerste deel.")],
+            ),
+            TranscriptionResult(
+                text=" Second part. ",
+                language="en",
+                confidence=0.5,
+                segments=[TranscriptionSegment(start=2.0, end=5.0, text="Second part.")],
+            ),
+        ]
+
+        result: TranscriptionResult = stitch_transcriptions(results, chunks)
+
+        assert result.text == "Eerste deel. Second part."
+        assert result.language == "nl"
+        assert result.confidence == pytest.approx((0.9 * 600 + 0.5 * 100) / 700, abs=1e-4)
+        assert [(s.start, s.end) for s in result.segments] == [(1.0, 4.0), (602.0, 605.0)]
+
+    def test_stitch_single_result_is_unchanged(self, chunks: list[AudioChunk]) -> None:
+        """Test a single chunk passes through as-is"""
+        single: TranscriptionResult = TranscriptionResult(text="x", language="en", confidence=None)
+
+        assert stitch_transcriptions([single], chunks[:1]) is single
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunks_runs_in_parallel(
+        self, whisper_service: WhisperService, chunks: list[AudioChunk]
+    ) -> None:
+        """Test every chunk is transcribed concurrently and stitched"""
+        in_flight: int = 0
+        peak: int = 0
+
+        async def transcribe(path: str, hint: object = None) -> TranscriptionResult:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return TranscriptionResult(text=path, language="nl", confidence=None)
+
+        with patch.object(whisper_service, "transcribe_audio", side_effect=transcribe):
+            result: TranscriptionResult = await whisper_service.transcribe_chunks(chunks)
+
+        assert peak == 2
+        assert result.text == "/tmp/a.part000.mp3 /tmp/a.part001.mp3"
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunks_requires_chunks(self, whisper_service: WhisperService) -> None:
+        """Test an empty chunk list is rejected"""
+        with pytest.raises(WhisperServiceError, match="No audio chunks"):
+            await whisper_service.transcribe_chunks([])
+
+
 class TestTranscriptionResult:
     """Test TranscriptionResult dataclass"""
 
@@ -0,0 +1,409 @@
+"""
+Tests for the Spotlight ingestion Celery task
+
+The API accepts a Spotlight link and returns immediately; the ingestion task
+fetches metadata, downloads the video, transcribes it and extracts claims,
+moving Submission.status through each stage.
+"""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.spotlight import SpotlightContent
+from app.models.submission import Submission
+from app.models.user import User
+
+SPOTLIGHT_LINK: str = "https://www.snapchat.com/spotlight/abc123"
+
+PARSED_METADATA: dict[str, Any] = {
+    "spotlight_id": "abc123",
+    "video_url": "https://cf-st.sc-cdn.net/video.mp4",
+    "thumbnail_url": "https://cf-st.sc-cdn.net/thumb.jpg",
+    "duration_ms": 30000,
+    "creator_name": "Test Creator",
+    "creator_username": "testcreator",
+    "view_count": 1000,
+}
+
+
+def session_factory(db_session: AsyncSession) -> Any:
+    """Return an AsyncSessionLocal replacement that yields the test session"""
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[AsyncSession]:
+        yield db_session
+
+    return factory
+
+
+def mock_snapchat_service(download_path: str = "/tmp/videos/abc123.mp4") -> MagicMock:
+    """Build a SnapchatService mock returning PARSED_METADATA"""
+    service = MagicMock()
+    service.fetch_spotlight_data = AsyncMock(return_value={"raw": "data"})
+    service.parse_spotlight_metadata = MagicMock(return_value=PARSED_METADATA)
+    service.download_video = AsyncMock(return_value=download_path)
+    return service
+
+
+async def create_submission(db_session: AsyncSession, user: User) -> Submission:
+    """Create a Spotlight submission in the "fetching" state"""
+    submission = Submission(
+        user_id=user.id,
+        content=f"Snapchat Spotlight: {SPOTLIGHT_LINK}",
+        submission_type="spotlight",
+        status="fetching",
+    )
+    db_session.add(submission)
+    await db_session.commit()
+    await db_session.refresh(submission)
+    return submission
+
+
+class TestIngestSpotlightTask:
+    """Tests for the ingest_spotlight Celery task"""
+
+    def test_task_is_registered(self) -> None:
+        """Test that the task is registered and routed to the ingestion queue"""
+        from app.core.celery_app import celery_app
+        from app.tasks import ingestion_tasks  # noqa: F401
+
+        assert "app.tasks.ingestion_tasks.ingest_spotlight" in celery_app.tasks
+        assert celery_app.conf.task_routes["app.tasks.ingestion_tasks.*"] == {"queue": "ingestion"}
+
+    @patch("app.tasks.ingestion_tasks._ingest_spotlight_async")
+    def test_task_calls_async_handler(self, mock_ingest: AsyncMock) -> None:
+        """Test the task runs the async pipeline and returns its result"""
+        from app.tasks.ingestion_tasks import ingest_spotlight
+
+        mock_ingest.return_value = {"success": True, "submission_id": "sub-1"}
+
+        result: dict[str, Any] = ingest_spotlight("sub-1", SPOTLIGHT_LINK)
+
+        assert result["success"] is True
+        assert mock_ingest.call_args[0][:2] == ("sub-1", SPOTLIGHT_LINK)
+
+    @patch("app.tasks.ingestion_tasks._ingest_spotlight_async")
+    def test_progress_is_published_from_the_task_loop(self, mock_ingest: AsyncMock) -> None:
+        """Test stages reported on the shared task loop's thread reach the task's state"""
+        from app.tasks.ingestion_tasks import STATUS_TRANSCRIBING, ingest_spotlight
+
+        async def ingest(submission_id: str, link: str, report_progress: Any) -> dict[str, Any]:
+            report_progress(STATUS_TRANSCRIBING)
+            return {"success": True, "submission_id": submission_id}
+
+        mock_ingest.side_effect = ingest
+
+        with patch.object(ingest_spotlight, "update_state") as mock_update_state:
+            ingest_spotlight.apply(args=("sub-1", SPOTLIGHT_LINK), task_id="task-1")
+
+        mock_update_state.assert_called_once_with(
+            task_id="task-1",
+            state="PROGRESS",
+            meta={"submission_id": "sub-1", "stage": STATUS_TRANSCRIBING},
+        )
+
+
+class TestIngestSpotlightAsync:
+    """Tests for the _ingest_spotlight_async pipeline"""
+
+    @pytest.mark.asyncio
+    async def test_full_pipeline_updates_status_and_stores_content(
+        self, db_session: AsyncSession, auth_user: Any
+    ) -> None:
+        """Test a successful run stores the content and reports every stage"""
+        from app.tasks.ingestion_tasks import _ingest_spotlight_async
+
+        user, _ = auth_user
+        submission: Submission = await create_submission(db_session, user)
+        stages: list[str] = []
+        statuses: list[str] = []
+
+        async def fake_transcribe(db: AsyncSession, spotlight_content_id: str) -> dict[str, Any]:
+            await db_session.refresh(submission)
+            statuses.append(submission.status)
+            return {"success": True, "spotlight_content_id": spotlight_content_id}
+
+        async def fake_extract(
+            db: AsyncSession, submission_id: str, spotlight_content_id: str
+        ) -> dict[str, Any]:
+            await db_session.refresh(submission)
+            statuses.append(submission.status)
+            return {"success": True, "claims_extracted": 2}
+
+        with (
+            patch("app.tasks.ingestion_tasks.AsyncSessionLocal", session_factory(db_session)),
+            patch("app.services.snapchat.snapchat_service", mock_snapchat_service()),
+            patch("app.tasks.ingestion_tasks.transcribe_spotlight_content", fake_transcribe),
+            patch("app.tasks.ingestion_tasks.extract_spotlight_claims", fake_extract),
+        ):
+            result: dict[str, Any] = await _ingest_spotlight_async(
+                str(submission.id), SPOTLIGHT_LINK, stages.append
+            )
+
+        assert result["success"] is True
+        assert result["claim_extraction"]["claims_extracted"] == 2
+        assert stages == ["fetching", "transcribing", "extracting_claims", "completed"]
+        assert statuses == ["transcribing", "extracting_claims"]
+
+        await db_session.refresh(submission)
+        assert submission.status == "completed"
+        assert "Test Creator" in submission.content
+
+        content: SpotlightContent = (
+            await db_session.execute(
+                select(SpotlightContent).where(SpotlightContent.submission_id == submission.id)
+            )
+        ).scalar_one()
+        assert str(content.id) == result["spotlight_content_id"]
+        assert content.video_local_path is None
+        assert content.creator_username == "testcreator"
+
+    @pytest.mark.asyncio
+    async def test_fetch_failure_marks_submission_failed(
+        self, db_session: AsyncSession, auth_user: Any
+    ) -> None:
+        """Test an API error fails the submission and skips later stages"""
+        from app.tasks.ingestion_tasks import _ingest_spotlight_async
+
+        user, _ = auth_user
+        submission: Submission = await create_submission(db_session, user)
+        service: MagicMock = mock_snapchat_service()
+        service.fetch_spotlight_data.side_effect = HTTPException(
+            status_code=404, detail="Spotlight not found"
+        )
+        mock_transcribe = AsyncMock()
+
+        with (
+            patch("app.tasks.ingestion_tasks.AsyncSessionLocal", session_factory(db_session)),
+            patch("app.services.snapchat.snapchat_service", service),
+            patch("app.tasks.ingestion_tasks.transcribe_spotlight_content", mock_transcribe),
+        ):
+            result: dict[str, Any] = await _ingest_spotlight_async(
+                str(submission.id), SPOTLIGHT_LINK
+            )
+
+        assert result["success"] is False
+        assert "Spotlight not found" in result["error"]
+        mock_transcribe.assert_not_called()
+
+        await db_session.refresh(submission)
+        assert submission.status == "failed"
+        assert submission.ingestion_error == (
+            "Failed to fetch Spotlight content: Spotlight not found"
+        )
+
+    @pytest.mark.asyncio
+    async def test_default_flow_streams_audio_without_storing_video(
+        self, db_session: AsyncSession, auth_user: Any
+    ) -> None:
+        """Test default settings transcribe from the remote video, not a local copy"""
+        from app.services.audio_extraction_service import AudioExtractionResult
+        from app.services.whisper_service import TranscriptionResult
+        from app.tasks.ingestion_tasks import _ingest_spotlight_async
+
+        user, _ = auth_user
+        submission: Submission = await create_submission(db_session, user)
+        service: MagicMock = mock_snapchat_service()
+        audio_service: AsyncMock = AsyncMock()
+        audio_service.extract_audio_from_stream.return_value = AudioExtractionResult(
+            audio_path="/tmp/audio/abc123.mp3",
+            format="mp3",
+            duration_seconds=30.0,
+            file_size_bytes=1024,
+        )
+        audio_service.split_audio.return_value = []
+        whisper_service: AsyncMock = AsyncMock()
+        whisper_service.transcribe_chunks.return_value = TranscriptionResult(
+            text="Vaccins bevatten microchips", language="nl", confidence=0.9
+        )
+
+        with (
+            patch("app.tasks.ingestion_tasks.AsyncSessionLocal", session_factory(db_session)),
+            patch("app.services.snapchat.snapchat_service", service),
+            patch(
+                "app.services.transcription_service.get_audio_extraction_service",
+                return_value=audio_service,
+            ),
+            patch(
+                "app.services.transcription_service.get_whisper_service",
+                return_value=whisper_service,
+            ),
+            patch(
+                "app.tasks.ingestion_tasks.extract_spotlight_claims",
+                AsyncMock(return_value={"success": True}),
+            ),
+        ):
+            result: dict[str, Any] = await _ingest_spotlight_async(
+                str(submission.id), SPOTLIGHT_LINK
+            )
+
+        assert result["success"] is True
+        assert result["transcription"]["transcription"] == "Vaccins bevatten microchips"
+        service.download_video.assert_not_called()
+        audio_service.extract_audio_from_stream.assert_awaited_once_with(
+            video_url=PARSED_METADATA["video_url"], spotlight_id="abc123"
+        )
+        audio_service.extract_audio_from_video.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transcription_failure_marks_submission_failed(
+        self, db_session: AsyncSession, auth_user: Any
+    ) -> None:
+        """Test a failed transcription fails the submission and skips claim extraction"""
+        from app.tasks.ingestion_tasks import _ingest_spotlight_async
+
+        user, _ = auth_user
+        submission: Submission = await create_submission(db_session, user)
+        stages: list[str] = []
+        mock_extract = AsyncMock()
+
+        with (
+            patch("app.tasks.ingestion_tasks.AsyncSessionLocal", session_factory(db_session)),
+            patch("app.services.snapchat.snapchat_service", mock_snapchat_service()),
+            patch(
+                "app.tasks.ingestion_tasks.transcribe_spotlight_content",
+                AsyncMock(return_value={"success": False, "error": "No speech"}),
+            ),
+            patch("app.tasks.ingestion_tasks.extract_spotlight_claims", mock_extract),
+        ):
+            result: dict[str, Any] = await _ingest_spotlight_async(
+                str(submission.id), SPOTLIGHT_LINK, stages.append
+            )
+
+        assert result["success"] is False
+        assert result["error"] == "Transcription failed: No speech"
+        assert result["transcription"]["success"] is False
+        assert stages == ["fetching", "transcribing", "failed"]
+        mock_extract.assert_not_called()
+
+        await db_session.refresh(submission)
+        assert submission.status == "failed"
+        assert submission.ingestion_error == "Transcription failed: No speech"
+
+    @pytest.mark.asyncio
+    async def test_retry_reuses_stored_content(
+        self, db_session: AsyncSession, auth_user: Any
+    ) -> None:
+        """Test a retried fetch does not call the API or insert a duplicate"""
+        from app.tasks.ingestion_tasks import _fetch_spotlight_async
+
+        user, _ = auth_user
+        submission: Submission = await create_submission(db_session, user)
+        service: MagicMock = mock_snapchat_service()
+
+        with (
+            patch("app.tasks.ingestion_tasks.AsyncSessionLocal", session_factory(db_session)),
+            patch("app.services.snapchat.snapchat_service", service),
+        ):
+            first: dict[str, Any] = await _fetch_spotlight_async(str(submission.id), SPOTLIGHT_LINK)
+            second: dict[str, Any] = await _fetch_spotlight_async(
+                str(submission.id), SPOTLIGHT_LINK
+            )
+
+        assert first["spotlight_content_id"] == second["spotlight_content_id"]
+        service.fetch_spotlight_data.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_video_can_be_archived(self, db_session: AsyncSession, auth_user: Any) -> None:
+        """Test SPOTLIGHT_DOWNLOAD_VIDEO=True keeps a local copy next to the remote URL"""
+        from app.tasks.ingestion_tasks import _fetch_spotlight_async
+
+        user, _ = auth_user
+        submission: Submission = await create_submission(db_session, user)
+        service: MagicMock = mock_snapchat_service()
+
+        with (
+            patch("app.tasks.ingestion_tasks.AsyncSessionLocal", session_factory(db_session)),
+            patch("app.services.snapchat.snapchat_service", service),
+            patch("app.tasks.ingestion_tasks.settings.SPOTLIGHT_DOWNLOAD_VIDEO", True),
+        ):
+            result: dict[str, Any] = await _fetch_spotlight_async(
+                str(submission.id), SPOTLIGHT_LINK
+            )
+
+        assert result["success"] is True
+        service.download_video.assert_awaited_once_with(PARSED_METADATA["video_url"], "abc123")
+        content: SpotlightContent = (
+            await db_session.execute(
+                select(SpotlightContent).where(SpotlightContent.submission_id == submission.id)
+            )
+        ).scalar_one()
+        assert content.video_local_path == "/tmp/videos/abc123.mp4"
+        assert content.video_url == PARSED_METADATA["video_url"]
+
+
+class TestCreateSpotlightSubmissionEndpoint:
+    """Tests for POST /api/v1/submissions/spotlight"""
+
+    @pytest.mark.asyncio
+    async def test_returns_accepted_and_queues_ingestion(
+        self, client: TestClient, db_session: AsyncSession, auth_user: Any
+    ) -> None:
+        """Test the endpoint queues the task without calling the Snapchat API"""
+        _, token = auth_user
+
+        with patch("app.tasks.ingestion_tasks.ingest_spotlight.delay") as mock_delay:
+            mock_delay.return_value = MagicMock(id="task-123")
+            response = client.post(
+                "/api/v1/submissions/spotlight",
+                json={"spotlight_link": SPOTLIGHT_LINK},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 202
+        data: dict[str, Any] = response.json()
+        assert data["status"] == "fetching"
+        assert data["task_id"] == "task-123"
+        assert data["spotlight_link"] == SPOTLIGHT_LINK
+        mock_delay.assert_called_once_with(data["submission_id"], SPOTLIGHT_LINK)
+
+        submission: Submission = (
+            await db_session.execute(
+                select(Submission).where(Submission.submission_type == "spotlight")
+            )
+        ).scalar_one()
+        assert str(submission.id) == data["submission_id"]
+        assert submission.status == "fetching"
+
+    @pytest.mark.asyncio
+    async def test_enqueue_failure_marks_submission_failed(
+        self, client: TestClient, db_session: AsyncSession, auth_user: Any
+    ) -> None:
+        """Test a broker error fails the submission instead of leaving it fetching"""
+        _, token = auth_user
+
+        with patch(
+            "app.tasks.ingestion_tasks.ingest_spotlight.delay",
+            side_effect=ConnectionError("broker unreachable"),
+        ):
+            response = client.post(
+                "/api/v1/submissions/spotlight",
+                json={"spotlight_link": SPOTLIGHT_LINK},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 503
+        submission: Submission = (
+            await db_session.execute(
+                select(Submission).where(Submission.submission_type == "spotlight")
+            )
+        ).scalar_one()
+        await db_session.refresh(submission)
+        assert submission.status == "failed"
+        assert submission.ingestion_error == "Failed to queue ingestion: broker unreachable"
+
+    def test_requires_authentication(self, client: TestClient) -> None:
+        """Test unauthenticated requests are rejected"""
+        response = client.post(
+            "/api/v1/submissions/spotlight", json={"spotlight_link": SPOTLIGHT_LINK}
+        )
+
+        assert response.status_code in (401, 403)
@@ -24,3 +24,13 @@ class TestRetentionCleanupTask:
         assert schedule_config["task"] == "app.tasks.retention_tasks.run_retention_cleanup"
         assert schedule_config["schedule"] == 86400.0  # Daily (24 hours)
         assert schedule_config["options"]["queue"] == "maintenance"
+
+    def test_analytics_partition_maintenance_is_scheduled(self) -> None:
+        """Test that Celery Beat schedule includes analytics partition maintenance"""
+        from app.core.celery_app import celery_app
+
+        schedule_config: dict[str, Any] = celery_app.conf.beat_schedule[
+            "analytics-partitions-daily"
+        ]
+        assert schedule_config["task"] == "app.tasks.retention_tasks.maintain_analytics_partitions"
+        assert schedule_config["options"]["queue"] == "maintenance"
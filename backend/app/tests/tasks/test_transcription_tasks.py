@@ -340,3 +340,39 @@ class TestTranscriptionTaskErrorHandling:
             assert result["success"] is False
             # Logger should have been called for error
             assert mock_logger.error.called or mock_logger.warning.called
+
+
+class TestAudioSourceSelection:
+    """Test which extraction path is used for a spotlight"""
+
+    @pytest.mark.asyncio
+    async def test_remote_video_is_streamed(self) -> None:
+        """Test spotlights without a local file are streamed into FFmpeg"""
+        from app.services.transcription_service import _extract_audio
+
+        audio_service = AsyncMock()
+        spotlight = AsyncMock(
+            video_local_path=None, video_url="https://cdn.example.com/v.mp4", spotlight_id="s1"
+        )
+
+        await _extract_audio(audio_service, spotlight)
+
+        audio_service.extract_audio_from_stream.assert_called_once_with(
+            video_url="https://cdn.example.com/v.mp4", spotlight_id="s1"
+        )
+        audio_service.extract_audio_from_url.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_local_video_is_preferred(self) -> None:
+        """Test an already stored video is read from disk"""
+        from app.services.transcription_service import _extract_audio
+
+        audio_service = AsyncMock()
+        spotlight = AsyncMock(
+            video_local_path="/media/s1.mp4", video_url="https://cdn.example.com/v.mp4"
+        )
+
+        await _extract_audio(audio_service, spotlight)
+
+        audio_service.extract_audio_from_video.assert_called_once()
+        audio_service.extract_audio_from_stream.assert_not_called()
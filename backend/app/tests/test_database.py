@@ -0,0 +1,69 @@
+"""
+Tests for shared database helpers
+
+Covers:
+- run_concurrently on an engine-bound session (one session per query)
+- run_concurrently on a connection-bound session (sequential fallback)
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.core.database import run_concurrently
+
+
+@pytest.fixture
+async def engine(tmp_path: Path) -> AsyncIterator[AsyncEngine]:
+    """File-backed SQLite engine, so separate connections are possible"""
+    engine: AsyncEngine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    yield engine
+    await engine.dispose()
+
+
+def select_value(
+    value: int, sessions: list[AsyncSession]
+) -> Callable[[AsyncSession], Awaitable[Any]]:
+    """Build a query returning value that records the session it ran on"""
+
+    async def query(session: AsyncSession) -> Any:
+        sessions.append(session)
+        return (await session.execute(text(f"SELECT {value}"))).scalar_one()
+
+    return query
+
+
+class TestRunConcurrently:
+    """Tests for run_concurrently"""
+
+    async def test_engine_bound_session_uses_a_session_per_query(self, engine: AsyncEngine) -> None:
+        """Test every query gets its own session and results keep query order"""
+        sessions: list[AsyncSession] = []
+
+        async with AsyncSession(engine) as db:
+            results: list[Any] = await run_concurrently(
+                db, select_value(1, sessions), select_value(2, sessions)
+            )
+
+        assert results == [1, 2]
+        assert len({id(session) for session in sessions}) == 2
+        assert db not in sessions
+
+    async def test_connection_bound_session_runs_queries_on_itself(
+        self, engine: AsyncEngine
+    ) -> None:
+        """Test a session bound to one connection runs every query on that session"""
+        sessions: list[AsyncSession] = []
+
+        async with engine.connect() as connection:
+            async with AsyncSession(bind=connection) as db:
+                results: list[Any] = await run_concurrently(
+                    db, select_value(1, sessions), select_value(2, sessions)
+                )
+
+        assert results == [1, 2]
+        assert sessions == [db, db]
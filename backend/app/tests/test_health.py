@@ -44,3 +44,24 @@ def test_health_check_contains_version(client: TestClient) -> None:
 
     assert "version" in data
     assert isinstance(data["version"], str)
+
+
+def test_upstream_health_reports_http_client_metrics(client: TestClient) -> None:
+    """Test the upstream endpoint lists statistics for every outbound integration"""
+    response = client.get("/api/v1/health/upstreams")
+    data = response.json()
+
+    assert response.status_code == 200
+    assert isinstance(data["http2"], bool)
+    assert {"snapchat_api", "snapchat_media", "wayback", "openai"} <= set(data["upstreams"])
+    assert "avg_ms" in data["upstreams"]["wayback"]
+
+
+def test_token_blacklist_health_reports_filter_state(client: TestClient) -> None:
+    """Test the blacklist filter state and lookup counts are exposed"""
+    response = client.get("/api/v1/health/token-blacklist")
+    data = response.json()
+
+    assert response.status_code == 200
+    assert isinstance(data["ready"], bool)
+    assert {"lookups", "filtered", "redis_checks", "rebuilds"} <= set(data)
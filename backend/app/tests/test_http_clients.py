@@ -0,0 +1,209 @@
+"""
+Tests for the shared outbound HTTP client registry
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from redis.asyncio import Redis
+
+from app.core import redis as redis_module
+from app.core.http_clients import (
+    UPSTREAM_OPENAI,
+    UPSTREAM_SNAPCHAT_API,
+    UPSTREAM_SNAPCHAT_MEDIA,
+    UPSTREAM_WAYBACK,
+    HttpClientRegistry,
+    UpstreamConfig,
+    closing_http_clients,
+    default_upstream_configs,
+    get_http_client,
+)
+from app.core.redis import get_redis_client
+
+
+def ok_transport(status_code: int = 200) -> httpx.MockTransport:
+    """Transport answering every request with the given status"""
+    return httpx.MockTransport(lambda request: httpx.Response(status_code, text="ok"))
+
+
+class TestUpstreamConfigs:
+    """Tests for the per-upstream settings"""
+
+    def test_every_integration_has_an_upstream(self) -> None:
+        """Test all outbound integrations are configured"""
+        configs: dict[str, UpstreamConfig] = default_upstream_configs()
+
+        assert set(configs) == {
+            UPSTREAM_SNAPCHAT_API,
+            UPSTREAM_SNAPCHAT_MEDIA,
+            UPSTREAM_WAYBACK,
+            UPSTREAM_OPENAI,
+        }
+        assert configs[UPSTREAM_SNAPCHAT_MEDIA].follow_redirects is True
+
+    def test_timeout_and_limits(self) -> None:
+        """Test configs translate into httpx timeouts and pool limits"""
+        config = UpstreamConfig(
+            timeout_seconds=30.0, max_connections=4, connect_timeout_seconds=2.0
+        )
+
+        assert config.timeout.read == 30.0
+        assert config.timeout.connect == 2.0
+        assert config.limits.max_connections == 4
+        assert config.limits.max_keepalive_connections == 4
+
+
+class TestHttpClientRegistry:
+    """Tests for HttpClientRegistry"""
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_within_a_loop(self) -> None:
+        """Test repeated lookups return the same pooled client"""
+        registry = HttpClientRegistry(http2=False, transport=ok_transport())
+
+        first: httpx.AsyncClient = registry.get(UPSTREAM_WAYBACK)
+
+        assert registry.get(UPSTREAM_WAYBACK) is first
+        assert registry.get(UPSTREAM_OPENAI) is not first
+        await registry.aclose()
+
+    def test_each_event_loop_gets_its_own_client(self) -> None:
+        """Test clients are not reused across loops (one asyncio.run per Celery task)"""
+        registry = HttpClientRegistry(http2=False, transport=ok_transport())
+
+        async def lookup() -> httpx.AsyncClient:
+            return registry.get(UPSTREAM_WAYBACK)
+
+        first: httpx.AsyncClient = asyncio.run(lookup())
+        second: httpx.AsyncClient = asyncio.run(lookup())
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_client_uses_upstream_timeout(self) -> None:
+        """Test the client carries the upstream's timeout and redirect policy"""
+        configs = {
+            "cdn": UpstreamConfig(timeout_seconds=12.0, max_connections=2, follow_redirects=True)
+        }
+        registry = HttpClientRegistry(configs, http2=False, transport=ok_transport())
+
+        client: httpx.AsyncClient = registry.get("cdn")
+
+        assert client.timeout.read == 12.0
+        assert client.follow_redirects is True
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_upstream_raises(self) -> None:
+        """Test lookups of unconfigured upstreams fail loudly"""
+        registry = HttpClientRegistry(http2=False, transport=ok_transport())
+
+        with pytest.raises(KeyError):
+            registry.get("unknown")
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_and_replaces_clients(self) -> None:
+        """Test closed clients are dropped and recreated on next use"""
+        registry = HttpClientRegistry(http2=False, transport=ok_transport())
+        client: httpx.AsyncClient = registry.get(UPSTREAM_WAYBACK)
+
+        await registry.aclose()
+
+        assert client.is_closed
+        assert registry.get(UPSTREAM_WAYBACK) is not client
+        await registry.aclose()
+
+    def test_http2_requires_h2_package(self) -> None:
+        """Test HTTP/2 is only enabled when h2 is installed"""
+        with patch("app.core.http_clients.http2_available", return_value=False):
+            assert HttpClientRegistry().http2 is False
+        with patch("app.core.http_clients.http2_available", return_value=True):
+            assert HttpClientRegistry().http2 is True
+
+    @pytest.mark.asyncio
+    async def test_clients_are_built_with_http2(self) -> None:
+        """Test the default registry builds its upstream transports with HTTP/2 enabled"""
+        registry = HttpClientRegistry()
+
+        with patch(
+            "app.core.http_clients.httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport
+        ) as mock_transport:
+            registry.get(UPSTREAM_OPENAI)
+
+        assert registry.http2 is True
+        assert mock_transport.call_args.kwargs["http2"] is True
+        await registry.aclose()
+
+
+class TestUpstreamMetrics:
+    """Tests for per-upstream request metrics"""
+
+    @pytest.mark.asyncio
+    async def test_records_requests_and_status_codes(self) -> None:
+        """Test responses are counted per upstream and status code"""
+        registry = HttpClientRegistry(http2=False, transport=ok_transport(503))
+        client: httpx.AsyncClient = registry.get(UPSTREAM_WAYBACK)
+
+        await client.get("https://web.archive.org/save/https://example.com")
+        await client.get("https://web.archive.org/save/https://example.com")
+
+        snapshot = registry.metrics_snapshot()
+        assert snapshot[UPSTREAM_WAYBACK]["requests"] == 2
+        assert snapshot[UPSTREAM_WAYBACK]["errors"] == 0
+        assert snapshot[UPSTREAM_WAYBACK]["status_codes"] == {"503": 2}
+        assert snapshot[UPSTREAM_OPENAI]["requests"] == 0
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_records_transport_errors(self) -> None:
+        """Test connection failures count as errors"""
+
+        def fail(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        registry = HttpClientRegistry(http2=False, transport=httpx.MockTransport(fail))
+        client: httpx.AsyncClient = registry.get(UPSTREAM_SNAPCHAT_API)
+
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://snapchat3.p.rapidapi.com/getSpotlightByLink")
+
+        snapshot = registry.metrics_snapshot()[UPSTREAM_SNAPCHAT_API]
+        assert snapshot["requests"] == 1
+        assert snapshot["errors"] == 1
+        await registry.aclose()
+
+
+class TestModuleHelpers:
+    """Tests for the process-wide registry helpers"""
+
+    @pytest.mark.asyncio
+    async def test_closing_http_clients_closes_after_coroutine(self) -> None:
+        """Test Celery task coroutines close their clients when done"""
+        registry = HttpClientRegistry(http2=False, transport=ok_transport())
+
+        async def task_body() -> httpx.AsyncClient:
+            return get_http_client(UPSTREAM_OPENAI)
+
+        with patch("app.core.http_clients._registry", registry):
+            client: httpx.AsyncClient = await closing_http_clients(task_body())
+
+        assert client.is_closed
+
+    def test_task_loops_do_not_leak_redis_clients(self) -> None:
+        """Test each task loop's Redis client is closed before the loop ends"""
+
+        async def task_body() -> object:
+            return get_redis_client()
+
+        with (
+            patch.object(redis_module, "_redis_client", None),
+            patch.object(Redis, "aclose", autospec=True) as aclose,
+        ):
+            clients = [asyncio.run(closing_http_clients(task_body())) for _ in range(2)]
+
+            assert clients[0] is not clients[1]
+            assert [call.args[0] for call in aclose.await_args_list] == clients
+            assert redis_module._redis_client is None
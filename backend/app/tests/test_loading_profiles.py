@@ -0,0 +1,149 @@
+"""
+Tests for relationship loading profiles (app.models.loading)
+
+Relationships are lazy="raise", so each endpoint issues a fixed number of
+statements no matter how many rows it returns. These tests pin those counts;
+when a change adds a query on purpose, update the expected number here.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import create_access_token
+from app.models.claim import Claim
+from app.models.loading import SUBMISSION_CLAIMS
+from app.models.submission import Submission
+from app.models.submission_reviewer import SubmissionReviewer
+from app.models.user import User, UserRole
+from app.tests.helpers import count_queries
+
+
+async def create_admin(db_session: AsyncSession, client: TestClient) -> tuple[User, dict[str, str]]:
+    """Create an admin and warm the principal cache for its token"""
+    admin = User(email="admin@example.com", password_hash="hashed", role=UserRole.ADMIN)
+    db_session.add(admin)
+    await db_session.commit()
+    await db_session.refresh(admin)
+    headers: dict[str, str] = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': str(admin.id)})}"
+    }
+    # Authentication is served from the principal cache in the measured requests
+    assert client.get("/api/v1/users/me", headers=headers).status_code == 200
+    return admin, headers
+
+
+async def create_submissions(
+    db_session: AsyncSession, owner: User, reviewer: User, count: int
+) -> list[Submission]:
+    """Create submissions, each with one claim and one assigned reviewer"""
+    submissions: list[Submission] = []
+    for i in range(count):
+        submission = Submission(
+            user_id=owner.id,
+            content=f"Submission {i}",
+            submission_type="text",
+            claims=[Claim(content=f"Claim {i}", source="test")],
+        )
+        db_session.add(submission)
+        await db_session.flush()
+        db_session.add(
+            SubmissionReviewer(
+                submission_id=submission.id, reviewer_id=reviewer.id, assigned_by_id=owner.id
+            )
+        )
+        submissions.append(submission)
+    await db_session.commit()
+    return submissions
+
+
+@pytest.fixture
+async def reviewer(db_session: AsyncSession) -> User:
+    """Create a reviewer to assign to submissions"""
+    user = User(email="reviewer@example.com", password_hash="hashed", role=UserRole.REVIEWER)
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+class TestEndpointQueryCounts:
+    """Statement counts per endpoint with a warm principal cache"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("rows", [1, 5])
+    async def test_list_submissions(
+        self, client: TestClient, db_session: AsyncSession, reviewer: User, rows: int
+    ) -> None:
+        """Test the list issues count + page + assignments + reviewers for any page size"""
+        admin, headers = await create_admin(db_session, client)
+        await create_submissions(db_session, admin, reviewer, rows)
+        db_session.expunge_all()
+
+        with count_queries(db_session) as queries:
+            response = client.get("/api/v1/submissions", headers=headers)
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == rows
+        assert queries.count == 4, queries.statements
+
+    @pytest.mark.asyncio
+    async def test_get_submission(
+        self, client: TestClient, db_session: AsyncSession, reviewer: User
+    ) -> None:
+        """Test the detail page loads exactly the SUBMISSION_DETAIL relationships"""
+        admin, headers = await create_admin(db_session, client)
+        (submission,) = await create_submissions(db_session, admin, reviewer, 1)
+        db_session.expunge_all()
+
+        with count_queries(db_session) as queries:
+            response = client.get(f"/api/v1/submissions/{submission.id}", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json()["reviewers"][0]["id"] == str(reviewer.id)
+        # submission, user, claims, fact_checks, spotlight, assignments, reviewers
+        assert queries.count == 7, queries.statements
+
+    @pytest.mark.asyncio
+    async def test_workflow_transition(
+        self, client: TestClient, db_session: AsyncSession, reviewer: User
+    ) -> None:
+        """Test a transition loads no relationships of the submission"""
+        admin, headers = await create_admin(db_session, client)
+        (submission,) = await create_submissions(db_session, admin, reviewer, 1)
+        db_session.expunge_all()
+
+        with count_queries(db_session) as queries:
+            response = client.post(
+                f"/api/v1/workflow/{submission.id}/transition",
+                json={"to_state": "queued"},
+                headers=headers,
+            )
+
+        assert response.status_code == 200
+        assert not any("claims" in statement for statement in queries.statements)
+        # submission, actor, UPDATE submission, INSERT transition, refresh
+        assert queries.count == 5, queries.statements
+
+
+class TestRaiseOnUnloaded:
+    """Relationships outside the query's profile raise instead of loading"""
+
+    @pytest.mark.asyncio
+    async def test_unloaded_relationship_raises(
+        self, db_session: AsyncSession, reviewer: User
+    ) -> None:
+        """Test touching a relationship no option asked for raises"""
+        (submission,) = await create_submissions(db_session, reviewer, reviewer, 1)
+        db_session.expunge_all()
+
+        result = await db_session.execute(
+            select(Submission).where(Submission.id == submission.id).options(*SUBMISSION_CLAIMS)
+        )
+        loaded: Submission = result.scalar_one()
+
+        assert [claim.content for claim in loaded.claims] == ["Claim 0"]
+        with pytest.raises(InvalidRequestError):
+            _ = loaded.reviewer_assignments
@@ -0,0 +1,149 @@
+"""
+Tests for keyset pagination and listing totals (app.core.pagination)
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_total,
+    decode_cursor,
+    encode_cursor,
+    fetch_keyset_page,
+)
+from app.models.submission import Submission
+from app.models.user import User, UserRole
+
+BASE_TIME = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+async def create_submissions(db_session: AsyncSession, created_at: list[datetime]) -> None:
+    """Create one submission per timestamp"""
+    user = User(email="pager@example.com", password_hash="hashed", role=UserRole.SUBMITTER)
+    db_session.add(user)
+    await db_session.flush()
+    db_session.add_all(
+        Submission(
+            user_id=user.id, content=f"Submission {i}", submission_type="text", created_at=ts
+        )
+        for i, ts in enumerate(created_at)
+    )
+    await db_session.commit()
+
+
+async def create_submissions_for_other_user(db_session: AsyncSession) -> None:
+    """Add one more submission after a count was cached"""
+    user = User(email="other@example.com", password_hash="hashed", role=UserRole.SUBMITTER)
+    db_session.add(user)
+    await db_session.flush()
+    db_session.add(Submission(user_id=user.id, content="Late", submission_type="text"))
+    await db_session.commit()
+
+
+class TestCursor:
+    """Tests for cursor encoding"""
+
+    def test_round_trip(self) -> None:
+        """Test a cursor decodes to the key it was built from"""
+        row_id: UUID = uuid4()
+        cursor: str = encode_cursor(BASE_TIME, row_id)
+
+        assert decode_cursor(cursor) == (BASE_TIME, row_id)
+        assert "=" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "WzEsMl0", "e30"])
+    def test_invalid_cursor_raises(self, cursor: str) -> None:
+        """Test tampered or foreign cursors raise InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+
+class TestFetchKeysetPage:
+    """Tests for walking a listing page by page"""
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_every_row_once_with_ties(self, db_session: AsyncSession) -> None:
+        """Test rows sharing a created_at are neither skipped nor repeated"""
+        timestamps: list[datetime] = [BASE_TIME] * 4 + [
+            BASE_TIME + timedelta(minutes=i) for i in range(1, 4)
+        ]
+        await create_submissions(db_session, timestamps)
+
+        seen: list[Any] = []
+        cursor: str | None = None
+        pages: int = 0
+        while True:
+            page = await fetch_keyset_page(
+                db_session,
+                select(Submission),
+                Submission.created_at,
+                Submission.id,
+                limit=3,
+                cursor=cursor,
+            )
+            seen.extend(page.items)
+            pages += 1
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert len({s.id for s in seen}) == len(timestamps) == len(seen)
+        keys = [(s.created_at, s.id) for s in seen]
+        assert keys == sorted(keys, reverse=True)
+
+    @pytest.mark.asyncio
+    async def test_last_full_page_has_no_cursor(self, db_session: AsyncSession) -> None:
+        """Test a page that ends exactly at the last row does not offer another"""
+        await create_submissions(db_session, [BASE_TIME + timedelta(minutes=i) for i in range(3)])
+
+        page = await fetch_keyset_page(
+            db_session, select(Submission), Submission.created_at, Submission.id, limit=3
+        )
+
+        assert len(page.items) == 3
+        assert page.next_cursor is None
+
+
+class TestCountTotal:
+    """Tests for the count modes"""
+
+    @pytest.mark.asyncio
+    async def test_none_skips_the_count(self, db_session: AsyncSession) -> None:
+        """Test CountMode.NONE returns no total"""
+        await create_submissions(db_session, [BASE_TIME])
+
+        assert await count_total(db_session, select(Submission), CountMode.NONE, "k") is None
+
+    @pytest.mark.asyncio
+    async def test_estimated_falls_back_to_exact_outside_postgres(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test the planner estimate is only used on PostgreSQL"""
+        await create_submissions(db_session, [BASE_TIME] * 3)
+
+        total = await count_total(db_session, select(Submission), CountMode.ESTIMATED, "k")
+
+        assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_count_is_reused(
+        self, db_session: AsyncSession, test_redis_client: Any
+    ) -> None:
+        """Test a cached total is served from Redis until it expires"""
+        await create_submissions(db_session, [BASE_TIME] * 2)
+        stmt = select(Submission)
+
+        assert await count_total(db_session, stmt, CountMode.CACHED, "test:subs") == 2
+        await create_submissions_for_other_user(db_session)
+
+        assert await count_total(db_session, stmt, CountMode.CACHED, "test:subs") == 2
+        assert await count_total(db_session, stmt, CountMode.EXACT, "test:subs") == 3
+        assert await test_redis_client.ttl("count:test:subs") > 0
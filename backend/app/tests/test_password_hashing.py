@@ -0,0 +1,224 @@
+"""
+Tests for off-loop password hashing and rehash-on-login
+"""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.context import CryptContext  # type: ignore[import-untyped]
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.password_hashing import PasswordHasher, PasswordHasherBusyError
+from app.core.security import hash_password, verify_password
+from app.models.user import User, UserRole
+
+# Low-cost bcrypt so the rehash tests stay fast
+LOW_COST_CONTEXT = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+
+
+def bcrypt_rounds(hashed: str) -> int:
+    """Return the cost factor encoded in a bcrypt hash"""
+    return int(hashed.split("$")[2])
+
+
+class TestPasswordHasher:
+    """Tests for the bounded hashing pool"""
+
+    @pytest.mark.asyncio
+    async def test_hash_and_verify_off_loop(self) -> None:
+        """Test hashes made on the pool verify with the sync helpers"""
+        hasher = PasswordHasher(max_workers=1, queue_limit=4)
+        try:
+            hashed: str = await hasher.hash("password123")
+            verified, new_hash = await hasher.verify_and_update("password123", hashed)
+        finally:
+            hasher.shutdown()
+
+        assert verify_password("password123", hashed)
+        assert verified is True
+        assert new_hash is None
+        assert hasher.metrics.completed == 2
+        assert hasher.metrics.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_wrong_password_is_not_verified(self) -> None:
+        """Test a wrong password fails and never triggers a rehash"""
+        hasher = PasswordHasher(max_workers=1, queue_limit=4)
+        try:
+            verified, new_hash = await hasher.verify_and_update(
+                "wrong", LOW_COST_CONTEXT.hash("password123")
+            )
+        finally:
+            hasher.shutdown()
+
+        assert verified is False
+        assert new_hash is None
+
+    @pytest.mark.asyncio
+    async def test_outdated_cost_is_rehashed(self) -> None:
+        """Test a hash with a different cost factor is upgraded on verification"""
+        hasher = PasswordHasher(max_workers=1, queue_limit=4)
+        try:
+            verified, new_hash = await hasher.verify_and_update(
+                "password123", LOW_COST_CONTEXT.hash("password123")
+            )
+        finally:
+            hasher.shutdown()
+
+        assert verified is True
+        assert new_hash is not None
+        assert bcrypt_rounds(new_hash) == 12
+        assert verify_password("password123", new_hash)
+        assert hasher.metrics.rehashed == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects_new_jobs(self) -> None:
+        """Test jobs beyond the queue limit fail fast and are counted"""
+        hasher = PasswordHasher(max_workers=1, queue_limit=2)
+        release = threading.Event()
+
+        def blocking_hash(password: str) -> str:
+            release.wait(timeout=5)
+            return password
+
+        try:
+            with patch("app.core.password_hashing.hash_password", blocking_hash):
+                running = [asyncio.create_task(hasher.hash("a")) for _ in range(2)]
+                await asyncio.sleep(0)
+
+                with pytest.raises(PasswordHasherBusyError):
+                    await hasher.hash("b")
+
+                release.set()
+                assert await asyncio.gather(*running) == ["a", "a"]
+        finally:
+            hasher.shutdown()
+
+        assert hasher.metrics.rejected == 1
+        assert hasher.metrics.max_pending == 2
+        assert hasher.metrics.snapshot()["completed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_hashing_does_not_block_event_loop(self) -> None:
+        """Test other coroutines keep running while a hash is computed"""
+        hasher = PasswordHasher(max_workers=1, queue_limit=4)
+        ticks: int = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            await hasher.hash("password123")
+        finally:
+            ticker_task.cancel()
+            hasher.shutdown()
+
+        assert ticks > 1
+
+
+class TestLoginRehash:
+    """Tests for transparent rehash-on-login"""
+
+    @pytest.mark.asyncio
+    async def test_login_upgrades_outdated_hash(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test a successful login stores a hash with the configured cost"""
+        user = User(
+            email="rehash@example.com",
+            password_hash=LOW_COST_CONTEXT.hash("password123"),
+            role=UserRole.SUBMITTER,
+        )
+        db_session.add(user)
+        await db_session.commit()
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": "rehash@example.com", "password": "password123"},
+        )
+
+        assert response.status_code == 200
+        stored: User = (
+            await db_session.execute(select(User).where(User.email == "rehash@example.com"))
+        ).scalar_one()
+        await db_session.refresh(stored)
+        assert bcrypt_rounds(stored.password_hash) == 12
+        assert verify_password("password123", stored.password_hash)
+
+    @pytest.mark.asyncio
+    async def test_login_keeps_current_hash(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test hashes already at the configured cost are left unchanged"""
+        original: str = hash_password("password123")
+        user = User(email="current@example.com", password_hash=original, role=UserRole.SUBMITTER)
+        db_session.add(user)
+        await db_session.commit()
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": "current@example.com", "password": "password123"},
+        )
+
+        assert response.status_code == 200
+        await db_session.refresh(user)
+        assert user.password_hash == original
+
+
+class TestBackpressure:
+    """Tests for the 503 response when the hashing queue is full"""
+
+    def test_register_returns_503_when_busy(self, client: TestClient) -> None:
+        """Test registration is rejected with Retry-After when saturated"""
+        with patch(
+            "app.core.password_hashing.PasswordHasher.hash",
+            side_effect=PasswordHasherBusyError("full"),
+        ):
+            response = client.post(
+                "/api/v1/auth/register",
+                json={"email": "busy@example.com", "password": "password123"},
+            )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_login_returns_503_when_busy(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test login is rejected with Retry-After when saturated"""
+        db_session.add(
+            User(
+                email="busy-login@example.com",
+                password_hash=LOW_COST_CONTEXT.hash("password123"),
+                role=UserRole.SUBMITTER,
+            )
+        )
+        await db_session.commit()
+
+        with patch(
+            "app.core.password_hashing.PasswordHasher.verify_and_update",
+            side_effect=PasswordHasherBusyError("full"),
+        ):
+            response = client.post(
+                "/api/v1/auth/login",
+                json={"email": "busy-login@example.com", "password": "password123"},
+            )
+
+        assert response.status_code == 503
+
+    def test_health_reports_hashing_metrics(self, client: TestClient) -> None:
+        """Test the pool statistics are exposed"""
+        response = client.get("/api/v1/health/password-hashing")
+        data = response.json()
+
+        assert response.status_code == 200
+        assert {"queue_limit", "pending", "rejected", "avg_wait_ms"} <= set(data)
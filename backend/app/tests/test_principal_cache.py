@@ -0,0 +1,222 @@
+"""
+Tests for the authenticated principal cache in get_current_user
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.principal_cache import (
+    INVALIDATION_CHANNEL,
+    Principal,
+    PrincipalCache,
+    create_invalidation_listener,
+    get_principal_cache,
+)
+from app.core.security import create_access_token, create_refresh_token, decode_token
+from app.models.user import User, UserRole
+from app.services.rtbf_service import RTBFService
+
+
+def make_principal(role: UserRole = UserRole.SUBMITTER) -> Principal:
+    """Build a principal without touching the database"""
+    now: datetime = datetime.now(timezone.utc)
+    return Principal(
+        id=uuid4(),
+        email="principal@example.com",
+        role=role,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def create_user(db_session: AsyncSession, email: str, role: UserRole) -> tuple[User, str]:
+    """Create a user and an access token for it"""
+    user = User(email=email, password_hash="hashed", role=role, is_active=True)
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user, create_access_token(data={"sub": str(user.id)})
+
+
+def token_jti(token: str) -> str:
+    """Return the jti claim of a token"""
+    payload: dict[str, Any] | None = decode_token(token)
+    assert payload is not None
+    return str(payload["jti"])
+
+
+def auth(token: str) -> dict[str, str]:
+    """Build the Authorization header for a token"""
+    return {"Authorization": f"Bearer {token}"}
+
+
+class TestPrincipalCache:
+    """Tests for the in-process cache"""
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Test a principal is not returned once its TTL has passed"""
+        cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+        principal: Principal = make_principal()
+        cache.set("jti-1", principal)
+
+        assert cache.get(principal.id, "jti-1") == principal
+        with patch("app.core.principal_cache.time.monotonic", return_value=10**9):
+            assert cache.get(principal.id, "jti-1") is None
+        assert len(cache) == 0
+
+    def test_oldest_entries_are_evicted(self) -> None:
+        """Test the cache never holds more than max_entries"""
+        cache = PrincipalCache(ttl_seconds=30, max_entries=2)
+        principals: list[Principal] = [make_principal() for _ in range(3)]
+        for i, principal in enumerate(principals):
+            cache.set(f"jti-{i}", principal)
+
+        assert len(cache) == 2
+        assert cache.get(principals[0].id, "jti-0") is None
+        assert cache.get(principals[2].id, "jti-2") == principals[2]
+
+    def test_invalidate_user_drops_all_tokens(self) -> None:
+        """Test invalidating a user drops every token but leaves others"""
+        cache = PrincipalCache(ttl_seconds=30, max_entries=10)
+        principal: Principal = make_principal()
+        other: Principal = make_principal()
+        cache.set("jti-a", principal)
+        cache.set("jti-b", principal)
+        cache.set("jti-c", other)
+
+        cache.invalidate_user(principal.id)
+
+        assert cache.get(principal.id, "jti-a") is None
+        assert cache.get(principal.id, "jti-b") is None
+        assert cache.get(other.id, "jti-c") == other
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        """Test PRINCIPAL_CACHE_TTL_SECONDS=0 turns caching off"""
+        cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+        principal: Principal = make_principal()
+        cache.set("jti-1", principal)
+
+        assert cache.get(principal.id, "jti-1") is None
+
+
+class TestGetCurrentUserCaching:
+    """Tests for cache use and invalidation in get_current_user"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_skips_redis_and_database(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test the second request with a token is served from the cache"""
+        _, token = await create_user(db_session, "cached@example.com", UserRole.SUBMITTER)
+        assert client.get("/api/v1/users/me", headers=auth(token)).status_code == 200
+
+        with (
+            patch("app.core.dependencies._load_principal", AsyncMock()) as load,
+            patch("app.core.dependencies._check_not_blacklisted", AsyncMock()) as blacklist,
+        ):
+            response = client.get("/api/v1/users/me", headers=auth(token))
+
+        assert response.status_code == 200
+        assert response.json()["email"] == "cached@example.com"
+        load.assert_not_awaited()
+        blacklist.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_logout_invalidates_cached_token(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test a cached access token is rejected right after logout"""
+        user, token = await create_user(db_session, "logout@example.com", UserRole.SUBMITTER)
+        assert client.get("/api/v1/users/me", headers=auth(token)).status_code == 200
+
+        refresh_token: str = create_refresh_token(data={"sub": str(user.id)})
+        logout = client.post(
+            "/api/v1/auth/logout", json={"refresh_token": refresh_token}, headers=auth(token)
+        )
+
+        assert logout.status_code == 200
+        assert get_principal_cache().get(user.id, token_jti(token)) is None
+        assert client.get("/api/v1/users/me", headers=auth(token)).status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_role_change_is_visible_immediately(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test a role update invalidates the user's cached principal"""
+        user, token = await create_user(db_session, "promoted@example.com", UserRole.SUBMITTER)
+        _, admin_token = await create_user(db_session, "admin@example.com", UserRole.SUPER_ADMIN)
+        assert client.get("/api/v1/users/me", headers=auth(token)).json()["role"] == "submitter"
+
+        response = client.patch(
+            f"/api/v1/users/{user.id}/role", json={"role": "reviewer"}, headers=auth(admin_token)
+        )
+
+        assert response.status_code == 200
+        assert client.get("/api/v1/users/me", headers=auth(token)).json()["role"] == "reviewer"
+
+    @pytest.mark.asyncio
+    async def test_deactivation_is_visible_immediately(
+        self, client: TestClient, db_session: AsyncSession
+    ) -> None:
+        """Test a deactivated user is rejected despite a cached principal"""
+        user, token = await create_user(db_session, "deactivated@example.com", UserRole.SUBMITTER)
+        _, admin_token = await create_user(db_session, "admin2@example.com", UserRole.ADMIN)
+        assert client.get("/api/v1/users/me", headers=auth(token)).status_code == 200
+
+        response = client.patch(
+            f"/api/v1/users/{user.id}", json={"is_active": False}, headers=auth(admin_token)
+        )
+
+        assert response.status_code == 200
+        assert client.get("/api/v1/users/me", headers=auth(token)).status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_rtbf_anonymization_invalidates_user(self, db_session: AsyncSession) -> None:
+        """Test RTBF processing drops the anonymized user's cached tokens"""
+        user, token = await create_user(db_session, "forget-me@example.com", UserRole.SUBMITTER)
+        cache: PrincipalCache = get_principal_cache()
+        jti: str = token_jti(token)
+        cache.set(jti, Principal.from_user(user))
+
+        await RTBFService(db_session).delete_user_personal_data(user.id)
+
+        assert cache.get(user.id, jti) is None
+
+
+class TestInvalidationListener:
+    """Tests for cross-process invalidation over Redis pub/sub"""
+
+    @pytest.mark.asyncio
+    async def test_published_invalidation_is_applied(self, test_redis_client: Any) -> None:
+        """Test an invalidation published by another process clears the entry"""
+        cache: PrincipalCache = get_principal_cache()
+        principal: Principal = make_principal()
+        cache.set("remote-jti", principal)
+
+        listener = create_invalidation_listener(retry_delay=0.01, poll_timeout=0.05)
+        listener.start()
+        try:
+            for _ in range(100):
+                if (await test_redis_client.pubsub_numsub(INVALIDATION_CHANNEL))[0][1]:
+                    break
+                await asyncio.sleep(0.01)
+            await test_redis_client.publish(
+                INVALIDATION_CHANNEL, json.dumps({"user_id": str(principal.id), "jti": None})
+            )
+            for _ in range(100):
+                if cache.get(principal.id, "remote-jti") is None:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await listener.stop()
+
+        assert cache.get(principal.id, "remote-jti") is None
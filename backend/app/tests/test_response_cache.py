@@ -0,0 +1,303 @@
+"""
+Tests for the Redis-backed response cache of public and analytics endpoints
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, Request, Response
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.core.response_cache as response_cache_module
+from app.core.response_cache import (
+    TRANSPARENCY_PAGES,
+    TRANSPARENCY_REPORTS,
+    CachedResponse,
+    ResponseCache,
+    etag_matches,
+)
+from app.models.transparency_page import TransparencyPage
+from app.services import transparency_page_service
+
+
+class FakeRedis:
+    """In-memory stand-in for the handful of Redis commands the cache uses"""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.data.get(key)
+
+    async def set(
+        self, key: str, value: bytes, nx: bool = False, px: Any = None, ex: Any = None
+    ) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete(self, key: str) -> int:
+        return 1 if self.data.pop(key, None) is not None else 0
+
+    async def incr(self, key: str) -> int:
+        value: int = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+def make_request(path: str = "/api/v1/transparency", query: str = "", **headers: str) -> Request:
+    """Build a GET request for respond()"""
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+        }
+    )
+
+
+class Counter:
+    """build() callable counting its invocations"""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls: int = 0
+        self.delay: float = delay
+
+    async def __call__(self) -> dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"calls": self.calls}
+
+
+class TestEtags:
+    """Tests for ETag rendering and If-None-Match matching"""
+
+    def test_render_keeps_download_headers(self) -> None:
+        """Test a Response keeps its Content-Disposition and gets a body ETag"""
+        rendered: CachedResponse = CachedResponse.render(
+            Response(
+                content="a,b\n",
+                media_type="text/csv",
+                headers={"Content-Disposition": 'attachment; filename="r.csv"'},
+            )
+        )
+
+        assert rendered.headers == {"content-disposition": 'attachment; filename="r.csv"'}
+        assert CachedResponse.unpack(rendered.pack()) == rendered
+
+    def test_if_none_match_lists_and_weak_tags(self) -> None:
+        """Test several and weak validators are compared against the ETag"""
+        assert etag_matches('"a", W/"b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
+
+
+class TestResponseCache:
+    """Tests for caching, revalidation and invalidation"""
+
+    async def test_second_request_is_a_hit(self) -> None:
+        """Test the second identical request is served from Redis"""
+        cache = ResponseCache(enabled=True, redis_client=FakeRedis())
+        build = Counter()
+
+        first: Response = await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, build)
+        second: Response = await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, build)
+
+        assert build.calls == 1
+        assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+        assert second.body == first.body == b'{"calls":1}'
+        assert second.headers["etag"] == first.headers["etag"]
+        assert second.headers["cache-control"] == "public, max-age=60"
+
+    async def test_query_order_does_not_matter(self) -> None:
+        """Test reordered query parameters share an entry"""
+        cache = ResponseCache(enabled=True, redis_client=FakeRedis())
+        build = Counter()
+
+        await cache.respond(make_request(query="a=1&b=2"), TRANSPARENCY_PAGES, 60, build)
+        await cache.respond(make_request(query="b=2&a=1"), TRANSPARENCY_PAGES, 60, build)
+        await cache.respond(make_request(query="a=2&b=2"), TRANSPARENCY_PAGES, 60, build)
+
+        assert build.calls == 2
+
+    async def test_matching_etag_gets_304(self) -> None:
+        """Test a client holding the current ETag gets 304 without a body"""
+        cache = ResponseCache(enabled=True, redis_client=FakeRedis())
+        first: Response = await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, Counter())
+
+        revalidated: Response = await cache.respond(
+            make_request(if_none_match=first.headers["etag"]), TRANSPARENCY_PAGES, 60, Counter()
+        )
+
+        assert revalidated.status_code == 304
+        assert revalidated.body == b""
+        assert revalidated.headers["etag"] == first.headers["etag"]
+
+    async def test_invalidation_is_per_namespace(self) -> None:
+        """Test invalidating a namespace recomputes only its responses"""
+        cache = ResponseCache(enabled=True, redis_client=FakeRedis())
+        pages, reports = Counter(), Counter()
+        for _ in range(2):
+            await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, pages)
+            await cache.respond(make_request(), TRANSPARENCY_REPORTS, 60, reports)
+
+        await cache.invalidate(TRANSPARENCY_PAGES)
+        await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, pages)
+        await cache.respond(make_request(), TRANSPARENCY_REPORTS, 60, reports)
+
+        assert (pages.calls, reports.calls) == (2, 1)
+
+    async def test_errors_are_not_cached(self) -> None:
+        """Test a 404 raised by build is re-raised on every request"""
+        cache = ResponseCache(enabled=True, redis_client=FakeRedis())
+
+        async def not_found() -> None:
+            raise HTTPException(status_code=404, detail="Not found")
+
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, not_found)
+        assert cache.stats()["misses"] == 2
+
+
+class TestSingleFlight:
+    """Tests that concurrent misses compute a response once"""
+
+    async def test_concurrent_misses_share_one_computation(self) -> None:
+        """Test a burst of requests for a cold key calls build once"""
+        cache = ResponseCache(enabled=True, redis_client=FakeRedis())
+        build = Counter(delay=0.05)
+
+        responses: list[Response] = await asyncio.gather(
+            *[cache.respond(make_request(), TRANSPARENCY_PAGES, 60, build) for _ in range(20)]
+        )
+
+        assert build.calls == 1
+        assert {response.body for response in responses} == {b'{"calls":1}'}
+        assert cache.stats()["coalesced"] == 19
+
+    async def test_waits_for_another_process(self) -> None:
+        """Test a miss waits for the entry another process is computing"""
+        redis = FakeRedis()
+        other = ResponseCache(enabled=True, redis_client=redis)
+        cache = ResponseCache(enabled=True, redis_client=redis)
+        slow, fast = Counter(delay=0.2), Counter()
+
+        first, second = await asyncio.gather(
+            other.respond(make_request(), TRANSPARENCY_PAGES, 60, slow),
+            cache.respond(make_request(), TRANSPARENCY_PAGES, 60, fast),
+        )
+
+        assert (slow.calls, fast.calls) == (1, 0)
+        assert second.body == first.body
+
+    async def test_computes_when_lock_holder_is_stuck(self) -> None:
+        """Test the wait for another process is bounded"""
+        redis = FakeRedis()
+        cache = ResponseCache(enabled=True, lock_wait_seconds=0.1, redis_client=redis)
+        build = Counter()
+
+        original_set = redis.set
+
+        async def locked_set(key: str, value: bytes, **kwargs: Any) -> bool:
+            if key.endswith(":lock"):
+                return False
+            return await original_set(key, value, **kwargs)
+
+        redis.set = locked_set  # type: ignore[method-assign, assignment]
+        response: Response = await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, build)
+
+        assert build.calls == 1
+        assert response.status_code == 200
+
+
+class TestDegradation:
+    """Tests that Redis problems never fail a request"""
+
+    async def test_redis_down_computes_directly(self) -> None:
+        """Test responses are computed when Redis is unreachable"""
+        redis: MagicMock = MagicMock()
+        redis.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        redis.incr = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache = ResponseCache(enabled=True, redis_client=redis)
+
+        response: Response = await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, Counter())
+        await cache.invalidate(TRANSPARENCY_PAGES)
+
+        assert response.headers["x-cache"] == "BYPASS"
+        assert response.body == b'{"calls":1}'
+        assert cache.stats()["redis_errors"] == 2
+
+    async def test_disabled_cache_still_sends_etag(self) -> None:
+        """Test conditional GET works without the shared cache"""
+        cache = ResponseCache(enabled=False, redis_client=FakeRedis())
+        first: Response = await cache.respond(make_request(), TRANSPARENCY_PAGES, 60, Counter())
+
+        second: Response = await cache.respond(
+            make_request(if_none_match=first.headers["etag"]),
+            TRANSPARENCY_PAGES,
+            60,
+            Counter(),
+        )
+
+        assert "cache-control" not in first.headers
+        assert second.status_code == 304
+
+
+@pytest.fixture
+def enabled_cache() -> Iterator[ResponseCache]:
+    """Install an enabled response cache backed by a FakeRedis"""
+    cache = ResponseCache(enabled=True, redis_client=FakeRedis())
+    original: Optional[ResponseCache] = response_cache_module._response_cache
+    response_cache_module._response_cache = cache
+    yield cache
+    response_cache_module._response_cache = original
+
+
+class TestEndpointInvalidation:
+    """Tests that writes invalidate the cached public responses"""
+
+    async def test_page_update_invalidates_cached_page(
+        self, client: TestClient, db_session: AsyncSession, enabled_cache: ResponseCache
+    ) -> None:
+        """Test update_page makes the next GET return the new content"""
+        db_session.add(
+            TransparencyPage(
+                slug="funding",
+                title={"en": "Funding"},
+                content={"en": "Old"},
+                version=1,
+                last_reviewed=datetime.now(timezone.utc),
+            )
+        )
+        await db_session.commit()
+
+        first = client.get("/api/v1/transparency/funding")
+        cached = client.get("/api/v1/transparency/funding")
+        not_modified = client.get(
+            "/api/v1/transparency/funding", headers={"If-None-Match": first.headers["etag"]}
+        )
+        await transparency_page_service.update_page(
+            db=db_session,
+            slug="funding",
+            title=None,
+            content={"en": "New"},
+            changed_by_id=uuid4(),
+            change_summary="Updated funding",
+        )
+        updated = client.get("/api/v1/transparency/funding")
+
+        assert (first.headers["x-cache"], cached.headers["x-cache"]) == ("MISS", "HIT")
+        assert not_modified.status_code == 304
+        assert cached.json()["content"] == {"en": "Old"}
+        assert updated.headers["x-cache"] == "MISS"
+        assert updated.json()["content"] == {"en": "New"}
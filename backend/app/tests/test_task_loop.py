@@ -0,0 +1,62 @@
+"""
+Tests for the shared Celery task loop
+
+Covers:
+- Coroutines submitted from several worker threads share one loop and overlap
+- Results and exceptions are passed back to the submitting thread
+- A forked process starts its own loop
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from app.core.task_loop import get_task_loop, run_in_task_loop
+
+
+class TestRunInTaskLoop:
+    """Tests for run_in_task_loop"""
+
+    def test_tasks_from_worker_threads_overlap_on_one_loop(self) -> None:
+        """Test coroutines from a thread pool run concurrently on the same loop"""
+        in_flight: int = 0
+        peak: int = 0
+
+        async def job() -> asyncio.AbstractEventLoop:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            loops = list(pool.map(lambda _: run_in_task_loop(job()), range(3)))
+
+        assert peak == 3
+        assert loops == [get_task_loop()] * 3
+
+    def test_result_and_exception_are_returned(self) -> None:
+        """Test the caller gets the coroutine's result or exception"""
+
+        async def answer() -> int:
+            return 42
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        assert run_in_task_loop(answer()) == 42
+        with pytest.raises(ValueError, match="boom"):
+            run_in_task_loop(fail())
+
+    def test_forked_process_starts_its_own_loop(self) -> None:
+        """Test a process with a different pid does not reuse the inherited loop"""
+        parent_loop: asyncio.AbstractEventLoop = get_task_loop()
+
+        with patch("app.core.task_loop.os.getpid", return_value=-1):
+            child_loop: asyncio.AbstractEventLoop = get_task_loop()
+
+        assert child_loop is not parent_loop
+        child_loop.call_soon_threadsafe(child_loop.stop)
@@ -10,14 +10,20 @@ Following TDD: These tests should FAIL initially, then PASS after implementation
 import asyncio
 import time
 from typing import Any
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from redis.asyncio import Redis
 
+from app.core.bloom_filter import BloomFilter
 from app.core.config import settings
-from app.services.token_blacklist import TokenBlacklistService
+from app.services.token_blacklist import (
+    BlacklistFilter,
+    BlacklistFilterSync,
+    TokenBlacklistService,
+)
 
 
 @pytest_asyncio.fixture
@@ -229,3 +235,113 @@ async def test_blacklist_handles_invalid_jti(
         assert result is False
     except Exception as e:
         pytest.fail(f"Blacklist service should handle invalid JTI gracefully: {e}")
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    """
+    Test that every added item is reported present and few others are.
+
+    Expected behavior:
+    - All added items are found
+    - False positive rate stays near the configured error rate
+    """
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    added = [str(uuid4()) for _ in range(1000)]
+    for jti in added:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in added)
+    false_positives = sum(str(uuid4()) in bloom for _ in range(10000))
+    assert false_positives < 300, f"{false_positives} false positives in 10000 lookups"
+
+
+@pytest.mark.asyncio
+async def test_filter_defers_to_redis_until_rebuilt(redis_client: Any) -> None:
+    """
+    Test that an unsynced filter never rules a token out.
+
+    Expected behavior:
+    - Before the first rebuild every lookup goes to Redis
+    - After a rebuild, JTIs already in Redis are kept and others are ruled out
+    """
+    blacklisted = str(uuid4())
+    await redis_client.setex(f"blacklist:{blacklisted}", 900, "1")
+    blacklist_filter = BlacklistFilter(capacity=1000, error_rate=0.001)
+
+    assert blacklist_filter.might_contain(str(uuid4())) is True
+
+    await blacklist_filter.rebuild(redis_client)
+
+    assert blacklist_filter.ready is True
+    assert blacklist_filter.might_contain(blacklisted) is True
+    assert blacklist_filter.might_contain(str(uuid4())) is False
+
+    blacklist_filter.mark_stale()
+    assert blacklist_filter.might_contain(str(uuid4())) is True
+
+
+@pytest.mark.asyncio
+async def test_filter_negative_skips_redis(redis_client: Any) -> None:
+    """
+    Test that tokens ruled out by the filter are not looked up in Redis.
+
+    Expected behavior:
+    - Unknown JTIs are answered locally
+    - Blacklisted JTIs still fall through to Redis and are detected
+    """
+    blacklist_filter = BlacklistFilter(capacity=1000, error_rate=0.001)
+    await blacklist_filter.rebuild(redis_client)
+    service = TokenBlacklistService(redis_client, blacklist_filter)
+    jti = str(uuid4())
+    await service.blacklist_token(jti, 900)
+
+    exists = redis_client.exists
+
+    async def counted_exists(*keys: str) -> int:
+        return int(await exists(*keys))
+
+    redis_client.exists = AsyncMock(side_effect=counted_exists)
+    assert await service.is_token_blacklisted(str(uuid4())) is False
+    redis_client.exists.assert_not_awaited()
+
+    assert await service.is_token_blacklisted(jti) is True
+    redis_client.exists.assert_awaited_once()
+    assert blacklist_filter.metrics.snapshot()["filtered"] == 1
+
+
+@pytest.mark.asyncio
+async def test_blacklisted_token_reaches_other_processes(redis_client: Any) -> None:
+    """
+    Test that a token blacklisted in one process is caught by another's filter.
+
+    Expected behavior:
+    - The blacklisting process announces the JTI over pub/sub
+    - A synced filter in another process adds it without a rebuild
+    """
+    remote_filter = BlacklistFilter(capacity=1000, error_rate=0.001)
+    sync = BlacklistFilterSync(remote_filter, rebuild_interval=3600, poll_timeout=0.05)
+    sync.start()
+    try:
+        for _ in range(100):
+            if remote_filter.ready:
+                break
+            await asyncio.sleep(0.01)
+        assert remote_filter.ready is True
+
+        jti = str(uuid4())
+        local_service = TokenBlacklistService(
+            redis_client, BlacklistFilter(capacity=1000, error_rate=0.001)
+        )
+        await local_service.blacklist_token(jti, 900)
+
+        for _ in range(100):
+            if remote_filter.might_contain(jti):
+                break
+            await asyncio.sleep(0.01)
+        remote_service = TokenBlacklistService(redis_client, remote_filter)
+        assert await remote_service.is_token_blacklisted(jti) is True
+        assert remote_filter.metrics.rebuilds == 1
+    finally:
+        await sync.stop()
+
+    assert remote_filter.ready is False
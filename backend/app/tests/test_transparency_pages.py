@@ -21,6 +21,7 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models.user import User, UserRole
 
@@ -199,10 +200,12 @@ class TestTransparencyPageModel:
 
         # Verify relationship
         result = await db_session.execute(
-            select(TransparencyPage).where(TransparencyPage.id == page.id)
+            select(TransparencyPage)
+            .where(TransparencyPage.id == page.id)
+            .options(selectinload(TransparencyPage.versions))
         )
         loaded_page = result.scalar_one()
-        assert hasattr(loaded_page, "versions")
+        assert [v.id for v in loaded_page.versions] == [version.id]
 
     @pytest.mark.asyncio
     async def test_query_transparency_page_by_slug(self, db_session: AsyncSession) -> None:
@@ -471,11 +474,11 @@ class TestTransparencyPageVersionModel:
         )
         db_session.add(version)
         await db_session.commit()
-        await db_session.refresh(version)
+        await db_session.refresh(version, ["page"])
 
         # Verify page relationship
         assert version.page_id == page.id
-        assert hasattr(version, "page")
+        assert version.page.id == page.id
 
 
 class TestRequiredTransparencyPages:
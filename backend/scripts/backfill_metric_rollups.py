@@ -0,0 +1,44 @@
+"""
+Backfill script for the EFCSN analytics rollup tables
+
+Recomputes fact_check_daily_rollups, source_rollups and correction_rollups
+from fact_checks, sources and corrections. Safe to re-run at any time.
+"""
+
+import asyncio
+import sys
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.services.metrics_rollup_service import rebuild_metric_rollups
+
+
+async def backfill_metric_rollups():
+    """Rebuild every rollup table from the raw tables"""
+    engine = create_async_engine(settings.DATABASE_URL)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with async_session() as session:
+            summary = await rebuild_metric_rollups(session)
+    finally:
+        await engine.dispose()
+
+    print("\n✓ Rebuilt metric rollups:\n")
+    for table, rows in summary.items():
+        print(f"  • {table}: {rows} rows")
+    print()
+
+
+async def main():
+    """Main entry point"""
+    try:
+        await backfill_metric_rollups()
+    except Exception as e:
+        print(f"\n❌ Error backfilling metric rollups: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
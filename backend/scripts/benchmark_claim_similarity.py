@@ -0,0 +1,254 @@
+"""
+Benchmark exact vs. approximate (HNSW) claim similarity search
+
+Issue #176: LLM-based Claim Extraction - Deduplication using vector similarity
+
+Builds a scratch table of synthetic 1536-dimension vectors in the configured
+PostgreSQL database (requires the pgvector extension), then compares the
+sequential-scan query used in "exact" mode with the HNSW index query used in
+"ann" mode. For every corpus size it reports:
+
+- recall@k of the ANN results against the exact top-k
+- p50/p95 latency of both query shapes
+
+Vectors are generated server-side with random() so that populating 1M rows
+does not require shipping ~6 GB of floats over the wire.
+
+Usage:
+    python -m scripts.benchmark_claim_similarity
+    python -m scripts.benchmark_claim_similarity --sizes 10000 100000 --queries 50
+    python -m scripts.benchmark_claim_similarity --ef-search 40 100 200
+
+The scratch table (claims_similarity_benchmark) is dropped afterwards unless
+--keep-table is given. Never point this at a production database.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from app.core.config import settings
+
+BENCHMARK_TABLE = "claims_similarity_benchmark"
+DIMENSIONS = 1536
+INSERT_BATCH_SIZE = 10000
+
+EXACT_SQL = f"""
+    SELECT id
+    FROM {BENCHMARK_TABLE}
+    WHERE 1 - (embedding <=> CAST(:embedding AS vector)) >= :threshold
+    ORDER BY 1 - (embedding <=> CAST(:embedding AS vector)) DESC
+    LIMIT :limit
+"""
+
+ANN_SQL = f"""
+    SELECT id
+    FROM (
+        SELECT id, 1 - (embedding <=> CAST(:embedding AS vector)) AS similarity
+        FROM {BENCHMARK_TABLE}
+        ORDER BY embedding <=> CAST(:embedding AS vector)
+        LIMIT :limit
+    ) AS nearest
+    WHERE similarity >= :threshold
+    ORDER BY similarity DESC
+"""
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) of values using nearest rank"""
+    ordered: list[float] = sorted(values)
+    index: int = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def populate_table(conn: AsyncConnection, size: int) -> None:
+    """(Re)create the scratch table with `size` random vectors and an HNSW index"""
+    await conn.execute(text(f"DROP TABLE IF EXISTS {BENCHMARK_TABLE}"))
+    await conn.execute(
+        text(
+            f"CREATE TABLE {BENCHMARK_TABLE} (id integer PRIMARY KEY, embedding vector({DIMENSIONS}))"
+        )
+    )
+
+    for start in range(0, size, INSERT_BATCH_SIZE):
+        stop: int = min(start + INSERT_BATCH_SIZE, size)
+        # The reference to g in the inner query forces one vector per row
+        await conn.execute(
+            text(f"""
+                INSERT INTO {BENCHMARK_TABLE} (id, embedding)
+                SELECT g, (
+                    SELECT array_agg(random() - 0.5 + g * 0)
+                    FROM generate_series(1, {DIMENSIONS})
+                )::vector
+                FROM generate_series(:start, :stop) AS g
+                """),
+            {"start": start + 1, "stop": stop},
+        )
+        print(f"    inserted {stop}/{size} vectors", end="\r", flush=True)
+    print()
+
+    build_start: float = time.perf_counter()
+    await conn.execute(
+        text(
+            f"CREATE INDEX ON {BENCHMARK_TABLE} USING hnsw (embedding vector_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        )
+    )
+    await conn.execute(text(f"ANALYZE {BENCHMARK_TABLE}"))
+    print(f"    HNSW index built in {time.perf_counter() - build_start:.1f}s")
+
+
+async def sample_queries(conn: AsyncConnection, count: int) -> list[str]:
+    """Use perturbed copies of stored vectors as queries so near neighbours exist"""
+    result = await conn.execute(
+        text(f"""
+            SELECT (
+                SELECT array_agg(v + (random() - 0.5) * 0.1)
+                FROM unnest(embedding::real[]) AS v
+            )::vector::text
+            FROM {BENCHMARK_TABLE}
+            ORDER BY random()
+            LIMIT :count
+            """),
+        {"count": count},
+    )
+    return [row[0] for row in result.fetchall()]
+
+
+async def run_query(
+    conn: AsyncConnection,
+    sql: str,
+    embedding: str,
+    threshold: float,
+    limit: int,
+    use_index: bool,
+    ef_search: int = 40,
+) -> tuple[list[int], float]:
+    """Run one similarity query and return (ids, elapsed milliseconds)"""
+    async with conn.begin_nested():
+        # Force the planner's hand so each mode measures the intended plan
+        await conn.execute(
+            text("SELECT set_config('enable_indexscan', :flag, true)"),
+            {"flag": "on" if use_index else "off"},
+        )
+        await conn.execute(
+            text("SELECT set_config('hnsw.ef_search', :ef, true)"), {"ef": str(ef_search)}
+        )
+        start: float = time.perf_counter()
+        result = await conn.execute(
+            text(sql), {"embedding": embedding, "threshold": threshold, "limit": limit}
+        )
+        ids: list[int] = [row[0] for row in result.fetchall()]
+        elapsed_ms: float = (time.perf_counter() - start) * 1000
+    return ids, elapsed_ms
+
+
+async def benchmark_size(
+    conn: AsyncConnection,
+    size: int,
+    queries: int,
+    limit: int,
+    threshold: float,
+    ef_search_values: list[int],
+) -> list[dict[str, Any]]:
+    """Benchmark one corpus size and return one result row per ef_search value"""
+    print(f"\n== {size:,} vectors ==")
+    await populate_table(conn, size)
+    query_vectors: list[str] = await sample_queries(conn, queries)
+
+    exact_ids: list[list[int]] = []
+    exact_latencies: list[float] = []
+    for embedding in query_vectors:
+        ids, elapsed = await run_query(conn, EXACT_SQL, embedding, threshold, limit, False)
+        exact_ids.append(ids)
+        exact_latencies.append(elapsed)
+
+    rows: list[dict[str, Any]] = []
+    for ef_search in ef_search_values:
+        ann_latencies: list[float] = []
+        hits: int = 0
+        expected: int = 0
+        for embedding, truth in zip(query_vectors, exact_ids):
+            ids, elapsed = await run_query(
+                conn, ANN_SQL, embedding, threshold, limit, True, ef_search
+            )
+            ann_latencies.append(elapsed)
+            hits += len(set(ids) & set(truth))
+            expected += len(truth)
+
+        rows.append(
+            {
+                "size": size,
+                "ef_search": ef_search,
+                "recall": hits / expected if expected else 1.0,
+                "exact_p50": statistics.median(exact_latencies),
+                "exact_p95": percentile(exact_latencies, 95),
+                "ann_p50": statistics.median(ann_latencies),
+                "ann_p95": percentile(ann_latencies, 95),
+            }
+        )
+    return rows
+
+
+def print_report(rows: list[dict[str, Any]]) -> None:
+    """Print benchmark results as a table"""
+    print("\n" + "=" * 86)
+    print(
+        f"{'vectors':>10} {'ef_search':>9} {'recall':>8} "
+        f"{'exact p50':>11} {'exact p95':>11} {'ann p50':>10} {'ann p95':>10} {'speedup':>8}"
+    )
+    print("-" * 86)
+    for row in rows:
+        speedup: float = row["exact_p50"] / row["ann_p50"] if row["ann_p50"] else 0.0
+        print(
+            f"{row['size']:>10,} {row['ef_search']:>9} {row['recall']:>8.3f} "
+            f"{row['exact_p50']:>9.1f}ms {row['exact_p95']:>9.1f}ms "
+            f"{row['ann_p50']:>8.1f}ms {row['ann_p95']:>8.1f}ms {speedup:>7.1f}x"
+        )
+    print("=" * 86 + "\n")
+
+
+async def main() -> None:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.0)
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 100])
+    parser.add_argument("--keep-table", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.DATABASE_URL)
+    rows: list[dict[str, Any]] = []
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            await conn.commit()
+            for size in args.sizes:
+                async with conn.begin():
+                    rows.extend(
+                        await benchmark_size(
+                            conn, size, args.queries, args.limit, args.threshold, args.ef_search
+                        )
+                    )
+            if not args.keep_table:
+                await conn.execute(text(f"DROP TABLE IF EXISTS {BENCHMARK_TABLE}"))
+                await conn.commit()
+    except Exception as e:
+        print(f"\n❌ Benchmark failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        await engine.dispose()
+
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
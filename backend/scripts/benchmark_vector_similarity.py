@@ -0,0 +1,119 @@
+"""
+Micro-benchmark the NumPy similarity kernels against the pure-Python ones
+
+Issue #176: LLM-based Claim Extraction - Deduplication using vector similarity
+
+Compares the per-pair Python loops in EmbeddingService (normalize_embedding,
+cosine_similarity) with the vectorized kernels in app.services.vector_similarity
+on random 1536-dimension vectors. No database or API access is needed.
+
+Usage:
+    python -m scripts.benchmark_vector_similarity
+    python -m scripts.benchmark_vector_similarity --sizes 100 1000 --queries 20
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+
+from app.services.embedding_service import EmbeddingService
+from app.services.vector_similarity import (
+    InMemoryVectorIndex,
+    cosine_many_to_many,
+    normalize_many,
+)
+
+DIMENSIONS = 1536
+
+
+def time_ms(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the median wall time of fn in milliseconds"""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def benchmark_size(
+    service: EmbeddingService, size: int, queries: int, repeat: int
+) -> list[dict[str, Any]]:
+    """Benchmark every operation for one corpus size"""
+    rng = np.random.default_rng(size)
+    corpus: list[list[float]] = rng.standard_normal((size, DIMENSIONS)).tolist()
+    query_vectors: list[list[float]] = rng.standard_normal((queries, DIMENSIONS)).tolist()
+    index: InMemoryVectorIndex[int] = InMemoryVectorIndex(list(range(size)), corpus)
+
+    cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "normalize",
+            lambda: [service.normalize_embedding(v) for v in corpus],
+            lambda: normalize_many(corpus),
+        ),
+        (
+            "many-vs-many",
+            lambda: [[service.cosine_similarity(q, v) for v in corpus] for q in query_vectors],
+            lambda: cosine_many_to_many(query_vectors, corpus),
+        ),
+        (
+            "top-5 search",
+            lambda: [
+                sorted((service.cosine_similarity(q, v) for v in corpus), reverse=True)[:5]
+                for q in query_vectors
+            ],
+            lambda: index.search_many(query_vectors, threshold=-1.0, limit=5),
+        ),
+    ]
+
+    rows: list[dict[str, Any]] = []
+    for name, python_fn, numpy_fn in cases:
+        python_ms: float = time_ms(python_fn, repeat)
+        numpy_ms: float = time_ms(numpy_fn, repeat)
+        rows.append({"size": size, "operation": name, "python": python_ms, "numpy": numpy_ms})
+        print(f"    {name}: done")
+    return rows
+
+
+def print_report(rows: list[dict[str, Any]]) -> None:
+    """Print benchmark results as a table"""
+    print("\n" + "=" * 64)
+    print(f"{'vectors':>10} {'operation':>14} {'python':>12} {'numpy':>12} {'speedup':>10}")
+    print("-" * 64)
+    for row in rows:
+        speedup: float = row["python"] / row["numpy"] if row["numpy"] else 0.0
+        print(
+            f"{row['size']:>10,} {row['operation']:>14} "
+            f"{row['python']:>10.2f}ms {row['numpy']:>10.2f}ms {speedup:>9.1f}x"
+        )
+    print("=" * 64 + "\n")
+
+
+def main() -> None:
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # The pure-Python helpers never call the API; a placeholder key satisfies __init__
+    with patch("app.services.embedding_service.settings") as mock_settings:
+        mock_settings.OPENAI_API_KEY = "benchmark"
+        service: EmbeddingService = EmbeddingService()
+
+    rows: list[dict[str, Any]] = []
+    for size in args.sizes:
+        print(f"\n== {size:,} vectors ==")
+        rows.extend(benchmark_size(service, size, args.queries, args.repeat))
+
+    print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
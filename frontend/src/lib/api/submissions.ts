@@ -4,7 +4,7 @@ import type {
 	SubmissionCreate,
 	SubmissionListResponse,
 	SpotlightSubmissionCreate,
-	SpotlightContent,
+	SpotlightSubmissionAccepted,
 	UserBasic
 } from './types';
 
@@ -18,11 +18,17 @@ export async function createSubmission(data: SubmissionCreate): Promise<Submissi
 
 /**
  * Create a new Spotlight submission
+ *
+ * The backend accepts the link and fetches the content in the background;
+ * follow the submission status for progress.
  */
 export async function createSpotlightSubmission(
 	data: SpotlightSubmissionCreate
-): Promise<SpotlightContent> {
-	const response = await apiClient.post<SpotlightContent>('/api/v1/submissions/spotlight', data);
+): Promise<SpotlightSubmissionAccepted> {
+	const response = await apiClient.post<SpotlightSubmissionAccepted>(
+		'/api/v1/submissions/spotlight',
+		data
+	);
 	return response.data;
 }
 
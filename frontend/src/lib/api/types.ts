@@ -45,6 +45,15 @@ export interface SpotlightSubmissionCreate {
 	submitter_comment?: string;
 }
 
+/** Returned when a Spotlight submission is queued for background ingestion */
+export interface SpotlightSubmissionAccepted {
+	submission_id: string;
+	/** Ingestion stage: fetching, transcribing, extracting_claims, completed or failed */
+	status: string;
+	spotlight_link: string;
+	task_id: string | null;
+}
+
 export interface SpotlightContent {
 	id: string;
 	submission_id: string;
@@ -858,6 +867,8 @@ export interface MonthlyFactCheckCountResponse {
 export interface TimeToPublicationMetrics {
 	average_hours: number;
 	median_hours: number;
+	p90_hours?: number;
+	p99_hours?: number;
 	min_hours: number;
 	max_hours: number;
 	total_published: number;
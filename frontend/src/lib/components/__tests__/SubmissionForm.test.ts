@@ -5,15 +5,10 @@ import SubmissionFormTest from './SubmissionFormTest.svelte';
 // Mock the API
 vi.mock('$lib/api/submissions', () => ({
 	createSpotlightSubmission: vi.fn().mockResolvedValue({
-		id: '123',
+		submission_id: '123',
 		spotlight_link: 'https://www.snapchat.com/spotlight/test',
-		creator_name: 'Test Creator',
-		creator_username: 'testuser',
-		view_count: 1000,
-		duration_ms: 30000,
-		status: 'pending',
-		created_at: '2025-01-01',
-		updated_at: '2025-01-01'
+		status: 'fetching',
+		task_id: 'task-123'
 	})
 }));
 